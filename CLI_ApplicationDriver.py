@@ -0,0 +1,310 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for CLI_ApplicationDriver,
+# the command line (headless) counterpart of GUI_ApplicationDriver. It runs the
+# hail, wind, and tornado processing stages without a display, and reports
+# progress as structured (JSON lines) logs.
+#
+# Examples:
+#   python CLI_ApplicationDriver.py --hazard hail --timespan 2016 \
+#       --magnitude all --region state --state TX --analyses OutputToCSVFile \
+#       --workspace C:/Output
+#   python CLI_ApplicationDriver.py --hazard torn --timespan All \
+#       --magnitude all --regions states --analyses OutputToCSVFile
+#   python CLI_ApplicationDriver.py --job overnight_jobs.json
+#
+# A job file is a JSON (or YAML, if PyYAML is installed) object with the same
+# keys as the arguments below (e.g. "custom_from"), or a list of them under
+# "jobs". Keys outside of "jobs" are defaults shared by every job.
+
+# All import statements for utilized modules.
+import sys
+import json
+import time
+import logging
+import argparse
+import traceback
+import Hazard_Pipeline
+import Hazard_BatchRunner
+from Hazard_DownloadCache import func_Set_Offline_Mode
+from Hazard_StageTrace import func_Start_Trace
+from Hazard_StageTrace import func_Stop_Trace
+
+# Names of the job keys that can be given as arguments.
+tuple_Job_Keys = ("hazard", "timespan", "custom_from", "custom_to",
+                  "magnitude", "magnitude_min", "magnitude_max", "region",
+                  "state", "county", "analyses", "workspace", "regions",
+                  "workers")
+
+
+class JSONLogFormatter(logging.Formatter):
+
+    # This class formats each log record as one JSON object per line, with
+    # the time, level, job, message, and any pipeline values (stage,
+    # progress, file names, counts, etc.).
+
+    def format(self, record):
+
+        entry = {"time": time.strftime("%Y-%m-%dT%H:%M:%S",
+                                       time.localtime(record.created)),
+                 "level": record.levelname,
+                 "job": getattr(record, "hazard_Job", None),
+                 "message": record.getMessage()}
+
+        entry.update(getattr(record, "hazard_Fields", {}))
+
+        if record.exc_info:
+
+            entry["traceback"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, default=str)
+
+
+class JobFilter(logging.Filter):
+
+    # This class adds the current job's number to every log record, so the
+    # logs of many jobs can be told apart.
+
+    def __init__(self):
+
+        logging.Filter.__init__(self)
+
+        self.job = None
+
+    def filter(self, record):
+
+        record.hazard_Job = self.job
+
+        return True
+
+
+def func_Parse_Arguments(argv):
+
+    # This function parses the command line arguments.
+
+    parser = argparse.ArgumentParser(
+        description="Run the hail, wind, or tornado processing without the "
+                    "GUI.")
+
+    parser.add_argument("--job", help="JSON/YAML job file (arguments given "
+                        "on the command line override its defaults).")
+    parser.add_argument("--hazard", choices=sorted(
+        Hazard_Pipeline.dict_Hazard_Settings))
+    parser.add_argument("--timespan", help="All, Custom, a year (e.g. 2016), "
+                        "or a year range (e.g. 2005-2007).")
+    parser.add_argument("--custom-from", dest="custom_from",
+                        help="Custom timespan FROM month (YYYY-MM).")
+    parser.add_argument("--custom-to", dest="custom_to",
+                        help="Custom timespan TO month (YYYY-MM).")
+    parser.add_argument("--magnitude", help="Magnitude selection, as shown "
+                        "in the GUI (e.g. EF-2) or its naming convention "
+                        "(e.g. ef2, 0_5_to_0_99), or Custom.")
+    parser.add_argument("--magnitude-min", dest="magnitude_min",
+                        help="Custom magnitude minimum.")
+    parser.add_argument("--magnitude-max", dest="magnitude_max",
+                        help="Custom magnitude maximum.")
+    parser.add_argument("--region", choices=("none", "usa", "state",
+                                             "county"),
+                        help="Clip region (none skips clipping and analyses).")
+    parser.add_argument("--state", help="State abbreviation (e.g. TX).")
+    parser.add_argument("--county", help="County name (e.g. Dallas).")
+    parser.add_argument("--analyses", help="Comma-delimited analysis options "
+                        "(e.g. OutputToCSVFile,IDW).")
+    parser.add_argument("--workspace", help="Output workspace folder.")
+    parser.add_argument("--regions", help="Comma-delimited clip regions for "
+                        "one download, run in parallel: usa, states (each of "
+                        "the 50 states and DC), TX, TX:Dallas, or TX:* (each "
+                        "county within TX). Replaces --region/--state/"
+                        "--county.")
+    parser.add_argument("--workers", type=int, help="Number of worker "
+                        "processes for --regions (default: one per CPU).")
+    parser.add_argument("--offline", action="store_true",
+                        help="Only use downloads within the download cache.")
+    parser.add_argument("--log-file", dest="log_file",
+                        help="Also write the logs to this file.")
+    parser.add_argument("--trace", help="Write the time, CPU time, and "
+                        "memory of each processing stage to this JSON file.")
+    parser.add_argument("--profile", action="store_true",
+                        help="With --trace, also capture each stage with "
+                        "cProfile (.prof files next to the trace file).")
+
+    return parser.parse_args(argv)
+
+
+def func_Load_Job_File(jobFile):
+
+    # This function loads a JSON or YAML job file.
+
+    with open(jobFile) as jobInput:
+
+        text = jobInput.read()
+
+    if jobFile.lower().endswith((".yaml", ".yml")):
+
+        # PyYAML is only needed for YAML job files.
+        import yaml
+
+        return yaml.safe_load(text)
+
+    return json.loads(text)
+
+
+def func_Build_Jobs(arguments):
+
+    # This function returns the list of job dictionaries to run. Command line
+    # values override the job file's values.
+
+    jobFile = {}
+
+    if arguments.job:
+
+        jobFile = func_Load_Job_File(arguments.job)
+
+    # Values shared by every job.
+    defaults = {key: value for key, value in jobFile.items() if key != "jobs"}
+
+    for key in tuple_Job_Keys:
+
+        if getattr(arguments, key) is not None:
+
+            defaults[key] = getattr(arguments, key)
+
+    jobs = []
+
+    for job in jobFile.get("jobs", [{}]):
+
+        combined = dict(defaults)
+        combined.update(job)
+
+        jobs.append(combined)
+
+    return jobs
+
+
+def func_Run_Jobs(jobs, jobFilter):
+
+    # This function runs every job in order, logging the result of each one.
+    # A failed job is logged and the next job is run. The number of failed
+    # jobs is returned.
+
+    logger = logging.getLogger("Hazard_Pipeline")
+    failures = 0
+
+    for number, job in enumerate(jobs, 1):
+
+        jobFilter.job = number
+        start_time = time.perf_counter()
+
+        try:
+
+            if "hazard" not in job:
+
+                raise ValueError("No hazard given (--hazard or job file).")
+
+            # If the job has a list of regions, run them as a batch.
+            if job.get("regions"):
+
+                results = Hazard_BatchRunner.func_Run_Batch(
+                    job, job["regions"], job.get("workers"))
+                regionFailures = sum(1 for result in results
+                                     if result[2] is not None)
+
+                if regionFailures:
+
+                    failures += 1
+
+                logger.info("Job finished.", extra={"hazard_Fields": {
+                    "stage": "job",
+                    "status": "failed" if regionFailures else "complete",
+                    "regions": len(results),
+                    "failed_regions": regionFailures,
+                    "seconds": round(time.perf_counter() - start_time, 3)}})
+
+                continue
+
+            runParams = Hazard_Pipeline.func_Job_RunParameters(job)
+            result = Hazard_Pipeline.func_Run_Pipeline(job["hazard"],
+                                                       runParams)
+
+            logger.info("Job finished.", extra={"hazard_Fields": {
+                "stage": "job", "status": result.status,
+                "folder": result.fullPathName,
+                "checked_rows": result.checkedCount,
+                "clipped_rows": result.clippedCount,
+                "data_counts": result.dataCountsCSV,
+                "seconds": round(time.perf_counter() - start_time, 3)}})
+
+        except Exception as e:
+
+            failures += 1
+
+            logger.error("Job failed: " + str(e), extra={"hazard_Fields": {
+                "stage": "job", "status": "failed", "job_values": job,
+                "traceback": traceback.format_exc(),
+                "seconds": round(time.perf_counter() - start_time, 3)}})
+
+    return failures
+
+
+def func_Main(argv=None):
+
+    # This function parses the arguments, sets up the structured logs, and
+    # runs the jobs. The exit code is 1 if any job failed, else 0.
+
+    arguments = func_Parse_Arguments(argv)
+
+    # Structured logs are written to stderr (and the log file, if given).
+    jobFilter = JobFilter()
+    logger = logging.getLogger("Hazard_Pipeline")
+    logger.setLevel(logging.INFO)
+
+    handlers = [logging.StreamHandler(sys.stderr)]
+
+    if arguments.log_file:
+
+        handlers.append(logging.FileHandler(arguments.log_file))
+
+    for handler in handlers:
+
+        handler.setFormatter(JSONLogFormatter())
+        handler.addFilter(jobFilter)
+        logger.addHandler(handler)
+
+    if arguments.offline:
+
+        func_Set_Offline_Mode(True)
+
+    # Stage trace (see Hazard_StageTrace), if a trace file is given.
+    if arguments.trace:
+
+        func_Start_Trace(arguments.trace, arguments.profile or None)
+
+    try:
+
+        try:
+
+            jobs = func_Build_Jobs(arguments)
+
+        except Exception as e:
+
+            logger.error("Unable to read the jobs: " + str(e))
+
+            return 2
+
+        return 1 if func_Run_Jobs(jobs, jobFilter) else 0
+
+    finally:
+
+        func_Stop_Trace()
+
+        # Remove the handlers, so calling func_Main again doesn't write every
+        # log twice.
+        for handler in handlers:
+
+            logger.removeHandler(handler)
+            handler.close()
+
+
+if __name__ == "__main__":
+
+    sys.exit(func_Main())
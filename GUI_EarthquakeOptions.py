@@ -12,25 +12,51 @@ from tkinter import messagebox
 from tkinter import scrolledtext
 import sys
 import os
-import shutil
 import time
 import csv
 import numpy
-from urllib import request
 from urllib.error import HTTPError
 from urllib.error import URLError
 import zipfile
 import calendar
 from datetime import datetime
 import datetime
-from dateutil.relativedelta import relativedelta
-import collections
 from collections import OrderedDict
 import traceback
 from time import sleep  # careful - this can freeze the GUI
 from threading import Thread # this is used to unfreeze the GUI
 from statistics import mode, StatisticsError
 from GUI_FrameLifts import FrameLifts
+from Hazard_GUIChannel import GUIChannel
+from Hazard_StageTrace import func_Start_Trace
+from Hazard_StageTrace import func_Stop_Trace
+from Hazard_StageTrace import func_Trace_GUI_Run
+from Hazard_Readiness import func_Remove_Folder
+from Hazard_AnalysisScheduler import scheduler_Scratch_FolderName
+from Hazard_AnalysisScheduler import dict_ArcGIS_Raster_Tools
+from Hazard_AnalysisScheduler import func_Run_Analysis_Jobs
+from Hazard_AnalysisScheduler import func_ArcGIS_Raster_Jobs
+from Hazard_AnalysisScheduler import func_Copy_ArcGIS_Raster
+from Hazard_DownloadCache import func_Cache_Retrieve
+from Hazard_ChunkDownloader import chunk_MaxWorkers
+from Hazard_ChunkDownloader import func_Stream_Chunks
+from Hazard_CountyStore import func_County_Store_Path
+from Hazard_CountyStore import func_County_Store_Exists
+from Hazard_CountyStore import func_Build_County_Store
+from Hazard_CountyStore import func_Extract_County_Mask
+from Hazard_FilterEngine import func_Filter_Quake_Rows
+from Hazard_QueryPlanner import func_Plan_Query_Windows
+from Hazard_QueryPlanner import func_Window_URL
+from Hazard_QueryPlanner import func_Window_Name
+from Hazard_RunParameters import RunParameters
+from Hazard_RunParameters import func_Get_Tk_Value
+from Hazard_RunParameters import func_Get_Checked_Analyses
+from Hazard_RunParameters import func_Custom_Timespan
+from Hazard_RunParameters import func_Custom_Timespan_Text
+from Hazard_RunParameters import func_Custom_Magnitude_Text
+from Hazard_GroupStats import func_Value_Statistics
+from Hazard_GroupStats import func_Group_Statistics
+from Hazard_GroupStats import func_Mode_String
 
 # For Python 2.7 consideration:
 # import Tkinter as tkinter
@@ -121,6 +147,11 @@ earthquake_siteURL = \
 earthquake_Custom_siteURL_CSV = \
     "https://earthquake.usgs.gov/fdsnws/event/1/query?format=csv"
 
+# This string represents the static portion of the URL path for counting the
+# earthquakes within a custom timespan (used to plan the custom downloads).
+earthquake_Custom_siteURL_Count = \
+    "https://earthquake.usgs.gov/fdsnws/event/1/count?format=geojson"
+
 # Additional string parameters used to access CUSTOM timespan/magnitude URLs.
 earthquake_Custom_siteURL_StartTime = "&starttime="
 earthquake_Custom_siteURL_EndTime = "&endtime="
@@ -265,6 +296,12 @@ class EarthquakeOptions(FrameLifts):
         self.stringState_Name = None
         self.stringCounty_Name = None
         self.nameFeatureClass_FromCSV = None
+        self.runParams = None
+
+        # Channel for the log messages and progress values posted by the
+        # processing thread (shown by the main loop, see Hazard_GUIChannel).
+        self.guiChannel = GUIChannel(self, (color_Red, color_Orange,
+                                            color_Blue))
 
         # Settings and configuration for the Earthquake Options GUI window.
         self.winfo_toplevel().title("Earthquake Options")
@@ -1313,6 +1350,39 @@ class EarthquakeOptions(FrameLifts):
                 # active program.
                 return
 
+    def func_Build_RunParameters(self):
+
+        # This function reads every GUI selection used by the processing tasks
+        # and returns them as an immutable RunParameters object. It must run
+        # on the GUI thread (before the OKClick thread starts), so that none of
+        # the processing tasks need to read a Tk variable.
+
+        # Names of the analysis checkboxes within the Analysis Options frame.
+        analysisNames = ("IDW", "KernelDensity", "Kriging", "NaturalNeighbor",
+                         "OptHotSpot", "PointDensity", "Spline", "Thiessen",
+                         "Trend", "OutputToCSVFile")
+
+        return RunParameters(
+            hazard_Timespan=self.stringEarthquakeTimespan.get(),
+            hazard_Magnitude=self.stringEarthquakeMagnitude.get(),
+            custom_Year_From=func_Get_Tk_Value(
+                self.intCustomTimespan_Year_From),
+            custom_Month_From=func_Get_Tk_Value(
+                self.intCustomTimespan_Month_From),
+            custom_Year_To=func_Get_Tk_Value(self.intCustomTimespan_Year_To),
+            custom_Month_To=func_Get_Tk_Value(self.intCustomTimespan_Month_To),
+            custom_Magnitude_Min=func_Get_Tk_Value(
+                self.doubleCustom_Magnitude_Min),
+            custom_Magnitude_Max=func_Get_Tk_Value(
+                self.doubleCustom_Magnitude_Max),
+            url_Text=self.textURLTextbox.get(),
+            workspace_Folder=
+                self.workspaceFolderTextbox_EarthquakeFolderDialog.get(),
+            options_Checked=self.statusVar_Checkbutton_Options.get(),
+            state_Name=func_Get_Tk_Value(self.stringState_Name),
+            county_Name=func_Get_Tk_Value(self.stringCounty_Name),
+            analysis_Options=func_Get_Checked_Analyses(self, analysisNames))
+
     def func_OKClick_Thread(self):
 
         # This function controls the OKClick function, by running it within a
@@ -1321,6 +1391,9 @@ class EarthquakeOptions(FrameLifts):
         # The daemon setting allows for the application to properly terminate
         # when the user clicks the "Cancel" button.
 
+        # Read all GUI selections once, while still on the GUI thread.
+        self.runParams = self.func_Build_RunParameters()
+
         self.thread_func_OKClick = Thread(target=self.func_OKClick)
         self.thread_func_OKClick.daemon = True
         self.thread_func_OKClick.start()
@@ -1361,16 +1434,16 @@ class EarthquakeOptions(FrameLifts):
 
             # If the user has selected a valid timespan, magnitude, and assigned
             # an output workspace folder...
-            if self.stringEarthquakeTimespan.get() != "Select..." and \
-                self.stringEarthquakeMagnitude.get() != "Select..." and \
-                self.workspaceFolderTextbox_EarthquakeFolderDialog.get() != \
+            if self.runParams.hazard_Timespan != "Select..." and \
+                self.runParams.hazard_Magnitude != "Select..." and \
+                self.runParams.workspace_Folder != \
                     folderDialog_Message:
 
                 # Start a timer for the script.
                 self.start_time = time.time()
 
                 # If the "Options" checkbox is selected...
-                if self.statusVar_Checkbutton_Options.get() == 1:
+                if self.runParams.options_Checked == 1:
 
                     # If the user hasn't selected a clipping option...
                     if self.radioButton_Selection is None:
@@ -1387,8 +1460,8 @@ class EarthquakeOptions(FrameLifts):
                         return
 
                     # If the timespan or magnitude combobox is "Custom..."...
-                    if self.stringEarthquakeTimespan.get() == "Custom..." or \
-                            self.stringEarthquakeMagnitude.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." or \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # If all custom timespan comboboxes have values...
                         if self.intCustomTimespan_Year_From is not None and \
@@ -1397,8 +1470,8 @@ class EarthquakeOptions(FrameLifts):
                             self.intCustomTimespan_Month_To is not None:
 
                             # If the YEAR FROM exceeds the YEAR TO value...
-                            if self.intCustomTimespan_Year_From.get() > \
-                                    self.intCustomTimespan_Year_To.get():
+                            if self.runParams.custom_Year_From > \
+                                    self.runParams.custom_Year_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1413,10 +1486,10 @@ class EarthquakeOptions(FrameLifts):
 
                             # Else if the FROM MONTH exceeds the TO MONTH within
                             # the same YEAR...
-                            elif self.intCustomTimespan_Year_From.get() == \
-                                    self.intCustomTimespan_Year_To.get() and \
-                                    self.intCustomTimespan_Month_From.get() > \
-                                    self.intCustomTimespan_Month_To.get():
+                            elif self.runParams.custom_Year_From == \
+                                    self.runParams.custom_Year_To and \
+                                    self.runParams.custom_Month_From > \
+                                    self.runParams.custom_Month_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1436,8 +1509,8 @@ class EarthquakeOptions(FrameLifts):
 
                             # If the minimum magnitude exceeds the maximum
                             # magnitude...
-                            if self.doubleCustom_Magnitude_Min.get() > \
-                                    self.doubleCustom_Magnitude_Max.get():
+                            if self.runParams.custom_Magnitude_Min > \
+                                    self.runParams.custom_Magnitude_Max:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1466,12 +1539,12 @@ class EarthquakeOptions(FrameLifts):
                             self.okClick_NonCustom_ExpansionHeight))
 
                 # Else if the "More Options" checkbox is not selected...
-                elif self.statusVar_Checkbutton_Options.get() == 0:
+                elif self.runParams.options_Checked == 0:
 
                     # If the timespan or magnitude "Custom..." comboboxes are
                     # selected...
-                    if self.stringEarthquakeTimespan.get() == "Custom..." or \
-                            self.stringEarthquakeMagnitude.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." or \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # If all custom timespan comboboxes have values...
                         if self.intCustomTimespan_Year_From is not None and \
@@ -1480,8 +1553,8 @@ class EarthquakeOptions(FrameLifts):
                             self.intCustomTimespan_Month_To is not None:
 
                             # If the YEAR FROM exceeds the YEAR TO value...
-                            if self.intCustomTimespan_Year_From.get() > \
-                                    self.intCustomTimespan_Year_To.get():
+                            if self.runParams.custom_Year_From > \
+                                    self.runParams.custom_Year_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1496,10 +1569,10 @@ class EarthquakeOptions(FrameLifts):
 
                             # Else if the FROM MONTH exceeds the TO MONTH within
                             # the same YEAR...
-                            elif self.intCustomTimespan_Year_From.get() == \
-                                    self.intCustomTimespan_Year_To.get() and \
-                                    self.intCustomTimespan_Month_From.get() > \
-                                    self.intCustomTimespan_Month_To.get():
+                            elif self.runParams.custom_Year_From == \
+                                    self.runParams.custom_Year_To and \
+                                    self.runParams.custom_Month_From > \
+                                    self.runParams.custom_Month_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1519,8 +1592,8 @@ class EarthquakeOptions(FrameLifts):
 
                             # If the MINIMUM magnitude exceeds the MAXIMUM
                             # magnitude...
-                            if self.doubleCustom_Magnitude_Min.get() > \
-                                    self.doubleCustom_Magnitude_Max.get():
+                            if self.runParams.custom_Magnitude_Min > \
+                                    self.runParams.custom_Magnitude_Max:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1563,11 +1636,28 @@ class EarthquakeOptions(FrameLifts):
                 # Run function to start the status bar.
                 self.func_StartStatusBar()
 
+                # Start the stage trace (the time, CPU time, and memory of
+                # each processing stage) within the output workspace folder,
+                # now that all selections are valid.
+                func_Start_Trace(os.path.join(
+                    self.runParams.workspace_Folder, "StageTrace_" +
+                    time.strftime("%Y%m%d_%H%M%S") + ".json"))
+
                 # Run function to create a folder in the user-specified output
                 # workspace folder.
                 # PLEASE NOTE:
-                # Numerous subtasks are executed within this function.
-                self.func_CreateFolder()
+                # Numerous subtasks are executed within this function. Each
+                # subtask (and ArcPy tool) is timed within the stage trace,
+                # which is written and stopped even if processing fails.
+                try:
+
+                    with func_Trace_GUI_Run(self):
+
+                        self.func_CreateFolder()
+
+                finally:
+
+                    func_Stop_Trace()
 
                 # Once all tasks are completed, this function will calculate the
                 # time it took for the script to run from start to finish.
@@ -1590,7 +1680,7 @@ class EarthquakeOptions(FrameLifts):
             else:
 
                 # If the timespan combobox shows "Select..."...
-                if self.stringEarthquakeTimespan.get() == "Select...":
+                if self.runParams.hazard_Timespan == "Select...":
 
                     # Display error message.
                     messagebox.showerror(errorMessage_Header,
@@ -1602,7 +1692,7 @@ class EarthquakeOptions(FrameLifts):
                     self.func_Enable_Buttons()
 
                 # Else if the magnitude combobox shows "Select..."...
-                elif self.stringEarthquakeMagnitude.get() == "Select...":
+                elif self.runParams.hazard_Magnitude == "Select...":
 
                     # Display error message.
                     messagebox.showerror(errorMessage_Header,
@@ -1615,7 +1705,7 @@ class EarthquakeOptions(FrameLifts):
 
                 # Else if the output workspace text is the default message...
                 elif \
-                self.workspaceFolderTextbox_EarthquakeFolderDialog.get() == \
+                self.runParams.workspace_Folder == \
                         folderDialog_Message:
 
                     # Display error message.
@@ -1663,7 +1753,7 @@ class EarthquakeOptions(FrameLifts):
         self.scrollHeight = 8
 
         # If the "More Options" checkbox is selected...
-        if self.statusVar_Checkbutton_Options.get() == 1:
+        if self.runParams.options_Checked == 1:
 
             # Set the scrolled text frame to 90 characters wide.
             self.scrollWidth = 90
@@ -1673,7 +1763,7 @@ class EarthquakeOptions(FrameLifts):
                                      columnspan=2)
 
         # If the "More Options" checkbox is not selected...
-        if self.statusVar_Checkbutton_Options.get() == 0:
+        if self.runParams.options_Checked == 0:
 
             # Set the scrolled text frame to 52 characters wide.
             self.scrollWidth = 52
@@ -1688,6 +1778,13 @@ class EarthquakeOptions(FrameLifts):
                         wrap=tkinter.WORD, state=tkinter.DISABLED)
         self.scrollBox.grid(column=0, row=0)
 
+        # The processing history of this run is streamed to a text file within
+        # the workspace folder as it is posted, then moved to the run's output
+        # folder once the run is complete (see func_Scroll_saveOutputText).
+        self.guiChannel.func_Start_History(os.path.join(
+            self.runParams.workspace_Folder, "ProcessingHistory_RUNNING_" +
+            time.strftime("%Y%m%d_%H%M%S") + fileExtText))
+
         # Sets the text variable to the function for updating the scrolledtext
         # output.
         self.func_Scroll_setOutputText("Beginning assigned tasks...", None)
@@ -1700,7 +1797,7 @@ class EarthquakeOptions(FrameLifts):
         self.progressBarFrame = tkinter.Frame(self.processingFrame)
 
         # If the "More Options" checkbox is selected...
-        if self.statusVar_Checkbutton_Options.get() == 1:
+        if self.runParams.options_Checked == 1:
 
             # Set the pixel width of the progress bar.
             self.progressBar_Length = 740
@@ -1710,7 +1807,7 @@ class EarthquakeOptions(FrameLifts):
                                        columnspan=2)
 
         # If the "More Options" checkbox is not selected...
-        if self.statusVar_Checkbutton_Options.get() == 0:
+        if self.runParams.options_Checked == 0:
 
             # Set the pixel width of the progress bar.
             self.progressBar_Length = 450
@@ -1743,11 +1840,11 @@ class EarthquakeOptions(FrameLifts):
 
         # This function controls the appearance of the status bar.
 
+        # The status bar is stepped every 30 milliseconds by the main loop
+        # (instead of pausing the main loop between steps).
         for i in range(100):
-            sleep(0.03)
-            self.statusBar["value"] = i  # increment progressbar
-            self.statusBar.update()  # have to call update() in loop
-        self.statusBar["value"] = 0  # reset/clear progressbar
+            self.after(30 * i, self.statusBar.config, {"value": i})
+        self.after(3000, self.statusBar.config, {"value": 0})
 
     def func_StartStatusBar(self):
 
@@ -2074,7 +2171,7 @@ class EarthquakeOptions(FrameLifts):
         try:
 
             # If the "More Options" checkbox is selected...
-            if self.statusVar_Checkbutton_Options.get() == 1:
+            if self.runParams.options_Checked == 1:
 
                 # If the USA clipping option is selected...
                 if self.radioButton_Selection == 1:
@@ -2090,7 +2187,7 @@ class EarthquakeOptions(FrameLifts):
                     # Create variable for adding State to folder
                     # naming convention.
                     self.featureClass_State_Selection_Only = \
-                        "state_only_" + self.stringState_Name.get()
+                        "state_only_" + self.runParams.state_Name
                     self.folderNamingAddition = \
                         "_" + self.featureClass_State_Selection_Only
 
@@ -2100,22 +2197,22 @@ class EarthquakeOptions(FrameLifts):
                     # Create modified variable for County name, removing all
                     # instances of special characters or spacing.
                     self.modified_stringCountyName = \
-                        self.stringCounty_Name.get().\
+                        self.runParams.county_Name.\
                         replace("'", "").replace("-", "").\
                         replace(".", "").replace(" ", "")
 
                     # Full string used for feature class naming purposes.
                     self.featureClass_County_State_Naming = "county_only_" + \
                                         self.modified_stringCountyName + "_" + \
-                                        self.stringState_Name.get()
+                                        self.runParams.state_Name
 
                     # Full string used for folder naming purposes.
                     self.folderNamingAddition = \
                         "_" + self.featureClass_County_State_Naming
 
                 # If both timespan/magnitude comboboxes are not "Custom..."...
-                if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                        self.stringEarthquakeMagnitude.get() != "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
 
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out seperately to be
@@ -2132,8 +2229,8 @@ class EarthquakeOptions(FrameLifts):
 
                 # If timespan combobox is "Custom..." and magnitude combobox is
                 # not "Custom..."...
-                if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                        self.stringEarthquakeMagnitude.get() != "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
 
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out seperately to be
@@ -2149,8 +2246,8 @@ class EarthquakeOptions(FrameLifts):
                                         self.folderNamingAddition
 
                 # If timespan is "Custom..." and magnitude is "Custom..."...
-                if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                        self.stringEarthquakeMagnitude.get() == "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out seperately to be
@@ -2166,8 +2263,8 @@ class EarthquakeOptions(FrameLifts):
                                         self.folderNamingAddition
 
                 # If timespan is not "Custom..." and magnitude is "Custom..."...
-                if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                        self.stringEarthquakeMagnitude.get() == "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out seperately to be
@@ -2183,11 +2280,11 @@ class EarthquakeOptions(FrameLifts):
                                         self.folderNamingAddition
 
             # If "More Options" checkbox is unchecked...
-            if self.statusVar_Checkbutton_Options.get() == 0:
+            if self.runParams.options_Checked == 0:
 
                 # If both timespan/magnitude comboboxes are not "Custom"...
-                if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                        self.stringEarthquakeMagnitude.get() != "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out seperately to be
@@ -2203,8 +2300,8 @@ class EarthquakeOptions(FrameLifts):
 
                 # If timespan combobox is "Custom..." and magnitude combobox is
                 # not "Custom..."...
-                if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                        self.stringEarthquakeMagnitude.get() != "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out seperately to be
@@ -2220,8 +2317,8 @@ class EarthquakeOptions(FrameLifts):
 
                 # If timespan combobox is "Custom..." and magnitude combobox is
                 # "Custom..."...
-                if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                        self.stringEarthquakeMagnitude.get() == "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out seperately to be
@@ -2237,8 +2334,8 @@ class EarthquakeOptions(FrameLifts):
 
                 # If timespan combobox is not "Custom..." and magnitude combobox
                 # is "Custom..."...
-                if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                        self.stringEarthquakeMagnitude.get() == "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out seperately to be
@@ -2263,11 +2360,8 @@ class EarthquakeOptions(FrameLifts):
                     self.func_Scroll_setOutputText(
                         "Deleting pre-existing folder.", None)
 
-                    # Pause script for 0.5 seconds.
-                    sleep(0.5)
-
-                    # Delete the folder.
-                    shutil.rmtree(self.fullPathName)
+                    # Delete the folder (returning once it is gone).
+                    func_Remove_Folder(self.fullPathName)
 
                     self.func_Scroll_setOutputText(
                         "Pre-existing folder deleted.", None)
@@ -2300,9 +2394,6 @@ class EarthquakeOptions(FrameLifts):
                     # Exit the application's task.
                     exit()
 
-            # Pause script for 2.0 seconds.
-            sleep(2.0)
-
             self.func_Scroll_setOutputText("Creating folder path:\n" +
                                            self.fullPathName, None)
 
@@ -2358,9 +2449,6 @@ class EarthquakeOptions(FrameLifts):
             self.func_Scroll_setOutputText(
                 "Creating CSV subfolder...", None)
 
-            # Pause script for 0.5 seconds.
-            sleep(0.5)
-
             # If subfolder doesn't exist, create it.
             if not os.path.exists(self.csvDirectory):
 
@@ -2388,8 +2476,8 @@ class EarthquakeOptions(FrameLifts):
         try:
 
             # If timespan is not "Custom..." and magnitude isn't "Custom..."...
-            if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                    self.stringEarthquakeMagnitude.get() != "Custom...":
+            if self.runParams.hazard_Timespan != "Custom..." and \
+                    self.runParams.hazard_Magnitude != "Custom...":
 
                 # Run function to create CSV subfolder.
                 self.func_Create_CSV_subFolder()
@@ -2402,7 +2490,7 @@ class EarthquakeOptions(FrameLifts):
                         fileExtCSV, None)
 
                     # Retrieve CSV from URL.
-                    request.urlretrieve(self.textURLTextbox.get(),
+                    func_Cache_Retrieve(self.runParams.url_Text,
                                         self.csvDirectory + "/" + usgs + "_" +
                                         quake + "_" + self.mag_naming +
                                         self.timespan_url + curDate +
@@ -2424,7 +2512,7 @@ class EarthquakeOptions(FrameLifts):
                     sleep(5)
 
                     # Retrieve CSV from URL.
-                    request.urlretrieve(self.textURLTextbox.get(),
+                    func_Cache_Retrieve(self.runParams.url_Text,
                                         self.csvDirectory + "/" + usgs + "_" +
                                         quake + "_" + self.mag_naming +
                                         self.timespan_url + curDate +
@@ -2440,8 +2528,8 @@ class EarthquakeOptions(FrameLifts):
                 self.func_NonCustomTimespan_CSV_HeaderCheck_ValueCheck()
 
             # If timespan is "Custom..." and magnitude is not "Custom..."...
-            if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                    self.stringEarthquakeMagnitude.get() != "Custom...":
+            if self.runParams.hazard_Timespan == "Custom..." and \
+                    self.runParams.hazard_Magnitude != "Custom...":
 
                 # Run function to create CSV subfolder.
                 self.func_Create_CSV_subFolder()
@@ -2450,8 +2538,8 @@ class EarthquakeOptions(FrameLifts):
                 self.func_CustomTimespan_Download_CSV_and_HeaderCheck()
 
             # If timespan is "Custom..." and magnitude is "Custom..."...
-            if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                    self.stringEarthquakeMagnitude.get() == "Custom...":
+            if self.runParams.hazard_Timespan == "Custom..." and \
+                    self.runParams.hazard_Magnitude == "Custom...":
 
                 # Run function to create CSV subfolder.
                 self.func_Create_CSV_subFolder()
@@ -2460,8 +2548,8 @@ class EarthquakeOptions(FrameLifts):
                 self.func_CustomTimespan_Download_CSV_and_HeaderCheck()
 
             # If timespan is not "Custom..." and magnitude is "Custom..."...
-            if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                    self.stringEarthquakeMagnitude.get() == "Custom...":
+            if self.runParams.hazard_Timespan != "Custom..." and \
+                    self.runParams.hazard_Magnitude == "Custom...":
 
                 # Run function to create CSV subfolder.
                 self.func_Create_CSV_subFolder()
@@ -2475,7 +2563,7 @@ class EarthquakeOptions(FrameLifts):
                         fileExtCSV, None)
 
                     # Retrieve CSV from URL.
-                    request.urlretrieve(self.textURLTextbox.get(),
+                    func_Cache_Retrieve(self.runParams.url_Text,
                                         self.csvDirectory + "/" + usgs + "_" +
                                         quake + "_" + self.custom_Mag_Naming +
                                         self.timespan_url + curDate +
@@ -2496,7 +2584,7 @@ class EarthquakeOptions(FrameLifts):
                     sleep(5)
 
                     # Retrieve CSV from URL.
-                    request.urlretrieve(self.textURLTextbox.get(),
+                    func_Cache_Retrieve(self.runParams.url_Text,
                                 self.csvDirectory + "/" + usgs + "_" + quake +
                                 "_" +
                                 self.custom_Mag_Naming + self.timespan_url +
@@ -2511,9 +2599,6 @@ class EarthquakeOptions(FrameLifts):
                 # Run the function for doing non-custom data checks.
                 self.func_NonCustomTimespan_CSV_HeaderCheck_ValueCheck()
 
-            # Pause script for 0.5 seconds.
-            sleep(0.5)
-
         except HTTPError as httpError:
 
             # Display error message for URL-specific problems.
@@ -2551,7 +2636,7 @@ class EarthquakeOptions(FrameLifts):
         try:
 
             # If the magnitude combobox displays "Custom..."...
-            if self.stringEarthquakeMagnitude.get() == "Custom...":
+            if self.runParams.hazard_Magnitude == "Custom...":
 
                 # Open the CSV file.
                 self.csv_InputFile = open(self.csvDirectory + "/" + usgs +
@@ -2588,7 +2673,7 @@ class EarthquakeOptions(FrameLifts):
                                                 self.timespan_url + curDate
 
             # If the magnitude combobox does not display "Custom..."...
-            elif self.stringEarthquakeMagnitude.get() != "Custom...":
+            elif self.runParams.hazard_Magnitude != "Custom...":
 
                 # Open the CSV file.
                 self.csv_InputFile = open(self.csvDirectory + "/" + usgs +
@@ -2707,19 +2792,20 @@ class EarthquakeOptions(FrameLifts):
 
         try:
 
+            # Custom timespan values (YYYY, MM, YYYY, MM) of the run.
+            yearFrom, monthFrom, yearTo, monthTo = \
+                func_Custom_Timespan(self.runParams)
+
             # Take the Custom Year From and Custom Month From and combine them
             # into a start date string. The first day of the month is added to
             # the start date.
-            startDate = self.textCustomYearFrom + "-" + \
-                                    self.textCustomMonthFrom + "-1"
+            startDate = yearFrom + "-" + monthFrom + "-1"
 
             # Take the Custom Year To and Custom Month To and combine them
             # into an end date string. Python calculates the proper end date
             # for whichever month/year combination is used.
-            endDate = self.textCustomYearTo + "-" + \
-                      self.textCustomMonthTo + "-" + \
-                      str(calendar.monthrange(int(self.textCustomYearTo),
-                                                int(self.textCustomMonthTo))[1])
+            endDate = yearTo + "-" + monthTo + "-" + \
+                      str(calendar.monthrange(int(yearTo), int(monthTo))[1])
 
             # Formats the start date as YYYY-M-DD.
             start = datetime.datetime.strptime(startDate, '%Y-%m-%d').date()
@@ -2727,412 +2813,107 @@ class EarthquakeOptions(FrameLifts):
             # Formats the end date as YYYY-M-DD.
             end = datetime.datetime.strptime(endDate, '%Y-%m-%d').date()
 
-            # Replace start with cur_date in the while loop below if errors.
-            # Otherwise, leave it alone. Might delete this soon.
-            # cur_date = start
-
-            # Counter for number of monthlyCSV downloads.
-            counter_MonthlyCSV = 0
-
-            # Create an ordered dictionary for storing names of CSV files per
-            # month.
-            dict = collections.OrderedDict()
-            dict.clear()
-
-            # While the start date is before the end date...
-            while start < end:
-
-                # Convert the start date to string.
-                date_YMD = str(start)
-
-                # Divide the string date into year, month, and day parameters by
-                # using the "-" symbol as the delimiter.
-                y, m, d = date_YMD.split("-")
-
-                # Add the date timeframe for the monthly CSV to the dictionary,
-                # assigning the proper number of days to each year/month
-                # combination.
-                dict[str(start)] = y + "-" + m + "-" + str(
-                    calendar.monthrange(int(y), int(m))[1])
-
-                # Increment the previous month by one month.
-                start += relativedelta(months=1)
-
-            # For each key/value combination within the dictionary...
-            for key, value in dict.items():
-
-                # Apply this naming convention to that monthly CSV file.
-                downloadedURL_fileName = "monthlyCSV_" + str(
-                    counter_MonthlyCSV + 1) + "_" + str(
-                    key).replace("-", "_") + "_to_" + str(value).replace(
-                    "-", "_") + fileExtCSV
-
-                # If the magnitude drop-down list shows "All"...
-                if self.stringEarthquakeMagnitude.get() == "All":
-
-                    try:
+            # Magnitude parameters added to each query URL, depending on the
+            # magnitude drop-down list. (The custom magnitude parameters
+            # already include "&minmagnitude=" and "&maxmagnitude=".)
+            if self.runParams.hazard_Magnitude == "Custom...":
 
-                        self.func_Scroll_setOutputText("Downloading:\n" +
-                                                       downloadedURL_fileName,
-                                                       None)
+                url_Magnitude = self.minMag + self.maxMag
 
-                        # Retrieve the CSV for the next month with this
-                        # magnitude's specific naming convention.
-                        request.urlretrieve(earthquake_Custom_siteURL_CSV +
-                                    earthquake_Custom_siteURL_StartTime + key +
-                                    earthquake_Custom_siteURL_EndTime + value,
-                                    self.csvDirectory + downloadedURL_fileName)
+            elif self.runParams.hazard_Magnitude in ("1.0+", "2.5+", "4.5+"):
 
-                        self.func_Scroll_setOutputText("Download Complete.",
-                                                       None)
-
-                    # If download fails, try one more time (it could have been
-                    # a small, temporary network glitch).
-                    except:
+                url_Magnitude = earthquake_Custom_siteURL_Min_Magnitude + \
+                                self.runParams.hazard_Magnitude.rstrip("+")
 
-                        self.func_Scroll_setOutputText(
-                            "Download failed, trying again:\n" +
-                            downloadedURL_fileName, color_Orange)
+            else:
 
-                        sleep(5)
+                url_Magnitude = ""
 
-                        # Retrieve the CSV for the next month with this
-                        # magnitude's specific naming convention.
-                        request.urlretrieve(earthquake_Custom_siteURL_CSV +
-                            earthquake_Custom_siteURL_StartTime + key +
-                            earthquake_Custom_siteURL_EndTime + value,
-                            self.csvDirectory + downloadedURL_fileName)
+            self.func_Scroll_setOutputText("Counting earthquakes within the "
+                "custom timespan to plan the downloads.", None)
 
-                        self.func_Scroll_setOutputText("Download Complete.",
-                                                       None)
-
-                # If the magnitude drop-down list shows "1.0+"...
-                elif self.stringEarthquakeMagnitude.get() == "1.0+":
-
-                    try:
+            # Plan the time windows to download, so that each query stays
+            # under the USGS limit of 20,000 events (the timespan runs from
+            # the start date through the end of the end date).
+            list_Windows = func_Plan_Query_Windows(
+                earthquake_Custom_siteURL_Count + url_Magnitude,
+                datetime.datetime.combine(start, datetime.time()),
+                datetime.datetime.combine(end, datetime.time()) +
+                datetime.timedelta(days=1))
 
-                        self.func_Scroll_setOutputText("Downloading:\n" +
-                                                       downloadedURL_fileName,
-                                                       None)
+            # Counter for number of downloads.
+            counter_Queries = len(list_Windows)
 
-                        # Retrieve the CSV for the next month with this
-                        # magnitude's specific naming convention.
-                        request.urlretrieve(earthquake_Custom_siteURL_CSV +
-                                    earthquake_Custom_siteURL_StartTime + key +
-                                    earthquake_Custom_siteURL_EndTime + value +
-                                    earthquake_Custom_siteURL_Min_Magnitude +
-                                    str(1.0), self.csvDirectory +
-                                    downloadedURL_fileName)
+            # Lists for the URL and name of each download.
+            list_Query_URLs = [func_Window_URL(
+                earthquake_Custom_siteURL_CSV + url_Magnitude, window.start,
+                window.end) for window in list_Windows]
+            list_Query_Names = [func_Window_Name(window)
+                                  for window in list_Windows]
 
-                        self.func_Scroll_setOutputText("Download Complete.",
-                                                       None)
-
-                    # If download fails, try one more time (it could have been
-                    # a small, temporary network glitch).
-                    except:
-
-                        self.func_Scroll_setOutputText(
-                            "Download failed, trying again:\n" +
-                            downloadedURL_fileName, color_Orange)
+            self.func_Scroll_setOutputText("Downloading " +
+                str(sum(window.count for window in list_Windows)) +
+                " earthquakes within " + str(counter_Queries) +
+                " queries (" + str(chunk_MaxWorkers) + " at a time) while "
+                "checking for missing headers, erroneous lat/long values, "
+                "and removing all non-earthquake events.", None)
 
-                        sleep(5)
+            # This function reports each download and retry.
+            def func_Report_Download(index, name, status, message):
 
-                        # Retrieve the CSV for the next month with this
-                        # magnitude's specific naming convention.
-                        request.urlretrieve(earthquake_Custom_siteURL_CSV +
-                            earthquake_Custom_siteURL_StartTime + key +
-                            earthquake_Custom_siteURL_EndTime + value +
-                            earthquake_Custom_siteURL_Min_Magnitude + str(1.0),
-                            self.csvDirectory + downloadedURL_fileName)
-
-                        self.func_Scroll_setOutputText("Download Complete.",
-                                                       None)
-
-                # If the magnitude drop-down list shows "2.5+"...
-                elif self.stringEarthquakeMagnitude.get() == "2.5+":
-
-                    try:
-
-                        self.func_Scroll_setOutputText("Downloading:\n" +
-                                                       downloadedURL_fileName,
-                                                       None)
-
-                        # Retrieve the CSV for the next month with this
-                        # magnitude's specific naming convention.
-                        request.urlretrieve(earthquake_Custom_siteURL_CSV +
-                                    earthquake_Custom_siteURL_StartTime + key +
-                                    earthquake_Custom_siteURL_EndTime + value +
-                                    earthquake_Custom_siteURL_Min_Magnitude +
-                                    str(2.5), self.csvDirectory +
-                                    downloadedURL_fileName)
-
-                        self.func_Scroll_setOutputText("Download Complete.",
-                                                       None)
-
-                    # If download fails, try one more time (it could have been
-                    # a small, temporary network glitch).
-                    except:
-
-                        self.func_Scroll_setOutputText(
-                            "Download failed, trying again:\n" +
-                            downloadedURL_fileName, color_Orange)
-
-                        sleep(5)
-
-                        # Retrieve the CSV for the next month with this
-                        # magnitude's specific naming convention.
-                        request.urlretrieve(earthquake_Custom_siteURL_CSV +
-                            earthquake_Custom_siteURL_StartTime + key +
-                            earthquake_Custom_siteURL_EndTime + value +
-                            earthquake_Custom_siteURL_Min_Magnitude + str(2.5),
-                            self.csvDirectory + downloadedURL_fileName)
-
-                        self.func_Scroll_setOutputText("Download Complete.",
-                                                       None)
-
-                # If the magnitude drop-down list shows "4.5+"...
-                elif self.stringEarthquakeMagnitude.get() == "4.5+":
-
-                    try:
-
-                        self.func_Scroll_setOutputText("Downloading:\n" +
-                                                       downloadedURL_fileName,
-                                                       None)
-
-                        # Retrieve the CSV for the next month with this
-                        # magnitude's specific naming convention.
-                        request.urlretrieve(earthquake_Custom_siteURL_CSV +
-                                    earthquake_Custom_siteURL_StartTime + key +
-                                    earthquake_Custom_siteURL_EndTime + value +
-                                    earthquake_Custom_siteURL_Min_Magnitude +
-                                    str(4.5), self.csvDirectory +
-                                    downloadedURL_fileName)
-
-                        self.func_Scroll_setOutputText("Download Complete.",
-                                                       None)
-
-                    # If download fails, try one more time (it could have been
-                    # a small, temporary network glitch).
-                    except:
-
-                        self.func_Scroll_setOutputText(
-                            "Download failed, trying again:\n" +
-                            downloadedURL_fileName, color_Orange)
-
-                        sleep(5)
-
-                        # Retrieve the CSV for the next month with this
-                        # magnitude's specific naming convention.
-                        request.urlretrieve(earthquake_Custom_siteURL_CSV +
-                            earthquake_Custom_siteURL_StartTime + key +
-                            earthquake_Custom_siteURL_EndTime + value +
-                            earthquake_Custom_siteURL_Min_Magnitude + str(4.5),
-                            self.csvDirectory + downloadedURL_fileName)
-
-                        self.func_Scroll_setOutputText("Download Complete.",
-                                                       None)
-
-                # If the magnitude drop-down list shows "Custom..."...
-                elif self.stringEarthquakeMagnitude.get() == "Custom...":
-
-                    try:
-
-                        self.func_Scroll_setOutputText("Downloading:\n" +
-                                                       downloadedURL_fileName,
-                                                       None)
-
-                        # Retrieve the CSV for the next month with this
-                        # magnitude's specific naming convention.
-                        request.urlretrieve(earthquake_Custom_siteURL_CSV +
-                                    earthquake_Custom_siteURL_StartTime + key +
-                                    earthquake_Custom_siteURL_EndTime + value +
-                                    earthquake_Custom_siteURL_Min_Magnitude +
-                                    self.minMag + self.maxMag,
-                                    self.csvDirectory + downloadedURL_fileName)
-
-                        self.func_Scroll_setOutputText("Download Complete.",
-                                                       None)
-
-                    # If download fails, try one more time (it could have been
-                    # a small, temporary network glitch).
-                    except:
-
-                        self.func_Scroll_setOutputText(
-                            "Download failed, trying again:\n" +
-                            downloadedURL_fileName, color_Orange)
-
-                        sleep(5)
-
-                        # Retrieve the CSV for the next month with this
-                        # magnitude's specific naming convention.
-                        request.urlretrieve(earthquake_Custom_siteURL_CSV +
-                            earthquake_Custom_siteURL_StartTime + key +
-                            earthquake_Custom_siteURL_EndTime + value +
-                            earthquake_Custom_siteURL_Min_Magnitude +
-                            self.minMag + self.maxMag, self.csvDirectory +
-                            downloadedURL_fileName)
+                if status == "retry":
 
-                        self.func_Scroll_setOutputText("Download Complete.",
-                                                       None)
-
-                # Increment CSV counter.
-                counter_MonthlyCSV = counter_MonthlyCSV + 1
+                    self.func_Scroll_setOutputText(
+                        "Download failed, trying again:\n" + name + "\n" +
+                        message, color_Orange)
 
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(22)
+                else:
 
-            # Create new counter for counting the monthly CSV files during the
-            # append process.
-            counter_MonthlyCSV_ForAppend = 0
+                    self.func_Scroll_setOutputText(
+                        "Download Complete:\n" + name, None)
 
-            # Set Key and Value within dictionary to next Key/Value set.
-            key, value = next(iter(dict.items()))
+            # This function checks one download's rows as they arrive.
+            def func_Check_Query_Rows(lines):
 
-            self.func_Scroll_setOutputText("Appending CSV files while checking "
-                "for missing headers, erroneous lat/long values, and removing "
-                "all non-earthquake events.", None)
+                return func_Filter_Quake_Rows(csv.reader(lines), quake_headers)
 
             # Naming convention of output CSV file for appending.
             self.csv_Check_If_Empty_CSV_Input = self.csvDirectory + usgs + \
                         "_" + quake + "_" + "monthlyCSV_appended_" + \
                         self.only_Mag_Timespan_CurDate + "_checked" + fileExtCSV
 
-            # Create/Open output CSV file for the the append process.
-            csv_OutputFile = open(self.csv_Check_If_Empty_CSV_Input, "a")
-
             # Naming convention for the feature class from CSV naming convention
             # to be used later when the feature class is created.
             self.nameFeatureClass_FromCSV = \
                 usgs + "_" + quake + "_" + self.only_Mag_Timespan_CurDate
 
-            # Create CSV writer to begin writing data to the appended CSV file.
-            csvWriter = csv.writer(csv_OutputFile, quotechar='"', delimiter=',',
-                                   quoting=csv.QUOTE_ALL, skipinitialspace=True,
-                                   lineterminator='\n')
-
-            # Open the first monthly CSV file to be appended to output CSV.
-            csv_InputFile = open(self.csvDirectory + "monthlyCSV_" +
-                        str(counter_MonthlyCSV_ForAppend + 1) + "_" +
-                        str(key).replace("-", "_") + "_to_" +
-                        str(value).replace("-", "_") + fileExtCSV)
-
-            # Read the first monthly CSV file to be appended to output CSV.
-            csv_Reader = csv.reader(csv_InputFile)
-
-            # Properly format first line of CSV to match header formatting.
-            firstLine = str(next(csv_Reader)).replace("'", "").replace(" ", "")
-
-            # If the headers exist within the first line of the CSV...
-            if quake_headers in firstLine:
-
-                # Write the first header row to the CSV file.
-                csvWriter.writerow(quake_headers.split(","))
+            # Create/Open output CSV file for the the append process.
+            with open(self.csv_Check_If_Empty_CSV_Input, "a") as \
+                    csv_OutputFile:
 
-            else:
+                # Create CSV writer to begin writing data to the appended CSV
+                # file.
+                csvWriter = csv.writer(csv_OutputFile, quotechar='"',
+                                       delimiter=',', quoting=csv.QUOTE_ALL,
+                                       skipinitialspace=True,
+                                       lineterminator='\n')
 
-                # Headers are missing in first CSV, so write them anyways.
+                # Write the header row to the CSV file.
                 csvWriter.writerow(quake_headers.split(","))
 
-                # Return the input CSV back to first row. This is necessary if
-                # headers did not already exist within the input CSV.
-                csv_InputFile.seek(0)
-
-            # For each row within the first monthly CSV...
-            for row in csv_Reader:
-
-                # If entire row is not empty and lat/long columns and magnitude
-                # column are not blank...
-                if row and row[1] != "" and row[2] != "" and row[4] != "":
-
-                    # If lat/long columns aren't showing 0,0 coordinates...
-                    if (row[1] != "0" or row[1] != "0.0") and \
-                            (row[2] != "0" or row[2] != "0.0"):
-
-                        # If lat/long columns are within appropriate range...
-                        if float(row[1]) >= -90.0 and float(row[1]) <= 90.0 and\
-                            float(row[2]) >= -180.0 and float(row[2]) <= 180.0:
-
-                            # If the earthquake type is an actual earthquake...
-                            if str(row[14]).lower() == csv_Parameter_Earthquake:
-
-                                # Write the row to the appended CSV file.
-                                csvWriter.writerow(row)
-
-            # Increment counter for monthly CSV file.
-            counter_MonthlyCSV_ForAppend = counter_MonthlyCSV_ForAppend + 1
+                # Download the time windows a few at a time (each one is
+                # retried with an increasing wait if it fails). Each window's
+                # rows are checked as they arrive, then appended in time
+                # order, so no intermediate CSV files are written.
+                for rows in func_Stream_Chunks(
+                        list_Query_URLs, list_Query_Names,
+                        func_Check_Query_Rows,
+                        func_Progress=func_Report_Download):
 
-            # Close the first monthly CSV file.
-            csv_InputFile.close()
+                    csvWriter.writerows(rows)
 
-            # For each monthly CSV file to be appended...
-            for num in range(1, counter_MonthlyCSV):
-
-                # Open the next monthly CSV file.
-                csv_NextFile = open(self.csvDirectory + "monthlyCSV_" +
-                    str(counter_MonthlyCSV_ForAppend + 1) + "_" +
-                    str(list(dict.keys())[num]).replace("-","_") + "_to_" +
-                    str(list(dict.values())[num]).replace("-", "_") +
-                    fileExtCSV)
-
-                # Read the next monthly CSV file.
-                csv_Next_Reader = csv.reader(csv_NextFile)
-
-                # Properly format first line of next CSV to match header
-                # formatting.
-                firstLine_nextCSV = \
-                    str(next(csv_Next_Reader)).replace("'", "").replace(" ", "")
-
-                # If the headers exist within the first line of the next CSV...
-                if quake_headers in firstLine_nextCSV:
-
-                    # Skip the row and don't add to appended CSV.
-                    pass
-
-                else:
-
-                    # If headers are missing, return the next CSV back to first
-                    # row so that the first row doesn't get skipped in the next
-                    # step.
-                    csv_NextFile.seek(0)
-
-                # For each row within the next monthly CSV...
-                for row in csv_Next_Reader:
-
-                    # If entire row is not empty and lat/long columns and
-                    # magnitude column are not blank...
-                    if row and row[1] != "" and row[2] != "" and row[4] != "":
-
-                        # If lat/long columns aren't showing 0,0 coordinates...
-                        if (row[1] != "0" or row[1] != "0.0") and \
-                                (row[2] != "0" or row[2] != "0.0"):
-
-                            # If lat/long columns are within appropriate range..
-                            if float(row[1]) >= -90.0 and \
-                                float(row[1]) <= 90.0 and \
-                                float(row[2]) >= -180.0 and \
-                                float(row[2]) <= 180.0:
-
-                                # If the earthquake type is an actual
-                                # earthquake...
-                                if str(row[14]).lower() == \
-                                        csv_Parameter_Earthquake:
-
-                                    # Append the row to the output appended CSV.
-                                    csvWriter.writerow(row)
-
-                # Close that next CSV file.
-                csv_NextFile.close()
-
-                # Increment the counter for the next monthly CSV file to be
-                # appended.
-                counter_MonthlyCSV_ForAppend = counter_MonthlyCSV_ForAppend + 1
-
-            # Close the output CSV file for appending once all monthly CSV files
-            # have been appended.
-            csv_OutputFile.close()
-
-            self.func_Scroll_setOutputText(str(counter_MonthlyCSV) +
-                                " CSV files were appended and checked.", None)
+            self.func_Scroll_setOutputText(str(counter_Queries) +
+                                " queries were appended and checked.", None)
 
             # Increment progress bar.
             self.func_ProgressBar_setProgress(25)
@@ -3227,10 +3008,6 @@ class EarthquakeOptions(FrameLifts):
                             "All additional processes may take considerable "
                             "time to complete.", color_Orange)
 
-                        # Pause the script for five seconds to allow the user
-                        # ample time to read the message.
-                        sleep(5)
-
                     # Increment progress bar.
                     self.func_ProgressBar_setProgress(28)
 
@@ -3297,9 +3074,6 @@ class EarthquakeOptions(FrameLifts):
             # Increment progress bar.
             self.func_ProgressBar_setProgress(31)
 
-            # Pause script for half a second.
-            sleep(0.5)
-
             self.func_Scroll_setOutputText("Creating File GDB...", None)
 
             # Create File GDB within the GIS subfolder.
@@ -3632,15 +3406,14 @@ class EarthquakeOptions(FrameLifts):
             # If the radio button is USA...
             if self.radioButton_Selection == 1:
 
-                # Execute function that downloads/unzips the Census Bureau's
-                # Shapefile.
-                self.func_Download_Unzip_Census_Shapefile()
+                # Execute function that builds (first run only) the county
+                # store from the Census Bureau's Shapefile.
+                self.func_Prepare_County_Store()
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract the 50 states and Washington DC only.
                 self.func_Extract_50_States_and_DC_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Then execute function to clip earthquake features to the
@@ -3661,15 +3434,14 @@ class EarthquakeOptions(FrameLifts):
             # If the radio button is State...
             elif self.radioButton_Selection == 2:
 
-                # Execute function that downloads/unzips the Census Bureau's
-                # Shapefile.
-                self.func_Download_Unzip_Census_Shapefile()
+                # Execute function that builds (first run only) the county
+                # store from the Census Bureau's Shapefile.
+                self.func_Prepare_County_Store()
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract state selection only.
                 self.func_Extract_State_Selection_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Then execute function to clip earthquake features to the
@@ -3690,15 +3462,14 @@ class EarthquakeOptions(FrameLifts):
             # If the radio button is County...
             elif self.radioButton_Selection == 3:
 
-                # Execute function that downloads/unzips the Census Bureau's
-                # Shapefile.
-                self.func_Download_Unzip_Census_Shapefile()
+                # Execute function that builds (first run only) the county
+                # store from the Census Bureau's Shapefile.
+                self.func_Prepare_County_Store()
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract the county selection only.
                 self.func_Extract_County_Selection_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Then execute function to clip earthquake features to the
@@ -3747,16 +3518,13 @@ class EarthquakeOptions(FrameLifts):
             # Increment progress bar.
             self.func_ProgressBar_setProgress(43)
 
-            # Pause script for half a second.
-            sleep(0.5)
-
             try:
 
                 self.func_Scroll_setOutputText(
                     "Downloading US Census Shapefile...", None)
 
                 # Attempt to download the Shapefile.
-                request.urlretrieve(census_URL_CountyShapefile,
+                func_Cache_Retrieve(census_URL_CountyShapefile,
                                     self.subFolder_CensusShapefile + "/" +
                                     census_URL_CountyShapefile_FileName +
                                     fileExtZip)
@@ -3774,7 +3542,7 @@ class EarthquakeOptions(FrameLifts):
                 sleep(5)
 
                 # Attempt to download the Shapefile.
-                request.urlretrieve(census_URL_CountyShapefile,
+                func_Cache_Retrieve(census_URL_CountyShapefile,
                                     self.subFolder_CensusShapefile + "/" +
                                     census_URL_CountyShapefile_FileName +
                                     fileExtZip)
@@ -3785,9 +3553,6 @@ class EarthquakeOptions(FrameLifts):
             # Increment progress bar.
             self.func_ProgressBar_setProgress(49)
 
-            # Pause script for half a second.
-            sleep(0.5)
-
             self.func_Scroll_setOutputText(
                 "Unzipping US Census Shapefile...", None)
 
@@ -3835,141 +3600,94 @@ class EarthquakeOptions(FrameLifts):
                                            "Traceback: " +
                                            traceback.format_exc(), color_Red)
 
-    def func_Extract_50_States_and_DC_Only(self, censusShapefile, fileGDB_Path):
+    def func_Prepare_County_Store(self):
 
-        # This function controls the process of extracting the 50 states and
-        # Washington DC from the Census Bureau's Shapefile and performing
-        # various modifications to that data.
+        # This function controls the county store, which holds the 50 states
+        # and DC counties already projected to the designated PCS and indexed
+        # by state FIPS code and county name. It is built once from the Census
+        # Bureau's Shapefile and then reused by every run, so the Census
+        # Shapefile is only downloaded when the county store doesn't exist.
 
         try:
 
-            self.func_Scroll_setOutputText(
-                "Copying Census Shapefile to File GDB...", None)
-
-            # Copy the Census Shapefile to a feature class within the File GDB.
-            arcpy.CopyFeatures_management(censusShapefile,
-                        fileGDB_Path + "/" + featureClass_50States_and_DC_only)
-
-            # Display geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "Census Shapefile copied to File GDB.", None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(55)
-
-            # Pause script for one second.
-            sleep(1)
-
-            self.func_Scroll_setOutputText(
-                "Extracting 50 States and DC from Feature Class...", None)
-
-            # Open the Census feature class with an Update Cursor.
-            # Attribute field set to the state's FIPS code.
-            with arcpy.da.UpdateCursor(fileGDB_Path + "/" +
-                                    featureClass_50States_and_DC_only,
-                                    census_Shapefile_Field_StateFIPS) as cursor:
-
-                # For each feature in the Census feature class.
-                for row in cursor:
+            # Assign the county store's feature class to variable.
+            self.countyStore = func_County_Store_Path(
+                census_URL_CountyShapefile_FileName)
 
-                    # This If statement removes non-50 state (and DC) FIPS codes
-                    # from the Census feature class. The original data includes
-                    # all US territories, and those FIPS codes must be removed.
-                    if row[0] == "60" or row[0] == "66" or row[0] == "69" or \
-                                    row[0] == "72" or row[0] == "78":
+            # If the county store has already been built...
+            if func_County_Store_Exists(census_URL_CountyShapefile_FileName):
 
-                        # Delete polygon feature.
-                        cursor.deleteRow()
+                self.func_Scroll_setOutputText("County store found (" +
+                                               self.countyStore + ").", None)
 
-            # Display geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "50 States and DC extracted from Feature Class.", None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(56)
+            else:
 
-            # Set the workspace within the File GDB for the following tasks.
-            arcpy.env.workspace = fileGDB_Path
+                self.func_Scroll_setOutputText(
+                    "County store not found, building it (one time only)...",
+                    None)
 
-            # Set naming convention variable for projecting Census feature
-            # class.
-            self.featureClass_Polygons_Projected = \
-                featureClass_50States_and_DC_only + "_Projected"
+                # Execute function that downloads/unzips the Census Bureau's
+                # Shapefile.
+                self.func_Download_Unzip_Census_Shapefile()
 
-            self.func_Scroll_setOutputText("Projecting feature class to PCS " +
+                self.func_Scroll_setOutputText("Projecting counties to PCS " +
                             pcsReferenceString +
-                            " with Central Meridian Offset (-30.0 degrees)...",
-                            None)
+                            " with Central Meridian Offset (-30.0 degrees) "
+                            "and indexing...", None)
 
-            # Project the Census feature class to the designated PCS as a new
-            # feature class within the File GDB.
-            arcpy.Project_management(featureClass_50States_and_DC_only,
-                                     self.featureClass_Polygons_Projected,
-                                     pcsReference)
+                # Build the county store from the Census Shapefile.
+                func_Build_County_Store(self.subFolder_CensusShapefile + "/" +
+                                        census_URL_CountyShapefile_FileName +
+                                        fileExtShp,
+                                        census_URL_CountyShapefile_FileName,
+                                        pcsReference)
 
-            # Display geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+                # Display geoprocessing messages.
+                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-            self.func_Scroll_setOutputText("PCS Projection to " +
-                                           pcsReferenceString + " completed.",
-                                           None)
+                self.func_Scroll_setOutputText("County store built (" +
+                                               self.countyStore + ").", None)
 
             # Increment progress bar.
-            self.func_ProgressBar_setProgress(57)
+            self.func_ProgressBar_setProgress(55)
 
-            self.func_Scroll_setOutputText(
-                "Recalculating extent for feature class...", None)
+        except arcpy.ExecuteError:
 
-            # Recalculate extent of the projected Census feature class.
-            arcpy.RecalculateFeatureClassExtent_management(
-                self.featureClass_Polygons_Projected)
+            # Display geoprocessing error messages.
+            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
 
-            # Display geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+        except Exception as e:
 
-            self.func_Scroll_setOutputText("Feature class extent recalculated.",
-                                           None)
+            # Display error messages for all other errors.
+            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
+                                           "Traceback: " +
+                                           traceback.format_exc(), color_Red)
 
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(58)
+    def func_Extract_50_States_and_DC_Only(self, countyStore, fileGDB_Path):
 
-            self.func_Scroll_setOutputText("Deleting feature class " +
-                                           featureClass_50States_and_DC_only +
-                                           " from File GDB...", None)
+        # This function controls the process of extracting the 50 states and
+        # Washington DC from the county store. The county store's polygons are
+        # already limited to the 50 states and DC and projected to the
+        # designated PCS, so they are copied straight into the File GDB.
 
-            # Delete the original, pre-projected Census feature class from the
-            # File GDB. It is no longer needed.
-            arcpy.Delete_management(featureClass_50States_and_DC_only)
+        try:
 
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+            # Set the workspace within the File GDB for the following tasks.
+            arcpy.env.workspace = fileGDB_Path
 
             self.func_Scroll_setOutputText(
-                "Feature class deleted from File GDB.", None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(59)
-
-            self.func_Scroll_setOutputText("Renaming feature class " +
-                                    self.featureClass_Polygons_Projected +
-                                    " back to " +
-                                    featureClass_50States_and_DC_only + "...",
-                                    None)
+                "Extracting 50 States and DC from county store...", None)
 
-            # Rename the projected Census feature class to the original naming
-            # convention of the feature class that was just deleted.
-            arcpy.Rename_management(self.featureClass_Polygons_Projected,
-                                    featureClass_50States_and_DC_only)
+            # Copy the projected counties from the county store to a feature
+            # class within the File GDB.
+            func_Extract_County_Mask(countyStore, fileGDB_Path + "/" +
+                                     featureClass_50States_and_DC_only)
 
-            # Get geoprocessing messages.
+            # Display geoprocessing messages.
             self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-            self.func_Scroll_setOutputText("Feature class has been renamed.",
-                                           None)
+            self.func_Scroll_setOutputText(
+                "50 States and DC extracted from county store.", None)
 
             # Increment progress bar.
             self.func_ProgressBar_setProgress(60)
@@ -3986,143 +3704,82 @@ class EarthquakeOptions(FrameLifts):
                                            "Traceback: " +
                                            traceback.format_exc(), color_Red)
 
-    def func_Extract_State_Selection_Only(self, censusShapefile, fileGDB_Path):
+    def func_Extract_State_Selection_Only(self, countyStore, fileGDB_Path):
 
         # This function controls the process of extracting the user-selected
-        # state from the Census Bureau's Shapefile and performing various
-        # modifications to that data.
+        # state from the county store. The state's counties are looked up by
+        # state FIPS code and are already projected to the designated PCS.
 
         try:
 
-            self.func_Scroll_setOutputText(
-                "Copying Census Shapefile to File GDB...", None)
-
-            # Copy the Census Shapefile to a feature class within the File GDB.
-            arcpy.CopyFeatures_management(censusShapefile, fileGDB_Path + "/" +
-                                        self.featureClass_State_Selection_Only)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "Census Shapefile copied to File GDB.", None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(55)
-
-            # Pause script for one second.
-            sleep(1)
-
-            self.func_Scroll_setOutputText("Extracting state selection(" +
-                                           self.stringState_Name.get() +
-                                           ") from Feature Class...", None)
-
-            # Open the Census feature class with an Update Cursor.
-            # Attribute field set to the state's FIPS code.
-            with arcpy.da.UpdateCursor(fileGDB_Path + "/" +
-                                    self.featureClass_State_Selection_Only,
-                                    census_Shapefile_Field_StateFIPS) as cursor:
-
-                # For each feature in the Census feature class...
-                for row in cursor:
-
-                    # This If statement removes all polygons not affiliated with
-                    # the user-selected state's FIPS code. This is accessed
-                    # from the state name/state FIPS dictionary.
-                    if row[0] != \
-                    dict_StateName_StateFIPs.get(self.stringState_Name.get()):
-
-                        # Delete polygon feature.
-                        cursor.deleteRow()
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("State selection(" +
-                                        self.stringState_Name.get() +
-                                        ") extracted from Feature Class.", None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(56)
-
             # Set workspace for the following tasks.
             arcpy.env.workspace = fileGDB_Path
 
-            # Set naming convention variable for projecting Census feature
-            # class.
-            self.featureClass_Polygons_Projected = \
-                self.featureClass_State_Selection_Only + "_Projected"
-
-            self.func_Scroll_setOutputText("Projecting feature class to PCS " +
-                            pcsReferenceString +
-                            " with Central Meridian Offset (-30.0 degrees)...",
-                            None)
+            self.func_Scroll_setOutputText("Extracting state selection(" +
+                                           self.runParams.state_Name +
+                                           ") from county store...", None)
 
-            # Project the Census feature class to the designated PCS as a new
-            # feature class within the File GDB.
-            arcpy.Project_management(self.featureClass_State_Selection_Only,
-                                     self.featureClass_Polygons_Projected,
-                                     pcsReference)
+            # Copy the user-selected state's projected counties from the county
+            # store to a feature class within the File GDB. The state's FIPS
+            # code is accessed from the state name/state FIPS dictionary.
+            func_Extract_County_Mask(countyStore, fileGDB_Path + "/" +
+                                     self.featureClass_State_Selection_Only,
+                                     dict_StateName_StateFIPs.get(
+                                         self.runParams.state_Name))
 
             # Get geoprocessing messages.
             self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-            self.func_Scroll_setOutputText("PCS Projection to " +
-                                           pcsReferenceString + " completed.",
+            self.func_Scroll_setOutputText("State selection(" +
+                                           self.runParams.state_Name +
+                                           ") extracted from county store.",
                                            None)
 
             # Increment progress bar.
-            self.func_ProgressBar_setProgress(57)
-
-            self.func_Scroll_setOutputText(
-                                    "Recalculating extent for feature class...",
-                                    None)
-
-            # Recalculate extent of the projected Census feature class.
-            arcpy.RecalculateFeatureClassExtent_management(
-                                        self.featureClass_Polygons_Projected)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+            self.func_ProgressBar_setProgress(60)
 
-            self.func_Scroll_setOutputText("Feature class extent recalculated.",
-                                           None)
+        except arcpy.ExecuteError:
 
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(58)
+            # Display geoprocessing error messages.
+            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
 
-            self.func_Scroll_setOutputText("Deleting feature class " +
-                                    self.featureClass_State_Selection_Only  +
-                                    " from File GDB...", None)
+        except Exception as e:
 
-            # Delete the original, pre-projected Census feature class from the
-            # File GDB. It is no longer needed.
-            arcpy.Delete_management(self.featureClass_State_Selection_Only )
+            # Display error messages for all other errors.
+            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
+                                           "Traceback: " +
+                                           traceback.format_exc(), color_Red)
 
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+    def func_Extract_County_Selection_Only(self, countyStore, fileGDB_Path):
 
-            self.func_Scroll_setOutputText(
-                "Feature class deleted from File GDB.", None)
+        # This function controls the process of extracting the user-selected
+        # county from the county store. The county is looked up by state FIPS
+        # code and county name and is already projected to the designated PCS.
 
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(59)
+        try:
 
-            self.func_Scroll_setOutputText("Renaming feature class " +
-                                self.featureClass_Polygons_Projected +
-                                " back to " +
-                                self.featureClass_State_Selection_Only + "...",
-                                None)
+            # Set workspace for the following tasks.
+            arcpy.env.workspace = fileGDB_Path
 
-            # Rename the projected Census feature class to the original naming
-            # convention of the feature class that was just deleted.
-            arcpy.Rename_management(self.featureClass_Polygons_Projected,
-                                    self.featureClass_State_Selection_Only)
+            self.func_Scroll_setOutputText("Extracting (" +
+                                           self.runParams.county_Name +
+                                           ", " + self.runParams.state_Name +
+                                           ") from county store...", None)
+
+            # Copy the user-selected county's projected polygon from the county
+            # store to a feature class within the File GDB.
+            func_Extract_County_Mask(countyStore, fileGDB_Path + "/" +
+                                     self.featureClass_County_State_Naming,
+                                     dict_StateName_StateFIPs.get(
+                                         self.runParams.state_Name),
+                                     self.runParams.county_Name)
 
             # Get geoprocessing messages.
             self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-            self.func_Scroll_setOutputText("Feature class has been renamed.",
+            self.func_Scroll_setOutputText(self.runParams.county_Name + ", " +
+                                           self.runParams.state_Name +
+                                           " extracted from county store.",
                                            None)
 
             # Increment progress bar.
@@ -4140,204 +3797,34 @@ class EarthquakeOptions(FrameLifts):
                                            "Traceback: " +
                                            traceback.format_exc(), color_Red)
 
-    def func_Extract_County_Selection_Only(self, censusShapefile, fileGDB_Path):
+    def func_FeatureClass_Clip(self, inputFC, clipFC, outputFC_Name):
 
-        # This function controls the process of extracting the user-selected
-        # county from the Census Bureau's Shapefile and performing various
-        # modifications to that data.
+        # This function controls the processes involved with clipping the
+        # earthquake point feature class to the user-selected Census polygon
+        # boundary feature class.
 
         try:
 
-            self.func_Scroll_setOutputText(
-                "Copying Census Shapefile to File GDB...", None)
-
-            # Copy the Census Shapefile to a feature class within the File GDB.
-            arcpy.CopyFeatures_management(censusShapefile, fileGDB_Path + "/" +
-                                          self.featureClass_County_State_Naming)
+            # Set the workspace to the File GDB for the following tasks.
+            arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
 
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+            # Set a new variable name for clipping based on this argument.
+            self.clipped_Output_FeatureClass = outputFC_Name
 
-            self.func_Scroll_setOutputText(
-                "Census Shapefile copied to File GDB.", None)
+            # If the user selects USA...
+            if self.radioButton_Selection == 1:
 
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(55)
+                # Display this particular message before executing the clip.
+                self.func_Scroll_setOutputText(
+                    "Clipping earthquake features to 50 states and DC...", None)
 
-            # Pause script for one second.
-            sleep(1)
-
-            self.func_Scroll_setOutputText("Extracting (" +
-                                           self.stringCounty_Name.get() +
-                                           ", " + self.stringState_Name.get() +
-                                           ") from Feature Class...", None)
-
-            # Open the Census feature class with an Update Cursor.
-            # Field names set to the state's FIPS code and county names.
-            with arcpy.da.UpdateCursor(fileGDB_Path + "/" +
-                                self.featureClass_County_State_Naming,
-                                field_names=[census_Shapefile_Field_StateFIPS,
-                                census_Shapefile_Field_CountyName]) as cursor:
-
-                # For each feature in the Census feature class...
-                for row in cursor:
-
-                    # If the feature's state FIPS code matches the user-selected
-                    # state's FIPS code...
-                    if row[0] == dict_StateName_StateFIPs.get(
-                            self.stringState_Name.get()):
-
-                        # If the feature's county name matches the user-selected
-                        # county name within the matching state FIPS code...
-                        if row[1] == self.stringCounty_Name.get():
-
-                            # Do nothing, leave that record within the feature
-                            # class.
-                            pass
-
-                        else:
-
-                            # Delete the feature from the feature class, as it
-                            # is not a match.
-                            cursor.deleteRow()
-
-                    else:
-
-                        # Else, delete the feature as the state FIPS code does
-                        # not match the user-selected state.
-                        cursor.deleteRow()
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(self.stringCounty_Name.get() + ", " +
-                                        self.stringState_Name.get() +
-                                        " extracted from Feature Class.", None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(56)
-
-            # Set workspace for the following tasks.
-            arcpy.env.workspace = fileGDB_Path
-
-            # Set naming convention variable for projecting Census feature
-            # class.
-            self.featureClass_Polygons_Projected = \
-                self.featureClass_County_State_Naming + "_Projected"
-
-            self.func_Scroll_setOutputText("Projecting feature class to PCS " +
-                    pcsReferenceString +
-                    " with Central Meridian Offset (-30.0 degrees)...", None)
-
-            # Project the Census feature class to the designated PCS as a new
-            # feature class within the File GDB.
-            arcpy.Project_management(self.featureClass_County_State_Naming,
-                                     self.featureClass_Polygons_Projected,
-                                     pcsReference)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("PCS Projection to " +
-                                           pcsReferenceString + " completed.",
-                                           None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(57)
-
-            self.func_Scroll_setOutputText(
-                "Recalculating extent for feature class...", None)
-
-            # Recalculate extent of the projected Census feature class.
-            arcpy.RecalculateFeatureClassExtent_management(
-                self.featureClass_Polygons_Projected)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("Feature class extent recalculated.",
-                                           None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(58)
-
-            self.func_Scroll_setOutputText("Deleting feature class " +
-                                        self.featureClass_County_State_Naming  +
-                                        " from File GDB...", None)
-
-            # Delete the original, pre-projected Census feature class from the
-            # File GDB. It is no longer needed.
-            arcpy.Delete_management(self.featureClass_County_State_Naming )
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "Feature class deleted from File GDB.", None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(59)
-
-            self.func_Scroll_setOutputText("Renaming feature class " +
-                                self.featureClass_Polygons_Projected +
-                                " back to " +
-                                self.featureClass_County_State_Naming + "...",
-                                None)
-
-            # Rename the projected Census feature class to the original naming
-            # convention of the feature class that was just deleted.
-            arcpy.Rename_management(self.featureClass_Polygons_Projected,
-                                    self.featureClass_County_State_Naming)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("Feature class has been renamed.",
-                                           None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(60)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing error messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-        except Exception as e:
-
-            # Display error messages for all other errors.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-    def func_FeatureClass_Clip(self, inputFC, clipFC, outputFC_Name):
-
-        # This function controls the processes involved with clipping the
-        # earthquake point feature class to the user-selected Census polygon
-        # boundary feature class.
-
-        try:
-
-            # Set the workspace to the File GDB for the following tasks.
-            arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-            # Set a new variable name for clipping based on this argument.
-            self.clipped_Output_FeatureClass = outputFC_Name
-
-            # If the user selects USA...
-            if self.radioButton_Selection == 1:
-
-                # Display this particular message before executing the clip.
-                self.func_Scroll_setOutputText(
-                    "Clipping earthquake features to 50 states and DC...", None)
-
-            # If the user selects State...
-            elif self.radioButton_Selection == 2:
+            # If the user selects State...
+            elif self.radioButton_Selection == 2:
 
                 # Display this particular message before executing the clip.
                 self.func_Scroll_setOutputText(
                     "Clipping earthquake features to state selection(" +
-                    self.stringState_Name.get() + ")...", None)
+                    self.runParams.state_Name + ")...", None)
 
             # If the user selects County...
             elif self.radioButton_Selection == 3:
@@ -4345,8 +3832,8 @@ class EarthquakeOptions(FrameLifts):
                 # Display this particular message before executing the clip.
                 self.func_Scroll_setOutputText(
                     "Clipping earthquake features to " +
-                    self.stringCounty_Name.get() + ", " +
-                    self.stringState_Name.get() + "...", None)
+                    self.runParams.county_Name + ", " +
+                    self.runParams.state_Name + "...", None)
 
             # Perform a clip of the earthquake point features to the specified
             # polygon boundary.
@@ -4369,7 +3856,7 @@ class EarthquakeOptions(FrameLifts):
                 # Display this particular message after executing the clip.
                 self.func_Scroll_setOutputText("Earthquake features have been "
                                                "clipped to state selection(" +
-                                               self.stringState_Name.get() +
+                                               self.runParams.state_Name +
                                                ").", None)
 
             # If the user selects County...
@@ -4377,8 +3864,8 @@ class EarthquakeOptions(FrameLifts):
 
                 # Display this particular message after executing the clip.
                 self.func_Scroll_setOutputText("Earthquake features have been "
-                                "clipped to " + self.stringCounty_Name.get() +
-                                ", " + self.stringState_Name.get() + ".", None)
+                                "clipped to " + self.runParams.county_Name +
+                                ", " + self.runParams.state_Name + ".", None)
 
             # Increment progress bar.
             self.func_ProgressBar_setProgress(64)
@@ -4426,7 +3913,7 @@ class EarthquakeOptions(FrameLifts):
             # Display this particular message with earthquake count value.
             self.func_Scroll_setOutputText(str(self.clipped_earthquakeCount) +
                                     " earthquake features observed within " +
-                                    self.stringState_Name.get() + ".", None)
+                                    self.runParams.state_Name + ".", None)
 
         # If user selects County...
         if self.radioButton_Selection == 3:
@@ -4434,15 +3921,12 @@ class EarthquakeOptions(FrameLifts):
             # Display this particular message with earthquake count value.
             self.func_Scroll_setOutputText(str(self.clipped_earthquakeCount) +
                                     " earthquake features observed within " +
-                                    self.stringCounty_Name.get() + ", " +
-                                    self.stringState_Name.get() + ".", None)
+                                    self.runParams.county_Name + ", " +
+                                    self.runParams.state_Name + ".", None)
 
         # Increment progress bar.
         self.func_ProgressBar_setProgress(67)
 
-        # Pause script for one second.
-        sleep(1)
-
         # If zero earthquake features present within the feature class...
         if self.clipped_earthquakeCount < 1:
 
@@ -4488,7 +3972,7 @@ class EarthquakeOptions(FrameLifts):
         try:
 
             # If the user chooses to output the count results to CSV file...
-            if self.statusAnalysis_OutputToCSVFile.get() == 1:
+            if "OutputToCSVFile" in self.runParams.analysis_Options:
 
                 # Set the workspace for the following analysis.
                 arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
@@ -4512,51 +3996,47 @@ class EarthquakeOptions(FrameLifts):
                                    self.folderNamingAddition + fileExtCSV, "w")
 
                     # If timespan and magnitude drop-downs don't show Custom...
-                    if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                            self.stringEarthquakeMagnitude.get() != "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                self.stringEarthquakeTimespan.get() + ",\n")
+                                self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                self.stringEarthquakeMagnitude.get() + ",\n")
+                                self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan drop-down shows Custom and magnitude doesn't..
-                    if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                            self.stringEarthquakeMagnitude.get() != "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # WRite the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                        self.textCustomMonthFrom.zfill(2) +
-                                        "-" + self.textCustomYearTo +
-                                        self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                self.stringEarthquakeMagnitude.get() + ",\n")
+                                self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan and magnitude drop-downs both show Custom...
-                    if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                            self.stringEarthquakeMagnitude.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                      self.textCustomMagFrom + "-" +
-                                      self.textCustomMagTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # If timespan drop-down doesn't show Custom and Magnitude
                     # does...
-                    if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                        self.stringEarthquakeMagnitude.get() == "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                         #Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                    self.stringEarthquakeTimespan.get() + ",\n")
+                                    self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                      self.textCustomMagFrom + "-" +
-                                      self.textCustomMagTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # Now write the following lines, regardless of
                     # timespan/magnitude selection.
@@ -4572,49 +4052,25 @@ class EarthquakeOptions(FrameLifts):
                                   "Mean Magnitude,Median Magnitude,"
                                   "Mode Magnitude,\n")
 
-                    # Create empty list to store all US magnitude values.
-                    magList_US = []
-
-                    # Open the in_memory spatial join as a Search Cursor,
-                    # with analysis fields set to FIPS code and magnitude.
-                    with arcpy.da.SearchCursor("in_memory/SpatialJoin",
-                                            [census_Shapefile_Field_StateFIPS,
-                                             analysis_Mag_Field]) as cursor:
-
-                        # For each feature within the spatial join...
-                        for row in cursor:
-
-                            # Add the magnitude to the US list.
-                            magList_US.append(row[1])
-
-                    try:
-
-                        # Calculate mode of all magnitudes within US list.
-                        modeValue_US = mode(magList_US)
+                    # Read the FIPS code and magnitude fields of the in_memory
+                    # spatial join into arrays (one scan for all statistics).
+                    joinArray = arcpy.da.FeatureClassToNumPyArray(
+                        "in_memory/SpatialJoin",
+                        [census_Shapefile_Field_StateFIPS, analysis_Mag_Field])
 
-                        # Convert mode information to float and then to
-                        # string with two decimal places.
-                        modeString_US = \
-                            str("{0:.2f}".format(float(modeValue_US)))
-
-                    except StatisticsError:
-
-                        # This catches any lists containing no mode.
-                        # This will occur if all values within list are
-                        # unique values.
-
-                        # Assign mode to the following phrase.
-                        modeString_US = "No Unique Mode"
-
-                        pass
+                    # Calculate statistics of all magnitudes within the US.
+                    stats_US = func_Value_Statistics(
+                        joinArray[analysis_Mag_Field])
 
                     # Write the following data to the data counts CSV.
-                    # Min mag, max mag, mean mag, median mag, and mode mag.
-                    csvFile.write(str(min(magList_US)) + "," +
-                            str(max(magList_US)) + "," +
-                            str("{0:.2f}".format(numpy.mean(magList_US)) + "," +
-                            str("{0:.2f}".format(numpy.median(magList_US))) +
-                            "," + modeString_US + "," + ",\n"))
+                    # Min magnitude, max magnitude, mean magnitude, median
+                    # magnitude, and mode magnitude.
+                    csvFile.write(str(stats_US.minimum) + "," +
+                                  str(stats_US.maximum) + "," +
+                                  str("{0:.2f}".format(stats_US.mean)) + "," +
+                                  str("{0:.2f}".format(stats_US.median)) +
+                                  "," + func_Mode_String(stats_US.mode) + "," +
+                                  ",\n")
 
                     csvFile.write("\n")
                     csvFile.write("Earthquake Data per State,\n")
@@ -4624,78 +4080,37 @@ class EarthquakeOptions(FrameLifts):
                                   "Mean Magnitude,Median Magnitude,"
                                   "Mode Magnitude,State FIPS Code,\n")
 
-                    # Create empty list for storing earthquake/magnitude values.
-                    magList_State = []
+                    # Calculate statistics of the magnitudes within each state
+                    # (one pass over the arrays, grouped by FIPS code).
+                    stats_PerState = func_Group_Statistics(
+                        joinArray[census_Shapefile_Field_StateFIPS],
+                        joinArray[analysis_Mag_Field])
 
                     # For each state value in the ordered dictionary...
                     for key in dictKeys_OrderedDict_StateNames:
 
-                        # Set counter to zero, for counting earthquakes within
-                        # each state during loop.
-                        counter = 0
-
-                        # Clears magList_State after each state count has
-                        # concluded.
-                        magList_State.clear()
-
-                        # Open the in_memory spatial join as a Search Cursor,
-                        # with analysis fields set to FIPS code and magnitude.
-                        with arcpy.da.SearchCursor("in_memory/SpatialJoin",
-                                            [census_Shapefile_Field_StateFIPS,
-                                             analysis_Mag_Field]) as cursor:
-
-                            # For each feature within the spatial join...
-                            for row in cursor:
-
-                                # If FIPS code matches a state in the ordered
-                                # dictionary...
-                                if row[0] == \
-                                        dictKeys_OrderedDict_StateNames[key]:
-
-                                    # Append row information to magList_State.
-                                    magList_State.append(row[1])
-
-                                    # Increment counter by one.
-                                    counter = counter + 1
-
-                        # If counter is greater than zero...
-                        if counter > 0:
-
-                            try:
-
-                                # Calculate mode of all magnitudes within list.
-                                modeValue_State = mode(magList_State)
-
-                                # Convert mode information to float and then to
-                                # string with two decimal places.
-                                modeString_State = \
-                                    str("{0:.2f}".format(
-                                        float(modeValue_State)))
-
-                            except StatisticsError:
-
-                                # This catches any lists containing no mode.
-                                # This will occur if all values within list are
-                                # unique values.
-
-                                # Assign mode  to the following phrase.
-                                modeString_State = "No Unique Mode"
+                        # Statistics for the state's FIPS code (None if the
+                        # state has no earthquakes).
+                        stats_State = stats_PerState.get(
+                            dictKeys_OrderedDict_StateNames[key])
 
-                                pass
+                        # If the state has any earthquakes...
+                        if stats_State is not None:
 
                             # Write the following data to the data counts CSV.
                             # State name, how many earthquakes, min mag, max
                             # mag, mean mag, median mag, mode mag, and FIPs.
-                            csvFile.write(str(key) + "," + str(counter) +
-                                "," + str(min(magList_State)) + "," +
-                                str(max(magList_State)) + "," +
-                                str("{0:.2f}".format(
-                                    numpy.mean(magList_State)) + "," +
-                                str("{0:.2f}".format(
-                                    numpy.median(magList_State))) + "," +
-                                modeString_State + "," +
+                            csvFile.write(str(key) + "," +
+                                str(stats_State.count) + "," +
+                                str(stats_State.minimum) + "," +
+                                str(stats_State.maximum) + "," +
+                                str("{0:.2f}".format(stats_State.mean)) +
+                                "," +
+                                str("{0:.2f}".format(stats_State.median)) +
+                                "," + func_Mode_String(stats_State.mode) +
+                                "," +
                                 str(dictKeys_OrderedDict_StateNames[key]) +
-                                ",\n"))
+                                ",\n")
 
                     # Close the data counts CSV file.
                     csvFile.close()
@@ -4724,53 +4139,49 @@ class EarthquakeOptions(FrameLifts):
                                    self.folderNamingAddition + fileExtCSV, "w")
 
                     # If timespan and magnitude drop-downs don't show Custom...
-                    if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                            self.stringEarthquakeMagnitude.get() != "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                self.stringEarthquakeTimespan.get() + ",\n")
+                                self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                self.stringEarthquakeMagnitude.get() + ",\n")
+                                self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan drop-down shows Custom and magnitude drop-down
                     # doesn't show Custom...
-                    if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                            self.stringEarthquakeMagnitude.get() != "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                self.stringEarthquakeMagnitude.get() + ",\n")
+                                self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan drop-down shows Custom and magnitude drop-down
                     # shows Custom...
-                    if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                            self.stringEarthquakeMagnitude.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                      self.textCustomMagFrom + "-" +
-                                      self.textCustomMagTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # If timespan drop-down doesn't show Custom and magnitude
                     # drop-down shows Custom...
-                    if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                            self.stringEarthquakeMagnitude.get() == "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                    self.stringEarthquakeTimespan.get() + ",\n")
+                                    self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                      self.textCustomMagFrom + "-" +
-                                      self.textCustomMagTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # Now write the following lines, regardless of
                     # timespan/magnitude selection.
@@ -4781,10 +4192,10 @@ class EarthquakeOptions(FrameLifts):
                                   str(self.usa_earthquake_count) + ",\n")
                     csvFile.write("\n")
                     csvFile.write("State Earthquakes - " +
-                                  str(self.stringState_Name.get()) +
+                                  str(self.runParams.state_Name) +
                                   " (FIPS: " +
                                   str(dictKeys_OrderedDict_StateNames[
-                                          self.stringState_Name.get()]) +
+                                          self.runParams.state_Name]) +
                                   "):," + str(self.clipped_earthquakeCount) +
                                   ",\n")
                     csvFile.write("\n")
@@ -4794,50 +4205,26 @@ class EarthquakeOptions(FrameLifts):
                                   "Mean Magnitude,Median Magnitude,"
                                   "Mode Magnitude,\n")
 
-                    # Create empty list to store all state magnitude values.
-                    magList_State = []
-
-                    # Open the in_memory spatial join as a Search Cursor,
-                    # with analysis fields set to FIPS code and magnitude.
-                    with arcpy.da.SearchCursor("in_memory/SpatialJoin",
-                                            [census_Shapefile_Field_CountyName,
-                                                analysis_Mag_Field]) as cursor:
-
-                        # For each feature within the spatial join...
-                        for row in cursor:
+                    # Read the county name and magnitude fields of the in_memory
+                    # spatial join into arrays (one scan for all statistics).
+                    joinArray = arcpy.da.FeatureClassToNumPyArray(
+                        "in_memory/SpatialJoin",
+                        [census_Shapefile_Field_CountyName, analysis_Mag_Field])
 
-                            # Add the magnitude to the state list.
-                            magList_State.append(row[1])
-
-                    try:
-
-                        # Calculate mode of all magnitudes within state list.
-                        modeValue_State = mode(magList_State)
-
-                        # Convert mode information to float and then to
-                        # string with two decimal places.
-                        modeString_State = \
-                            str("{0:.2f}".format(float(modeValue_State)))
-
-                    except StatisticsError:
-
-                        # This catches any lists containing no mode.
-                        # This will occur if all values within list are
-                        # unique values.
-
-                        # Assign mode to the following phrase.
-                        modeString_State = "No Unique Mode"
-
-                        pass
+                    # Calculate statistics of all magnitudes within the state.
+                    stats_State = func_Value_Statistics(
+                        joinArray[analysis_Mag_Field])
 
                     # Write the following data to the data counts CSV.
-                    # Min mag, max mag, mean mag, median mag, and mode mag.
-                    csvFile.write(str(min(magList_State)) + "," +
-                            str(max(magList_State)) + "," +
-                            str("{0:.2f}".format(numpy.mean(magList_State)) +
-                            "," +
-                            str("{0:.2f}".format(numpy.median(magList_State))) +
-                            "," + modeString_State + "," + ",\n"))
+                    # Min magnitude, max magnitude, mean magnitude, median
+                    # magnitude, and mode magnitude.
+                    csvFile.write(str(stats_State.minimum) + "," +
+                                  str(stats_State.maximum) + "," +
+                                  str("{0:.2f}".format(stats_State.mean)) +
+                                  "," +
+                                  str("{0:.2f}".format(stats_State.median)) +
+                                  "," + func_Mode_String(stats_State.mode) +
+                                  "," + ",\n")
 
                     csvFile.write("\n")
                     csvFile.write("Earthquake Data per County\n")
@@ -4847,80 +4234,38 @@ class EarthquakeOptions(FrameLifts):
                                   "Mean Magnitude,Median Magnitude,"
                                   "Mode Magnitude,\n")
 
-                    # Create empty list for storing earthquake/magnitude values.
-                    magList_County = []
+                    # Calculate statistics of the magnitudes within each county
+                    # (one pass over the arrays, grouped by county name).
+                    stats_PerCounty = func_Group_Statistics(
+                        joinArray[census_Shapefile_Field_CountyName],
+                        joinArray[analysis_Mag_Field])
 
                     # For each county list within state/county dictionary
                     # matching the state drop-down selection...
                     for key in GUI_CountiesPerState.dict_state_counties[
-                        self.stringState_Name.get()]:
-
-                        # Set counter to zero, for counting earthquakes within
-                        # each state during loop.
-                        counter = 0
-
-                        # Clears magList after each state count has concluded.
-                        magList_County.clear()
-
-                        # Open the in_memory spatial join as a Search Cursor,
-                        # with analysis fields set to county name and magnitude.
-                        with arcpy.da.SearchCursor("in_memory/SpatialJoin",
-                                            [census_Shapefile_Field_CountyName,
-                                                analysis_Mag_Field]) as cursor:
-
-                            # For each feature within the spatial join...
-                            for row in cursor:
-
-                                # If the county name matches a county name
-                                # within the state/county dictionary....
-                                if row[0] == key:
-
-                                    # Append row information to magList.
-                                    magList_County.append(row[1])
-
-                                    # Increment counter by one.
-                                    counter = counter + 1
-
-                        # If row counter is greater than zero...
-                        if counter > 0:
-
-                            try:
-
-                                # Calculate mode of all magnitudes within list.
-                                modeValue_County = mode(magList_County)
+                        self.runParams.state_Name]:
 
-                                # Convert mode information to float and then to
-                                # string with two decimal places.
-                                modeString_County = \
-                                    str("{0:.2f}".format(
-                                        float(modeValue_County)))
-
-                            except StatisticsError:
-
-                                # This catches any lists containing no mode.
-                                # This will occur if all values within list are
-                                # unique values.
-
-                                # Assign modeString to the following phrase.
-                                modeString_County = "No Unique Mode"
+                        # Statistics for the county (None if the county has no
+                        # earthquakes).
+                        stats_County = stats_PerCounty.get(key)
 
-                                pass
+                        # If the county has any earthquakes...
+                        if stats_County is not None:
 
                             # Write the following data to the data counts CSV.
                             # County name, how many earthquakes, min mag, max
                             # mag, mean mag, median mag, and mode mag.
-                            csvFile.write(str(key) + ", " + str(counter) +
-                                "," + str("{0:.2f}".format(
-                                min(magList_County))) +
-                                "," + str("{0:.2f}".format(
-                                max(magList_County))) +
+                            csvFile.write(str(key) + ", " +
+                                str(stats_County.count) + "," +
+                                str("{0:.2f}".format(stats_County.minimum)) +
                                 "," +
-                                str("{0:.2f}".format(
-                                numpy.mean(magList_County))) +
+                                str("{0:.2f}".format(stats_County.maximum)) +
                                 "," +
-                                str("{0:.2f}".format(
-                                numpy.median(magList_County))) +
-                                "," + modeString_County +",\n")
+                                str("{0:.2f}".format(stats_County.mean)) +
+                                "," +
+                                str("{0:.2f}".format(stats_County.median)) +
+                                "," + func_Mode_String(stats_County.mode) +
+                                ",\n")
 
                     # Close the data counts CSV file.
                     csvFile.close()
@@ -4947,53 +4292,49 @@ class EarthquakeOptions(FrameLifts):
                                    self.folderNamingAddition + fileExtCSV, "w")
 
                     # If timespan and magnitude drop-downs don't show Custom...
-                    if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                            self.stringEarthquakeMagnitude.get() != "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                    self.stringEarthquakeTimespan.get() + ",\n")
+                                    self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                self.stringEarthquakeMagnitude.get() + ",\n")
+                                self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan drop-down shows Custom and magnitude drop-down
                     # doesn't show Custom...
-                    if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                            self.stringEarthquakeMagnitude.get() != "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                self.stringEarthquakeMagnitude.get() + ",\n")
+                                self.runParams.hazard_Magnitude + ",\n")
 
                     # timespan drop-down shows Custom and magnitude drop-down
                     # shows Custom...
-                    if self.stringEarthquakeTimespan.get() == "Custom..." and \
-                            self.stringEarthquakeMagnitude.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                      self.textCustomMagFrom + "-" +
-                                      self.textCustomMagTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # If timespan drop-down doesn't show Custom and magnitude
                     # drop-down shows Custom...
-                    if self.stringEarthquakeTimespan.get() != "Custom..." and \
-                            self.stringEarthquakeMagnitude.get() == "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                    self.stringEarthquakeTimespan.get() + ",\n")
+                                    self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Magnitude Range:," +
-                                      self.textCustomMagFrom + "-" +
-                                      self.textCustomMagTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # Now write the following lines, regardless of
                     # timespan/magnitude selection.
@@ -5003,13 +4344,13 @@ class EarthquakeOptions(FrameLifts):
                     csvFile.write("USA (and DC) Earthquakes:," +
                                   str(self.usa_earthquake_count) + ",\n")
                     csvFile.write("State Earthquakes - " +
-                        str(self.stringState_Name.get()) + " (FIPS: " +
+                        str(self.runParams.state_Name) + " (FIPS: " +
                         str(dictKeys_OrderedDict_StateNames[
-                                self.stringState_Name.get()]) + "):," +
+                                self.runParams.state_Name]) + "):," +
                                   str(self.state_earthquake_count) + ",\n")
                     csvFile.write("\n")
                     csvFile.write("County Earthquakes - " +
-                                  self.stringCounty_Name.get() + ":," +
+                                  self.runParams.county_Name + ":," +
                                   str(self.clipped_earthquakeCount) + ",\n")
                     csvFile.write("\n")
                     csvFile.write("County Earthquake Data\n")
@@ -5024,7 +4365,7 @@ class EarthquakeOptions(FrameLifts):
                     # For each county list within state/county dictionary
                     # matching the state drop-down selection...
                     for key in GUI_CountiesPerState.dict_state_counties[
-                                                self.stringState_Name.get()]:
+                                                self.runParams.state_Name]:
 
                         # Set counter to zero, for counting earthquakes within
                         # each county during loop.
@@ -5060,283 +4401,41 @@ class EarthquakeOptions(FrameLifts):
                                 # Calculate mode of all magnitudes within list.
                                 modeValue = mode(magList)
 
-                                # Convert mode information to float and then to
-                                # string with two decimal places.
-                                modeString = \
-                                    str("{0:.2f}".format(float(modeValue)))
-
-                            except StatisticsError:
-
-                                # This catches any lists containing no mode.
-                                # This will occur if all values within list are
-                                # unique.
-
-                                #Assign modeString to the following phrase.
-                                modeString = "No Unique Mode"
-
-                                pass
-
-                            # Write the following data to the data counts CSV.
-                            # Min mag, max mag, mean mag, median mag, and
-                            # mode mag.
-                            csvFile.write(str("{0:.2f}".format(min(magList))) +
-                                "," + str("{0:.2f}".format(max(magList))) +
-                                "," +
-                                str("{0:.2f}".format(numpy.mean(magList))) +
-                                "," +
-                                str("{0:.2f}".format(numpy.median(magList))) +
-                                "," + modeString + ",\n")
-
-                    # Close the data counts CSV file.
-                    csvFile.close()
-
-                # Clear any intermediate output from memory.
-                self.func_Clear_InMemory()
-
-                self.func_Scroll_setOutputText("Count results successfully "
-                                               "written to CSV file.", None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script for one second.
-                sleep(1)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(
-                "Output CSV was not written successfully.", color_Red)
-
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-            pass
-
-        except Exception as e:
-
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-        try:
-
-            # If the user selects the IDW analysis...
-            if self.statusAnalysis_IDW.get() == 1:
-
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                self.func_Scroll_setOutputText("Performing IDW Analysis on all "
-                                    "points, then clipping/masking output to " +
-                                    featureClass_Mask + " extent...", None)
-
-                # Point Density parameters, with optional parameters set to None
-                # for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                required_ZField = analysis_Mag_Field
-                optional_CellSize = None
-                optional_Power = None
-                optional_SearchRadius = None
-
-                # Perform the IDW analysis.
-                output_IDW = arcpy.sa.Idw(required_InputFile, required_ZField,
-                                            optional_CellSize, optional_Power,
-                                            optional_SearchRadius)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                # Pause script for one second.
-                sleep(1)
-
-                self.func_Scroll_setOutputText("Masking IDW results...", None)
-
-                # Mask the IDW results.
-                output_IDW_with_Mask = arcpy.sa.ExtractByMask(
-                    output_IDW, featureClass_Mask)
-
-                # Save the masked IDW feature class results to File GDB.
-                output_IDW_with_Mask.save(
-                    "idw_" + self.clipped_Output_FeatureClass)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                self.func_Scroll_setOutputText("IDW Analysis completed.", None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self. analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script by one second.
-                sleep(1)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-            pass
-
-        except Exception as e:
-
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-            pass
-
-        try:
-
-            # If the user selects the Kernel Density analysis...
-            if self.statusAnalysis_KernelDensity.get() == 1:
-
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                self.func_Scroll_setOutputText("Performing Kernel Density "
-                    "Analysis on all points, then clipping/masking output to " +
-                    featureClass_Mask + " extent...", None)
-
-                # Kernel Density parameters, with optional parameters set to
-                # None for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                optional_PopField = None
-                optional_CellSize = None
-                optional_SearchRadius = None
-                optional_AreaUnitScaleFactor = None
-                optional_OutputCellValues = None
-                optional_Method = None
-
-                # Perform the Kernel Density analysis.
-                output_KernelDensity = arcpy.sa.KernelDensity(
-                    required_InputFile, optional_PopField, optional_CellSize,
-                    optional_SearchRadius, optional_AreaUnitScaleFactor,
-                    optional_OutputCellValues, optional_Method)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                # Pause script for one second.
-                sleep(1)
-
-                # Mask the Kernel Density results.
-                output_KernelDensity_with_Mask = arcpy.sa.ExtractByMask(
-                    output_KernelDensity, featureClass_Mask)
-
-                self.func_Scroll_setOutputText(
-                    "Masking Kernel Density results...", None)
-
-                # Save the masked Kernel Density feature class results to
-                # File GDB.
-                output_KernelDensity_with_Mask.save("kerneldensity_" +
-                                            self.clipped_Output_FeatureClass)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                self.func_Scroll_setOutputText(
-                    "Kernel Density Analysis completed.", None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script for one second.
-                sleep(1)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-            pass
-
-        except Exception as e:
-
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-            pass
-
-        try:
-
-            # If the user selects the Kriging analysis...
-            if self.statusAnalysis_Kriging.get() == 1:
-
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                self.func_Scroll_setOutputText("Performing Kriging Analysis on "
-                                "all points, then clipping/masking output to " +
-                                featureClass_Mask + " extent...", None)
+                                # Convert mode information to float and then to
+                                # string with two decimal places.
+                                modeString = \
+                                    str("{0:.2f}".format(float(modeValue)))
 
-                # Kriging parameters, with optional parameters set to None
-                # for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                required_ZField = analysis_Mag_Field
-                optional_KrigingModel = None
-                optional_CellSize = None
-                optional_SearchRadius = None
-                optional_OutputVariancePredictionRaster = None
-
-                # Perform the Kriging analysis.
-                output_Kriging = arcpy.sa.Kriging(required_InputFile,
-                                    required_ZField, optional_KrigingModel,
-                                    optional_CellSize, optional_SearchRadius,
-                                    optional_OutputVariancePredictionRaster)
+                            except StatisticsError:
 
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+                                # This catches any lists containing no mode.
+                                # This will occur if all values within list are
+                                # unique.
 
-                # Pause script for one second.
-                sleep(1)
+                                #Assign modeString to the following phrase.
+                                modeString = "No Unique Mode"
 
-                # Mask the Kriging results.
-                output_Kriging_with_Mask = arcpy.sa.ExtractByMask(
-                    output_Kriging, featureClass_Mask)
+                                pass
 
-                self.func_Scroll_setOutputText("Masking Kriging results...",
-                                               None)
+                            # Write the following data to the data counts CSV.
+                            # Min mag, max mag, mean mag, median mag, and
+                            # mode mag.
+                            csvFile.write(str("{0:.2f}".format(min(magList))) +
+                                "," + str("{0:.2f}".format(max(magList))) +
+                                "," +
+                                str("{0:.2f}".format(numpy.mean(magList))) +
+                                "," +
+                                str("{0:.2f}".format(numpy.median(magList))) +
+                                "," + modeString + ",\n")
 
-                # Save the masked Kriging results to File GDB.
-                output_Kriging_with_Mask.save(
-                    "kriging_" + self.clipped_Output_FeatureClass)
+                    # Close the data counts CSV file.
+                    csvFile.close()
 
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+                # Clear any intermediate output from memory.
+                self.func_Clear_InMemory()
 
-                self.func_Scroll_setOutputText("Kriging Analysis completed.",
-                                               None)
+                self.func_Scroll_setOutputText("Count results successfully "
+                                               "written to CSV file.", None)
 
                 # Increase current progress bar percentage by three percent.
                 self.analysis_Percentage_Counter = \
@@ -5346,12 +4445,12 @@ class EarthquakeOptions(FrameLifts):
                 self.func_ProgressBar_setProgress(
                     self.analysis_Percentage_Counter)
 
-                # Pause script for one second.
-                sleep(1)
-
         except arcpy.ExecuteError:
 
             # Display geoprocessing errors and skip the failed analysis.
+            self.func_Scroll_setOutputText(
+                "Output CSV was not written successfully.", color_Red)
+
             self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
 
             pass
@@ -5364,82 +4463,11 @@ class EarthquakeOptions(FrameLifts):
                                            "Traceback: " +
                                            traceback.format_exc(), color_Red)
 
-            pass
-
         try:
 
-            # If the user selects the Natural Neighbor analysis...
-            if self.statusAnalysis_NaturalNeighbor.get() == 1:
-
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                # If the total number of earthquake features reach 14,750,000...
-                if self.worldwide_earthquake_count >= 14750000:
-
-                    # Display this message, as the geoprocessing tool will fail
-                    # if the total number approaches 15 million records (Esri).
-                    self.func_Scroll_setOutputText(
-                        "UNABLE TO EXECUTE NATURAL NEIGHBOR ANALYSIS:\n" +
-                        "According to Esri, this analysis will fail if the "
-                        "input earthquake count nears 15,000,000.\n" +
-                        "Skipping this analysis...", color_Red)
-
-                else:
-                    # Else, perform the analysis.
-                    self.func_Scroll_setOutputText("Performing Natural "
-                                        "Neighbor Analysis on all points, "
-                                        "then clipping/masking output to " +
-                                        featureClass_Mask + " extent...", None)
-
-                    # Natural Neighbor parameters, with optional parameters set
-                    # to None for Esri defaults.
-                    required_InputFile = self.clipped_Output_FeatureClass
-                    required_ZField = analysis_Mag_Field
-                    optional_CellSize = None
-
-                    # Perform the Natural Neighbor analysis.
-                    output_NaturalNeighbor = arcpy.sa.NaturalNeighbor(
-                        required_InputFile, required_ZField, optional_CellSize)
-
-                    # Get geoprocessing messages.
-                    self.func_Scroll_setOutputText(arcpy.GetMessages(0),
-                                                   color_Blue)
-
-                    # Pause script for one second.
-                    sleep(1)
-
-                    # Mask the Natural Neighbor results.
-                    output_NaturalNeighbor_with_Mask = arcpy.sa.ExtractByMask(
-                        output_NaturalNeighbor, featureClass_Mask)
-
-                    self.func_Scroll_setOutputText(
-                        "Masking Natural Neighbor results...", None)
-
-                    # Save masked results to the File GDB.
-                    output_NaturalNeighbor_with_Mask.save(
-                        "naturalneighbor_" + self.clipped_Output_FeatureClass)
-
-                    # Get geoprocessing messages.
-                    self.func_Scroll_setOutputText(arcpy.GetMessages(0),
-                                                   color_Blue)
-
-                    self.func_Scroll_setOutputText(
-                        "Natural Neighbor Analysis completed.", None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script for one second.
-                sleep(1)
+            # Run the selected raster analyses at the same time, each within
+            # its own worker process (see Hazard_AnalysisScheduler).
+            self.func_Run_Scheduled_Raster_Analyses(featureClass_Mask)
 
         except arcpy.ExecuteError:
 
@@ -5461,7 +4489,7 @@ class EarthquakeOptions(FrameLifts):
         try:
 
             # If the user selects the Optimized Hot Spot analysis...
-            if self.statusAnalysis_OptHotSpot.get() == 1:
+            if "OptHotSpot" in self.runParams.analysis_Options:
 
                 # Set the workspace for the following analysis.
                 arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
@@ -5553,9 +4581,6 @@ class EarthquakeOptions(FrameLifts):
                                 "Spot Analysis (analysis field = '" +
                                 analysis_Mag_Field + "') completed.", None)
 
-                    # Pause script for one second.
-                    sleep(1)
-
                 # Begin the second iteration of the same analysis WITHOUT an
                 # analysis field set as an input parameter.
 
@@ -5641,181 +4666,6 @@ class EarthquakeOptions(FrameLifts):
                 self.func_ProgressBar_setProgress(
                                         self.analysis_Percentage_Counter)
 
-                # Pause script for one second.
-                sleep(1)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-            # Clear any intermediate output from memory.
-            self.func_Clear_InMemory()
-
-            pass
-
-        except Exception as e:
-
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-            # Clear any intermediate output from memory.
-            self.func_Clear_InMemory()
-
-            pass
-
-        try:
-
-            # If the user selects the Point Density analysis...
-            if self.statusAnalysis_PointDensity.get() == 1:
-
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                self.func_Scroll_setOutputText("Performing Point Density "
-                                "Analysis on all points, then clipping/masking "
-                                "output to " + featureClass_Mask + " extent...",
-                                None)
-
-                # Point Density parameters, with optional parameters set to None
-                # for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                optional_PopField = None
-                optional_CellSize = None
-                optional_NeighborhoodType = None
-                optional_AreaUnitScalFactor = None
-
-                # Execute Point Density analysis with default Esri values.
-                output_PointDensity = arcpy.sa.PointDensity(required_InputFile,
-                                        optional_PopField, optional_CellSize,
-                                        optional_NeighborhoodType,
-                                        optional_AreaUnitScalFactor)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                # Pause script for one second.
-                sleep(1)
-
-                # Mask the Point Density results.
-                output_PointDensity_with_Mask = \
-                    arcpy.sa.ExtractByMask(output_PointDensity,
-                                           featureClass_Mask)
-
-                self.func_Scroll_setOutputText(
-                    "Masking Point Density results...", None)
-
-                # Save the masked results to the File GDB.
-                output_PointDensity_with_Mask.save("pointdensity_" +
-                                            self.clipped_Output_FeatureClass)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                self.func_Scroll_setOutputText(
-                    "Point Density Analysis completed.", None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script for one second.
-                sleep(1)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-            pass
-
-        except Exception as e:
-
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-            pass
-
-        try:
-
-            # If the user selects the Spline analysis...
-            if self.statusAnalysis_Spline.get() == 1:
-
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                self.func_Scroll_setOutputText("Performing Spline Analysis on "
-                                "all points, then clipping/masking output to " +
-                                featureClass_Mask + " extent...", None)
-
-                # Spline parameters, with optional parameters set to None
-                # for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                required_ZField = analysis_Mag_Field
-                optional_CellSize = None
-                optional_SplineType = None
-                optional_Weight = None
-                optional_PointNumber = None
-
-                # Execute Spline Analysis with default Esri values.
-                output_Spline = arcpy.sa.Spline(required_InputFile,
-                                required_ZField, optional_CellSize,
-                                optional_SplineType, optional_Weight,
-                                optional_PointNumber)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                # Pause script for one second.
-                sleep(1)
-
-                # Mask the Spline results.
-                output_Spline_with_Mask = arcpy.sa.ExtractByMask(output_Spline,
-                                                          featureClass_Mask)
-
-                self.func_Scroll_setOutputText("Masking Spline results...",
-                                               None)
-
-                # Save the masked results to File GDB.
-                output_Spline_with_Mask.save("spline_" +
-                                             self.clipped_Output_FeatureClass)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                self.func_Scroll_setOutputText("Spline Analysis completed.",
-                                               None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Clear any intermediate output from memory.
-                self.func_Clear_InMemory()
-
-                # Pause script for one second.
-                sleep(1)
-
         except arcpy.ExecuteError:
 
             # Display geoprocessing errors and skip the failed analysis.
@@ -5842,7 +4692,7 @@ class EarthquakeOptions(FrameLifts):
         try:
 
             # If the user selects the Thiessen analysis...
-            if self.statusAnalysis_Thiessen.get() == 1:
+            if "Thiessen" in self.runParams.analysis_Options:
 
                 # Set the workspace for the following analysis.
                 arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
@@ -5870,9 +4720,6 @@ class EarthquakeOptions(FrameLifts):
                 # Get geoprocessing messages.
                 self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-                # Pause script for one second.
-                sleep(1)
-
                 self.func_Scroll_setOutputText(
                     "Clipping Thiessen Polygon Analysis results...", None)
 
@@ -5898,9 +4745,6 @@ class EarthquakeOptions(FrameLifts):
                 self.func_ProgressBar_setProgress(
                     self.analysis_Percentage_Counter)
 
-                # Pause script for one second.
-                sleep(1)
-
         except arcpy.ExecuteError:
 
             # Display geoprocessing errors and skip the failed analysis.
@@ -5924,56 +4768,90 @@ class EarthquakeOptions(FrameLifts):
 
             pass
 
-        try:
+    def func_Run_Scheduled_Raster_Analyses(self, featureClass_Mask):
 
-            # If the user selects the Trend analysis...
-            if self.statusAnalysis_Trend.get() ==1:
+        # This function runs the selected raster analyses (each an arcpy.sa
+        # tool, masked to the feature class mask) at the same time through the
+        # analysis scheduler, each within its own worker process with its own
+        # workspace and extent. As each analysis completes, its masked raster
+        # is copied into the File GDB (under the same name as before) and the
+        # progress bar is incremented by three percent.
 
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
+        # Set the workspace and extent, the same as each analysis.
+        fileGDB_Path = self.subFolder_GIS + "/" + nameFileGDB
+        arcpy.env.workspace = fileGDB_Path
+        arcpy.env.extent = featureClass_Mask
 
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
+        # Folder holding each worker's scratch File GDB.
+        scratchFolder = self.subFolder_GIS + "/" + scheduler_Scratch_FolderName
 
-                self.func_Scroll_setOutputText("Performing Trend Analysis on "
-                            "all points, then clipping/masking output to " +
-                            featureClass_Mask + " extent...", None)
+        # Selected raster analyses.
+        list_Names = [name for name in dict_ArcGIS_Raster_Tools
+                      if name in self.runParams.analysis_Options]
 
-                # Trend parameters, with optional parameters set to None
-                # for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                required_ZField = analysis_Mag_Field
-                optional_CellSize = None
-                optional_Order = None
-                optional_RegressionType = None
-                optional_OutputRMSFile = None
+        # If the total number of earthquake features reach 14,750,000...
+        if "NaturalNeighbor" in list_Names and \
+                self.worldwide_earthquake_count >= 14750000:
 
-                # Execute Trend Analysis with default Esri values
-                output_Trend = arcpy.sa.Trend(required_InputFile,
-                            required_ZField, optional_CellSize, optional_Order,
-                            optional_RegressionType, optional_OutputRMSFile)
+            # Display this message, as the geoprocessing tool will fail
+            # if the total number approaches 15 million records (Esri).
+            self.func_Scroll_setOutputText(
+                "UNABLE TO EXECUTE NATURAL NEIGHBOR ANALYSIS:\n" +
+                "According to Esri, this analysis will fail if the "
+                "input earthquake count nears 15,000,000.\n" +
+                "Skipping this analysis...", color_Red)
 
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+            list_Names.remove("NaturalNeighbor")
 
-                # Pause script for one second.
-                sleep(1)
+            # Increase current progress bar percentage by three percent.
+            self.analysis_Percentage_Counter = \
+                self.analysis_Percentage_Counter + 3
 
-                # Mask the Trend results.
-                output_Trend_with_Mask = arcpy.sa.ExtractByMask(output_Trend,
-                                                            featureClass_Mask)
+            # Increment progress bar by adjusted value.
+            self.func_ProgressBar_setProgress(
+                self.analysis_Percentage_Counter)
 
-                self.func_Scroll_setOutputText("Masking Trend results...", None)
+        list_Jobs = func_ArcGIS_Raster_Jobs(list_Names, fileGDB_Path,
+                                            self.clipped_Output_FeatureClass,
+                                            featureClass_Mask,
+                                            analysis_Mag_Field, scratchFolder)
 
-                # Save the masked results to the File GDB.
-                output_Trend_with_Mask.save("trend_" +
-                                            self.clipped_Output_FeatureClass)
+        for job in list_Jobs:
+
+            self.func_Scroll_setOutputText("Performing " + job.label +
+                                           " Analysis on all points, then "
+                                           "clipping/masking output to " +
+                                           featureClass_Mask + " extent...",
+                                           None)
+
+        def func_Progress(result, completed, total):
+
+            # This function displays each analysis as it completes, and
+            # copies its masked raster into the File GDB.
+
+            try:
+
+                # If the analysis failed, display its errors and skip it.
+                if result.error is not None:
+
+                    self.func_Scroll_setOutputText(str(result.error),
+                                                   color_Red)
+
+                    return
+
+                list_Messages, outputRaster = result.value
 
                 # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+                for message in list_Messages:
+
+                    self.func_Scroll_setOutputText(message, color_Blue)
 
-                self.func_Scroll_setOutputText("Trend Analysis completed.",
-                                               None)
+                # Copy the masked results to the File GDB.
+                self.func_Scroll_setOutputText(func_Copy_ArcGIS_Raster(
+                    outputRaster, fileGDB_Path), color_Blue)
+
+                self.func_Scroll_setOutputText(
+                    result.job.label + " Analysis completed.", None)
 
                 # Increase current progress bar percentage by three percent.
                 self.analysis_Percentage_Counter = \
@@ -5983,23 +4861,32 @@ class EarthquakeOptions(FrameLifts):
                 self.func_ProgressBar_setProgress(
                     self.analysis_Percentage_Counter)
 
-                # Pause script for one second.
-                sleep(1)
+            except arcpy.ExecuteError:
 
-        except arcpy.ExecuteError:
+                # Display geoprocessing errors and skip the failed analysis.
+                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
 
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
+                pass
 
-            pass
+            except Exception as e:
 
-        except Exception as e:
+                # Display error messages for all other errors and skip failed
+                # analysis.
+                self.func_Scroll_setOutputText("Error Message: " + str(e) +
+                                               "\n" + "Traceback: " +
+                                               traceback.format_exc(),
+                                               color_Red)
 
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
+                pass
+
+        func_Run_Analysis_Jobs(list_Jobs, func_Progress=func_Progress)
+
+        try:
+
+            # Delete the scratch File GDBs (any still locked are left).
+            func_Remove_Folder(scratchFolder, 5.0)
+
+        except OSError:
 
             pass
 
@@ -6014,36 +4901,13 @@ class EarthquakeOptions(FrameLifts):
             # Set workspace to File GDB for the following analysis.
             arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
 
-            # Assign Census Shapefile within Shapefile subfolder to variable.
-            censusShapefile = self.subFolder_CensusShapefile + "/" + \
-                              census_URL_CountyShapefile_FileName + fileExtShp
-
             # Create Census polygon feature class variable stored within memory.
             memoryFeatureClass_US = "in_memory/" + \
                                     featureClass_50States_and_DC_only
 
-            # Copy Census Shapefile to feature class stored in memory.
-            arcpy.CopyFeatures_management(censusShapefile,
-                                          memoryFeatureClass_US)
-
-            # Pause script for one second.
-            sleep(1)
-
-            # Open the Census in_memory feature class with an Update Cursor.
-            with arcpy.da.UpdateCursor(memoryFeatureClass_US,
-                                    census_Shapefile_Field_StateFIPS) as cursor:
-
-                # For each feature in the Census in_memory feature class...
-                for row in cursor:
-
-                    # This If statement removes non-50 state (and DC) FIPS codes
-                    # from the Census feature class. The original polygons
-                    # include all US territories.
-                    if row[0] == "60" or row[0] == "66" or row[0] == "69" or \
-                                    row[0] == "72" or row[0] == "78":
-
-                        # Delete feature from in_memory feature class.
-                        cursor.deleteRow()
+            # Copy the 50 states and DC counties from the county store to a
+            # feature class stored in memory.
+            func_Extract_County_Mask(self.countyStore, memoryFeatureClass_US)
 
             # Recalculate the extent of the in_memory feature class.
             arcpy.RecalculateFeatureClassExtent_management(
@@ -6098,35 +4962,15 @@ class EarthquakeOptions(FrameLifts):
             # Set workspace to File GDB for the following analysis.
             arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
 
-            # Assign Census Shapefile within Shapefile subfolder to variable.
-            censusShapefile = self.subFolder_CensusShapefile + "/" + \
-                                census_URL_CountyShapefile_FileName + fileExtShp
-
             # Create Census polygon feature class variable stored in memory.
             memoryFeatureClass_State = "in_memory/" + \
-                                       self.stringState_Name.get()
+                                       self.runParams.state_Name
 
-            # Copy Census Shapefile to feature class stored in memory.
-            arcpy.CopyFeatures_management(censusShapefile,
-                                          memoryFeatureClass_State)
-
-            # Pause script for one second.
-            sleep(1)
-
-            # Open the Census in_memory feature class with an Update Cursor.
-            with arcpy.da.UpdateCursor(memoryFeatureClass_State,
-                                    census_Shapefile_Field_StateFIPS) as cursor:
-
-                # For each feature in the Census in_memory feature class...
-                for row in cursor:
-
-                    # This If statement removes all state polygon features not
-                    # matching the user-selected state FIPS code.
-                    if row[0] != \
-                    dict_StateName_StateFIPs.get(self.stringState_Name.get()):
-
-                        # Delete feature from in_memory feature class.
-                        cursor.deleteRow()
+            # Copy the user-selected state's counties from the county store to
+            # a feature class stored in memory.
+            func_Extract_County_Mask(self.countyStore, memoryFeatureClass_State,
+                                     dict_StateName_StateFIPs.get(
+                                         self.runParams.state_Name))
 
             # Recalculate the extent of the in_memory feature class.
             arcpy.RecalculateFeatureClassExtent_management(
@@ -6204,7 +5048,7 @@ class EarthquakeOptions(FrameLifts):
 
     def func_Scroll_saveOutputText(self):
 
-        # This function writes all of the output text found within the
+        # This function saves all of the output text posted to the
         # ScrolledText widget to a text file located within the user-defined
         # workspace. This is done at the conclusion of every application
         # iteration.
@@ -6214,27 +5058,23 @@ class EarthquakeOptions(FrameLifts):
             # If the output text file's naming convention has been set...
             if self.nameFeatureClass_FromCSV is not None:
 
-                # Create/Open a new text file for all output messages to be
-                # written to.
-                textFile_ProcessingHistory = open(self.fullPathName + "/" +
-                        "ProcessingHistory_" + self.nameFeatureClass_FromCSV +
-                                              fileExtText,"w")
+                # Text file that all output messages are written to.
+                historyPath = self.fullPathName + "/" + \
+                    "ProcessingHistory_" + self.nameFeatureClass_FromCSV + \
+                    fileExtText
             else:
 
                 # If the application throws errors and fails within the early
                 # stages, the naming convention for the output text file will
                 # not be established. If that is the case, the naming convention
                 # will be saved with FAILED in the name.
-                textFile_ProcessingHistory = open(self.fullPathName + "/" +
-                        "ProcessingHistory_FAILED" + fileExtText, "w")
+                historyPath = self.fullPathName + "/" + \
+                    "ProcessingHistory_FAILED" + fileExtText
 
-            # Once the application processes have finished, take all output
-            # messages within the scroll box and write to the output text file.
-            textFile_ProcessingHistory.write(
-                self.scrollBox.get(1.0, tkinter.END))
-
-            # Close the text file.
-            textFile_ProcessingHistory.close()
+            # Once the application processes have finished, move the output
+            # messages (streamed to a text file within the workspace folder
+            # while processing) to the output text file.
+            self.guiChannel.func_Finish_History(historyPath)
 
             self.func_Scroll_setOutputText(
                 "The processing history (what you see here) "
@@ -6696,29 +5536,20 @@ class EarthquakeOptions(FrameLifts):
 
         # This function controls what and how the output texts are displayed
         # within the scroll box for users to read. It takes an input argument
-        # from the user as well as a text color tag.
-
-        # These tags set the color used for specific text.
-        self.scrollBox.tag_config(color_Red, foreground = color_Red)
-        self.scrollBox.tag_config(color_Orange, foreground = color_Orange)
-        self.scrollBox.tag_config(color_Blue, foreground = color_Blue)
-
-        # This section inputs the user-defined wording and displays the message
-        # within the scroll box. The focus of the scroll box shifts to the
-        # last (bottom) entered text message.
-        self.scrollBox.config(state=tkinter.NORMAL)
-        self.scrollBox.insert(tkinter.END, word, (tag))
-        self.scrollBox.insert(tkinter.END, "\n--------------------\n")
-        self.scrollBox.see(tkinter.END)
-        self.scrollBox.config(state=tkinter.DISABLED)
+        # from the user as well as a text color tag. The message is posted to
+        # the GUI channel, so it can be called from the processing thread;
+        # the main loop shows it within the scroll box and shifts the focus
+        # to the last (bottom) entered text message.
+
+        self.guiChannel.func_Post_Log(word, tag)
 
     def func_ProgressBar_setProgress(self, value):
 
         # This function controls the progress bar increment by taking a
-        # user-defined input argument (integer).
+        # user-defined input argument (integer), posted to the GUI channel
+        # the same as the output texts.
 
-        self.progressBar["value"] = value
-        self.progressBar.update()
+        self.guiChannel.func_Post_Progress(value)
 
 
 
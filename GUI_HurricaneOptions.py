@@ -11,11 +11,9 @@ from tkinter import messagebox
 from tkinter import scrolledtext
 import sys
 import os
-import shutil
 import time
 import csv
 import numpy
-from urllib import request
 from urllib.error import HTTPError
 from urllib.error import URLError
 import zipfile
@@ -27,6 +25,31 @@ import traceback
 from time import sleep  # careful - this can freeze the GUI
 from threading import Thread  # this is used to unfreeze the GUI
 from GUI_FrameLifts import FrameLifts
+from Hazard_GUIChannel import GUIChannel
+from Hazard_StageTrace import func_Start_Trace
+from Hazard_StageTrace import func_Stop_Trace
+from Hazard_StageTrace import func_Trace_GUI_Run
+from Hazard_Readiness import func_Remove_Folder
+from Hazard_AnalysisScheduler import scheduler_Scratch_FolderName
+from Hazard_AnalysisScheduler import dict_ArcGIS_Raster_Tools
+from Hazard_AnalysisScheduler import func_Run_Analysis_Jobs
+from Hazard_AnalysisScheduler import func_ArcGIS_Raster_Jobs
+from Hazard_AnalysisScheduler import func_Copy_ArcGIS_Raster
+from Hazard_DownloadCache import func_Cache_Retrieve
+from Hazard_CountyStore import func_County_Store_Path
+from Hazard_CountyStore import func_County_Store_Exists
+from Hazard_CountyStore import func_Build_County_Store
+from Hazard_CountyStore import func_Extract_County_Mask
+from Hazard_RunParameters import RunParameters
+from Hazard_RunParameters import func_Get_Tk_Value
+from Hazard_RunParameters import func_Get_Checked_Analyses
+from Hazard_RunParameters import func_Custom_Timespan
+from Hazard_RunParameters import func_Custom_Timespan_Text
+from Hazard_RunParameters import func_Custom_Magnitude_Text
+from Hazard_GroupStats import func_Value_Statistics
+from Hazard_GroupStats import func_Group_Statistics
+from Hazard_GroupStats import func_Group_Distinct_Counts
+from Hazard_GroupStats import func_Mode_String
 from statistics import mode
 from statistics import StatisticsError
 
@@ -292,6 +315,7 @@ class HurricaneOptions(FrameLifts):
         self.stringState_Name = None
         self.stringCounty_Name = None
         self.nameFeatureClass_FromCSV = None
+        self.runParams = None
         self.unzipped_Hurr_RawShapefileName = None
         self.name_Hurr_FeatureClass = None
         self.worldwide_storm_count = None
@@ -299,6 +323,11 @@ class HurricaneOptions(FrameLifts):
         self.state_storm_count = None
         self.county_storm_count = None
 
+        # Channel for the log messages and progress values posted by the
+        # processing thread (shown by the main loop, see Hazard_GUIChannel).
+        self.guiChannel = GUIChannel(self, (color_Red, color_Orange,
+                                            color_Blue))
+
         # Settings and configuration for the Hurricane Options GUI window.
         self.winfo_toplevel().title("Hurricane Options")
         self.winfo_toplevel().geometry("%dx%d" %
@@ -1173,6 +1202,38 @@ class HurricaneOptions(FrameLifts):
                 # active program.
                 return
 
+    def func_Build_RunParameters(self):
+
+        # This function reads every GUI selection used by the processing tasks
+        # and returns them as an immutable RunParameters object. It must run
+        # on the GUI thread (before the OKClick thread starts), so that none of
+        # the processing tasks need to read a Tk variable.
+
+        # Names of the analysis checkboxes within the Analysis Options frame.
+        analysisNames = ("HotSpot", "KernelDensity", "LineDensity",
+                         "OutputToCSVFile")
+
+        return RunParameters(
+            hazard_Timespan=self.stringHurricaneTimespan.get(),
+            hazard_Magnitude=self.stringHurricaneIntensity.get(),
+            custom_Year_From=func_Get_Tk_Value(
+                self.intCustomTimespan_Year_From),
+            custom_Month_From=func_Get_Tk_Value(
+                self.intCustomTimespan_Month_From),
+            custom_Year_To=func_Get_Tk_Value(self.intCustomTimespan_Year_To),
+            custom_Month_To=func_Get_Tk_Value(self.intCustomTimespan_Month_To),
+            custom_Magnitude_Min=func_Get_Tk_Value(
+                self.intCustom_Intensity_Min),
+            custom_Magnitude_Max=func_Get_Tk_Value(
+                self.intCustom_Intensity_Max),
+            url_Text=self.textURLTextbox.get(),
+            workspace_Folder=
+                self.workspaceFolderTextbox_HurricaneFolderDialog.get(),
+            options_Checked=self.statusVar_Checkbutton_Options.get(),
+            state_Name=func_Get_Tk_Value(self.stringState_Name),
+            county_Name=func_Get_Tk_Value(self.stringCounty_Name),
+            analysis_Options=func_Get_Checked_Analyses(self, analysisNames))
+
     def func_OKClick_Thread(self):
 
         # This function controls the OKClick function, by running it within a
@@ -1181,6 +1242,9 @@ class HurricaneOptions(FrameLifts):
         # The daemon setting allows for the application to properly terminate
         # when the user clicks the "Cancel" button.
 
+        # Read all GUI selections once, while still on the GUI thread.
+        self.runParams = self.func_Build_RunParameters()
+
         self.thread_func_OKClick = Thread(target=self.func_OKClick)
         self.thread_func_OKClick.daemon = True
         self.thread_func_OKClick.start()
@@ -1221,16 +1285,16 @@ class HurricaneOptions(FrameLifts):
 
             # If the user has selected a valid timespan, intensity, and assigned
             # an output workspace folder...
-            if self.stringHurricaneTimespan.get() != "Select..." and \
-                    self.stringHurricaneIntensity.get() != "Select..." and \
-                    self.workspaceFolderTextbox_HurricaneFolderDialog.get() != \
+            if self.runParams.hazard_Timespan != "Select..." and \
+                    self.runParams.hazard_Magnitude != "Select..." and \
+                    self.runParams.workspace_Folder != \
                     folderDialog_Message:
 
                 # Start a timer for the script.
                 self.start_time = time.time()
 
                 # If the "Options" checkbox is selected...
-                if self.statusVar_Checkbutton_Options.get() == 1:
+                if self.runParams.options_Checked == 1:
 
                     # If the user hasn't selected a clipping option...
                     if self.radioButton_Selection is None:
@@ -1247,8 +1311,8 @@ class HurricaneOptions(FrameLifts):
                         return
 
                     # If the timespan or intensity combobox is "Custom..."...
-                    if self.stringHurricaneTimespan.get() == "Custom..." or \
-                            self.stringHurricaneIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." or \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # If all custom timespan comboboxes have values...
                         if self.intCustomTimespan_Year_From is not None and \
@@ -1257,8 +1321,8 @@ class HurricaneOptions(FrameLifts):
                             self.intCustomTimespan_Month_To is not None:
 
                             # If the YEAR FROM exceeds the YEAR TO value...
-                            if self.intCustomTimespan_Year_From.get() > \
-                                    self.intCustomTimespan_Year_To.get():
+                            if self.runParams.custom_Year_From > \
+                                    self.runParams.custom_Year_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1273,10 +1337,10 @@ class HurricaneOptions(FrameLifts):
 
                             # Else if the FROM MONTH exceeds the TO MONTH within
                             # the same YEAR...
-                            elif self.intCustomTimespan_Year_From.get() == \
-                                    self.intCustomTimespan_Year_To.get() and \
-                                    self.intCustomTimespan_Month_From.get() > \
-                                    self.intCustomTimespan_Month_To.get():
+                            elif self.runParams.custom_Year_From == \
+                                    self.runParams.custom_Year_To and \
+                                    self.runParams.custom_Month_From > \
+                                    self.runParams.custom_Month_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1296,8 +1360,8 @@ class HurricaneOptions(FrameLifts):
 
                             # If the minimum intensity exceeds the maximum
                             # intensity...
-                            if self.intCustom_Intensity_Min.get() > \
-                                    self.intCustom_Intensity_Max.get():
+                            if self.runParams.custom_Magnitude_Min > \
+                                    self.runParams.custom_Magnitude_Max:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1326,12 +1390,12 @@ class HurricaneOptions(FrameLifts):
                             self.okClick_NonCustom_ExpansionHeight))
 
                 # Else if the "More Options" checkbox is not selected...
-                elif self.statusVar_Checkbutton_Options.get() == 0:
+                elif self.runParams.options_Checked == 0:
 
                     # If the timespan or intensity "Custom..." comboboxes are
                     # selected...
-                    if self.stringHurricaneTimespan.get() == "Custom..." or \
-                            self.stringHurricaneIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." or \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # If all custom timespan comboboxes have values...
                         if self.intCustomTimespan_Year_From is not None and \
@@ -1340,8 +1404,8 @@ class HurricaneOptions(FrameLifts):
                             self.intCustomTimespan_Month_To is not None:
 
                             # If the YEAR FROM exceeds the YEAR TO value...
-                            if self.intCustomTimespan_Year_From.get() > \
-                                    self.intCustomTimespan_Year_To.get():
+                            if self.runParams.custom_Year_From > \
+                                    self.runParams.custom_Year_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1356,10 +1420,10 @@ class HurricaneOptions(FrameLifts):
 
                             # Else if the FROM MONTH exceeds the TO MONTH within
                             # the same YEAR...
-                            elif self.intCustomTimespan_Year_From.get() == \
-                                    self.intCustomTimespan_Year_To.get() and \
-                                    self.intCustomTimespan_Month_From.get() > \
-                                    self.intCustomTimespan_Month_To.get():
+                            elif self.runParams.custom_Year_From == \
+                                    self.runParams.custom_Year_To and \
+                                    self.runParams.custom_Month_From > \
+                                    self.runParams.custom_Month_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1379,8 +1443,8 @@ class HurricaneOptions(FrameLifts):
 
                             # If the MINIMUM intensity exceeds the MAXIMUM
                             # intensity...
-                            if self.intCustom_Intensity_Min.get() > \
-                                    self.intCustom_Intensity_Max.get():
+                            if self.runParams.custom_Magnitude_Min > \
+                                    self.runParams.custom_Magnitude_Max:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1423,11 +1487,28 @@ class HurricaneOptions(FrameLifts):
                 # Run function to start the status bar.
                 self.func_StartStatusBar()
 
+                # Start the stage trace (the time, CPU time, and memory of
+                # each processing stage) within the output workspace folder,
+                # now that all selections are valid.
+                func_Start_Trace(os.path.join(
+                    self.runParams.workspace_Folder, "StageTrace_" +
+                    time.strftime("%Y%m%d_%H%M%S") + ".json"))
+
                 # Run function to create a folder in the user-specified output
                 # workspace folder.
                 # PLEASE NOTE:
-                # Numerous subtasks are executed within this function.
-                self.func_CreateFolder()
+                # Numerous subtasks are executed within this function. Each
+                # subtask (and ArcPy tool) is timed within the stage trace,
+                # which is written and stopped even if processing fails.
+                try:
+
+                    with func_Trace_GUI_Run(self):
+
+                        self.func_CreateFolder()
+
+                finally:
+
+                    func_Stop_Trace()
 
                 # Once all tasks are completed, this function will calculate the
                 # time it took for the script to run from start to finish.
@@ -1450,7 +1531,7 @@ class HurricaneOptions(FrameLifts):
             else:
 
                 # If the timespan combobox shows "Select..."...
-                if self.stringHurricaneTimespan.get() == "Select...":
+                if self.runParams.hazard_Timespan == "Select...":
 
                     # Display error message.
                     messagebox.showerror(errorMessage_Header,
@@ -1462,7 +1543,7 @@ class HurricaneOptions(FrameLifts):
                     self.func_Enable_Buttons()
 
                 # Else if the intensity combobox shows "Select..."...
-                elif self.stringHurricaneIntensity.get() == "Select...":
+                elif self.runParams.hazard_Magnitude == "Select...":
 
                     # Display error message.
                     messagebox.showerror(errorMessage_Header,
@@ -1474,7 +1555,7 @@ class HurricaneOptions(FrameLifts):
                     self.func_Enable_Buttons()
 
                 # Else if the output workspace text is the default message...
-                elif self.workspaceFolderTextbox_HurricaneFolderDialog.get() ==\
+                elif self.runParams.workspace_Folder ==\
                                 folderDialog_Message:
 
                     # Display error message.
@@ -1522,7 +1603,7 @@ class HurricaneOptions(FrameLifts):
         self.scrollHeight = 8
 
         # If the "More Options" checkbox is selected...
-        if self.statusVar_Checkbutton_Options.get() == 1:
+        if self.runParams.options_Checked == 1:
             # Set the scrolled text frame to 90 characters wide.
             self.scrollWidth = 90
 
@@ -1531,7 +1612,7 @@ class HurricaneOptions(FrameLifts):
                                      columnspan=2)
 
         # If the "More Options" checkbox is not selected...
-        if self.statusVar_Checkbutton_Options.get() == 0:
+        if self.runParams.options_Checked == 0:
             # Set the scrolled text frame to 52 characters wide.
             self.scrollWidth = 52
 
@@ -1547,6 +1628,13 @@ class HurricaneOptions(FrameLifts):
                                                    state=tkinter.DISABLED)
         self.scrollBox.grid(column=0, row=0)
 
+        # The processing history of this run is streamed to a text file within
+        # the workspace folder as it is posted, then moved to the run's output
+        # folder once the run is complete (see func_Scroll_saveOutputText).
+        self.guiChannel.func_Start_History(os.path.join(
+            self.runParams.workspace_Folder, "ProcessingHistory_RUNNING_" +
+            time.strftime("%Y%m%d_%H%M%S") + fileExtText))
+
         # Sets the text variable to the function for updating the scrolledtext
         # output.
         self.func_Scroll_setOutputText("Beginning assigned tasks...", None)
@@ -1559,7 +1647,7 @@ class HurricaneOptions(FrameLifts):
         self.progressBarFrame = tkinter.Frame(self.processingFrame)
 
         # If the "More Options" checkbox is selected...
-        if self.statusVar_Checkbutton_Options.get() == 1:
+        if self.runParams.options_Checked == 1:
             # Set the pixel width of the progress bar.
             self.progressBar_Length = 740
 
@@ -1568,7 +1656,7 @@ class HurricaneOptions(FrameLifts):
                                        columnspan=2)
 
         # If the "More Options" checkbox is not selected...
-        if self.statusVar_Checkbutton_Options.get() == 0:
+        if self.runParams.options_Checked == 0:
             # Set the pixel width of the progress bar.
             self.progressBar_Length = 450
 
@@ -1600,11 +1688,11 @@ class HurricaneOptions(FrameLifts):
 
         # This function controls the appearance of the status bar.
 
+        # The status bar is stepped every 30 milliseconds by the main loop
+        # (instead of pausing the main loop between steps).
         for i in range(100):
-            sleep(0.03)
-            self.statusBar["value"] = i  # increment progressbar
-            self.statusBar.update()  # have to call update() in loop
-        self.statusBar["value"] = 0  # reset/clear progressbar
+            self.after(30 * i, self.statusBar.config, {"value": i})
+        self.after(3000, self.statusBar.config, {"value": 0})
 
     def func_StartStatusBar(self):
 
@@ -1881,7 +1969,7 @@ class HurricaneOptions(FrameLifts):
         try:
 
             # If the "More Options" checkbox is selected...
-            if self.statusVar_Checkbutton_Options.get() == 1:
+            if self.runParams.options_Checked == 1:
 
                 # If the USA clipping option is selected...
                 if self.radioButton_Selection == 1:
@@ -1897,7 +1985,7 @@ class HurricaneOptions(FrameLifts):
                     # Create variable for adding State to folder
                     # naming convention.
                     self.featureClass_State_Selection_Only = \
-                        "state_only_" + self.stringState_Name.get()
+                        "state_only_" + self.runParams.state_Name
                     self.folderNamingAddition = \
                         "_" + self.featureClass_State_Selection_Only
 
@@ -1907,27 +1995,27 @@ class HurricaneOptions(FrameLifts):
                     # Create variable for adding State to folder
                     # naming convention.
                     self.featureClass_State_Selection_Only = \
-                        "state_only_" + self.stringState_Name.get()
+                        "state_only_" + self.runParams.state_Name
 
                     # Create modified variable for County name, removing all
                     # instances of special characters or spacing.
                     self.modified_stringCountyName = \
-                        self.stringCounty_Name.get(). \
+                        self.runParams.county_Name. \
                             replace("'", "").replace("-", ""). \
                             replace(".", "").replace(" ", "")
 
                     # Full string used for feature class naming purposes.
                     self.featureClass_County_State_Naming = "county_only_" + \
                                         self.modified_stringCountyName + "_" + \
-                                        self.stringState_Name.get()
+                                        self.runParams.state_Name
 
                     # Full string used for folder naming purposes.
                     self.folderNamingAddition = \
                         "_" + self.featureClass_County_State_Naming
 
                 # If both timespan/intensity comboboxes are not "Custom..."...
-                if self.stringHurricaneTimespan.get() != "Custom..." and \
-                        self.stringHurricaneIntensity.get() != "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out separately to be
                     # used later on for CSV files, XY Event Layers, and
@@ -1944,8 +2032,8 @@ class HurricaneOptions(FrameLifts):
 
                 # If timespan combobox is "Custom..." and intensity combobox is
                 # not "Custom..."...
-                if self.stringHurricaneTimespan.get() == "Custom..." and \
-                        self.stringHurricaneIntensity.get() != "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out separately to be
                     # used later on for CSV files, XY Event Layers, and
@@ -1960,8 +2048,8 @@ class HurricaneOptions(FrameLifts):
                                             self.folderNamingAddition
 
                 # If timespan is "Custom..." and intensity is "Custom..."...
-                if self.stringHurricaneTimespan.get() == "Custom..." and \
-                        self.stringHurricaneIntensity.get() == "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -1978,8 +2066,8 @@ class HurricaneOptions(FrameLifts):
                                         self.folderNamingAddition
 
                 # If timespan is not "Custom..." and intensity is "Custom..."...
-                if self.stringHurricaneTimespan.get() != "Custom..." and \
-                        self.stringHurricaneIntensity.get() == "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -1997,11 +2085,11 @@ class HurricaneOptions(FrameLifts):
                                         self.folderNamingAddition
 
             # If "More Options" checkbox is unchecked...
-            if self.statusVar_Checkbutton_Options.get() == 0:
+            if self.runParams.options_Checked == 0:
 
                 # If both timespan/intensity comboboxes are not "Custom"...
-                if self.stringHurricaneTimespan.get() != "Custom..." and \
-                        self.stringHurricaneIntensity.get() != "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -2018,8 +2106,8 @@ class HurricaneOptions(FrameLifts):
 
                 # If timespan combobox is "Custom..." and intensity combobox is
                 # not "Custom..."...
-                if self.stringHurricaneTimespan.get() == "Custom..." and \
-                        self.stringHurricaneIntensity.get() != "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -2035,8 +2123,8 @@ class HurricaneOptions(FrameLifts):
 
                 # If timespan combobox is "Custom..." and intensity combobox is
                 # "Custom..."...
-                if self.stringHurricaneTimespan.get() == "Custom..." and \
-                        self.stringHurricaneIntensity.get() == "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -2053,8 +2141,8 @@ class HurricaneOptions(FrameLifts):
 
                 # If timespan combobox is not "Custom..." and intensity combobox
                 # is "Custom..."...
-                if self.stringHurricaneTimespan.get() != "Custom..." and \
-                        self.stringHurricaneIntensity.get() == "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -2081,11 +2169,8 @@ class HurricaneOptions(FrameLifts):
                     self.func_Scroll_setOutputText(
                         "Deleting pre-existing folder.", None)
 
-                    # Pause script for 0.5 seconds.
-                    sleep(0.5)
-
-                    # Delete the folder.
-                    shutil.rmtree(self.fullPathName)
+                    # Delete the folder (returning once it is gone).
+                    func_Remove_Folder(self.fullPathName)
 
                     self.func_Scroll_setOutputText(
                         "Pre-existing folder deleted.", None)
@@ -2118,9 +2203,6 @@ class HurricaneOptions(FrameLifts):
                     # Exit the application's task.
                     exit()
 
-            # Pause script for 2.0 seconds.
-            sleep(2.0)
-
             self.func_Scroll_setOutputText("Creating folder path:\n" +
                                            self.fullPathName, None)
 
@@ -2175,9 +2257,6 @@ class HurricaneOptions(FrameLifts):
 
             self.func_Scroll_setOutputText("Creating CSV subfolder.", None)
 
-            # Pause script for 0.5 seconds.
-            sleep(0.5)
-
             # If subfolder doesn't exist, create it.
             if not os.path.exists(self.csvDirectory):
 
@@ -2204,9 +2283,6 @@ class HurricaneOptions(FrameLifts):
 
             self.func_Scroll_setOutputText("Creating GIS subfolder.", None)
 
-            # Pause script for 0.5 seconds.
-            sleep(0.5)
-
             # If subfolder doesn't exist, create it.
             if not os.path.exists(self.subFolder_GIS):
 
@@ -2232,10 +2308,10 @@ class HurricaneOptions(FrameLifts):
         try:
 
             # If timespan is not "Custom..."...
-            if self.stringHurricaneTimespan.get() != "Custom...":
+            if self.runParams.hazard_Timespan != "Custom...":
 
                 # If timespan equals All...
-                if self.stringHurricaneTimespan.get() == \
+                if self.runParams.hazard_Timespan == \
                         "All | 1842-" + str(int_OneYearAgo):
 
                     # Run function to create GIS subfolder.
@@ -2249,7 +2325,7 @@ class HurricaneOptions(FrameLifts):
                             curDate + fileExtZip, None)
 
                         # Retrieve CSV from URL.
-                        request.urlretrieve(self.textURLTextbox.get(),
+                        func_Cache_Retrieve(self.runParams.url_Text,
                             self.subFolder_GIS + "/" + noaa + "_" + hurr + "_" +
                             str(self.timespan_url).replace("-", "_to_").lower()+
                             curDate + fileExtZip)
@@ -2270,7 +2346,7 @@ class HurricaneOptions(FrameLifts):
                         sleep(5)
 
                         # Retrieve CSV from URL.
-                        request.urlretrieve(self.textURLTextbox.get(),
+                        func_Cache_Retrieve(self.runParams.url_Text,
                             self.subFolder_GIS + "/" + noaa + "_" + hurr + "_" +
                             str(self.timespan_url).replace("-", "_to_").lower()+
                             curDate + fileExtZip)
@@ -2309,7 +2385,7 @@ class HurricaneOptions(FrameLifts):
                             curDate, None)
 
                         # Retrieve CSV from URL.
-                        request.urlretrieve(self.textURLTextbox.get(),
+                        func_Cache_Retrieve(self.runParams.url_Text,
                             self.subFolder_GIS + "/" + noaa + "_" + hurr + "_" +
                             str(self.timespan_url).replace("-","_to_").lower() +
                             curDate + fileExtZip)
@@ -2330,7 +2406,7 @@ class HurricaneOptions(FrameLifts):
                         sleep(5)
 
                         # Retrieve CSV from URL.
-                        request.urlretrieve(self.textURLTextbox.get(),
+                        func_Cache_Retrieve(self.runParams.url_Text,
                             self.subFolder_GIS + "/" + noaa + "_" + hurr + "_" +
                             str(self.timespan_url).replace("-","_to_").lower() +
                             curDate + fileExtZip)
@@ -2358,9 +2434,6 @@ class HurricaneOptions(FrameLifts):
 
                     self.func_Scroll_setOutputText("Shapefile unzipped.", None)
 
-                # Pause script for half a second.
-                sleep(0.5)
-
                 # Execute function to rename the unzipped Shapefile.
                 self.func_Rename_Unzipped_Hurr_Shapefile()
 
@@ -2379,7 +2452,7 @@ class HurricaneOptions(FrameLifts):
                 self.func_NonCustomTimespan_FeatureClass_ValueChecks()
 
             # If timespan is "Custom..."...
-            if self.stringHurricaneTimespan.get() == "Custom...":
+            if self.runParams.hazard_Timespan == "Custom...":
 
                 # Run function to create GIS subfolder.
                 self.func_Create_GIS_subFolder()
@@ -2392,7 +2465,7 @@ class HurricaneOptions(FrameLifts):
                             curDate + fileExtZip, None)
 
                     # Retrieve CSV from URL.
-                    request.urlretrieve(self.textURLTextbox.get(),
+                    func_Cache_Retrieve(self.runParams.url_Text,
                             self.subFolder_GIS + "/" + noaa + "_" + hurr + "_" +
                             str(self.timespan_url).replace("-","_to_").lower() +
                             curDate + fileExtZip)
@@ -2412,7 +2485,7 @@ class HurricaneOptions(FrameLifts):
                     sleep(5)
 
                     # Retrieve CSV from URL.
-                    request.urlretrieve(self.textURLTextbox.get(),
+                    func_Cache_Retrieve(self.runParams.url_Text,
                             self.subFolder_GIS + "/" + noaa + "_" + hurr + "_" +
                             str(self.timespan_url).replace("-","_to_").lower() +
                             curDate + fileExtZip)
@@ -2437,9 +2510,6 @@ class HurricaneOptions(FrameLifts):
 
                 self.func_Scroll_setOutputText("Shapefile unzipped.", None)
 
-                # Pause script for half a second.
-                sleep(0.5)
-
                 # Execute function to rename the unzipped Shapefile.
                 self.func_Rename_Unzipped_Hurr_Shapefile()
 
@@ -2461,9 +2531,6 @@ class HurricaneOptions(FrameLifts):
                 # Run function to check attribute values within feature class.
                 self.func_CustomTimespan_FeatureClass_ValueChecks()
 
-            # Pause script for 0.5 seconds.
-            sleep(0.5)
-
         except HTTPError as httpError:
 
             # Display error message for URL-specific problems.
@@ -2556,7 +2623,7 @@ class HurricaneOptions(FrameLifts):
         # chosen.
 
         # If the speed combobox displays "Custom..."...
-        if self.stringHurricaneIntensity.get() == "Custom...":
+        if self.runParams.hazard_Magnitude == "Custom...":
 
                 # This will be the naming convention of the output feature class
                 # once converted from Shapefile.
@@ -2566,7 +2633,7 @@ class HurricaneOptions(FrameLifts):
                         curDate
 
         # If the speed combobox does not display "Custom..."...
-        elif self.stringHurricaneIntensity.get() != "Custom...":
+        elif self.runParams.hazard_Magnitude != "Custom...":
 
             # This will be the naming convention of the output feature class
             # once converted from Shapefile.
@@ -2581,7 +2648,7 @@ class HurricaneOptions(FrameLifts):
         # self.name_Hurr_FeatureClass variable if a custom timespan is chosen.
 
         # If the speed combobox displays "Custom..."...
-        if self.stringHurricaneIntensity.get() == "Custom...":
+        if self.runParams.hazard_Magnitude == "Custom...":
 
             # This will be the naming convention of the output feature class
             # once converted from Shapefile.
@@ -2590,7 +2657,7 @@ class HurricaneOptions(FrameLifts):
                 self.timespan_file_folder_naming + curDate
 
         # If the speed combobox does not display "Custom..."...
-        elif self.stringHurricaneIntensity.get() != "Custom...":
+        elif self.runParams.hazard_Magnitude != "Custom...":
 
             # This will be the naming convention of the output feature class
             # once converted from Shapefile.
@@ -2833,13 +2900,13 @@ class HurricaneOptions(FrameLifts):
                 for row in cursor:
 
                     # If the wind intensity is set to All...
-                    if self.stringHurricaneIntensity.get() == "All":
+                    if self.runParams.hazard_Magnitude == "All":
 
                         # Delete nothing.
                         pass
 
                     # If the wind intensity is set to Tropical Depression...
-                    elif self.stringHurricaneIntensity.get() == \
+                    elif self.runParams.hazard_Magnitude == \
                             "Trop. Depression":
 
                         # If the wind intensity is greater than or equal to
@@ -2849,7 +2916,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is set to Tropical Storm...
-                    elif self.stringHurricaneIntensity.get() == \
+                    elif self.runParams.hazard_Magnitude == \
                             "Trop. Storm":
 
                         # If the wind intensity is less than 34 knots and
@@ -2860,7 +2927,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is set to Category 1...
-                    elif self.stringHurricaneIntensity.get() == "Cat. 1":
+                    elif self.runParams.hazard_Magnitude == "Cat. 1":
 
                         # If the wind intensity is less than 64 knots and
                         # greater than or equal to 83 knots...
@@ -2870,7 +2937,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is set to Category 2...
-                    elif self.stringHurricaneIntensity.get() == "Cat. 2":
+                    elif self.runParams.hazard_Magnitude == "Cat. 2":
 
                         # If the wind intensity is less than 83 knots and
                         # greater than or equal to 96 knots...
@@ -2880,7 +2947,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is set to Category 3...
-                    elif self.stringHurricaneIntensity.get() == "Cat. 3":
+                    elif self.runParams.hazard_Magnitude == "Cat. 3":
 
                         # If the wind intensity is less than 96 knots and
                         # greater than or equal to 113 knots...
@@ -2890,7 +2957,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is Category 4...
-                    elif self.stringHurricaneIntensity.get() == "Cat. 4":
+                    elif self.runParams.hazard_Magnitude == "Cat. 4":
 
                         # If the wind intensity is less than 113 knots and
                         # greater than or equal to 137 knots...
@@ -2900,7 +2967,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is Category 5...
-                    elif self.stringHurricaneIntensity.get() == "Cat. 5":
+                    elif self.runParams.hazard_Magnitude == "Cat. 5":
 
                         # If the wind intensity is less than 137 knots...
                         if int(float(row[0])) < 137:
@@ -2908,14 +2975,14 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is set to Custom...
-                    elif self.stringHurricaneIntensity.get() == "Custom...":
+                    elif self.runParams.hazard_Magnitude == "Custom...":
 
                         # If the wind intensity is not within the
                         # From/To selections...
                         if int(float(row[0])) < \
-                                int(self.textCustomIntensityFrom) or \
+                                self.runParams.custom_Magnitude_Min or \
                                 int(float(row[0])) > \
-                                int(self.textCustomIntensityTo):
+                                self.runParams.custom_Magnitude_Max:
                             # Delete the row from the feature class.
                             cursor.deleteRow()
 
@@ -3100,8 +3167,6 @@ class HurricaneOptions(FrameLifts):
 
             self.func_Scroll_setOutputText("FULL_DATE field added.", None)
 
-            sleep(1)
-
             self.func_Scroll_setOutputText("Populating FULL_DATE field...",
                                            None)
 
@@ -3181,6 +3246,10 @@ class HurricaneOptions(FrameLifts):
                                            "within the selected custom "
                                            "timespan...", None)
 
+            # Custom timespan values (YYYY, MM, YYYY, MM) of the run.
+            yearFrom, monthFrom, yearTo, monthTo = \
+                func_Custom_Timespan(self.runParams)
+
             # Open the hurricane feature class with an Update Cursor.
             # Attribute field is set to the full_date field. Any values not
             # within the custom timespan selected will be deleted from the
@@ -3193,23 +3262,21 @@ class HurricaneOptions(FrameLifts):
 
                     # Assign the YYYYMM's monthly range in days.
                     monthRange = \
-                        calendar.monthrange(int(self.textCustomYearFrom),
-                                            int(self.textCustomMonthFrom))[1]
+                        calendar.monthrange(int(yearFrom), int(monthFrom))[1]
 
                     # Create FROM date by combining YYYY, MM, and DD
                     # parameters. DD = 1 for beginning of month.
                     fromDate = \
-                        datetime.datetime.strptime(self.textCustomYearFrom +
-                                                "-" + self.textCustomMonthFrom +
-                                                "-1", "%Y-%m-%d")
+                        datetime.datetime.strptime(yearFrom + "-" +
+                                                   monthFrom + "-1",
+                                                   "%Y-%m-%d")
 
                     # Create TO date by combining YYYY, MM, and DD
                     # parameters. DD = Monthly range for the given month/year.
                     toDate = \
-                        datetime.datetime.strptime(self.textCustomYearTo +
-                                                "-" + self.textCustomMonthTo +
-                                                "-" + str(monthRange),
-                                                "%Y-%m-%d")
+                        datetime.datetime.strptime(yearTo + "-" + monthTo +
+                                                   "-" + str(monthRange),
+                                                   "%Y-%m-%d")
 
                     # Format the "full_date" column into the
                     # following date format so that it can be used to
@@ -3228,9 +3295,6 @@ class HurricaneOptions(FrameLifts):
                                            "selected custom timespan have been "
                                            "removed.", None)
 
-            # Pause script for one second.
-            sleep(1)
-
             self.func_Scroll_setOutputText("Checking hurricane feature class "
                                            "for erroneous wind speed values "
                                            "equal to or less than zero knots. "
@@ -3267,13 +3331,13 @@ class HurricaneOptions(FrameLifts):
                 for row in cursor:
 
                     # If the wind intensity is set to All...
-                    if self.stringHurricaneIntensity.get() == "All":
+                    if self.runParams.hazard_Magnitude == "All":
 
                         # Delete nothing.
                         pass
 
                     # If the wind intensity is set to Tropical Depression...
-                    elif self.stringHurricaneIntensity.get() == \
+                    elif self.runParams.hazard_Magnitude == \
                             "Trop. Depression":
 
                         # If the wind intensity is greater than or equal to
@@ -3283,7 +3347,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is set to Tropical Storm...
-                    elif self.stringHurricaneIntensity.get() == \
+                    elif self.runParams.hazard_Magnitude == \
                             "Trop. Storm":
 
                         # If the wind intensity is less than 34 knots and
@@ -3294,7 +3358,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is set to Category 1...
-                    elif self.stringHurricaneIntensity.get() == "Cat. 1":
+                    elif self.runParams.hazard_Magnitude == "Cat. 1":
 
                         # If the wind intensity is less than 64 knots and
                         # greater than or equal to 83 knots...
@@ -3304,7 +3368,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is set to Category 2...
-                    elif self.stringHurricaneIntensity.get() == "Cat. 2":
+                    elif self.runParams.hazard_Magnitude == "Cat. 2":
 
                         # If the wind intensity is less than 83 knots and
                         # greater than or equal to 96 knots...
@@ -3314,7 +3378,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is set to Category 3...
-                    elif self.stringHurricaneIntensity.get() == "Cat. 3":
+                    elif self.runParams.hazard_Magnitude == "Cat. 3":
 
                         # If the wind intensity is less than 96 knots and
                         # greater than or equal to 113 knots...
@@ -3324,7 +3388,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is Category 4...
-                    elif self.stringHurricaneIntensity.get() == "Cat. 4":
+                    elif self.runParams.hazard_Magnitude == "Cat. 4":
 
                         # If the wind intensity is less than 113 knots and
                         # greater than or equal to 137 knots...
@@ -3334,7 +3398,7 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is Category 5...
-                    elif self.stringHurricaneIntensity.get() == "Cat. 5":
+                    elif self.runParams.hazard_Magnitude == "Cat. 5":
 
                         # If the wind intensity is less than 137 knots...
                         if int(float(row[0])) < 137:
@@ -3342,14 +3406,14 @@ class HurricaneOptions(FrameLifts):
                             cursor.deleteRow()
 
                     # If the wind intensity is set to Custom...
-                    elif self.stringHurricaneIntensity.get() == "Custom...":
+                    elif self.runParams.hazard_Magnitude == "Custom...":
 
                         # If the wind intensity is not within the
                         # From/To selections...
                         if int(float(row[0])) < \
-                                int(self.textCustomIntensityFrom) or \
+                                self.runParams.custom_Magnitude_Min or \
                                 int(float(row[0])) > \
-                                int(self.textCustomIntensityTo):
+                                self.runParams.custom_Magnitude_Max:
                             # Delete the row from the feature class.
                             cursor.deleteRow()
 
@@ -3645,15 +3709,14 @@ class HurricaneOptions(FrameLifts):
             # If the radio button is USA...
             if self.radioButton_Selection == 1:
 
-                # Execute function that downloads/unzips the Census Bureau's
-                # Shapefile.
-                self.func_Download_Unzip_Census_Shapefile()
+                # Execute function that builds (first run only) the county
+                # store from the Census Bureau's Shapefile.
+                self.func_Prepare_County_Store()
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract the 50 states and Washington DC only.
                 self.func_Extract_50_States_and_DC_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Increment progress bar.
@@ -3682,25 +3745,23 @@ class HurricaneOptions(FrameLifts):
             # If the radio button is State...
             elif self.radioButton_Selection == 2:
 
-                # Execute function that downloads/unzips the Census Bureau's
-                # Shapefile.
-                self.func_Download_Unzip_Census_Shapefile()
+                # Execute function that builds (first run only) the county
+                # store from the Census Bureau's Shapefile.
+                self.func_Prepare_County_Store()
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract the 50 states and Washington DC only.
                 self.func_Extract_50_States_and_DC_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Increment progress bar.
                 self.func_ProgressBar_setProgress(55)
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract state selection only.
                 self.func_Extract_State_Selection_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Increment progress bar.
@@ -3729,35 +3790,32 @@ class HurricaneOptions(FrameLifts):
             # If the radio button is County...
             elif self.radioButton_Selection == 3:
 
-                # Execute function that downloads/unzips the Census Bureau's
-                # Shapefile.
-                self.func_Download_Unzip_Census_Shapefile()
+                # Execute function that builds (first run only) the county
+                # store from the Census Bureau's Shapefile.
+                self.func_Prepare_County_Store()
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract the 50 states and Washington DC only.
                 self.func_Extract_50_States_and_DC_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Increment progress bar.
                 self.func_ProgressBar_setProgress(55)
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract state selection only.
                 self.func_Extract_State_Selection_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Increment progress bar.
                 self.func_ProgressBar_setProgress(58)
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract the county selection only.
                 self.func_Extract_County_Selection_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Increment progress bar.
@@ -3814,16 +3872,13 @@ class HurricaneOptions(FrameLifts):
             # Increment progress bar.
             self.func_ProgressBar_setProgress(43)
 
-            # Pause script for half a second.
-            sleep(0.5)
-
             try:
 
                 self.func_Scroll_setOutputText(
                     "Downloading US Census Shapefile...", None)
 
                 # Attempt to download the Shapefile.
-                request.urlretrieve(census_URL_CountyShapefile,
+                func_Cache_Retrieve(census_URL_CountyShapefile,
                                     self.subFolder_CensusShapefile + "/" +
                                     census_URL_CountyShapefile_FileName +
                                     fileExtZip)
@@ -3841,7 +3896,7 @@ class HurricaneOptions(FrameLifts):
                 sleep(5)
 
                 # Attempt to download the Shapefile.
-                request.urlretrieve(census_URL_CountyShapefile,
+                func_Cache_Retrieve(census_URL_CountyShapefile,
                                     self.subFolder_CensusShapefile + "/" +
                                     census_URL_CountyShapefile_FileName +
                                     fileExtZip)
@@ -3852,9 +3907,6 @@ class HurricaneOptions(FrameLifts):
             # Increment progress bar.
             self.func_ProgressBar_setProgress(49)
 
-            # Pause script for half a second.
-            sleep(0.5)
-
             self.func_Scroll_setOutputText(
                 "Unzipping US Census Shapefile...", None)
 
@@ -3902,127 +3954,94 @@ class HurricaneOptions(FrameLifts):
                                            "Traceback: " +
                                            traceback.format_exc(), color_Red)
 
-    def func_Extract_50_States_and_DC_Only(self, censusShapefile, fileGDB_Path):
+    def func_Prepare_County_Store(self):
 
-        # This function controls the process of extracting the 50 states and
-        # Washington DC from the Census Bureau's Shapefile and performing
-        # various modifications to that data.
+        # This function controls the county store, which holds the 50 states
+        # and DC counties already projected to the designated PCS and indexed
+        # by state FIPS code and county name. It is built once from the Census
+        # Bureau's Shapefile and then reused by every run, so the Census
+        # Shapefile is only downloaded when the county store doesn't exist.
 
         try:
 
-            self.func_Scroll_setOutputText(
-                "Copying Census Shapefile to File GDB...", None)
+            # Assign the county store's feature class to variable.
+            self.countyStore = func_County_Store_Path(
+                census_URL_CountyShapefile_FileName)
 
-            # Copy the Census Shapefile to a feature class within the File GDB.
-            arcpy.CopyFeatures_management(censusShapefile,
-                                          fileGDB_Path + "/" +
-                                          featureClass_50States_and_DC_only)
+            # If the county store has already been built...
+            if func_County_Store_Exists(census_URL_CountyShapefile_FileName):
 
-            # Display geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+                self.func_Scroll_setOutputText("County store found (" +
+                                               self.countyStore + ").", None)
 
-            self.func_Scroll_setOutputText(
-                "Census Shapefile copied to File GDB.", None)
+            else:
 
-            # Pause script for one second.
-            sleep(1)
+                self.func_Scroll_setOutputText(
+                    "County store not found, building it (one time only)...",
+                    None)
 
-            self.func_Scroll_setOutputText(
-                "Extracting 50 States and DC from Feature Class...", None)
+                # Execute function that downloads/unzips the Census Bureau's
+                # Shapefile.
+                self.func_Download_Unzip_Census_Shapefile()
 
-            # Open the Census feature class with an Update Cursor.
-            # Attribute field set to the state's FIPS code.
-            with arcpy.da.UpdateCursor(fileGDB_Path + "/" +
-                                    featureClass_50States_and_DC_only,
-                                    census_Shapefile_Field_StateFIPS) as cursor:
+                self.func_Scroll_setOutputText("Projecting counties to PCS " +
+                            pcsReferenceString +
+                            " with Central Meridian Offset (-30.0 degrees) "
+                            "and indexing...", None)
 
-                # For each feature in the Census feature class.
-                for row in cursor:
+                # Build the county store from the Census Shapefile.
+                func_Build_County_Store(self.subFolder_CensusShapefile + "/" +
+                                        census_URL_CountyShapefile_FileName +
+                                        fileExtShp,
+                                        census_URL_CountyShapefile_FileName,
+                                        pcsReference)
 
-                    # This If statement removes non-50 state (and DC) FIPS codes
-                    # from the Census feature class. The original data includes
-                    # all US territories, and those FIPS codes must be removed.
-                    if row[0] == "60" or row[0] == "66" or row[0] == "69" or \
-                            row[0] == "72" or row[0] == "78":
+                # Display geoprocessing messages.
+                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-                        # Delete polygon feature.
-                        cursor.deleteRow()
+                self.func_Scroll_setOutputText("County store built (" +
+                                               self.countyStore + ").", None)
 
-            # Display geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+            # Increment progress bar.
+            self.func_ProgressBar_setProgress(55)
 
-            self.func_Scroll_setOutputText(
-                "50 States and DC extracted from Feature Class.", None)
+        except arcpy.ExecuteError:
 
-            # Set the workspace within the File GDB for the following tasks.
-            arcpy.env.workspace = fileGDB_Path
+            # Display geoprocessing error messages.
+            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
 
-            # Set naming convention variable for projecting Census feature
-            # class.
-            self.featureClass_Polygons_Projected = \
-                featureClass_50States_and_DC_only + "_Projected"
+        except Exception as e:
 
-            self.func_Scroll_setOutputText("Projecting feature class to PCS " +
-                            pcsReferenceString +
-                            " with Central Meridian Offset (-30.0 degrees)...",
-                            None)
+            # Display error messages for all other errors.
+            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
+                                           "Traceback: " +
+                                           traceback.format_exc(), color_Red)
 
-            # Project the Census feature class to the designated PCS as a new
-            # feature class within the File GDB.
-            arcpy.Project_management(featureClass_50States_and_DC_only,
-                                     self.featureClass_Polygons_Projected,
-                                     pcsReference)
+    def func_Extract_50_States_and_DC_Only(self, countyStore, fileGDB_Path):
 
-            # Display geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+        # This function controls the process of extracting the 50 states and
+        # Washington DC from the county store. The county store's polygons are
+        # already limited to the 50 states and DC and projected to the
+        # designated PCS, so they are copied straight into the File GDB.
 
-            self.func_Scroll_setOutputText("PCS Projection to " +
-                                           pcsReferenceString + " completed.",
-                                           None)
+        try:
+
+            # Set the workspace within the File GDB for the following tasks.
+            arcpy.env.workspace = fileGDB_Path
 
             self.func_Scroll_setOutputText(
-                "Recalculating extent for feature class...", None)
+                "Extracting 50 States and DC from county store...", None)
 
-            # Recalculate extent of the projected Census feature class.
-            arcpy.RecalculateFeatureClassExtent_management(
-                self.featureClass_Polygons_Projected)
+            # Copy the projected counties from the county store to a feature
+            # class within the File GDB.
+            func_Extract_County_Mask(countyStore, fileGDB_Path + "/" +
+                                     featureClass_50States_and_DC_only)
 
             # Display geoprocessing messages.
             self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-            self.func_Scroll_setOutputText("Feature class extent recalculated.",
-                                           None)
-
-            self.func_Scroll_setOutputText("Deleting feature class " +
-                                           featureClass_50States_and_DC_only +
-                                           " from File GDB...", None)
-
-            # Delete the original, pre-projected Census feature class from the
-            # File GDB. It is no longer needed.
-            arcpy.Delete_management(featureClass_50States_and_DC_only)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
             self.func_Scroll_setOutputText(
-                "Feature class deleted from File GDB.", None)
-
-            self.func_Scroll_setOutputText("Renaming feature class " +
-                                    self.featureClass_Polygons_Projected +
-                                    " back to " +
-                                    featureClass_50States_and_DC_only + "...",
-                                    None)
-
-            # Rename the projected Census feature class to the original naming
-            # convention of the feature class that was just deleted.
-            arcpy.Rename_management(self.featureClass_Polygons_Projected,
-                                    featureClass_50States_and_DC_only)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("Feature class has been renamed.",
-                                           None)
+                "50 States and DC extracted from county store.", None)
 
         except arcpy.ExecuteError:
 
@@ -4036,130 +4055,35 @@ class HurricaneOptions(FrameLifts):
                                            "Traceback: " +
                                            traceback.format_exc(), color_Red)
 
-    def func_Extract_State_Selection_Only(self, censusShapefile, fileGDB_Path):
+    def func_Extract_State_Selection_Only(self, countyStore, fileGDB_Path):
 
         # This function controls the process of extracting the user-selected
-        # state from the Census Bureau's Shapefile and performing various
-        # modifications to that data.
+        # state from the county store. The state's counties are looked up by
+        # state FIPS code and are already projected to the designated PCS.
 
         try:
 
-            self.func_Scroll_setOutputText(
-                "Copying Census Shapefile to File GDB...", None)
-
-            # Copy the Census Shapefile to a feature class within the File GDB.
-            arcpy.CopyFeatures_management(censusShapefile, fileGDB_Path + "/" +
-                                        self.featureClass_State_Selection_Only)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "Census Shapefile copied to File GDB.", None)
-
-            # Pause script for one second.
-            sleep(1)
-
-            self.func_Scroll_setOutputText("Extracting state selection(" +
-                                           self.stringState_Name.get() +
-                                           ") from Feature Class...", None)
-
-            # Open the Census feature class with an Update Cursor.
-            # Attribute field set to the state's FIPS code.
-            with arcpy.da.UpdateCursor(fileGDB_Path + "/" +
-                                    self.featureClass_State_Selection_Only,
-                                    census_Shapefile_Field_StateFIPS) as cursor:
-
-                # For each feature in the Census feature class...
-                for row in cursor:
-
-                    # This If statement removes all polygons not affiliated with
-                    # the user-selected state's FIPS code. This is accessed
-                    # from the state name/state FIPS dictionary.
-                    if row[0] != \
-                            dict_StateName_StateFIPs.get(
-                                self.stringState_Name.get()):
-
-                        # Delete polygon feature.
-                        cursor.deleteRow()
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("State selection(" +
-                                           self.stringState_Name.get() +
-                                           ") extracted from Feature Class.",
-                                           None)
-
             # Set workspace for the following tasks.
             arcpy.env.workspace = fileGDB_Path
 
-            # Set naming convention variable for projecting Census feature
-            # class.
-            self.featureClass_Polygons_Projected = \
-                self.featureClass_State_Selection_Only + "_Projected"
-
-            self.func_Scroll_setOutputText("Projecting feature class to PCS " +
-                            pcsReferenceString +
-                            " with Central Meridian Offset (-30.0 degrees)...",
-                            None)
-
-            # Project the Census feature class to the designated PCS as a new
-            # feature class within the File GDB.
-            arcpy.Project_management(self.featureClass_State_Selection_Only,
-                                     self.featureClass_Polygons_Projected,
-                                     pcsReference)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("PCS Projection to " +
-                                           pcsReferenceString + " completed.",
-                                           None)
-
-            self.func_Scroll_setOutputText(
-                "Recalculating extent for feature class...",
-                None)
-
-            # Recalculate extent of the projected Census feature class.
-            arcpy.RecalculateFeatureClassExtent_management(
-                self.featureClass_Polygons_Projected)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("Feature class extent recalculated.",
-                                           None)
-
-            self.func_Scroll_setOutputText("Deleting feature class " +
-                                        self.featureClass_State_Selection_Only +
-                                        " from File GDB...", None)
-
-            # Delete the original, pre-projected Census feature class from the
-            # File GDB. It is no longer needed.
-            arcpy.Delete_management(self.featureClass_State_Selection_Only)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "Feature class deleted from File GDB.", None)
-
-            self.func_Scroll_setOutputText("Renaming feature class " +
-                                self.featureClass_Polygons_Projected +
-                                " back to " +
-                                self.featureClass_State_Selection_Only + "...",
-                                None)
+            self.func_Scroll_setOutputText("Extracting state selection(" +
+                                           self.runParams.state_Name +
+                                           ") from county store...", None)
 
-            # Rename the projected Census feature class to the original naming
-            # convention of the feature class that was just deleted.
-            arcpy.Rename_management(self.featureClass_Polygons_Projected,
-                                    self.featureClass_State_Selection_Only)
+            # Copy the user-selected state's projected counties from the county
+            # store to a feature class within the File GDB. The state's FIPS
+            # code is accessed from the state name/state FIPS dictionary.
+            func_Extract_County_Mask(countyStore, fileGDB_Path + "/" +
+                                     self.featureClass_State_Selection_Only,
+                                     dict_StateName_StateFIPs.get(
+                                         self.runParams.state_Name))
 
             # Get geoprocessing messages.
             self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-            self.func_Scroll_setOutputText("Feature class has been renamed.",
+            self.func_Scroll_setOutputText("State selection(" +
+                                           self.runParams.state_Name +
+                                           ") extracted from county store.",
                                            None)
 
         except arcpy.ExecuteError:
@@ -4174,146 +4098,36 @@ class HurricaneOptions(FrameLifts):
                                            "Traceback: " +
                                            traceback.format_exc(), color_Red)
 
-    def func_Extract_County_Selection_Only(self, censusShapefile, fileGDB_Path):
+    def func_Extract_County_Selection_Only(self, countyStore, fileGDB_Path):
 
         # This function controls the process of extracting the user-selected
-        # county from the Census Bureau's Shapefile and performing various
-        # modifications to that data.
+        # county from the county store. The county is looked up by state FIPS
+        # code and county name and is already projected to the designated PCS.
 
         try:
 
-            self.func_Scroll_setOutputText(
-                "Copying Census Shapefile to File GDB...", None)
-
-            # Copy the Census Shapefile to a feature class within the File GDB.
-            arcpy.CopyFeatures_management(censusShapefile, fileGDB_Path + "/" +
-                                          self.featureClass_County_State_Naming)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "Census Shapefile copied to File GDB.", None)
-
-            # Pause script for one second.
-            sleep(1)
-
-            self.func_Scroll_setOutputText("Extracting (" +
-                                           self.stringCounty_Name.get() +
-                                           ", " + self.stringState_Name.get() +
-                                           ") from Feature Class...", None)
-
-            # Open the Census feature class with an Update Cursor.
-            # Field names set to the state's FIPS code and county names.
-            with arcpy.da.UpdateCursor(fileGDB_Path + "/" +
-                                self.featureClass_County_State_Naming,
-                                field_names=[census_Shapefile_Field_StateFIPS,
-                                census_Shapefile_Field_CountyName]) as cursor:
-
-                # For each feature in the Census feature class...
-                for row in cursor:
-
-                    # If the feature's state FIPS code matches the user-selected
-                    # state's FIPS code...
-                    if row[0] == dict_StateName_StateFIPs.get(
-                            self.stringState_Name.get()):
-
-                        # If the feature's county name matches the user-selected
-                        # county name within the matching state FIPS code...
-                        if row[1] == self.stringCounty_Name.get():
-
-                            # Do nothing, leave that record within the feature
-                            # class.
-                            pass
-
-                        else:
-
-                            # Delete the feature from the feature class, as it
-                            # is not a match.
-                            cursor.deleteRow()
-
-                    else:
-
-                        # Else, delete the feature as the state FIPS code does
-                        # not match the user-selected state.
-                        cursor.deleteRow()
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(self.stringCounty_Name.get() + ", " +
-                                           self.stringState_Name.get() +
-                                           " extracted from Feature Class.",
-                                           None)
-
             # Set workspace for the following tasks.
             arcpy.env.workspace = fileGDB_Path
 
-            # Set naming convention variable for projecting Census feature
-            # class.
-            self.featureClass_Polygons_Projected = \
-                self.featureClass_County_State_Naming + "_Projected"
-
-            self.func_Scroll_setOutputText("Projecting feature class to PCS " +
-                            pcsReferenceString +
-                            " with Central Meridian Offset (-30.0 degrees)...",
-                            None)
-
-            # Project the Census feature class to the designated PCS as a new
-            # feature class within the File GDB.
-            arcpy.Project_management(self.featureClass_County_State_Naming,
-                                     self.featureClass_Polygons_Projected,
-                                     pcsReference)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("PCS Projection to " +
-                                           pcsReferenceString + " completed.",
-                                           None)
-
-            self.func_Scroll_setOutputText(
-                "Recalculating extent for feature class...", None)
-
-            # Recalculate extent of the projected Census feature class.
-            arcpy.RecalculateFeatureClassExtent_management(
-                self.featureClass_Polygons_Projected)
+            self.func_Scroll_setOutputText("Extracting (" +
+                                           self.runParams.county_Name +
+                                           ", " + self.runParams.state_Name +
+                                           ") from county store...", None)
+
+            # Copy the user-selected county's projected polygon from the county
+            # store to a feature class within the File GDB.
+            func_Extract_County_Mask(countyStore, fileGDB_Path + "/" +
+                                     self.featureClass_County_State_Naming,
+                                     dict_StateName_StateFIPs.get(
+                                         self.runParams.state_Name),
+                                     self.runParams.county_Name)
 
             # Get geoprocessing messages.
             self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-            self.func_Scroll_setOutputText("Feature class extent recalculated.",
-                                           None)
-
-            self.func_Scroll_setOutputText("Deleting feature class " +
-                                        self.featureClass_County_State_Naming +
-                                        " from File GDB...", None)
-
-            # Delete the original, pre-projected Census feature class from the
-            # File GDB. It is no longer needed.
-            arcpy.Delete_management(self.featureClass_County_State_Naming)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "Feature class deleted from File GDB.", None)
-
-            self.func_Scroll_setOutputText("Renaming feature class " +
-                                self.featureClass_Polygons_Projected +
-                                " back to " +
-                                self.featureClass_County_State_Naming + "...",
-                                None)
-
-            # Rename the projected Census feature class to the original naming
-            # convention of the feature class that was just deleted.
-            arcpy.Rename_management(self.featureClass_Polygons_Projected,
-                                    self.featureClass_County_State_Naming)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("Feature class has been renamed.",
+            self.func_Scroll_setOutputText(self.runParams.county_Name + ", " +
+                                           self.runParams.state_Name +
+                                           " extracted from county store.",
                                            None)
 
         except arcpy.ExecuteError:
@@ -4371,7 +4185,7 @@ class HurricaneOptions(FrameLifts):
                 # Display this particular message before executing the clip.
                 self.func_Scroll_setOutputText(
                     "Clipping hurricane features to state selection(" +
-                    self.stringState_Name.get() + ") with ~50 mile buffer...",
+                    self.runParams.state_Name + ") with ~50 mile buffer...",
                     None)
 
             # If the user selects County...
@@ -4380,8 +4194,8 @@ class HurricaneOptions(FrameLifts):
                 # Display this particular message before executing the clip.
                 self.func_Scroll_setOutputText(
                     "Clipping hurricane features to " +
-                    self.stringCounty_Name.get() + ", " +
-                    self.stringState_Name.get() + " with ~50 mile buffer...",
+                    self.runParams.county_Name + ", " +
+                    self.runParams.state_Name + " with ~50 mile buffer...",
                     None)
 
             # Perform a clip of the hurricane line features to the specified
@@ -4441,7 +4255,7 @@ class HurricaneOptions(FrameLifts):
                 self.func_Scroll_setOutputText(
                     str(self.state_storm_count) + " storms have been "
                     "clipped to state selection(" +
-                    self.stringState_Name.get() + ").", None)
+                    self.runParams.state_Name + ").", None)
 
             # If the user selects County...
             if self.radioButton_Selection == 3:
@@ -4457,8 +4271,8 @@ class HurricaneOptions(FrameLifts):
                 # Display this particular message after executing the clip.
                 self.func_Scroll_setOutputText(
                     str(self.county_storm_count) + " storms have been clipped "
-                    "to " + self.stringCounty_Name.get() + ", " +
-                    self.stringState_Name.get() + ".", None)
+                    "to " + self.runParams.county_Name + ", " +
+                    self.runParams.state_Name + ".", None)
 
             # Clear any in memory storage.
             self.func_Clear_InMemory()
@@ -4600,7 +4414,7 @@ class HurricaneOptions(FrameLifts):
         try:
 
             # If the user chooses to output the count results to CSV file...
-            if self.statusAnalysis_OutputToCSVFile.get() == 1:
+            if "OutputToCSVFile" in self.runParams.analysis_Options:
 
                 # Execute function to create CSV folder for output data counts
                 # file to be stored.
@@ -4640,51 +4454,47 @@ class HurricaneOptions(FrameLifts):
                                    self.folderNamingAddition + fileExtCSV, "w")
 
                     # If timespan and intensity drop-downs don't show Custom...
-                    if self.stringHurricaneTimespan.get() != "Custom..." and \
-                            self.stringHurricaneIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                    self.stringHurricaneTimespan.get() + ",\n")
+                                    self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                    self.stringHurricaneIntensity.get() + ",\n")
+                                    self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan drop-down shows Custom and intensity doesn't..
-                    if self.stringHurricaneTimespan.get() == "Custom..." and \
-                            self.stringHurricaneIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # WRite the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                    self.stringHurricaneIntensity.get() + ",\n")
+                                    self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan and intensity drop-downs both show Custom...
-                    if self.stringHurricaneTimespan.get() == "Custom..." and \
-                            self.stringHurricaneIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # If timespan drop-down doesn't show Custom and Intensity
                     # does...
-                    if self.stringHurricaneTimespan.get() != "Custom..." and \
-                            self.stringHurricaneIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                    self.stringHurricaneTimespan.get() + ",\n")
+                                    self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # Now write the following lines, regardless of
                     # timespan/intensity selection.
@@ -4703,54 +4513,32 @@ class HurricaneOptions(FrameLifts):
                                   "Mean Intensity,Median Intensity,"
                                   "Mode Intensity,\n")
 
-                    # Create empty list to store all US intensity values.
-                    magList_US = []
-
-                    # Open the temp_union feature class as a Search Cursor,
-                    # with analysis fields set to FIPS code and intensity.
-                    with arcpy.da.SearchCursor("temp_union",
-                                            [census_Shapefile_Field_StateFIPS,
-                                            analysis_Mag_Field]) as cursor:
-
-                        # For each feature within the spatial join...
-                        for row in cursor:
-
-                            if row[1] > 0:
-
-                                # Append hurricane intensities to magList_US.
-                                magList_US.append(row[1])
-
-                    try:
-
-                        # Calculate mode of all intensities within list.
-                        modeValue_US = mode(magList_US)
-
-                        # Convert mode information to float and then to
-                        # string with two decimal places.
-                        modeString_US = \
-                                    str("{0:.2f}".format(float(modeValue_US)))
-
-                    except StatisticsError:
-
-                            # This catches any lists containing no mode.
-                            # This will occur if all values within list are
-                            # unique values.
-
-                            # Assign modeString to the following phrase.
-                        modeString_US = "No Unique Mode"
-
-                        pass
-
-                        # Write the following data to the data counts CSV.
-                        # Min intensity, max intensity, mean intensity, median
-                        # intensity, and mode intensity.
-                    csvFile.write(str(min(magList_US)) + "," +
-                                str(max(magList_US)) + "," +
-                                str("{0:.2f}".format(numpy.mean(magList_US)) +
-                                "," +
-                                str("{0:.2f}".format(
-                                    numpy.median(magList_US))) + "," +
-                                modeString_US + "," + ",\n"))
+                    # Read the FIPS code, storm code, and intensity fields of
+                    # the temp_union feature class into arrays (one scan for
+                    # all statistics). Areas outside of the storm buffers have
+                    # no intensity, so they are read as 0.
+                    unionArray = arcpy.da.FeatureClassToNumPyArray(
+                        "temp_union", [census_Shapefile_Field_StateFIPS,
+                                       analysis_HurrCode_Field,
+                                       analysis_Mag_Field],
+                        null_value={analysis_Mag_Field: 0})
+
+                    # Keep only the features with wind speed above 0.
+                    unionArray = unionArray[unionArray[analysis_Mag_Field] > 0]
+
+                    # Calculate statistics of all intensities within the US.
+                    stats_US = func_Value_Statistics(
+                        unionArray[analysis_Mag_Field])
+
+                    # Write the following data to the data counts CSV.
+                    # Min intensity, max intensity, mean intensity, median
+                    # intensity, and mode intensity.
+                    csvFile.write(str(stats_US.minimum) + "," +
+                                  str(stats_US.maximum) + "," +
+                                  str("{0:.2f}".format(stats_US.mean)) + "," +
+                                  str("{0:.2f}".format(stats_US.median)) +
+                                  "," + func_Mode_String(stats_US.mode) + "," +
+                                  ",\n")
 
                     csvFile.write("\n")
                     csvFile.write("Nationwide Storm Name(s):,")
@@ -4767,93 +4555,44 @@ class HurricaneOptions(FrameLifts):
                                   "Mean Intensity,Median Intensity,"
                                   "Mode Intensity,State FIPS Code,\n")
 
-                    # Create empty list for storing hurricane values per state.
-                    hurrList = []
+                    # Calculate statistics of the intensities within each state
+                    # (one pass over the arrays, grouped by FIPS code).
+                    stats_PerState = func_Group_Statistics(
+                        unionArray[census_Shapefile_Field_StateFIPS],
+                        unionArray[analysis_Mag_Field])
 
-                    # Create empty list for storing hurricane intensity values
-                    # per state.
-                    magList = []
+                    # Count the unique storm codes within each state. This
+                    # reveals how many hurricanes occurred.
+                    stormCount_PerState = func_Group_Distinct_Counts(
+                        unionArray[census_Shapefile_Field_StateFIPS],
+                        unionArray[analysis_HurrCode_Field])
 
                     # For each state value in the ordered dictionary...
                     for key in dictKeys_OrderedDict_StateNames:
 
-                        # Set counter to zero, for counting hurricane within
-                        # each state during loop.
-                        counter = 0
-
-                        # Clears hurrList after each state count has concluded.
-                        hurrList.clear()
+                        # Statistics for the state's FIPS code (None if the
+                        # state has no storms).
+                        stats_State = stats_PerState.get(
+                            dictKeys_OrderedDict_StateNames[key])
 
-                        # Clears magList after each state count has concluded.
-                        magList.clear()
-
-                        # Open the in_memory spatial join as a Search Cursor,
-                        # with analysis fields set to FIPS code and intensity.
-                        with arcpy.da.SearchCursor("temp_union",
-                                            [census_Shapefile_Field_StateFIPS,
-                                            analysis_HurrCode_Field,
-                                            analysis_Mag_Field]) as cursor:
-
-                            # For each feature within the spatial join...
-                            for row in cursor:
-
-                                # If FIPS code matches a state in the ordered
-                                # dictionary and the wind speed is above 0...
-                                if row[0] == \
-                                    dictKeys_OrderedDict_StateNames[key] and \
-                                    row[2] > 0:
-
-                                    # Append hurricane names to hurrList.
-                                    hurrList.append(row[1])
-
-                                    # Append hurricane intensities to magList.
-                                    magList.append(row[2])
-
-                                    # Increment counter by one.
-                                    counter = counter + 1
-
-                        # If counter is greater than zero...
-                        if counter > 0:
-
-                            try:
-
-                                # Calculate mode of all intensities within list.
-                                modeValue = mode(magList)
-
-                                # Convert mode information to float and then to
-                                # string with two decimal places.
-                                modeString = \
-                                    str("{0:.2f}".format(float(modeValue)))
-
-                            except StatisticsError:
-
-                                # This catches any lists containing no mode.
-                                # This will occur if all values within list are
-                                # unique values.
-
-                                # Assign modeString to the following phrase.
-                                modeString = "No Unique Mode"
-
-                                pass
-
-                            # Identify and count the unique storm names within
-                            # hurrList. The length (count) of the uniqueNames
-                            # variable will reveal how many hurricanes occurred.
-                            uniqueNameCount = len(numpy.unique((hurrList)))
+                        # If the state has any storms...
+                        if stats_State is not None:
 
                             # Write the following data to the data counts CSV.
                             # State name, how many hurricanes, min mag, max
                             # mag, mean mag, median mag, mode mag, and FIPs.
                             csvFile.write(str(key) + "," +
-                                str(uniqueNameCount) + "," +
-                                str(min(magList)) + "," + str(max(magList)) +
+                                str(stormCount_PerState[
+                                    dictKeys_OrderedDict_StateNames[key]]) +
+                                "," + str(stats_State.minimum) + "," +
+                                str(stats_State.maximum) + "," +
+                                str("{0:.2f}".format(stats_State.mean)) +
                                 "," +
-                                str("{0:.2f}".format(numpy.mean(magList)) +
+                                str("{0:.2f}".format(stats_State.median)) +
+                                "," + func_Mode_String(stats_State.mode) +
                                 "," +
-                                str("{0:.2f}".format(numpy.median(magList))) +
-                                "," + modeString + "," +
                                 str(dictKeys_OrderedDict_StateNames[key]) +
-                                ",\n"))
+                                ",\n")
 
                     # Close the data counts CSV file.
                     csvFile.close()
@@ -4893,55 +4632,51 @@ class HurricaneOptions(FrameLifts):
                                    self.folderNamingAddition + fileExtCSV, "w")
 
                     # If timespan and intensity drop-downs don't show Custom...
-                    if self.stringHurricaneTimespan.get() != "Custom..." and \
-                            self.stringHurricaneIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                      self.stringHurricaneTimespan.get() +
+                                      self.runParams.hazard_Timespan +
                                       ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                      self.stringHurricaneIntensity.get() +
+                                      self.runParams.hazard_Magnitude +
                                       ",\n")
 
                     # If timespan drop-down shows Custom and intensity drop-down
                     # doesn't show Custom...
-                    if self.stringHurricaneTimespan.get() == "Custom..." and \
-                            self.stringHurricaneIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                    self.stringHurricaneIntensity.get() + ",\n")
+                                    self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan drop-down shows Custom and intensity drop-down
                     # shows Custom...
-                    if self.stringHurricaneTimespan.get() == "Custom..." and \
-                            self.stringHurricaneIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # If timespan drop-down doesn't show Custom and intensity
                     # drop-down shows Custom...
-                    if self.stringHurricaneTimespan.get() != "Custom..." and \
-                            self.stringHurricaneIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                      self.stringHurricaneTimespan.get() + ",\n")
+                                      self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # Now write the following lines, regardless of
                     # timespan/intensity selection.
@@ -4955,10 +4690,10 @@ class HurricaneOptions(FrameLifts):
                                   str(self.nationwide_storm_count) + ",\n")
                     csvFile.write("\n")
                     csvFile.write("State Storms - " +
-                                  str(self.stringState_Name.get()) +
+                                  str(self.runParams.state_Name) +
                                   " (FIPS: " +
                                   str(dictKeys_OrderedDict_StateNames[
-                                          self.stringState_Name.get()]) +
+                                          self.runParams.state_Name]) +
                                   "):," + str(self.state_storm_count) + ",\n")
                     csvFile.write("\n")
                     csvFile.write("Statewide Hurricane Data,\n")
@@ -4967,56 +4702,33 @@ class HurricaneOptions(FrameLifts):
                                   "Mean Intensity,Median Intensity,"
                                   "Mode Intensity,\n")
 
-                    # Create empty list to store all state intensity values.
-                    magList_State = []
-
-                    # Open the in_memory spatial join as a Search Cursor,
-                    # with analysis fields set to FIPS code and intensity.
-                    with arcpy.da.SearchCursor("temp_union",
-                                            [census_Shapefile_Field_StateFIPS,
-                                            analysis_Mag_Field]) as cursor:
-
-                        # For each feature within the spatial join...
-                        for row in cursor:
-
-                            # If the intensity field is greater than zero...
-                            if row[1] > 0:
-
-                                # Append hurricane intensities to magList_State.
-                                magList_State.append(row[1])
-
-                    try:
-
-                        # Calculate mode of all intensities within list.
-                        modeValue_State = mode(magList_State)
-
-                        # Convert mode information to float and then to
-                        # string with two decimal places.
-                        modeString_State = \
-                                    str("{0:.2f}".format(
-                                        float(modeValue_State)))
-
-                    except StatisticsError:
-
-                            # This catches any lists containing no mode.
-                            # This will occur if all values within list are
-                            # unique values.
-
-                            # Assign modeString to the following phrase.
-                        modeString_State = "No Unique Mode"
-
-                        pass
-
-                        # Write the following data to the data counts CSV.
-                        # Min intensity, max intensity, mean intensity, median
-                        # intensity, and mode intensity.
-                    csvFile.write(str(min(magList_State)) + "," +
-                                str(max(magList_State)) + "," +
-                                str("{0:.2f}".format(
-                                    numpy.mean(magList_State)) + "," +
-                                str("{0:.2f}".format(
-                                    numpy.median(magList_State))) + "," +
-                                modeString_State + "," + ",\n"))
+                    # Read the county name, storm code, and intensity fields of
+                    # the temp_union feature class into arrays (one scan for
+                    # all statistics). Areas outside of the storm buffers have
+                    # no intensity, so they are read as 0.
+                    unionArray = arcpy.da.FeatureClassToNumPyArray(
+                        "temp_union", [census_Shapefile_Field_CountyName_1,
+                                       analysis_HurrCode_Field,
+                                       analysis_Mag_Field],
+                        null_value={analysis_Mag_Field: 0})
+
+                    # Keep only the features with wind speed above 0.
+                    unionArray = unionArray[unionArray[analysis_Mag_Field] > 0]
+
+                    # Calculate statistics of all intensities within the state.
+                    stats_State = func_Value_Statistics(
+                        unionArray[analysis_Mag_Field])
+
+                    # Write the following data to the data counts CSV.
+                    # Min intensity, max intensity, mean intensity, median
+                    # intensity, and mode intensity.
+                    csvFile.write(str(stats_State.minimum) + "," +
+                                  str(stats_State.maximum) + "," +
+                                  str("{0:.2f}".format(stats_State.mean)) +
+                                  "," +
+                                  str("{0:.2f}".format(stats_State.median)) +
+                                  "," + func_Mode_String(stats_State.mode) +
+                                  "," + ",\n")
 
                     csvFile.write("\n")
                     csvFile.write("State Storm Name(s):,")
@@ -5033,91 +4745,43 @@ class HurricaneOptions(FrameLifts):
                                   "Mean Intensity,Median Intensity,"
                                   "Mode Intensity,\n")
 
-                    # Create empty list for storing hurricane values per county.
-                    hurrList = []
+                    # Calculate statistics of the intensities within each
+                    # county (one pass over the arrays, grouped by county
+                    # name).
+                    stats_PerCounty = func_Group_Statistics(
+                        unionArray[census_Shapefile_Field_CountyName_1],
+                        unionArray[analysis_Mag_Field])
 
-                    # Create empty list for storing hurricane intensity values
-                    # per county.
-                    magList = []
+                    # Count the unique storm codes within each county. This
+                    # reveals how many hurricanes occurred.
+                    stormCount_PerCounty = func_Group_Distinct_Counts(
+                        unionArray[census_Shapefile_Field_CountyName_1],
+                        unionArray[analysis_HurrCode_Field])
 
                     # For each county list within state/county dictionary
                     # matching the state drop-down selection...
                     for key in GUI_CountiesPerState.dict_state_counties[
-                        self.stringState_Name.get()]:
+                        self.runParams.state_Name]:
 
-                        # Set counter to zero, for counting hurricane within
-                        # each county during loop.
-                        counter = 0
+                        # Statistics for the county (None if the county has no
+                        # storms).
+                        stats_County = stats_PerCounty.get(key)
 
-                        # Clears hurrList after each county count has concluded.
-                        hurrList.clear()
-
-                        # Clears magList after each county count has concluded.
-                        magList.clear()
-
-                        # Open the in_memory spatial join as a Search Cursor,
-                        # with analysis fields set to FIPS code and intensity.
-                        with arcpy.da.SearchCursor("temp_union",
-                                        [census_Shapefile_Field_CountyName_1,
-                                            analysis_HurrCode_Field,
-                                            analysis_Mag_Field]) as cursor:
-
-                            # For each feature within the spatial join...
-                            for row in cursor:
-
-                                # If FIPS code matches a state in the ordered
-                                # dictionary and the wind speed is above 0...
-                                if row[0] == key and row[2] > 0:
-
-                                    # Append hurricane names to hurrList.
-                                    hurrList.append(row[1])
-
-                                    # Append hurricane intensities to magList.
-                                    magList.append(row[2])
-
-                                    # Increment counter by one.
-                                    counter = counter + 1
-
-                        # If counter is greater than zero...
-                        if counter > 0:
-
-                            try:
-
-                                # Calculate mode of all intensities within list.
-                                modeValue = mode(magList)
-
-                                # Convert mode information to float and then to
-                                # string with two decimal places.
-                                modeString = \
-                                    str("{0:.2f}".format(float(modeValue)))
-
-                            except StatisticsError:
-
-                                # This catches any lists containing no mode.
-                                # This will occur if all values within list are
-                                # unique values.
-
-                                # Assign modeString to the following phrase.
-                                modeString = "No Unique Mode"
-
-                                pass
-
-                            # Identify and count the unique storm names within
-                            # hurrList. The length (count) of the uniqueNames
-                            # variable will reveal how many hurricanes occurred.
-                            uniqueNameCount = len(numpy.unique((hurrList)))
+                        # If the county has any storms...
+                        if stats_County is not None:
 
                             # Write the following data to the data counts CSV.
-                            # State name, how many hurricanes, min mag, max
-                            # mag, mean mag, median mag, mode mag, and FIPs.
+                            # County name, how many hurricanes, min mag, max
+                            # mag, mean mag, median mag, and mode mag.
                             csvFile.write(str(key) + "," +
-                                str(uniqueNameCount) + "," +
-                                str(min(magList)) + "," + str(max(magList)) +
+                                str(stormCount_PerCounty[key]) + "," +
+                                str(stats_County.minimum) + "," +
+                                str(stats_County.maximum) + "," +
+                                str("{0:.2f}".format(stats_County.mean)) +
                                 "," +
-                                str("{0:.2f}".format(numpy.mean(magList)) +
-                                "," +
-                                str("{0:.2f}".format(numpy.median(magList))) +
-                                "," + modeString + ",\n"))
+                                str("{0:.2f}".format(stats_County.median)) +
+                                "," + func_Mode_String(stats_County.mode) +
+                                ",\n")
 
                     # Close the data counts CSV file.
                     csvFile.close()
@@ -5145,56 +4809,52 @@ class HurricaneOptions(FrameLifts):
                                    self.folderNamingAddition + fileExtCSV, "w")
 
                     # If timespan and intensity drop-downs don't show Custom...
-                    if self.stringHurricaneTimespan.get() != "Custom..." and \
-                            self.stringHurricaneIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                      self.stringHurricaneTimespan.get() +
+                                      self.runParams.hazard_Timespan +
                                       ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                      self.stringHurricaneIntensity.get() +
+                                      self.runParams.hazard_Magnitude +
                                       ",\n")
 
                     # If timespan drop-down shows Custom and intensity drop-down
                     # doesn't show Custom...
-                    if self.stringHurricaneTimespan.get() == "Custom..." and \
-                            self.stringHurricaneIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                      self.stringHurricaneIntensity.get() +
+                                      self.runParams.hazard_Magnitude +
                                       ",\n")
 
                     # timespan drop-down shows Custom and intensity drop-down
                     # shows Custom...
-                    if self.stringHurricaneTimespan.get() == "Custom..." and \
-                            self.stringHurricaneIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # If timespan drop-down doesn't show Custom and intensity
                     # drop-down shows Custom...
-                    if self.stringHurricaneTimespan.get() != "Custom..." and \
-                            self.stringHurricaneIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                    self.stringHurricaneTimespan.get() + ",\n")
+                                    self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Intensity Range (Knots):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # Now write the following lines, regardless of
                     # timespan/intensity selection.
@@ -5207,13 +4867,13 @@ class HurricaneOptions(FrameLifts):
                     csvFile.write("USA (and DC) Storms:," +
                                   str(self.nationwide_storm_count) + ",\n")
                     csvFile.write("State Storms - " +
-                                str(self.stringState_Name.get()) + " (FIPS: " +
+                                str(self.runParams.state_Name) + " (FIPS: " +
                                 str(dictKeys_OrderedDict_StateNames[
-                                self.stringState_Name.get()]) + "):," +
+                                self.runParams.state_Name]) + "):," +
                                 str(self.state_storm_count) + ",\n")
                     csvFile.write("\n")
                     csvFile.write("County Storms - " +
-                                  self.stringCounty_Name.get() + ":," +
+                                  self.runParams.county_Name + ":," +
                                   str(self.county_storm_count) + ",\n")
                     csvFile.write("County Storm Name(s):,")
 
@@ -5253,7 +4913,7 @@ class HurricaneOptions(FrameLifts):
                     # For each county list within state/county dictionary
                     # matching the state drop-down selection...
                     for key in GUI_CountiesPerState.dict_state_counties[
-                        self.stringState_Name.get()]:
+                        self.runParams.state_Name]:
 
                         # Set counter to zero, for counting hurricane within
                         # each county during loop.
@@ -5347,9 +5007,6 @@ class HurricaneOptions(FrameLifts):
                 # Clear any intermediate output from memory.
                 self.func_Clear_InMemory()
 
-                # Pause script for one second.
-                sleep(1)
-
         except arcpy.ExecuteError:
 
             # Display geoprocessing errors and skip the failed analysis.
@@ -5370,68 +5027,9 @@ class HurricaneOptions(FrameLifts):
 
         try:
 
-            # If the user selects the Kernel Density analysis...
-            if self.statusAnalysis_KernelDensity.get() == 1:
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                self.func_Scroll_setOutputText("Performing Kernel Density "
-                    "Analysis on all lines, then clipping/masking output to " +
-                    featureClass_Mask + " extent...", None)
-
-                # Kernel Density parameters, with optional parameters set to
-                # None for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                optional_PopField = None
-                optional_CellSize = None
-                optional_SearchRadius = None
-                optional_AreaUnitScaleFactor = None
-                optional_OutputCellValues = None
-                optional_Method = None
-
-                # Perform the Kernel Density analysis.
-                output_KernelDensity = arcpy.sa.KernelDensity(
-                    required_InputFile, optional_PopField, optional_CellSize,
-                    optional_SearchRadius, optional_AreaUnitScaleFactor,
-                    optional_OutputCellValues, optional_Method)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                # Pause script for one second.
-                sleep(1)
-
-                # Mask the Kernel Density results.
-                output_KernelDensity_with_Mask = arcpy.sa.ExtractByMask(
-                    output_KernelDensity, featureClass_Mask)
-
-                self.func_Scroll_setOutputText(
-                    "Masking Kernel Density results...", None)
-
-                # Save the masked Kernel Density feature class results to
-                # File GDB.
-                output_KernelDensity_with_Mask.save("kerneldensity_" +
-                                            self.clipped_Output_FeatureClass)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                self.func_Scroll_setOutputText(
-                    "Kernel Density Analysis completed.", None)
-
-                # Increase current progress bar percentage by six percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 6
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script for one second.
-                sleep(1)
+            # Run the selected raster analyses at the same time, each within
+            # its own worker process (see Hazard_AnalysisScheduler).
+            self.func_Run_Scheduled_Raster_Analyses(featureClass_Mask)
 
         except arcpy.ExecuteError:
 
@@ -5453,7 +5051,7 @@ class HurricaneOptions(FrameLifts):
         try:
 
             # If the user selects the Hot Spot analysis...
-            if self.statusAnalysis_HotSpot.get() == 1:
+            if "HotSpot" in self.runParams.analysis_Options:
 
                 # Set the workspace for the following analysis.
                 arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
@@ -5563,9 +5161,6 @@ class HurricaneOptions(FrameLifts):
                 self.func_ProgressBar_setProgress(
                     self.analysis_Percentage_Counter)
 
-                # Pause script for one second.
-                sleep(1)
-
         except arcpy.ExecuteError:
 
             # Display geoprocessing errors and skip the failed analysis.
@@ -5589,88 +5184,6 @@ class HurricaneOptions(FrameLifts):
 
             pass
 
-        try:
-
-            # If the user selects the Line Density analysis...
-            if self.statusAnalysis_LineDensity.get() == 1:
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                self.func_Scroll_setOutputText("Performing Line Density "
-                                "Analysis on all lines, then clipping/masking "
-                                "output to " + featureClass_Mask + " extent...",
-                                None)
-
-                # Line Density parameters, with optional parameters set to None
-                # for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                required_PopField = analysis_Mag_Field
-                optional_CellSize = None
-                optional_SearchRadius = None
-                optional_AreaUnitScalFactor = None
-
-                # Execute Line Density analysis with default Esri values.
-                output_LineDensity = arcpy.sa.LineDensity(required_InputFile,
-                                                    required_PopField,
-                                                    optional_CellSize,
-                                                    optional_SearchRadius,
-                                                    optional_AreaUnitScalFactor)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                # Pause script for one second.
-                sleep(1)
-
-                # Mask the Line Density results.
-                output_LineDensity_with_Mask = \
-                    arcpy.sa.ExtractByMask(output_LineDensity,
-                                           featureClass_Mask)
-
-                self.func_Scroll_setOutputText(
-                    "Masking Line Density results...", None)
-
-                # Save the masked results to the File GDB.
-                output_LineDensity_with_Mask.save("linedensity_" +
-                                            self.clipped_Output_FeatureClass)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                self.func_Scroll_setOutputText(
-                    "Line Density Analysis completed.", None)
-
-                # Increase current progress bar percentage by six percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 6
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script for one second.
-                sleep(1)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-            pass
-
-        except Exception as e:
-
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-            pass
-
         try:
 
             self.func_Scroll_setOutputText("Deleting any temporary feature "
@@ -5715,6 +5228,106 @@ class HurricaneOptions(FrameLifts):
 
             pass
 
+    def func_Run_Scheduled_Raster_Analyses(self, featureClass_Mask):
+
+        # This function runs the selected raster analyses (each an arcpy.sa
+        # tool, masked to the feature class mask) at the same time through the
+        # analysis scheduler, each within its own worker process with its own
+        # workspace and extent. As each analysis completes, its masked raster
+        # is copied into the File GDB (under the same name as before) and the
+        # progress bar is incremented by six percent.
+
+        # Set the workspace and extent, the same as each analysis.
+        fileGDB_Path = self.subFolder_GIS + "/" + nameFileGDB
+        arcpy.env.workspace = fileGDB_Path
+        arcpy.env.extent = featureClass_Mask
+
+        # Folder holding each worker's scratch File GDB.
+        scratchFolder = self.subFolder_GIS + "/" + scheduler_Scratch_FolderName
+
+        # Selected raster analyses.
+        list_Names = [name for name in dict_ArcGIS_Raster_Tools
+                      if name in self.runParams.analysis_Options]
+
+        list_Jobs = func_ArcGIS_Raster_Jobs(list_Names, fileGDB_Path,
+                                            self.clipped_Output_FeatureClass,
+                                            featureClass_Mask,
+                                            analysis_Mag_Field, scratchFolder)
+
+        for job in list_Jobs:
+
+            self.func_Scroll_setOutputText("Performing " + job.label +
+                                           " Analysis on all lines, then "
+                                           "clipping/masking output to " +
+                                           featureClass_Mask + " extent...",
+                                           None)
+
+        def func_Progress(result, completed, total):
+
+            # This function displays each analysis as it completes, and
+            # copies its masked raster into the File GDB.
+
+            try:
+
+                # If the analysis failed, display its errors and skip it.
+                if result.error is not None:
+
+                    self.func_Scroll_setOutputText(str(result.error),
+                                                   color_Red)
+
+                    return
+
+                list_Messages, outputRaster = result.value
+
+                # Get geoprocessing messages.
+                for message in list_Messages:
+
+                    self.func_Scroll_setOutputText(message, color_Blue)
+
+                # Copy the masked results to the File GDB.
+                self.func_Scroll_setOutputText(func_Copy_ArcGIS_Raster(
+                    outputRaster, fileGDB_Path), color_Blue)
+
+                self.func_Scroll_setOutputText(
+                    result.job.label + " Analysis completed.", None)
+
+                # Increase current progress bar percentage by six percent.
+                self.analysis_Percentage_Counter = \
+                    self.analysis_Percentage_Counter + 6
+
+                # Increment progress bar by adjusted value.
+                self.func_ProgressBar_setProgress(
+                    self.analysis_Percentage_Counter)
+
+            except arcpy.ExecuteError:
+
+                # Display geoprocessing errors and skip the failed analysis.
+                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
+
+                pass
+
+            except Exception as e:
+
+                # Display error messages for all other errors and skip failed
+                # analysis.
+                self.func_Scroll_setOutputText("Error Message: " + str(e) +
+                                               "\n" + "Traceback: " +
+                                               traceback.format_exc(),
+                                               color_Red)
+
+                pass
+
+        func_Run_Analysis_Jobs(list_Jobs, func_Progress=func_Progress)
+
+        try:
+
+            # Delete the scratch File GDBs (any still locked are left).
+            func_Remove_Folder(scratchFolder, 5.0)
+
+        except OSError:
+
+            pass
+
     def func_CSV_DataCount_Global_Count(self):
 
         # This function controls the counting of all hurricane storm systems
@@ -5779,9 +5392,6 @@ class HurricaneOptions(FrameLifts):
             arcpy.CopyFeatures_management(featureClass_50States_and_DC_only,
                                           memoryFeatureClass_US)
 
-            # Pause script for one second.
-            sleep(1)
-
             # Dissolve parameters.
             required_InputFile = memoryFeatureClass_US
             required_OutputFileDiss = "temp_DissolvedStates"
@@ -5882,15 +5492,12 @@ class HurricaneOptions(FrameLifts):
 
             # Create Census polygon feature class variable stored in memory.
             memoryFeatureClass_State = "in_memory/" + \
-                                       self.stringState_Name.get()
+                                       self.runParams.state_Name
 
             # Copy Census Shapefile to feature class stored in memory.
             arcpy.CopyFeatures_management(self.featureClass_State_Selection_Only,
                                           memoryFeatureClass_State)
 
-            # Pause script for one second.
-            sleep(1)
-
             # Dissolve parameters.
             required_InputFile = memoryFeatureClass_State
             required_OutputFileDiss = "in_memory/temp_DissolvedState"
@@ -5990,15 +5597,12 @@ class HurricaneOptions(FrameLifts):
 
             # Create Census polygon feature class variable stored in memory.
             memoryFeatureClass_County = "in_memory/" + \
-                                       self.stringCounty_Name.get()
+                                       self.runParams.county_Name
 
             # Copy Census Shapefile to feature class stored in memory.
             arcpy.CopyFeatures_management(self.featureClass_County_State_Naming,
                                           memoryFeatureClass_County)
 
-            # Pause script for one second.
-            sleep(1)
-
             # Buffer parameters.
             required_InputFile = memoryFeatureClass_County
             required_OutputFileBuff = "in_memory/temp_BufferCounty"
@@ -6105,7 +5709,7 @@ class HurricaneOptions(FrameLifts):
 
     def func_Scroll_saveOutputText(self):
 
-        # This function writes all of the output text found within the
+        # This function saves all of the output text posted to the
         # ScrolledText widget to a text file located within the user-defined
         # workspace. This is done at the conclusion of every application
         # iteration.
@@ -6115,11 +5719,10 @@ class HurricaneOptions(FrameLifts):
             # If the output text file's naming convention has been set...
             if self.name_Hurr_FeatureClass is not None:
 
-                # Create/Open a new text file for all output messages to be
-                # written to.
-                textFile_ProcessingHistory = open(self.fullPathName + "/" +
-                        "ProcessingHistory_" + self.name_Hurr_FeatureClass +
-                        fileExtText, "w")
+                # Text file that all output messages are written to.
+                historyPath = self.fullPathName + "/" + \
+                    "ProcessingHistory_" + self.name_Hurr_FeatureClass + \
+                    fileExtText
 
             else:
 
@@ -6127,17 +5730,13 @@ class HurricaneOptions(FrameLifts):
                 # stages, the naming convention for the output text file will
                 # not be established. If that is the case, the naming convention
                 # will be saved with FAILED in the name.
-                textFile_ProcessingHistory = open(self.fullPathName + "/" +
-                                    "ProcessingHistory_FAILED" + fileExtText,
-                                    "w")
-
-            # Once the application processes have finished, take all output
-            # messages within the scroll box and write to the output text file.
-            textFile_ProcessingHistory.write(
-                self.scrollBox.get(1.0, tkinter.END))
+                historyPath = self.fullPathName + "/" + \
+                    "ProcessingHistory_FAILED" + fileExtText
 
-            # Close the text file.
-            textFile_ProcessingHistory.close()
+            # Once the application processes have finished, move the output
+            # messages (streamed to a text file within the workspace folder
+            # while processing) to the output text file.
+            self.guiChannel.func_Finish_History(historyPath)
 
             self.func_Scroll_setOutputText(
                 "The processing history (what you see here) "
@@ -6532,26 +6131,17 @@ class HurricaneOptions(FrameLifts):
 
         # This function controls what and how the output texts are displayed
         # within the scroll box for users to read. It takes an input argument
-        # from the user as well as a text color tag.
-
-        # These tags set the color used for specific text.
-        self.scrollBox.tag_config(color_Red, foreground=color_Red)
-        self.scrollBox.tag_config(color_Orange, foreground=color_Orange)
-        self.scrollBox.tag_config(color_Blue, foreground=color_Blue)
-
-        # This section inputs the user-defined wording and displays the message
-        # within the scroll box. The focus of the scroll box shifts to the
-        # last (bottom) entered text message.
-        self.scrollBox.config(state=tkinter.NORMAL)
-        self.scrollBox.insert(tkinter.END, word, (tag))
-        self.scrollBox.insert(tkinter.END, "\n--------------------\n")
-        self.scrollBox.see(tkinter.END)
-        self.scrollBox.config(state=tkinter.DISABLED)
+        # from the user as well as a text color tag. The message is posted to
+        # the GUI channel, so it can be called from the processing thread;
+        # the main loop shows it within the scroll box and shifts the focus
+        # to the last (bottom) entered text message.
+
+        self.guiChannel.func_Post_Log(word, tag)
 
     def func_ProgressBar_setProgress(self, value):
 
         # This function controls the progress bar increment by taking a
-        # user-defined input argument (integer).
+        # user-defined input argument (integer), posted to the GUI channel
+        # the same as the output texts.
 
-        self.progressBar["value"] = value
-        self.progressBar.update()
\ No newline at end of file
+        self.guiChannel.func_Post_Progress(value)
\ No newline at end of file
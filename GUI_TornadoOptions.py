@@ -11,15 +11,12 @@ from tkinter import messagebox
 from tkinter import scrolledtext
 import sys
 import os
-import shutil
 import time
 import csv
 import numpy
-from urllib import request
 from urllib.error import HTTPError
 from urllib.error import URLError
 import zipfile
-import calendar
 from datetime import datetime
 import datetime
 from collections import OrderedDict
@@ -27,6 +24,34 @@ import traceback
 from time import sleep  # careful - this can freeze the GUI
 from threading import Thread  # this is used to unfreeze the GUI
 from GUI_FrameLifts import FrameLifts
+from Hazard_GUIChannel import GUIChannel
+from Hazard_StageTrace import func_Start_Trace
+from Hazard_StageTrace import func_Stop_Trace
+from Hazard_StageTrace import func_Trace_GUI_Run
+from Hazard_Readiness import func_Remove_Folder
+from Hazard_AnalysisScheduler import scheduler_Scratch_FolderName
+from Hazard_AnalysisScheduler import dict_ArcGIS_Raster_Tools
+from Hazard_AnalysisScheduler import func_Run_Analysis_Jobs
+from Hazard_AnalysisScheduler import func_ArcGIS_Raster_Jobs
+from Hazard_AnalysisScheduler import func_Copy_ArcGIS_Raster
+from Hazard_DownloadCache import func_Cache_Retrieve
+from Hazard_CountyStore import func_County_Store_Path
+from Hazard_CountyStore import func_County_Store_Exists
+from Hazard_CountyStore import func_Build_County_Store
+from Hazard_CountyStore import func_Extract_County_Mask
+from Hazard_RunParameters import RunParameters
+from Hazard_RunParameters import func_Get_Tk_Value
+from Hazard_RunParameters import func_Get_Checked_Analyses
+from Hazard_RunParameters import func_Custom_Timespan
+from Hazard_RunParameters import func_Custom_Timespan_Text
+from Hazard_RunParameters import func_Custom_Magnitude_Text
+from Hazard_GroupStats import func_Value_Statistics
+from Hazard_GroupStats import func_Group_Statistics
+from Hazard_GroupStats import func_Mode_String
+from Hazard_FilterEngine import func_Filter_SPC_Catalog
+from Hazard_FilterEngine import func_Selection_Count
+from Hazard_CatalogCache import func_Load_SPC_Catalog
+from Hazard_CatalogCache import func_Load_Cached_SPC_Catalog
 from statistics import mode
 from statistics import StatisticsError
 
@@ -238,6 +263,10 @@ class TornadoOptions(FrameLifts):
         self.timespan_url = None
         self.intensity_url = None
         self.comboFrame_Custom_Timespan = None
+        self.dict_Expected_Count_Catalogs = {}
+        self.expected_Count_Selection = None
+        self.expected_Count_Request = None
+        self.set_Expected_Count_Loading = set()
         self.comboFrame_Custom_Intensity = None
         self.custom_intensity_url = None
         self.intCustomTimespan_Year_From = None
@@ -263,6 +292,12 @@ class TornadoOptions(FrameLifts):
         self.stringState_Name = None
         self.stringCounty_Name = None
         self.nameFeatureClass_FromCSV = None
+        self.runParams = None
+
+        # Channel for the log messages and progress values posted by the
+        # processing thread (shown by the main loop, see Hazard_GUIChannel).
+        self.guiChannel = GUIChannel(self, (color_Red, color_Orange,
+                                            color_Blue))
 
         # Settings and configuration for the Tornado Options GUI window.
         self.winfo_toplevel().title("Tornado Options")
@@ -610,6 +645,9 @@ class TornadoOptions(FrameLifts):
                     "_to_" + self.textCustomYearTo + \
                     self.textCustomMonthTo.zfill(2)
 
+            # Display the expected output of the new timespan selection.
+            self.func_Display_Expected_Count()
+
             # Run the function that checks if GUI window needs to be resized.
             self.func_windowResize()
 
@@ -654,6 +692,9 @@ class TornadoOptions(FrameLifts):
                 self.textCustomIntensityFrom.replace(".", "_") + "_to_" + \
                 self.textCustomIntensityTo.replace(".", "_")
 
+            # Display the expected output of the new intensity selection.
+            self.func_Display_Expected_Count()
+
             # Run the function that checks if GUI window needs to be resized.
             self.func_windowResize()
 
@@ -664,6 +705,121 @@ class TornadoOptions(FrameLifts):
                                            "Traceback: " +
                                            traceback.format_exc(), color_Red)
 
+    def func_Display_Expected_Count(self):
+
+        # This function displays the number of tornado records the current
+        # intensity and timespan selections will output, before the user
+        # clicks OK. The count is read from the intensity bin and time indexes
+        # of the input CSV's catalog. If the catalog isn't within memory yet,
+        # no count is displayed now; it is loaded from the download cache
+        # (only if the CSV has already been downloaded) by a background
+        # thread, which posts the count once the catalog is ready (see
+        # func_Load_Expected_Count_Catalog).
+
+        # If the selections aren't complete, there is no count to display.
+        if self.stringTornadoTimespan.get() == "Select..." or \
+                self.stringTornadoIntensity.get() == "Select..." or \
+                (self.stringTornadoIntensity.get() == "Custom..." and
+                 (self.textCustomIntensityFrom is None or
+                  self.textCustomIntensityTo is None)):
+
+            return
+
+        # If the timespan is Custom, its values (YYYY, MM, YYYY, MM).
+        if self.stringTornadoTimespan.get() == "Custom...":
+
+            customTimespan = (self.textCustomYearFrom,
+                              self.textCustomMonthFrom,
+                              self.textCustomYearTo, self.textCustomMonthTo)
+
+            timespanText = self.textCustomYearFrom + "/" + \
+                self.textCustomMonthFrom.zfill(2) + " to " + \
+                self.textCustomYearTo + "/" + \
+                self.textCustomMonthTo.zfill(2)
+
+        else:
+
+            customTimespan = None
+
+            timespanText = self.timespan_url.replace("-", " to ")
+
+        selection = (self.text_Tornado_URL, self.stringTornadoIntensity.get(),
+                     self.textCustomIntensityFrom, self.textCustomIntensityTo,
+                     timespanText)
+
+        # If the selections haven't changed since the last count, don't
+        # display it again.
+        if selection == self.expected_Count_Selection:
+
+            return
+
+        self.expected_Count_Selection = selection
+
+        # Count request: the selections, and the custom timespan (or None).
+        self.expected_Count_Request = (selection, customTimespan)
+
+        catalog = self.dict_Expected_Count_Catalogs.get(self.text_Tornado_URL)
+
+        if catalog is not None:
+
+            self.func_Post_Expected_Count(catalog,
+                                          self.expected_Count_Request)
+
+        # If the catalog isn't already being loaded, load it within a
+        # background thread (so the GUI doesn't freeze while it is parsed).
+        elif self.text_Tornado_URL not in self.set_Expected_Count_Loading:
+
+            self.set_Expected_Count_Loading.add(self.text_Tornado_URL)
+
+            Thread(target=self.func_Load_Expected_Count_Catalog,
+                   args=(self.text_Tornado_URL,), daemon=True).start()
+
+    def func_Load_Expected_Count_Catalog(self, url):
+
+        # This function runs within a background thread. It loads the URL's
+        # catalog from the download cache (without any network request), and
+        # if the latest count request is for this URL, posts its count to the
+        # GUI channel. If the CSV hasn't been downloaded yet, no count is
+        # posted.
+
+        try:
+
+            catalog = func_Load_Cached_SPC_Catalog(url, torn, tornado_headers)
+
+            if catalog is not None:
+
+                self.dict_Expected_Count_Catalogs[url] = catalog
+
+                request = self.expected_Count_Request
+
+                if request is not None and request[0][0] == url:
+
+                    self.func_Post_Expected_Count(catalog, request)
+
+        except Exception as e:
+
+            # Display error message.
+            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
+                                           "Traceback: " +
+                                           traceback.format_exc(), color_Red)
+
+        finally:
+
+            self.set_Expected_Count_Loading.discard(url)
+
+    def func_Post_Expected_Count(self, catalog, request):
+
+        # This function posts the expected output of a count request (see
+        # func_Display_Expected_Count) to the GUI channel, from any thread.
+
+        selection, customTimespan = request
+
+        self.func_Scroll_setOutputText(
+            "Expected output: " + str(func_Selection_Count(
+                catalog, torn, selection[1], selection[2], selection[3],
+                customTimespan)) + " tornado records from " + selection[4] +
+            ".", None)
+
     def func_URLFrame(self):
 
         # This function controls the display of the URL frame within the GUI.
@@ -774,6 +930,10 @@ class TornadoOptions(FrameLifts):
                 if self.comboFrame_Custom_Timespan is not None:
                     self.comboFrame_Custom_Timespan.grid_remove()
 
+            # Display the expected output of the new timespan selection (once
+            # a magnitude is selected too).
+            self.func_Display_Expected_Count()
+
         except Exception as e:
 
             # Display error message.
@@ -958,6 +1118,9 @@ class TornadoOptions(FrameLifts):
             # Run the function that sets the custom intensity variables.
             self.func_Set_Custom_Intensity(event)
 
+        # Display the expected output of the new intensity selection.
+        self.func_Display_Expected_Count()
+
     def func_WorkspaceFolderFrame(self):
 
         # The following function controls the workspace folder frame within the
@@ -1100,6 +1263,39 @@ class TornadoOptions(FrameLifts):
                 # active program.
                 return
 
+    def func_Build_RunParameters(self):
+
+        # This function reads every GUI selection used by the processing tasks
+        # and returns them as an immutable RunParameters object. It must run
+        # on the GUI thread (before the OKClick thread starts), so that none of
+        # the processing tasks need to read a Tk variable.
+
+        # Names of the analysis checkboxes within the Analysis Options frame.
+        analysisNames = ("IDW", "KernelDensity", "Kriging", "NaturalNeighbor",
+                         "OptHotSpot", "PointDensity", "Spline", "Thiessen",
+                         "Trend", "OutputToCSVFile")
+
+        return RunParameters(
+            hazard_Timespan=self.stringTornadoTimespan.get(),
+            hazard_Magnitude=self.stringTornadoIntensity.get(),
+            custom_Year_From=func_Get_Tk_Value(
+                self.intCustomTimespan_Year_From),
+            custom_Month_From=func_Get_Tk_Value(
+                self.intCustomTimespan_Month_From),
+            custom_Year_To=func_Get_Tk_Value(self.intCustomTimespan_Year_To),
+            custom_Month_To=func_Get_Tk_Value(self.intCustomTimespan_Month_To),
+            custom_Magnitude_Min=func_Get_Tk_Value(
+                self.intCustom_Intensity_Min),
+            custom_Magnitude_Max=func_Get_Tk_Value(
+                self.intCustom_Intensity_Max),
+            url_Text=self.textURLTextbox.get(),
+            workspace_Folder=
+                self.workspaceFolderTextbox_TornadoFolderDialog.get(),
+            options_Checked=self.statusVar_Checkbutton_Options.get(),
+            state_Name=func_Get_Tk_Value(self.stringState_Name),
+            county_Name=func_Get_Tk_Value(self.stringCounty_Name),
+            analysis_Options=func_Get_Checked_Analyses(self, analysisNames))
+
     def func_OKClick_Thread(self):
 
         # This function controls the OKClick function, by running it within a
@@ -1108,6 +1304,9 @@ class TornadoOptions(FrameLifts):
         # The daemon setting allows for the application to properly terminate
         # when the user clicks the "Cancel" button.
 
+        # Read all GUI selections once, while still on the GUI thread.
+        self.runParams = self.func_Build_RunParameters()
+
         self.thread_func_OKClick = Thread(target=self.func_OKClick)
         self.thread_func_OKClick.daemon = True
         self.thread_func_OKClick.start()
@@ -1145,16 +1344,16 @@ class TornadoOptions(FrameLifts):
 
             # If the user has selected a valid timespan, intensity, and assigned
             # an output workspace folder...
-            if self.stringTornadoTimespan.get() != "Select..." and \
-                    self.stringTornadoIntensity.get() != "Select..." and \
-                    self.workspaceFolderTextbox_TornadoFolderDialog.get() != \
+            if self.runParams.hazard_Timespan != "Select..." and \
+                    self.runParams.hazard_Magnitude != "Select..." and \
+                    self.runParams.workspace_Folder != \
                     folderDialog_Message:
 
                 # Start a timer for the script.
                 self.start_time = time.time()
 
                 # If the "Options" checkbox is selected...
-                if self.statusVar_Checkbutton_Options.get() == 1:
+                if self.runParams.options_Checked == 1:
 
                     # If the user hasn't selected a clipping option...
                     if self.radioButton_Selection is None:
@@ -1170,8 +1369,8 @@ class TornadoOptions(FrameLifts):
                         return
 
                     # If the timespan or intensity combobox is "Custom..."...
-                    if self.stringTornadoTimespan.get() == "Custom..." or \
-                            self.stringTornadoIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." or \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # If all custom timespan comboboxes have values...
                         if self.intCustomTimespan_Year_From is not None and \
@@ -1180,8 +1379,8 @@ class TornadoOptions(FrameLifts):
                             self.intCustomTimespan_Month_To is not None:
 
                             # If the YEAR FROM exceeds the YEAR TO value...
-                            if self.intCustomTimespan_Year_From.get() > \
-                                    self.intCustomTimespan_Year_To.get():
+                            if self.runParams.custom_Year_From > \
+                                    self.runParams.custom_Year_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1196,10 +1395,10 @@ class TornadoOptions(FrameLifts):
 
                             # Else if the FROM MONTH exceeds the TO MONTH within
                             # the same YEAR...
-                            elif self.intCustomTimespan_Year_From.get() == \
-                                    self.intCustomTimespan_Year_To.get() and \
-                                    self.intCustomTimespan_Month_From.get() > \
-                                    self.intCustomTimespan_Month_To.get():
+                            elif self.runParams.custom_Year_From == \
+                                    self.runParams.custom_Year_To and \
+                                    self.runParams.custom_Month_From > \
+                                    self.runParams.custom_Month_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1219,8 +1418,8 @@ class TornadoOptions(FrameLifts):
 
                             # If the minimum intensity exceeds the maximum
                             # intensity...
-                            if self.intCustom_Intensity_Min.get() > \
-                                    self.intCustom_Intensity_Max.get():
+                            if self.runParams.custom_Magnitude_Min > \
+                                    self.runParams.custom_Magnitude_Max:
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
                                 message="Invalid intensity entry.\n" +
@@ -1248,12 +1447,12 @@ class TornadoOptions(FrameLifts):
                             self.okClick_NonCustom_ExpansionHeight))
 
                 # Else if the "More Options" checkbox is not selected...
-                elif self.statusVar_Checkbutton_Options.get() == 0:
+                elif self.runParams.options_Checked == 0:
 
                     # If the timespan or intensity "Custom..." comboboxes are
                     # selected...
-                    if self.stringTornadoTimespan.get() == "Custom..." or \
-                            self.stringTornadoIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." or \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # If all custom timespan comboboxes have values...
                         if self.intCustomTimespan_Year_From is not None and \
@@ -1262,8 +1461,8 @@ class TornadoOptions(FrameLifts):
                             self.intCustomTimespan_Month_To is not None:
 
                             # If the YEAR FROM exceeds the YEAR TO value...
-                            if self.intCustomTimespan_Year_From.get() > \
-                                    self.intCustomTimespan_Year_To.get():
+                            if self.runParams.custom_Year_From > \
+                                    self.runParams.custom_Year_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1278,10 +1477,10 @@ class TornadoOptions(FrameLifts):
 
                             # Else if the FROM MONTH exceeds the TO MONTH within
                             # the same YEAR...
-                            elif self.intCustomTimespan_Year_From.get() == \
-                                    self.intCustomTimespan_Year_To.get() and \
-                                    self.intCustomTimespan_Month_From.get() > \
-                                    self.intCustomTimespan_Month_To.get():
+                            elif self.runParams.custom_Year_From == \
+                                    self.runParams.custom_Year_To and \
+                                    self.runParams.custom_Month_From > \
+                                    self.runParams.custom_Month_To:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1301,8 +1500,8 @@ class TornadoOptions(FrameLifts):
 
                             # If the MINIMUM intensity exceeds the MAXIMUM
                             # intensity...
-                            if self.intCustom_Intensity_Min.get() > \
-                                    self.intCustom_Intensity_Max.get():
+                            if self.runParams.custom_Magnitude_Min > \
+                                    self.runParams.custom_Magnitude_Max:
 
                                 # Display error message.
                                 messagebox.showerror(errorMessage_Header,
@@ -1345,11 +1544,28 @@ class TornadoOptions(FrameLifts):
                 # Run function to start the status bar.
                 self.func_StartStatusBar()
 
+                # Start the stage trace (the time, CPU time, and memory of
+                # each processing stage) within the output workspace folder,
+                # now that all selections are valid.
+                func_Start_Trace(os.path.join(
+                    self.runParams.workspace_Folder, "StageTrace_" +
+                    time.strftime("%Y%m%d_%H%M%S") + ".json"))
+
                 # Run function to create a folder in the user-specified output
                 # workspace folder.
                 # PLEASE NOTE:
-                # Numerous subtasks are executed within this function.
-                self.func_CreateFolder()
+                # Numerous subtasks are executed within this function. Each
+                # subtask (and ArcPy tool) is timed within the stage trace,
+                # which is written and stopped even if processing fails.
+                try:
+
+                    with func_Trace_GUI_Run(self):
+
+                        self.func_CreateFolder()
+
+                finally:
+
+                    func_Stop_Trace()
 
                 # Once all tasks are completed, this function will calculate the
                 # time it took for the script to run from start to finish.
@@ -1372,7 +1588,7 @@ class TornadoOptions(FrameLifts):
             else:
 
                 # If the timespan combobox shows "Select..."...
-                if self.stringTornadoTimespan.get() == "Select...":
+                if self.runParams.hazard_Timespan == "Select...":
 
                     # Display error message.
                     messagebox.showerror(errorMessage_Header,
@@ -1384,7 +1600,7 @@ class TornadoOptions(FrameLifts):
                     self.func_Enable_Buttons()
 
                 # Else if the intensity combobox shows "Select..."...
-                elif self.stringTornadoIntensity.get() == "Select...":
+                elif self.runParams.hazard_Magnitude == "Select...":
 
                     # Display error message.
                     messagebox.showerror(errorMessage_Header,
@@ -1396,7 +1612,7 @@ class TornadoOptions(FrameLifts):
                     self.func_Enable_Buttons()
 
                 # Else if the output workspace text is the default message...
-                elif self.workspaceFolderTextbox_TornadoFolderDialog.get() == \
+                elif self.runParams.workspace_Folder == \
                                 folderDialog_Message:
 
                     # Display error message.
@@ -1429,7 +1645,7 @@ class TornadoOptions(FrameLifts):
         self.scrollHeight = 8
 
         # If the "More Options" checkbox is selected...
-        if self.statusVar_Checkbutton_Options.get() == 1:
+        if self.runParams.options_Checked == 1:
             # Set the scrolled text frame to 90 characters wide.
             self.scrollWidth = 90
 
@@ -1438,7 +1654,7 @@ class TornadoOptions(FrameLifts):
                                      columnspan=2)
 
         # If the "More Options" checkbox is not selected...
-        if self.statusVar_Checkbutton_Options.get() == 0:
+        if self.runParams.options_Checked == 0:
 
             # Set the scrolled text frame to 52 characters wide.
             self.scrollWidth = 52
@@ -1455,6 +1671,13 @@ class TornadoOptions(FrameLifts):
                                                    state=tkinter.DISABLED)
         self.scrollBox.grid(column=0, row=0)
 
+        # The processing history of this run is streamed to a text file within
+        # the workspace folder as it is posted, then moved to the run's output
+        # folder once the run is complete (see func_Scroll_saveOutputText).
+        self.guiChannel.func_Start_History(os.path.join(
+            self.runParams.workspace_Folder, "ProcessingHistory_RUNNING_" +
+            time.strftime("%Y%m%d_%H%M%S") + fileExtText))
+
         # Sets the text variable to the function for updating the scrolledtext
         # output.
         self.func_Scroll_setOutputText("Beginning assigned tasks...", None)
@@ -1467,7 +1690,7 @@ class TornadoOptions(FrameLifts):
         self.progressBarFrame = tkinter.Frame(self.processingFrame)
 
         # If the "More Options" checkbox is selected...
-        if self.statusVar_Checkbutton_Options.get() == 1:
+        if self.runParams.options_Checked == 1:
             # Set the pixel width of the progress bar.
             self.progressBar_Length = 740
 
@@ -1476,7 +1699,7 @@ class TornadoOptions(FrameLifts):
                                        columnspan=2)
 
         # If the "More Options" checkbox is not selected...
-        if self.statusVar_Checkbutton_Options.get() == 0:
+        if self.runParams.options_Checked == 0:
             # Set the pixel width of the progress bar.
             self.progressBar_Length = 450
 
@@ -1508,11 +1731,11 @@ class TornadoOptions(FrameLifts):
 
         # This function controls the appearance of the status bar.
 
+        # The status bar is stepped every 30 milliseconds by the main loop
+        # (instead of pausing the main loop between steps).
         for i in range(100):
-            sleep(0.03)
-            self.statusBar["value"] = i  # increment progressbar
-            self.statusBar.update()  # have to call update() in loop
-        self.statusBar["value"] = 0  # reset/clear progressbar
+            self.after(30 * i, self.statusBar.config, {"value": i})
+        self.after(3000, self.statusBar.config, {"value": 0})
 
     def func_StartStatusBar(self):
 
@@ -1850,7 +2073,7 @@ class TornadoOptions(FrameLifts):
         try:
 
             # If the "More Options" checkbox is selected...
-            if self.statusVar_Checkbutton_Options.get() == 1:
+            if self.runParams.options_Checked == 1:
 
                 # If the USA clipping option is selected...
                 if self.radioButton_Selection == 1:
@@ -1864,7 +2087,7 @@ class TornadoOptions(FrameLifts):
                     # Create variable for adding State to folder
                     # naming convention.
                     self.featureClass_State_Selection_Only = \
-                        "state_only_" + self.stringState_Name.get()
+                        "state_only_" + self.runParams.state_Name
                     self.folderNamingAddition = \
                         "_" + self.featureClass_State_Selection_Only
 
@@ -1873,22 +2096,22 @@ class TornadoOptions(FrameLifts):
                     # Create modified variable for County name, removing all
                     # instances of special characters or spacing.
                     self.modified_stringCountyName = \
-                        self.stringCounty_Name.get(). \
+                        self.runParams.county_Name. \
                             replace("'", "").replace("-", ""). \
                             replace(".", "").replace(" ", "")
 
                     # Full string used for feature class naming purposes.
                     self.featureClass_County_State_Naming = "county_only_" + \
                                         self.modified_stringCountyName + "_" + \
-                                        self.stringState_Name.get()
+                                        self.runParams.state_Name
 
                     # Full string used for folder naming purposes.
                     self.folderNamingAddition = \
                         "_" + self.featureClass_County_State_Naming
 
                 # If both timespan/intensity comboboxes are not "Custom..."...
-                if self.stringTornadoTimespan.get() != "Custom..." and \
-                        self.stringTornadoIntensity.get() != "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out separately to be
                     # used later on for CSV files, XY Event Layers, and
@@ -1905,8 +2128,8 @@ class TornadoOptions(FrameLifts):
 
                 # If timespan combobox is "Custom..." and intensity combobox is
                 # not "Custom..."...
-                if self.stringTornadoTimespan.get() == "Custom..." and \
-                        self.stringTornadoIntensity.get() != "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out separately to be
                     # used later on for CSV files, XY Event Layers, and
@@ -1921,8 +2144,8 @@ class TornadoOptions(FrameLifts):
                                             self.folderNamingAddition
 
                 # If timespan is "Custom..." and intensity is "Custom..."...
-                if self.stringTornadoTimespan.get() == "Custom..." and \
-                        self.stringTornadoIntensity.get() == "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -1939,8 +2162,8 @@ class TornadoOptions(FrameLifts):
                                         self.folderNamingAddition
 
                 # If timespan is not "Custom..." and intensity is "Custom..."...
-                if self.stringTornadoTimespan.get() != "Custom..." and \
-                        self.stringTornadoIntensity.get() == "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -1957,11 +2180,11 @@ class TornadoOptions(FrameLifts):
                                         self.folderNamingAddition
 
             # If "More Options" checkbox is unchecked...
-            if self.statusVar_Checkbutton_Options.get() == 0:
+            if self.runParams.options_Checked == 0:
 
                 # If both timespan/intensity comboboxes are not "Custom"...
-                if self.stringTornadoTimespan.get() != "Custom..." and \
-                        self.stringTornadoIntensity.get() != "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -1978,8 +2201,8 @@ class TornadoOptions(FrameLifts):
 
                 # If timespan combobox is "Custom..." and intensity combobox is
                 # not "Custom..."...
-                if self.stringTornadoTimespan.get() == "Custom..." and \
-                        self.stringTornadoIntensity.get() != "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude != "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -1995,8 +2218,8 @@ class TornadoOptions(FrameLifts):
 
                 # If timespan combobox is "Custom..." and intensity combobox is
                 # "Custom..."...
-                if self.stringTornadoTimespan.get() == "Custom..." and \
-                        self.stringTornadoIntensity.get() == "Custom...":
+                if self.runParams.hazard_Timespan == "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -2013,8 +2236,8 @@ class TornadoOptions(FrameLifts):
 
                 # If timespan combobox is not "Custom..." and intensity combobox
                 # is "Custom..."...
-                if self.stringTornadoTimespan.get() != "Custom..." and \
-                        self.stringTornadoIntensity.get() == "Custom...":
+                if self.runParams.hazard_Timespan != "Custom..." and \
+                        self.runParams.hazard_Magnitude == "Custom...":
 
                     # Assign naming conventions for output data and folders.
                     # (Mag/Timespan/Current Date broken out separately to be
@@ -2040,11 +2263,8 @@ class TornadoOptions(FrameLifts):
                     self.func_Scroll_setOutputText(
                         "Deleting pre-existing folder.", None)
 
-                    # Pause script for 0.5 seconds.
-                    sleep(0.5)
-
-                    # Delete the folder.
-                    shutil.rmtree(self.fullPathName)
+                    # Delete the folder (returning once it is gone).
+                    func_Remove_Folder(self.fullPathName)
 
                     self.func_Scroll_setOutputText(
                         "Pre-existing folder deleted.", None)
@@ -2077,9 +2297,6 @@ class TornadoOptions(FrameLifts):
                     # Exit the process.
                     exit()
 
-            # Pause script for 2.0 seconds.
-            sleep(2.0)
-
             self.func_Scroll_setOutputText("Creating folder path:\n" +
                                            self.fullPathName, None)
 
@@ -2134,9 +2351,6 @@ class TornadoOptions(FrameLifts):
 
             self.func_Scroll_setOutputText("Creating CSV subfolder.", None)
 
-            # Pause script for 0.5 seconds.
-            sleep(0.5)
-
             # If subfolder doesn't exist, create it.
             if not os.path.exists(self.csvDirectory):
                 os.makedirs(self.csvDirectory)
@@ -2160,10 +2374,10 @@ class TornadoOptions(FrameLifts):
         try:
 
             # If timespan is not "Custom..."...
-            if self.stringTornadoTimespan.get() != "Custom...":
+            if self.runParams.hazard_Timespan != "Custom...":
 
                 # If timespan equals All...
-                if self.stringTornadoTimespan.get() == \
+                if self.runParams.hazard_Timespan == \
                         "All | 1950-" + str(int_OneYearAgo):
 
                     # Run function to create CSV subfolder.
@@ -2179,7 +2393,7 @@ class TornadoOptions(FrameLifts):
                         try:
 
                             # Retrieve CSV from URL.
-                            request.urlretrieve(self.textURLTextbox.get(),
+                            func_Cache_Retrieve(self.runParams.url_Text,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-", "_to_") +
@@ -2197,10 +2411,10 @@ class TornadoOptions(FrameLifts):
                             # likely need to be deleted once the web URL has
                             # been updated to its regular naming convention.
                             temp_PreliminaryURL = \
-                                self.textURLTextbox.get()[:47] + "_prelim" + \
-                                self.textURLTextbox.get()[47:]
+                                self.runParams.url_Text[:47] + "_prelim" + \
+                                self.runParams.url_Text[47:]
 
-                            request.urlretrieve(temp_PreliminaryURL,
+                            func_Cache_Retrieve(temp_PreliminaryURL,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-", "_to_") +
@@ -2224,7 +2438,7 @@ class TornadoOptions(FrameLifts):
                         try:
 
                             # Retrieve CSV from URL.
-                            request.urlretrieve(self.textURLTextbox.get(),
+                            func_Cache_Retrieve(self.runParams.url_Text,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-", "_to_") +
@@ -2242,10 +2456,10 @@ class TornadoOptions(FrameLifts):
                             # likely need to be deleted once the web URL has
                             # been updated to its regular naming convention.
                             temp_PreliminaryURL = \
-                                self.textURLTextbox.get()[:47] + "_prelim" + \
-                                self.textURLTextbox.get()[47:]
+                                self.runParams.url_Text[:47] + "_prelim" + \
+                                self.runParams.url_Text[47:]
 
-                            request.urlretrieve(temp_PreliminaryURL,
+                            func_Cache_Retrieve(temp_PreliminaryURL,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-", "_to_") +
@@ -2322,7 +2536,7 @@ class TornadoOptions(FrameLifts):
                         try:
 
                             # Retrieve CSV from URL.
-                            request.urlretrieve(self.textURLTextbox.get(),
+                            func_Cache_Retrieve(self.runParams.url_Text,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-","_to_") +
@@ -2341,10 +2555,10 @@ class TornadoOptions(FrameLifts):
                             # been updated to its regular naming convention.
                             #http://www.spc.noaa.gov/wcm/data/2017_torn.csv
                             temp_PreliminaryURL = \
-                                self.textURLTextbox.get()[:42] + "_prelim" + \
-                                self.textURLTextbox.get()[42:]
+                                self.runParams.url_Text[:42] + "_prelim" + \
+                                self.runParams.url_Text[42:]
 
-                            request.urlretrieve(temp_PreliminaryURL,
+                            func_Cache_Retrieve(temp_PreliminaryURL,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-","_to_") +
@@ -2368,7 +2582,7 @@ class TornadoOptions(FrameLifts):
                         try:
 
                             # Retrieve CSV from URL.
-                            request.urlretrieve(self.textURLTextbox.get(),
+                            func_Cache_Retrieve(self.runParams.url_Text,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-","_to_") +
@@ -2387,10 +2601,10 @@ class TornadoOptions(FrameLifts):
                             # been updated to its regular naming convention.
                             #http://www.spc.noaa.gov/wcm/data/2017_torn.csv
                             temp_PreliminaryURL = \
-                                self.textURLTextbox.get()[:42] + "_prelim" + \
-                                self.textURLTextbox.get()[42:]
+                                self.runParams.url_Text[:42] + "_prelim" + \
+                                self.runParams.url_Text[42:]
 
-                            request.urlretrieve(temp_PreliminaryURL,
+                            func_Cache_Retrieve(temp_PreliminaryURL,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-","_to_") +
@@ -2406,7 +2620,7 @@ class TornadoOptions(FrameLifts):
                     self.func_NonCustomTimespan_CSV_HeaderCheck_ValueCheck()
 
             # If timespan is "Custom..."...
-            if self.stringTornadoTimespan.get() == "Custom...":
+            if self.runParams.hazard_Timespan == "Custom...":
 
                 # Run function to create CSV subfolder.
                 self.func_Create_CSV_subFolder()
@@ -2421,7 +2635,7 @@ class TornadoOptions(FrameLifts):
                     try:
 
                         # Retrieve CSV from URL.
-                        request.urlretrieve(self.textURLTextbox.get(),
+                        func_Cache_Retrieve(self.runParams.url_Text,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-", "_to_") +
@@ -2439,10 +2653,10 @@ class TornadoOptions(FrameLifts):
                         # likely need to be deleted once the web URL has
                         # been updated to its regular naming convention.
                         temp_PreliminaryURL = \
-                                self.textURLTextbox.get()[:47] + "_prelim" + \
-                                self.textURLTextbox.get()[47:]
+                                self.runParams.url_Text[:47] + "_prelim" + \
+                                self.runParams.url_Text[47:]
 
-                        request.urlretrieve(temp_PreliminaryURL,
+                        func_Cache_Retrieve(temp_PreliminaryURL,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-", "_to_") +
@@ -2465,7 +2679,7 @@ class TornadoOptions(FrameLifts):
                     try:
 
                         # Retrieve CSV from URL.
-                        request.urlretrieve(self.textURLTextbox.get(),
+                        func_Cache_Retrieve(self.runParams.url_Text,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-", "_to_") +
@@ -2483,10 +2697,10 @@ class TornadoOptions(FrameLifts):
                         # likely need to be deleted once the web URL has
                         # been updated to its regular naming convention.
                         temp_PreliminaryURL = \
-                                self.textURLTextbox.get()[:47] + "_prelim" + \
-                                self.textURLTextbox.get()[47:]
+                                self.runParams.url_Text[:47] + "_prelim" + \
+                                self.runParams.url_Text[47:]
 
-                        request.urlretrieve(temp_PreliminaryURL,
+                        func_Cache_Retrieve(temp_PreliminaryURL,
                                 self.csvDirectory + "/" + noaa + "_" + torn +
                                 "_" +
                                 str(self.timespan_url).replace("-", "_to_") +
@@ -2547,9 +2761,6 @@ class TornadoOptions(FrameLifts):
                 # Run function to do data checks on the CSV file.
                 self.func_CustomTimespan_CSV_HeaderCheck_ValueCheck()
 
-            # Pause script for 0.5 seconds.
-            sleep(0.5)
-
         except HTTPError as httpError:
 
             # Display error message for URL-specific problems.
@@ -2587,7 +2798,7 @@ class TornadoOptions(FrameLifts):
         try:
 
             # If the intensity combobox displays "Custom..."...
-            if self.stringTornadoIntensity.get() == "Custom...":
+            if self.runParams.hazard_Magnitude == "Custom...":
 
                 # Open the CSV file.
                 self.csv_InputFile = open(self.csvDirectory + "/" + noaa +
@@ -2628,7 +2839,7 @@ class TornadoOptions(FrameLifts):
                         str(self.timespan_url).replace("-", "_to_") + curDate
 
             # If the intensity combobox does not display "Custom..."...
-            elif self.stringTornadoIntensity.get() != "Custom...":
+            elif self.runParams.hazard_Magnitude != "Custom...":
 
                 # Open the CSV file.
                 self.csv_InputFile = open(self.csvDirectory + "/" + noaa +
@@ -2673,128 +2884,27 @@ class TornadoOptions(FrameLifts):
                                            " and removing invalid tornado "
                                            "sizes.", None)
 
-            # Remove single quotes and spaces from the CSV's first row.
-            firstLine = \
-                str(next(self.csv_Reader)).replace("'", "").replace(" ", "")
-
-            # If the tornado headers exist in that CSV's first row...
-            if tornado_headers in firstLine:
-
-                # Write the tornado headers to the output CSV file, splitting
-                # at the comma. The firstLine row will be skipped for the next
-                # step.
-                self.csv_Writer.writerow(tornado_headers.split(","))
-
-            else:
-
-                # Else, if the tornado headers are not present in the CSV's
-                # first row, add the tornado headers.
-                self.csv_Writer.writerow(tornado_headers.split(","))
-
-                # Return to first row of input CSV file, since this row does not
-                # represent a header.
-                self.csv_InputFile.seek(0)
-
-            # For each row in the input CSV...
-            for row in self.csv_Reader:
-
-                # If entire row is not empty and intensity column and lat/long
-                # columns are not blank...
-                if row and row[10] != "" and row[15] != "" and row[16] != "":
-
-                    # If lat/long columns are not showing 0,0 coordinates...
-                    if (row[15] != "0" or row[15] != "0.0") and \
-                            (row[16] != "0" or row[16] != "0.0"):
-
-                        # If lat/long columns are within appropriate range...
-                        if float(row[15]) >= -90.0 and float(row[15]) <= 90.0 \
-                                and float(row[16]) >= -180.0 and \
-                                float(row[16]) <= 180.0:
-
-                            # If the intensity is at least zero and less
-                            # than 6 (negative values and above five indicate
-                            # errors)...
-                            if int(row[10]) >= 0 and int(row[10]) < 6:
-
-                                # If the tornado intensity is set to All...
-                                if self.stringTornadoIntensity.get() == "All":
-
-                                    # Write the row to the output CSV.
-                                    self.csv_Writer.writerow(row)
-
-                                # If the tornado intensity is set to EF-0...
-                                elif self.stringTornadoIntensity.get() == \
-                                        "EF-0":
-
-                                    # If the CSV row intensity is 0...
-                                    if int(row[10]) == 0:
-
-                                        # Write the row to the output CSV.
-                                        self.csv_Writer.writerow(row)
-
-                                # If the tornado intensity is set to EF-1...
-                                elif self.stringTornadoIntensity.get() == \
-                                        "EF-1":
-
-                                    # If the CSV row intensity is 1...
-                                    if int(row[10]) == 1:
-
-                                        # Write the row to the output CSV.
-                                        self.csv_Writer.writerow(row)
-
-                                # If the tornado intensity is set to EF-2...
-                                elif self.stringTornadoIntensity.get() == \
-                                        "EF-2":
-
-                                    # If the CSV row intensity is 2...
-                                    if int(row[10]) == 2:
-
-                                        # Write the row to the output CSV.
-                                        self.csv_Writer.writerow(row)
-
-                                # If the tornado intensity is set to EF-3...
-                                elif self.stringTornadoIntensity.get() == \
-                                        "EF-3":
-
-                                    # If the CSV row intensity is 3...
-                                    if int(row[10]) == 3:
-
-                                        # Write the row to the output CSV.
-                                        self.csv_Writer.writerow(row)
-
-                                # If the tornado intensity is set to EF-4...
-                                elif self.stringTornadoIntensity.get() == \
-                                             "EF-4":
-
-                                    # If the CSV row intensity is 4...
-                                    if int(row[10]) == 4:
-
-                                        # Write the row to the output CSV.
-                                        self.csv_Writer.writerow(row)
-
-                                # If the tornado intensity is set to EF-5...
-                                elif self.stringTornadoIntensity.get() == \
-                                             "EF-5":
-
-                                    # If the CSV row intensity is 5...
-                                    if int(row[10]) == 5:
-
-                                        # Write the row to the output CSV.
-                                        self.csv_Writer.writerow(row)
-
-                                # If the tornado intensity is set to Custom...
-                                elif self.stringTornadoIntensity.get() == \
-                                        "Custom...":
-
-                                    # If the CSV row intensity is between the
-                                    # Intensity From/To selections...
-                                    if int(row[10]) >= \
-                                        int(self.textCustomIntensityFrom) and \
-                                        int(row[10]) <= \
-                                        int(self.textCustomIntensityTo):
-
-                                        # Write the row to the output CSV.
-                                        self.csv_Writer.writerow(row)
+            # Write the tornado headers to the output CSV file, splitting at the
+            # comma.
+            self.csv_Writer.writerow(tornado_headers.split(","))
+
+            # Run the vectorized filter engine on the input CSV's catalog of
+            # typed columns (parsed once, then memory-mapped from the catalog
+            # cache by later runs on the same CSV), writing the rows that pass
+            # all checks to the output CSV.
+            # The catalog is kept under the URL, so later selections can
+            # display their expected output.
+            catalog = func_Load_SPC_Catalog(self.csv_InputFile.name, torn,
+                                            tornado_headers)
+            self.dict_Expected_Count_Catalogs[self.runParams.url_Text] = \
+                catalog
+
+            func_Filter_SPC_Catalog(
+                catalog,
+                self.csv_Writer, torn,
+                self.runParams.hazard_Magnitude,
+                self.runParams.custom_Magnitude_Min,
+                self.runParams.custom_Magnitude_Max)
 
             # Close the input CSV (otherwise there may be a file lock).
             self.csv_InputFile.close()
@@ -2832,7 +2942,7 @@ class TornadoOptions(FrameLifts):
         try:
 
             # If the intensity combobox displays "Custom..."...
-            if self.stringTornadoIntensity.get() == "Custom...":
+            if self.runParams.hazard_Magnitude == "Custom...":
 
                 # Open the CSV file.
                 self.csv_InputFile = open(self.csvDirectory + "/" + noaa +
@@ -2873,7 +2983,7 @@ class TornadoOptions(FrameLifts):
                     self.timespan_file_folder_naming + curDate
 
             # If the intensity combobox does not display "Custom..."...
-            elif self.stringTornadoIntensity.get() != "Custom...":
+            elif self.runParams.hazard_Magnitude != "Custom...":
 
                 # Open the CSV file.
                 self.csv_InputFile = open(self.csvDirectory + "/" + noaa +
@@ -2918,217 +3028,28 @@ class TornadoOptions(FrameLifts):
                                            " and removing invalid tornado "
                                            "sizes.", None)
 
-            # Remove single quotes and spaces from the CSV's first row.
-            firstLine = \
-                str(next(self.csv_Reader)).replace("'", "").replace(" ", "")
-
-            # If the tornado headers exist in that CSV's first row...
-            if tornado_headers in firstLine:
-
-                # Write the tornado headers to the output CSV file, splitting
-                # at the comma. The firstLine row will be skipped for the next
-                # step.
-                self.csv_Writer.writerow(tornado_headers.split(","))
-
-            else:
-
-                # Else, if the tornado headers are not present in the CSV's
-                # first row, add the tornado headers.
-                self.csv_Writer.writerow(tornado_headers.split(","))
-
-                # Return to first row of input CSV file, since this row does not
-                # represent a header.
-                self.csv_InputFile.seek(0)
-
-            # Variable declarations with no values assigned. These will be used
-            # in the following for loop.
-            fromDate = None
-            toDate = None
-            date_in_row = None
-
-            # For each row in the input CSV...
-            for row in self.csv_Reader:
-
-                try:
-
-                    # First, try to identify the CSV row's date (date_in_row)
-                    # by combining the Year, Month, and Day fields. If the days
-                    # of the month are out of range (e.g. June 31st), this will
-                    # cause a ValueError to occur. If that happens, a different
-                    # approach will be attempted within the except clause.
-
-                    # User-defined variables combined to create the FROM date.
-                    # YYYY, MM, DD. DD is set to 1.
-                    fromDate = datetime.date(int(self.textCustomYearFrom),
-                                             int(self.textCustomMonthFrom), 1)
-
-                    # User-defined variables combined to create the TO date.
-                    # YYYY, MM, DD. DD is set to the monthly range of the
-                    # specific YYYYMM combination.
-                    toDate = datetime.date(int(self.textCustomYearTo),
-                                           int(self.textCustomMonthTo),
-                                           calendar.monthrange(
-                                               int(self.textCustomYearTo),
-                                               int(self.textCustomMonthTo))[1])
-
-                    # Year, Month, and Day column values from CSV combined to
-                    # create a date field for each row.
-                    date_in_row = \
-                        datetime.date(int(row[1]), int(row[2]), int(row[3]))
-
-                except ValueError:
-
-                    # If the above Try block fails (likely due to a monthrange
-                    # problem like June 31st being assigned within the CSV), the
-                    # code will attempt to identify the CSV row's date by
-                    # analyzing an additional column that has the YYYY/MM/DD
-                    # fields combined into one. If this field does not have the
-                    # same typos, it will proceed successfully with the
-                    # following modification.
-
-                    try:
-
-                        # Assign the YYYYMM's monthly range in days.
-                        monthRange = \
-                            calendar.monthrange(int(self.textCustomYearFrom),
-                                            int(self.textCustomMonthFrom))[1]
-
-                        # Create FROM date by combining YYYY, MM, and DD
-                        # parameters.
-                        fromDate = \
-                            datetime.datetime.strptime(self.textCustomYearFrom +
-                                            "-" + self.textCustomMonthFrom +
-                                            "-1","%Y-%m-%d")
-
-                        # Create TO date by combining YYYY, MM, and DD
-                        # parameters.
-                        toDate = \
-                            datetime.datetime.strptime(self.textCustomYearTo +
-                                            "-" + self.textCustomMonthTo +
-                                            "-" + str(monthRange), "%Y-%m-%d")
-
-                        # Format the "date" column within the CSV into the
-                        # following date format so that it can be used to
-                        # compare itself to the fromDate and toDate variables.
-                        date_in_row = datetime.datetime.strptime(row[4],
-                                                    "%Y-%m-%d")  # '%m/%d/%Y')
-
-                    except ValueError:
-
-                        # If the "date" column within the CSV also shows invalid
-                        # date values, then proceed to skip this row.
-                        pass
-
-                # If entire row is not empty and the date in CSV row is between
-                # the from and to dates...
-                if row and fromDate <= date_in_row <= toDate:
-
-                    # If intensity column and lat/long columns are not blank...
-                    if row[10] != "" and row[15] != "" and row[16] != "":
-
-                        # If lat/long columns are not showing 0,0 coordinates...
-                        if (row[15] != "0" or row[15] != "0.0") and \
-                                (row[16] != "0" or row[16] != "0.0"):
-
-                            # If lat/long columns are within appropriate range..
-                            if float(row[15]) >= -90.0 and \
-                                    float(row[15]) <= 90.0 and \
-                                    float(row[16]) >= -180.0 and \
-                                    float(row[16]) <= 180.0:
-
-                                # If the intensity is at least zero and
-                                # less than 6 (negative values and values above
-                                # five indicate errors).
-                                # Note: Because zeroes exist within the CSV
-                                # files, those values must first be converted to
-                                # float and then to integer as they are being
-                                # read. Otherwise, the process will fail due to
-                                # Python not being able to convert 0.0 directly
-                                # to integer).
-                                if int(float(row[10])) >= 0 and \
-                                        int(float(row[10])) < 6:
-
-                                    # If tornado intensity selection is All...
-                                    if self.stringTornadoIntensity.get() == \
-                                            "All":
-
-                                        # Write the row to the output CSV.
-                                        self.csv_Writer.writerow(row)
-
-                                    # If tornado intensity selection is EF-0...
-                                    elif self.stringTornadoIntensity.get() == \
-                                            "EF-0":
-
-                                        # If tornado intensity in CSV is zero...
-                                        if int(float(row[10])) == 0:
-
-                                            # Write the row to the output CSV.
-                                            self.csv_Writer.writerow(row)
-
-                                    # If tornado intensity selection is EF-1...
-                                    elif self.stringTornadoIntensity.get() == \
-                                            "EF-1":
-
-                                        # If tornado intensity in CSV is 1...
-                                        if int(float(row[10])) == 1:
-
-                                            # Write the row to the output CSV.
-                                            self.csv_Writer.writerow(row)
-
-                                    # If tornado intensity selection is EF-2...
-                                    elif self.stringTornadoIntensity.get() == \
-                                            "EF-2":
-
-                                        # If tornado intensity in CSV is 2...
-                                        if int(float(row[10])) == 2:
-
-                                            # Write the row to the output CSV.
-                                            self.csv_Writer.writerow(row)
-
-                                    # If tornado intensity selection is EF-3...
-                                    elif self.stringTornadoIntensity.get() == \
-                                            "EF-3":
-
-                                        # If tornado intensity in CSV is 3...
-                                        if int(float(row[10])) == 3:
-
-                                            # Write the row to the output CSV.
-                                            self.csv_Writer.writerow(row)
-
-                                    # If tornado intensity selection is EF-4...
-                                    elif self.stringTornadoIntensity.get() == \
-                                                 "EF-4":
-
-                                        # If tornado intensity in CSV is 4...
-                                        if int(float(row[10])) == 4:
-
-                                            # Write the row to the output CSV.
-                                            self.csv_Writer.writerow(row)
-
-                                    # If tornado intensity selection is EF-5...
-                                    elif self.stringTornadoIntensity.get() == \
-                                                 "EF-5":
-
-                                        # If tornado intensity in CSV is 5...
-                                        if int(float(row[10])) == 5:
-
-                                            # Write the row to the output CSV.
-                                            self.csv_Writer.writerow(row)
-
-                                    # If tornado intensity selection is
-                                    # Custom...
-                                    elif self.stringTornadoIntensity.get() == \
-                                            "Custom...":
-
-                                        # If CSV row's tornado intensity is
-                                        # between the Min and Max range...
-                                        if int(float(row[10])) >= \
-                                            int(self.textCustomIntensityFrom) \
-                                            and int(float(row[10])) <= \
-                                                int(self.textCustomIntensityTo):
-
-                                            # Write the row to the output CSV.
-                                            self.csv_Writer.writerow(row)
+            # Write the tornado headers to the output CSV file, splitting at the
+            # comma.
+            self.csv_Writer.writerow(tornado_headers.split(","))
+
+            # Run the vectorized filter engine on the input CSV's catalog of
+            # typed columns (parsed once, then memory-mapped from the catalog
+            # cache by later runs on the same CSV), writing the rows that pass
+            # all checks to the output CSV.
+            # The catalog is kept under the URL, so later selections can
+            # display their expected output.
+            catalog = func_Load_SPC_Catalog(self.csv_InputFile.name, torn,
+                                            tornado_headers)
+            self.dict_Expected_Count_Catalogs[self.runParams.url_Text] = \
+                catalog
+
+            func_Filter_SPC_Catalog(
+                catalog,
+                self.csv_Writer, torn,
+                self.runParams.hazard_Magnitude,
+                self.runParams.custom_Magnitude_Min,
+                self.runParams.custom_Magnitude_Max,
+                func_Custom_Timespan(self.runParams))
 
             # Close the input CSV (otherwise there may be a file lock).
             self.csv_InputFile.close()
@@ -3214,10 +3135,6 @@ class TornadoOptions(FrameLifts):
                                     "may take considerable time to complete.",
                                     color_Orange)
 
-                        # Pause the script for five seconds to allow the user
-                        # ample time to read the message.
-                        sleep(5)
-
                     # Increment progress bar.
                     self.func_ProgressBar_setProgress(28)
 
@@ -3283,9 +3200,6 @@ class TornadoOptions(FrameLifts):
             # Increment progress bar.
             self.func_ProgressBar_setProgress(31)
 
-            # Pause script for half a second.
-            sleep(0.5)
-
             self.func_Scroll_setOutputText("Creating File GDB...", None)
 
             # Create File GDB within the GIS subfolder.
@@ -3612,15 +3526,14 @@ class TornadoOptions(FrameLifts):
             # If the radio button is USA...
             if self.radioButton_Selection == 1:
 
-                # Execute function that downloads/unzips the Census Bureau's
-                # Shapefile.
-                self.func_Download_Unzip_Census_Shapefile()
+                # Execute function that builds (first run only) the county
+                # store from the Census Bureau's Shapefile.
+                self.func_Prepare_County_Store()
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract the 50 states and Washington DC only.
                 self.func_Extract_50_States_and_DC_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Then execute function to clip tornado features to the
@@ -3641,15 +3554,14 @@ class TornadoOptions(FrameLifts):
             # If the radio button is State...
             elif self.radioButton_Selection == 2:
 
-                # Execute function that downloads/unzips the Census Bureau's
-                # Shapefile.
-                self.func_Download_Unzip_Census_Shapefile()
+                # Execute function that builds (first run only) the county
+                # store from the Census Bureau's Shapefile.
+                self.func_Prepare_County_Store()
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract state selection only.
                 self.func_Extract_State_Selection_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Then execute function to clip tornado features to the
@@ -3670,15 +3582,14 @@ class TornadoOptions(FrameLifts):
             # If the radio button is County...
             elif self.radioButton_Selection == 3:
 
-                # Execute function that downloads/unzips the Census Bureau's
-                # Shapefile.
-                self.func_Download_Unzip_Census_Shapefile()
+                # Execute function that builds (first run only) the county
+                # store from the Census Bureau's Shapefile.
+                self.func_Prepare_County_Store()
 
-                # Once Census Shapefile has been downloaded, execute function
+                # Once the county store is ready, execute function
                 # to extract the county selection only.
                 self.func_Extract_County_Selection_Only(
-                    self.subFolder_CensusShapefile + "/" +
-                    census_URL_CountyShapefile_FileName + fileExtShp,
+                    self.countyStore,
                     self.subFolder_GIS + "/" + nameFileGDB)
 
                 # Then execute function to clip tornado features to the
@@ -3727,16 +3638,13 @@ class TornadoOptions(FrameLifts):
             # Increment progress bar.
             self.func_ProgressBar_setProgress(43)
 
-            # Pause script for half a second.
-            sleep(0.5)
-
             try:
 
                 self.func_Scroll_setOutputText(
                     "Downloading US Census Shapefile...", None)
 
                 # Attempt to download the Shapefile.
-                request.urlretrieve(census_URL_CountyShapefile,
+                func_Cache_Retrieve(census_URL_CountyShapefile,
                                 self.subFolder_CensusShapefile + "/" +
                                 census_URL_CountyShapefile_FileName +
                                 fileExtZip)
@@ -3754,7 +3662,7 @@ class TornadoOptions(FrameLifts):
                 sleep(5)
 
                 # Attempt to download the Shapefile.
-                request.urlretrieve(census_URL_CountyShapefile,
+                func_Cache_Retrieve(census_URL_CountyShapefile,
                                 self.subFolder_CensusShapefile + "/" +
                                 census_URL_CountyShapefile_FileName +
                                 fileExtZip)
@@ -3765,9 +3673,6 @@ class TornadoOptions(FrameLifts):
             # Increment progress bar.
             self.func_ProgressBar_setProgress(49)
 
-            # Pause script for half a second.
-            sleep(0.5)
-
             self.func_Scroll_setOutputText(
                 "Unzipping US Census Shapefile...", None)
 
@@ -3815,141 +3720,139 @@ class TornadoOptions(FrameLifts):
                                            "Traceback: " +
                                            traceback.format_exc(), color_Red)
 
-    def func_Extract_50_States_and_DC_Only(self, censusShapefile, fileGDB_Path):
+    def func_Prepare_County_Store(self):
 
-        # This function controls the process of extracting the 50 states and
-        # Washington DC from the Census Bureau's Shapefile and performing
-        # various modifications to that data.
+        # This function controls the county store, which holds the 50 states
+        # and DC counties already projected to the designated PCS and indexed
+        # by state FIPS code and county name. It is built once from the Census
+        # Bureau's Shapefile and then reused by every run, so the Census
+        # Shapefile is only downloaded when the county store doesn't exist.
 
         try:
 
-            self.func_Scroll_setOutputText(
-                "Copying Census Shapefile to File GDB...", None)
-
-            # Copy the Census Shapefile to a feature class within the File GDB.
-            arcpy.CopyFeatures_management(censusShapefile,
-                                          fileGDB_Path + "/" +
-                                          featureClass_50States_and_DC_only)
-
-            # Display geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "Census Shapefile copied to File GDB.", None)
+            # Assign the county store's feature class to variable.
+            self.countyStore = func_County_Store_Path(
+                census_URL_CountyShapefile_FileName)
 
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(55)
+            # If the county store has already been built...
+            if func_County_Store_Exists(census_URL_CountyShapefile_FileName):
 
-            # Pause script for one second.
-            sleep(1)
+                self.func_Scroll_setOutputText("County store found (" +
+                                               self.countyStore + ").", None)
 
-            self.func_Scroll_setOutputText(
-                "Extracting 50 States and DC from Feature Class...", None)
+            else:
 
-            # Open the Census feature class with an Update Cursor.
-            # Attribute field set to the state's FIPS code.
-            with arcpy.da.UpdateCursor(fileGDB_Path + "/" +
-                                    featureClass_50States_and_DC_only,
-                                    census_Shapefile_Field_StateFIPS) as cursor:
+                self.func_Scroll_setOutputText(
+                    "County store not found, building it (one time only)...",
+                    None)
 
-                # For each feature in the Census feature class.
-                for row in cursor:
+                # Execute function that downloads/unzips the Census Bureau's
+                # Shapefile.
+                self.func_Download_Unzip_Census_Shapefile()
 
-                    # This If statement removes non-50 state (and DC) FIPS codes
-                    # from the Census feature class. The original data includes
-                    # all US territories, and those FIPS codes must be removed.
-                    if row[0] == "60" or row[0] == "66" or row[0] == "69" or \
-                            row[0] == "72" or row[0] == "78":
+                self.func_Scroll_setOutputText("Projecting counties to PCS " +
+                            pcsReferenceString +
+                            " with Central Meridian Offset (-30.0 degrees) "
+                            "and indexing...", None)
 
-                        # Delete polygon feature.
-                        cursor.deleteRow()
+                # Build the county store from the Census Shapefile.
+                func_Build_County_Store(self.subFolder_CensusShapefile + "/" +
+                                        census_URL_CountyShapefile_FileName +
+                                        fileExtShp,
+                                        census_URL_CountyShapefile_FileName,
+                                        pcsReference)
 
-            # Display geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+                # Display geoprocessing messages.
+                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-            self.func_Scroll_setOutputText(
-                "50 States and DC extracted from Feature Class.", None)
+                self.func_Scroll_setOutputText("County store built (" +
+                                               self.countyStore + ").", None)
 
             # Increment progress bar.
-            self.func_ProgressBar_setProgress(56)
+            self.func_ProgressBar_setProgress(55)
 
-            # Set the workspace within the File GDB for the following tasks.
-            arcpy.env.workspace = fileGDB_Path
+        except arcpy.ExecuteError:
 
-            # Set naming convention variable for projecting Census feature
-            # class.
-            self.featureClass_Polygons_Projected = \
-                featureClass_50States_and_DC_only + "_Projected"
+            # Display geoprocessing error messages.
+            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
 
-            self.func_Scroll_setOutputText("Projecting feature class to PCS " +
-                            pcsReferenceString +
-                            " with Central Meridian Offset (-30.0 degrees)...",
-                            None)
+        except Exception as e:
 
-            # Project the Census feature class to the designated PCS as a new
-            # feature class within the File GDB.
-            arcpy.Project_management(featureClass_50States_and_DC_only,
-                                     self.featureClass_Polygons_Projected,
-                                     pcsReference)
+            # Display error messages for all other errors.
+            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
+                                           "Traceback: " +
+                                           traceback.format_exc(), color_Red)
 
-            # Display geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+    def func_Extract_50_States_and_DC_Only(self, countyStore, fileGDB_Path):
 
-            self.func_Scroll_setOutputText("PCS Projection to " +
-                                           pcsReferenceString + " completed.",
-                                           None)
+        # This function controls the process of extracting the 50 states and
+        # Washington DC from the county store. The county store's polygons are
+        # already limited to the 50 states and DC and projected to the
+        # designated PCS, so they are copied straight into the File GDB.
 
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(57)
+        try:
+
+            # Set the workspace within the File GDB for the following tasks.
+            arcpy.env.workspace = fileGDB_Path
 
             self.func_Scroll_setOutputText(
-                "Recalculating extent for feature class...", None)
+                "Extracting 50 States and DC from county store...", None)
 
-            # Recalculate extent of the projected Census feature class.
-            arcpy.RecalculateFeatureClassExtent_management(
-                self.featureClass_Polygons_Projected)
+            # Copy the projected counties from the county store to a feature
+            # class within the File GDB.
+            func_Extract_County_Mask(countyStore, fileGDB_Path + "/" +
+                                     featureClass_50States_and_DC_only)
 
             # Display geoprocessing messages.
             self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-            self.func_Scroll_setOutputText("Feature class extent recalculated.",
-                                           None)
+            self.func_Scroll_setOutputText(
+                "50 States and DC extracted from county store.", None)
 
             # Increment progress bar.
-            self.func_ProgressBar_setProgress(58)
+            self.func_ProgressBar_setProgress(60)
 
-            self.func_Scroll_setOutputText("Deleting feature class " +
-                                           featureClass_50States_and_DC_only +
-                                           " from File GDB...", None)
+        except arcpy.ExecuteError:
 
-            # Delete the original, pre-projected Census feature class from the
-            # File GDB. It is no longer needed.
-            arcpy.Delete_management(featureClass_50States_and_DC_only)
+            # Display geoprocessing error messages.
+            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
 
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+        except Exception as e:
 
-            self.func_Scroll_setOutputText(
-                "Feature class deleted from File GDB.", None)
+            # Display error messages for all other errors.
+            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
+                                           "Traceback: " +
+                                           traceback.format_exc(), color_Red)
 
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(59)
+    def func_Extract_State_Selection_Only(self, countyStore, fileGDB_Path):
 
-            self.func_Scroll_setOutputText("Renaming feature class " +
-                                    self.featureClass_Polygons_Projected +
-                                    " back to " +
-                                    featureClass_50States_and_DC_only + "...",
-                                    None)
+        # This function controls the process of extracting the user-selected
+        # state from the county store. The state's counties are looked up by
+        # state FIPS code and are already projected to the designated PCS.
+
+        try:
+
+            # Set workspace for the following tasks.
+            arcpy.env.workspace = fileGDB_Path
 
-            # Rename the projected Census feature class to the original naming
-            # convention of the feature class that was just deleted.
-            arcpy.Rename_management(self.featureClass_Polygons_Projected,
-                                    featureClass_50States_and_DC_only)
+            self.func_Scroll_setOutputText("Extracting state selection(" +
+                                           self.runParams.state_Name +
+                                           ") from county store...", None)
+
+            # Copy the user-selected state's projected counties from the county
+            # store to a feature class within the File GDB. The state's FIPS
+            # code is accessed from the state name/state FIPS dictionary.
+            func_Extract_County_Mask(countyStore, fileGDB_Path + "/" +
+                                     self.featureClass_State_Selection_Only,
+                                     dict_StateName_StateFIPs.get(
+                                         self.runParams.state_Name))
 
             # Get geoprocessing messages.
             self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-            self.func_Scroll_setOutputText("Feature class has been renamed.",
+            self.func_Scroll_setOutputText("State selection(" +
+                                           self.runParams.state_Name +
+                                           ") extracted from county store.",
                                            None)
 
             # Increment progress bar.
@@ -3967,341 +3870,60 @@ class TornadoOptions(FrameLifts):
                                            "Traceback: " +
                                            traceback.format_exc(), color_Red)
 
-    def func_Extract_State_Selection_Only(self, censusShapefile, fileGDB_Path):
+    def func_Extract_County_Selection_Only(self, countyStore, fileGDB_Path):
 
         # This function controls the process of extracting the user-selected
-        # state from the Census Bureau's Shapefile and performing various
-        # modifications to that data.
+        # county from the county store. The county is looked up by state FIPS
+        # code and county name and is already projected to the designated PCS.
 
         try:
 
-            self.func_Scroll_setOutputText(
-                "Copying Census Shapefile to File GDB...", None)
+            # Set workspace for the following tasks.
+            arcpy.env.workspace = fileGDB_Path
 
-            # Copy the Census Shapefile to a feature class within the File GDB.
-            arcpy.CopyFeatures_management(censusShapefile, fileGDB_Path + "/" +
-                                        self.featureClass_State_Selection_Only)
+            self.func_Scroll_setOutputText("Extracting (" +
+                                           self.runParams.county_Name +
+                                           ", " + self.runParams.state_Name +
+                                           ") from county store...", None)
+
+            # Copy the user-selected county's projected polygon from the county
+            # store to a feature class within the File GDB.
+            func_Extract_County_Mask(countyStore, fileGDB_Path + "/" +
+                                     self.featureClass_County_State_Naming,
+                                     dict_StateName_StateFIPs.get(
+                                         self.runParams.state_Name),
+                                     self.runParams.county_Name)
 
             # Get geoprocessing messages.
             self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-            self.func_Scroll_setOutputText(
-                "Census Shapefile copied to File GDB.", None)
+            self.func_Scroll_setOutputText(self.runParams.county_Name + ", " +
+                                           self.runParams.state_Name +
+                                           " extracted from county store.",
+                                           None)
 
             # Increment progress bar.
-            self.func_ProgressBar_setProgress(55)
+            self.func_ProgressBar_setProgress(60)
 
-            # Pause script for one second.
-            sleep(1)
+        except arcpy.ExecuteError:
 
-            self.func_Scroll_setOutputText("Extracting state selection(" +
-                                           self.stringState_Name.get() +
-                                           ") from Feature Class...", None)
+            # Display geoprocessing error messages.
+            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
 
-            # Open the Census feature class with an Update Cursor.
-            # Attribute field set to the state's FIPS code.
-            with arcpy.da.UpdateCursor(fileGDB_Path + "/" +
-                                    self.featureClass_State_Selection_Only,
-                                    census_Shapefile_Field_StateFIPS) as cursor:
+        except Exception as e:
 
-                # For each feature in the Census feature class...
-                for row in cursor:
+            # Display error messages for all other errors.
+            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
+                                           "Traceback: " +
+                                           traceback.format_exc(), color_Red)
 
-                    # This If statement removes all polygons not affiliated with
-                    # the user-selected state's FIPS code. This is accessed
-                    # from the state name/state FIPS dictionary.
-                    if row[0] != \
-                            dict_StateName_StateFIPs.get(
-                                self.stringState_Name.get()):
+    def func_FeatureClass_Clip(self, inputFC, clipFC, outputFC_Name):
 
-                        # Delete polygon feature.
-                        cursor.deleteRow()
+        # This function controls the processes involved with clipping the
+        # tornado point feature class to the user-selected Census polygon
+        # boundary feature class.
 
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("State selection(" +
-                                           self.stringState_Name.get() +
-                                           ") extracted from Feature Class.",
-                                           None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(56)
-
-            # Set workspace for the following tasks.
-            arcpy.env.workspace = fileGDB_Path
-
-            # Set naming convention variable for projecting Census feature
-            # class.
-            self.featureClass_Polygons_Projected = \
-                self.featureClass_State_Selection_Only + "_Projected"
-
-            self.func_Scroll_setOutputText("Projecting feature class to PCS " +
-                            pcsReferenceString +
-                            " with Central Meridian Offset (-30.0 degrees)...",
-                            None)
-
-            # Project the Census feature class to the designated PCS as a new
-            # feature class within the File GDB.
-            arcpy.Project_management(self.featureClass_State_Selection_Only,
-                                     self.featureClass_Polygons_Projected,
-                                     pcsReference)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("PCS Projection to " +
-                                           pcsReferenceString + " completed.",
-                                           None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(57)
-
-            self.func_Scroll_setOutputText(
-                "Recalculating extent for feature class...",
-                None)
-
-            # Recalculate extent of the projected Census feature class.
-            arcpy.RecalculateFeatureClassExtent_management(
-                self.featureClass_Polygons_Projected)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("Feature class extent recalculated.",
-                                           None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(58)
-
-            self.func_Scroll_setOutputText("Deleting feature class " +
-                                        self.featureClass_State_Selection_Only +
-                                        " from File GDB...", None)
-
-            # Delete the original, pre-projected Census feature class from the
-            # File GDB. It is no longer needed.
-            arcpy.Delete_management(self.featureClass_State_Selection_Only)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "Feature class deleted from File GDB.", None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(59)
-
-            self.func_Scroll_setOutputText("Renaming feature class " +
-                                self.featureClass_Polygons_Projected +
-                                " back to " +
-                                self.featureClass_State_Selection_Only + "...",
-                                None)
-
-            # Rename the projected Census feature class to the original naming
-            # convention of the feature class that was just deleted.
-            arcpy.Rename_management(self.featureClass_Polygons_Projected,
-                                    self.featureClass_State_Selection_Only)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("Feature class has been renamed.",
-                                           None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(60)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing error messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-        except Exception as e:
-
-            # Display error messages for all other errors.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-    def func_Extract_County_Selection_Only(self, censusShapefile, fileGDB_Path):
-
-        # This function controls the process of extracting the user-selected
-        # county from the Census Bureau's Shapefile and performing various
-        # modifications to that data.
-
-        try:
-
-            self.func_Scroll_setOutputText(
-                "Copying Census Shapefile to File GDB...", None)
-
-            # Copy the Census Shapefile to a feature class within the File GDB.
-            arcpy.CopyFeatures_management(censusShapefile, fileGDB_Path + "/" +
-                                          self.featureClass_County_State_Naming)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "Census Shapefile copied to File GDB.", None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(55)
-
-            # Pause script for one second.
-            sleep(1)
-
-            self.func_Scroll_setOutputText("Extracting (" +
-                                           self.stringCounty_Name.get() +
-                                           ", " + self.stringState_Name.get() +
-                                           ") from Feature Class...", None)
-
-            # Open the Census feature class with an Update Cursor.
-            # Field names set to the state's FIPS code and county names.
-            with arcpy.da.UpdateCursor(fileGDB_Path + "/" +
-                                self.featureClass_County_State_Naming,
-                                field_names=[census_Shapefile_Field_StateFIPS,
-                                census_Shapefile_Field_CountyName]) as cursor:
-
-                # For each feature in the Census feature class...
-                for row in cursor:
-
-                    # If the feature's state FIPS code matches the user-selected
-                    # state's FIPS code...
-                    if row[0] == dict_StateName_StateFIPs.get(
-                            self.stringState_Name.get()):
-
-                        # If the feature's county name matches the user-selected
-                        # county name within the matching state FIPS code...
-                        if row[1] == self.stringCounty_Name.get():
-
-                            # Do nothing, leave that record within the feature
-                            # class.
-                            pass
-
-                        else:
-
-                            # Delete the feature from the feature class, as it
-                            # is not a match.
-                            cursor.deleteRow()
-
-                    else:
-
-                        # Else, delete the feature as the state FIPS code does
-                        # not match the user-selected state.
-                        cursor.deleteRow()
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(self.stringCounty_Name.get() + ", " +
-                                           self.stringState_Name.get() +
-                                           " extracted from Feature Class.",
-                                           None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(56)
-
-            # Set workspace for the following tasks.
-            arcpy.env.workspace = fileGDB_Path
-
-            # Set naming convention variable for projecting Census feature
-            # class.
-            self.featureClass_Polygons_Projected = \
-                self.featureClass_County_State_Naming + "_Projected"
-
-            self.func_Scroll_setOutputText("Projecting feature class to PCS " +
-                            pcsReferenceString +
-                            " with Central Meridian Offset (-30.0 degrees)...",
-                            None)
-
-            # Project the Census feature class to the designated PCS as a new
-            # feature class within the File GDB.
-            arcpy.Project_management(self.featureClass_County_State_Naming,
-                                     self.featureClass_Polygons_Projected,
-                                     pcsReference)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("PCS Projection to " +
-                                           pcsReferenceString + " completed.",
-                                           None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(57)
-
-            self.func_Scroll_setOutputText(
-                "Recalculating extent for feature class...", None)
-
-            # Recalculate extent of the projected Census feature class.
-            arcpy.RecalculateFeatureClassExtent_management(
-                self.featureClass_Polygons_Projected)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("Feature class extent recalculated.",
-                                           None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(58)
-
-            self.func_Scroll_setOutputText("Deleting feature class " +
-                                        self.featureClass_County_State_Naming +
-                                        " from File GDB...", None)
-
-            # Delete the original, pre-projected Census feature class from the
-            # File GDB. It is no longer needed.
-            arcpy.Delete_management(self.featureClass_County_State_Naming)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText(
-                "Feature class deleted from File GDB.", None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(59)
-
-            self.func_Scroll_setOutputText("Renaming feature class " +
-                                self.featureClass_Polygons_Projected +
-                                " back to " +
-                                self.featureClass_County_State_Naming + "...",
-                                None)
-
-            # Rename the projected Census feature class to the original naming
-            # convention of the feature class that was just deleted.
-            arcpy.Rename_management(self.featureClass_Polygons_Projected,
-                                    self.featureClass_County_State_Naming)
-
-            # Get geoprocessing messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-            self.func_Scroll_setOutputText("Feature class has been renamed.",
-                                           None)
-
-            # Increment progress bar.
-            self.func_ProgressBar_setProgress(60)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing error messages.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-        except Exception as e:
-
-            # Display error messages for all other errors.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-    def func_FeatureClass_Clip(self, inputFC, clipFC, outputFC_Name):
-
-        # This function controls the processes involved with clipping the
-        # tornado point feature class to the user-selected Census polygon
-        # boundary feature class.
-
-        try:
+        try:
 
             # Set the workspace to the File GDB for the following tasks.
             arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
@@ -4322,7 +3944,7 @@ class TornadoOptions(FrameLifts):
                 # Display this particular message before executing the clip.
                 self.func_Scroll_setOutputText(
                     "Clipping tornado features to state selection(" +
-                    self.stringState_Name.get() + ")...", None)
+                    self.runParams.state_Name + ")...", None)
 
             # If the user selects County...
             elif self.radioButton_Selection == 3:
@@ -4330,8 +3952,8 @@ class TornadoOptions(FrameLifts):
                 # Display this particular message before executing the clip.
                 self.func_Scroll_setOutputText(
                     "Clipping tornado features to " +
-                    self.stringCounty_Name.get() + ", " +
-                    self.stringState_Name.get() + "...", None)
+                    self.runParams.county_Name + ", " +
+                    self.runParams.state_Name + "...", None)
 
             # Perform a clip of the tornado point features to the specified
             # polygon boundary.
@@ -4353,15 +3975,15 @@ class TornadoOptions(FrameLifts):
                 # Display this particular message after executing the clip.
                 self.func_Scroll_setOutputText("Tornado features have been "
                                                "clipped to state selection(" +
-                                               self.stringState_Name.get() +
+                                               self.runParams.state_Name +
                                                ").", None)
 
             # If the user selects County...
             if self.radioButton_Selection == 3:
                 # Display this particular message after executing the clip.
                 self.func_Scroll_setOutputText("Tornado features have been "
-                                "clipped to " + self.stringCounty_Name.get() +
-                                ", " + self.stringState_Name.get() + ".", None)
+                                "clipped to " + self.runParams.county_Name +
+                                ", " + self.runParams.state_Name + ".", None)
 
             # Increment progress bar.
             self.func_ProgressBar_setProgress(64)
@@ -4410,7 +4032,7 @@ class TornadoOptions(FrameLifts):
             # Display this particular message with tornado count value.
             self.func_Scroll_setOutputText(str(self.clipped_tornadoCount) +
                                         " tornado features observed within " +
-                                        self.stringState_Name.get() + ".", None)
+                                        self.runParams.state_Name + ".", None)
 
         # If user selects County...
         if self.radioButton_Selection == 3:
@@ -4418,15 +4040,12 @@ class TornadoOptions(FrameLifts):
             # Display this particular message with tornado count value.
             self.func_Scroll_setOutputText(str(self.clipped_tornadoCount) +
                                         " tornado features observed within " +
-                                        self.stringCounty_Name.get() + ", " +
-                                        self.stringState_Name.get() + ".", None)
+                                        self.runParams.county_Name + ", " +
+                                        self.runParams.state_Name + ".", None)
 
         # Increment progress bar.
         self.func_ProgressBar_setProgress(67)
 
-        # Pause script for one second.
-        sleep(1)
-
         # If zero tornado features present within the feature class...
         if self.clipped_tornadoCount < 1:
             # Display this message and error message to the user, since the
@@ -4471,7 +4090,7 @@ class TornadoOptions(FrameLifts):
         try:
 
             # If the user chooses to output the count results to CSV file...
-            if self.statusAnalysis_OutputToCSVFile.get() == 1:
+            if "OutputToCSVFile" in self.runParams.analysis_Options:
 
                 # Set the workspace for the following analysis.
                 arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
@@ -4495,51 +4114,47 @@ class TornadoOptions(FrameLifts):
                                    self.folderNamingAddition + fileExtCSV, "w")
 
                     # If timespan and intensity drop-downs don't show Custom...
-                    if self.stringTornadoTimespan.get() != "Custom..." and \
-                            self.stringTornadoIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                      self.stringTornadoTimespan.get() + ",\n")
+                                      self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.stringTornadoIntensity.get() + ",\n")
+                                      self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan drop-down shows Custom and intensity doesn't..
-                    if self.stringTornadoTimespan.get() == "Custom..." and \
-                            self.stringTornadoIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # WRite the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.stringTornadoIntensity.get() + ",\n")
+                                      self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan and intensity drop-downs both show Custom...
-                    if self.stringTornadoTimespan.get() == "Custom..." and \
-                            self.stringTornadoIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # If timespan drop-down doesn't show Custom and Intensity
                     # does...
-                    if self.stringTornadoTimespan.get() != "Custom..." and \
-                            self.stringTornadoIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                      self.stringTornadoTimespan.get() + ",\n")
+                                      self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # Now write the following lines, regardless of
                     # timespan/intensity selection.
@@ -4551,47 +4166,21 @@ class TornadoOptions(FrameLifts):
                     csvFile.write("V,V,V,\n")
                     csvFile.write("Minimum Size,Maximum Size,Mode Size,\n")
 
-                    # Create empty list to store all US Intensity values.
-                    magList_US = []
-
-                    # Open the in_memory spatial join as a Search Cursor,
-                    # with analysis fields set to FIPS code and Intensity.
-                    with arcpy.da.SearchCursor("in_memory/SpatialJoin",
-                                            [census_Shapefile_Field_StateFIPS,
-                                             analysis_Mag_Field]) as cursor:
+                    # Read the FIPS code and intensity fields of the in_memory
+                    # spatial join into arrays (one scan for all statistics).
+                    joinArray = arcpy.da.FeatureClassToNumPyArray(
+                        "in_memory/SpatialJoin",
+                        [census_Shapefile_Field_StateFIPS, analysis_Mag_Field])
 
-                        # For each feature within the spatial join...
-                        for row in cursor:
-
-                            # Add the Intensity to the US list.
-                            magList_US.append(row[1])
-
-                    try:
-
-                        # Calculate mode of all Intensities within US list.
-                        modeValue_US = mode(magList_US)
-
-                        # Convert mode information to float and then to
-                        # string with two decimal places.
-                        modeString_US = \
-                            str("{0:.2f}".format(float(modeValue_US)))
-
-                    except StatisticsError:
-
-                        # This catches any lists containing no mode.
-                        # This will occur if all values within list are
-                        # unique values.
-
-                        # Assign mode to the following phrase.
-                        modeString_US = "No Unique Mode"
-
-                        pass
+                    # Calculate statistics of all intensities within the US.
+                    stats_US = func_Value_Statistics(
+                        joinArray[analysis_Mag_Field])
 
                     # Write the following data to the data counts CSV.
                     # Min size, max size, and mode size.
-                    csvFile.write(str(min(magList_US)) + "," +
-                            str(max(magList_US)) + "," +
-                            modeString_US + ",\n")
+                    csvFile.write(str(stats_US.minimum) + "," +
+                                  str(stats_US.maximum) + "," +
+                                  func_Mode_String(stats_US.mode) + ",\n")
 
                     csvFile.write("\n")
                     csvFile.write("Tornado Data per State,\n")
@@ -4600,69 +4189,31 @@ class TornadoOptions(FrameLifts):
                                   "Minimum Size,Maximum Size,"
                                   "Mode Size,State FIPS Code,\n")
 
-                    # Create empty list for storing tornado/intensity values.
-                    magList = []
+                    # Calculate statistics of the intensities within each state
+                    # (one pass over the arrays, grouped by FIPS code).
+                    stats_PerState = func_Group_Statistics(
+                        joinArray[census_Shapefile_Field_StateFIPS],
+                        joinArray[analysis_Mag_Field])
 
                     # For each state value in the ordered dictionary...
                     for key in dictKeys_OrderedDict_StateNames:
 
-                        # Set counter to zero, for counting tornado within
-                        # each state during loop.
-                        counter = 0
-
-                        # Clears magList after each state count has concluded.
-                        magList.clear()
+                        # Statistics for the state's FIPS code (None if the
+                        # state has no tornadoes).
+                        stats_State = stats_PerState.get(
+                            dictKeys_OrderedDict_StateNames[key])
 
-                        # Open the in_memory spatial join as a Search Cursor,
-                        # with analysis fields set to FIPS code and intensity.
-                        with arcpy.da.SearchCursor("in_memory/SpatialJoin",
-                                            [census_Shapefile_Field_StateFIPS,
-                                            analysis_Mag_Field]) as cursor:
-
-                            # For each feature within the spatial join...
-                            for row in cursor:
-
-                                # If FIPS code matches a state in the ordered
-                                # dictionary...
-                                if row[0] == \
-                                        dictKeys_OrderedDict_StateNames[key]:
-                                    # Append row information to magList.
-                                    magList.append(row[1])
-
-                                    # Increment counter by one.
-                                    counter = counter + 1
-
-                        # If counter is greater than zero...
-                        if counter > 0:
-
-                            try:
-
-                                # Calculate mode of all intensities within list.
-                                modeValue = mode(magList)
-
-                                # Convert mode information to float and then to
-                                # string with two decimal places.
-                                modeString = \
-                                    str("{0:.2f}".format(float(modeValue)))
-
-                            except StatisticsError:
-
-                                # This catches any lists containing no mode.
-                                # This will occur if all values within list are
-                                # unique values.
-
-                                # Assign modeString to the following phrase.
-                                modeString = "No Unique Mode"
-
-                                pass
+                        # If the state has any tornadoes...
+                        if stats_State is not None:
 
                             # Write the following data to the data counts CSV.
                             # State name, how many tornadoes, min size, max
                             # size, mode size, and FIPs.
-                            csvFile.write(str(key) + "," + str(counter) +
-                                "," + str(min(magList)) + "," +
-                                str(max(magList)) + "," +
-                                modeString + "," +
+                            csvFile.write(str(key) + "," +
+                                str(stats_State.count) + "," +
+                                str(stats_State.minimum) + "," +
+                                str(stats_State.maximum) + "," +
+                                func_Mode_String(stats_State.mode) + "," +
                                 str(dictKeys_OrderedDict_StateNames[key]) +
                                 ",\n")
 
@@ -4693,53 +4244,49 @@ class TornadoOptions(FrameLifts):
                                    self.folderNamingAddition + fileExtCSV, "w")
 
                     # If timespan and intensity drop-downs don't show Custom...
-                    if self.stringTornadoTimespan.get() != "Custom..." and \
-                            self.stringTornadoIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                      self.stringTornadoTimespan.get() + ",\n")
+                                      self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.stringTornadoIntensity.get() + ",\n")
+                                      self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan drop-down shows Custom and intensity drop-down
                     # doesn't show Custom...
-                    if self.stringTornadoTimespan.get() == "Custom..." and \
-                            self.stringTornadoIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.stringTornadoIntensity.get() + ",\n")
+                                      self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan drop-down shows Custom and intensity drop-down
                     # shows Custom...
-                    if self.stringTornadoTimespan.get() == "Custom..." and \
-                            self.stringTornadoIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # If timespan drop-down doesn't show Custom and intensity
                     # drop-down shows Custom...
-                    if self.stringTornadoTimespan.get() != "Custom..." and \
-                            self.stringTornadoIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                      self.stringTornadoTimespan.get() + ",\n")
+                                      self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # Now write the following lines, regardless of
                     # timespan/intensity selection.
@@ -4748,10 +4295,10 @@ class TornadoOptions(FrameLifts):
                                   str(self.usa_tornado_count) + ",\n")
                     csvFile.write("\n")
                     csvFile.write("State Tornadoes - " +
-                                  str(self.stringState_Name.get()) +
+                                  str(self.runParams.state_Name) +
                                   " (FIPS: " +
                                   str(dictKeys_OrderedDict_StateNames[
-                                          self.stringState_Name.get()]) +
+                                          self.runParams.state_Name]) +
                                   "):," + str(self.clipped_tornadoCount) +
                                   ",\n")
                     csvFile.write("\n")
@@ -4759,47 +4306,21 @@ class TornadoOptions(FrameLifts):
                     csvFile.write("V,V,V,\n")
                     csvFile.write("Minimum Size,Maximum Size,Mode Size,\n")
 
-                    # Create empty list to store all state intensity values.
-                    magList_State = []
-
-                    # Open the in_memory spatial join as a Search Cursor,
-                    # with analysis fields set to FIPS code and intensity.
-                    with arcpy.da.SearchCursor("in_memory/SpatialJoin",
-                                            [census_Shapefile_Field_CountyName,
-                                                analysis_Mag_Field]) as cursor:
-
-                        # For each feature within the spatial join...
-                        for row in cursor:
+                    # Read the county name and intensity fields of the in_memory
+                    # spatial join into arrays (one scan for all statistics).
+                    joinArray = arcpy.da.FeatureClassToNumPyArray(
+                        "in_memory/SpatialJoin",
+                        [census_Shapefile_Field_CountyName, analysis_Mag_Field])
 
-                            # Add the intensity to the state list.
-                            magList_State.append(row[1])
-
-                    try:
-
-                        # Calculate mode of all intensities within state list.
-                        modeValue_State = mode(magList_State)
-
-                        # Convert mode information to float and then to
-                        # string with two decimal places.
-                        modeString_State = \
-                            str("{0:.2f}".format(float(modeValue_State)))
-
-                    except StatisticsError:
-
-                        # This catches any lists containing no mode.
-                        # This will occur if all values within list are
-                        # unique values.
-
-                        # Assign mode to the following phrase.
-                        modeString_State = "No Unique Mode"
-
-                        pass
+                    # Calculate statistics of all intensities within the state.
+                    stats_State = func_Value_Statistics(
+                        joinArray[analysis_Mag_Field])
 
                     # Write the following data to the data counts CSV.
                     # Min size, max size, and mode size.
-                    csvFile.write(str(min(magList_State)) + "," +
-                            str(max(magList_State)) + "," +
-                            modeString_State + ",\n")
+                    csvFile.write(str(stats_State.minimum) + "," +
+                                  str(stats_State.maximum) + "," +
+                                  func_Mode_String(stats_State.mode) + ",\n")
 
                     csvFile.write("\n")
                     csvFile.write("Tornado Data per County\n")
@@ -4808,70 +4329,34 @@ class TornadoOptions(FrameLifts):
                                   "Minimum Size,Maximum Size,"
                                   "Mode Size,\n")
 
-                    # Create empty list for storing tornado/intensity values.
-                    magList = []
+                    # Calculate statistics of the intensities within each county
+                    # (one pass over the arrays, grouped by county name).
+                    stats_PerCounty = func_Group_Statistics(
+                        joinArray[census_Shapefile_Field_CountyName],
+                        joinArray[analysis_Mag_Field])
 
                     # For each county list within state/county dictionary
                     # matching the state drop-down selection...
                     for key in GUI_CountiesPerState.dict_state_counties[
-                        self.stringState_Name.get()]:
-
-                        # Set counter to zero, for counting tornado within
-                        # each state during loop.
-                        counter = 0
-
-                        # Clears magList after each state count has concluded.
-                        magList.clear()
-
-                        # Open the in_memory spatial join as a Search Cursor,
-                        # with analysis fields set to county name and intensity.
-                        with arcpy.da.SearchCursor("in_memory/SpatialJoin",
-                                            [census_Shapefile_Field_CountyName,
-                                            analysis_Mag_Field]) as cursor:
-
-                            # For each feature within the spatial join...
-                            for row in cursor:
+                        self.runParams.state_Name]:
 
-                                # If the county name matches a county name
-                                # within the state/county dictionary....
-                                if row[0] == key:
-                                    # Append row information to magList.
-                                    magList.append(row[1])
-
-                                    # Increment counter by one.
-                                    counter = counter + 1
-
-                        # If row counter is greater than zero...
-                        if counter > 0:
-
-                            try:
-
-                                # Calculate mode of all intensities within list.
-                                modeValue = mode(magList)
+                        # Statistics for the county (None if the county has no
+                        # tornadoes).
+                        stats_County = stats_PerCounty.get(key)
 
-                                # Convert mode information to float and then to
-                                # string with two decimal places.
-                                modeString = \
-                                    str("{0:.2f}".format(float(modeValue)))
-
-                            except StatisticsError:
-
-                                # This catches any lists containing no mode.
-                                # This will occur if all values within list are
-                                # unique values.
-
-                                # Assign modeString to the following phrase.
-                                modeString = "No Unique Mode"
-
-                                pass
+                        # If the county has any tornadoes...
+                        if stats_County is not None:
 
                             # Write the following data to the data counts CSV.
                             # County name, how many tornado, min size, max
                             # size, and mode size.
-                            csvFile.write(str(key) + "," + str(counter) +
-                                "," + str("{0:.2f}".format(min(magList))) +
-                                "," + str("{0:.2f}".format(max(magList))) +
-                                "," + modeString + ",\n")
+                            csvFile.write(str(key) + "," +
+                                str(stats_County.count) + "," +
+                                str("{0:.2f}".format(stats_County.minimum)) +
+                                "," +
+                                str("{0:.2f}".format(stats_County.maximum)) +
+                                "," + func_Mode_String(stats_County.mode) +
+                                ",\n")
 
                     # Close the data counts CSV file.
                     csvFile.close()
@@ -4898,53 +4383,49 @@ class TornadoOptions(FrameLifts):
                                    self.folderNamingAddition + fileExtCSV, "w")
 
                     # If timespan and intensity drop-downs don't show Custom...
-                    if self.stringTornadoTimespan.get() != "Custom..." and \
-                            self.stringTornadoIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                      self.stringTornadoTimespan.get() + ",\n")
+                                      self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.stringTornadoIntensity.get() + ",\n")
+                                      self.runParams.hazard_Magnitude + ",\n")
 
                     # If timespan drop-down shows Custom and intensity drop-down
                     # doesn't show Custom...
-                    if self.stringTornadoTimespan.get() == "Custom..." and \
-                            self.stringTornadoIntensity.get() != "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude != "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.stringTornadoIntensity.get() + ",\n")
+                                      self.runParams.hazard_Magnitude + ",\n")
 
                     # timespan drop-down shows Custom and intensity drop-down
                     # shows Custom...
-                    if self.stringTornadoTimespan.get() == "Custom..." and \
-                            self.stringTornadoIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan == "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
-                        csvFile.write("Timespan:," + self.textCustomYearFrom +
-                                      self.textCustomMonthFrom.zfill(2) +
-                                      "-" + self.textCustomYearTo +
-                                      self.textCustomMonthTo.zfill(2) + ",\n")
+                        csvFile.write("Timespan:," + func_Custom_Timespan_Text(
+                            self.runParams) + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # If timespan drop-down doesn't show Custom and intensity
                     # drop-down shows Custom...
-                    if self.stringTornadoTimespan.get() != "Custom..." and \
-                            self.stringTornadoIntensity.get() == "Custom...":
+                    if self.runParams.hazard_Timespan != "Custom..." and \
+                            self.runParams.hazard_Magnitude == "Custom...":
 
                         # Write the following lines into the data counts CSV.
                         csvFile.write("Timespan:," +
-                                      self.stringTornadoTimespan.get() + ",\n")
+                                      self.runParams.hazard_Timespan + ",\n")
                         csvFile.write("Size Range (EF):," +
-                                      self.textCustomIntensityFrom + "-" +
-                                      self.textCustomIntensityTo + ",\n")
+                                      func_Custom_Magnitude_Text(
+                                          self.runParams) + ",\n")
 
                     # Now write the following lines, regardless of
                     # timespan/intensity selection.
@@ -4952,13 +4433,13 @@ class TornadoOptions(FrameLifts):
                     csvFile.write("USA (and DC) Tornadoes:," +
                                   str(self.usa_tornado_count) + ",\n")
                     csvFile.write("State Tornadoes - " +
-                                str(self.stringState_Name.get()) + " (FIPS: " +
+                                str(self.runParams.state_Name) + " (FIPS: " +
                                 str(dictKeys_OrderedDict_StateNames[
-                                self.stringState_Name.get()]) + "):," +
+                                self.runParams.state_Name]) + "):," +
                                 str(self.state_tornado_count) + ",\n")
                     csvFile.write("\n")
                     csvFile.write("County Tornadoes - " +
-                                  self.stringCounty_Name.get() + ":," +
+                                  self.runParams.county_Name + ":," +
                                   str(self.clipped_tornadoCount) + ",\n")
                     csvFile.write("\n")
                     csvFile.write("County Tornado Data\n")
@@ -4978,7 +4459,7 @@ class TornadoOptions(FrameLifts):
                     # For each county list within state/county dictionary
                     # matching the state drop-down selection...
                     for key in GUI_CountiesPerState.dict_state_counties[
-                        self.stringState_Name.get()]:
+                        self.runParams.state_Name]:
 
                         # Set counter to zero, for counting tornadoes within
                         # each county during loop.
@@ -5008,282 +4489,41 @@ class TornadoOptions(FrameLifts):
                         # If row counter is greater than zero...
                         if counter > 0:
 
-                            try:
-
-                                # Calculate mode of all intensities within list.
-                                modeValue = mode(magList)
-
-                                # Convert mode information to float and then to
-                                # string with two decimal places.
-                                modeString = \
-                                    str("{0:.2f}".format(float(modeValue)))
-
-                            except StatisticsError:
-
-                                # This catches any lists containing no mode.
-                                # This will occur if all values within list are
-                                # unique.
-
-                                # Assign modeString to the following phrase.
-                                modeString = "No Unique Mode"
-
-                                pass
-
-                            # Write the following data to the data counts CSV.
-                            # Min size, max size, and mode size.
-                            csvFile.write(str("{0:.2f}".format(min(magList))) +
-                                "," + str("{0:.2f}".format(max(magList))) +
-                                "," + modeString + ",\n")
-
-                    # Close the data counts CSV file.
-                    csvFile.close()
-
-                # Clear any intermediate output from memory.
-                self.func_Clear_InMemory()
-
-                self.func_Scroll_setOutputText("Count results successfully "
-                                               "written to CSV file.", None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script for one second.
-                sleep(1)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(
-                "Output CSV was not written successfully.", color_Red)
-
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-            pass
-
-        except Exception as e:
-
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-        try:
-
-            # If the user selects the IDW analysis...
-            if self.statusAnalysis_IDW.get() == 1:
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                self.func_Scroll_setOutputText("Performing IDW Analysis on all "
-                                    "points, then clipping/masking output to " +
-                                    featureClass_Mask + " extent...", None)
-
-                # Point Density parameters, with optional parameters set to None
-                # for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                required_ZField = analysis_Mag_Field
-                optional_CellSize = None
-                optional_Power = None
-                optional_SearchRadius = None
-
-                # Perform the IDW analysis.
-                output_IDW = arcpy.sa.Idw(required_InputFile, required_ZField,
-                                          optional_CellSize, optional_Power,
-                                          optional_SearchRadius)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                # Pause script for one second.
-                sleep(1)
-
-                self.func_Scroll_setOutputText("Masking IDW results...", None)
-
-                # Mask the IDW results.
-                output_IDW_with_Mask = arcpy.sa.ExtractByMask(
-                    output_IDW, featureClass_Mask)
-
-                # Save the masked IDW feature class results to File GDB.
-                output_IDW_with_Mask.save(
-                    "idw_" + self.clipped_Output_FeatureClass)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                self.func_Scroll_setOutputText("IDW Analysis completed.", None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script by one second.
-                sleep(1)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-            pass
-
-        except Exception as e:
-
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-            pass
-
-        try:
-
-            # If the user selects the Kernel Density analysis...
-            if self.statusAnalysis_KernelDensity.get() == 1:
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                self.func_Scroll_setOutputText("Performing Kernel Density "
-                    "Analysis on all points, then clipping/masking output to " +
-                    featureClass_Mask + " extent...", None)
-
-                # Kernel Density parameters, with optional parameters set to
-                # None for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                optional_PopField = None
-                optional_CellSize = None
-                optional_SearchRadius = None
-                optional_AreaUnitScaleFactor = None
-                optional_OutputCellValues = None
-                optional_Method = None
-
-                # Perform the Kernel Density analysis.
-                output_KernelDensity = arcpy.sa.KernelDensity(
-                    required_InputFile, optional_PopField, optional_CellSize,
-                    optional_SearchRadius, optional_AreaUnitScaleFactor,
-                    optional_OutputCellValues, optional_Method)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                # Pause script for one second.
-                sleep(1)
-
-                # Mask the Kernel Density results.
-                output_KernelDensity_with_Mask = arcpy.sa.ExtractByMask(
-                    output_KernelDensity, featureClass_Mask)
-
-                self.func_Scroll_setOutputText(
-                    "Masking Kernel Density results...", None)
-
-                # Save the masked Kernel Density feature class results to
-                # File GDB.
-                output_KernelDensity_with_Mask.save("kerneldensity_" +
-                                            self.clipped_Output_FeatureClass)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                self.func_Scroll_setOutputText(
-                    "Kernel Density Analysis completed.", None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script for one second.
-                sleep(1)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-            pass
-
-        except Exception as e:
-
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-            pass
-
-        try:
-
-            # If the user selects the Kriging analysis...
-            if self.statusAnalysis_Kriging.get() == 1:
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
+                            try:
 
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
+                                # Calculate mode of all intensities within list.
+                                modeValue = mode(magList)
 
-                self.func_Scroll_setOutputText("Performing Kriging Analysis on "
-                                "all points, then clipping/masking output to " +
-                                featureClass_Mask + " extent...", None)
+                                # Convert mode information to float and then to
+                                # string with two decimal places.
+                                modeString = \
+                                    str("{0:.2f}".format(float(modeValue)))
 
-                # Kriging parameters, with optional parameters set to None
-                # for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                required_ZField = analysis_Mag_Field
-                optional_KrigingModel = None
-                optional_CellSize = None
-                optional_SearchRadius = None
-                optional_OutputVariancePredictionRaster = None
-
-                # Perform the Kriging analysis.
-                output_Kriging = arcpy.sa.Kriging(required_InputFile,
-                                        required_ZField,
-                                        optional_KrigingModel,
-                                        optional_CellSize,
-                                        optional_SearchRadius,
-                                        optional_OutputVariancePredictionRaster)
+                            except StatisticsError:
 
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+                                # This catches any lists containing no mode.
+                                # This will occur if all values within list are
+                                # unique.
 
-                # Pause script for one second.
-                sleep(1)
+                                # Assign modeString to the following phrase.
+                                modeString = "No Unique Mode"
 
-                # Mask the Kriging results.
-                output_Kriging_with_Mask = arcpy.sa.ExtractByMask(
-                    output_Kriging, featureClass_Mask)
+                                pass
 
-                self.func_Scroll_setOutputText("Masking Kriging results...",
-                                               None)
+                            # Write the following data to the data counts CSV.
+                            # Min size, max size, and mode size.
+                            csvFile.write(str("{0:.2f}".format(min(magList))) +
+                                "," + str("{0:.2f}".format(max(magList))) +
+                                "," + modeString + ",\n")
 
-                # Save the masked Kriging results to File GDB.
-                output_Kriging_with_Mask.save(
-                    "kriging_" + self.clipped_Output_FeatureClass)
+                    # Close the data counts CSV file.
+                    csvFile.close()
 
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+                # Clear any intermediate output from memory.
+                self.func_Clear_InMemory()
 
-                self.func_Scroll_setOutputText("Kriging Analysis completed.",
-                                               None)
+                self.func_Scroll_setOutputText("Count results successfully "
+                                               "written to CSV file.", None)
 
                 # Increase current progress bar percentage by three percent.
                 self.analysis_Percentage_Counter = \
@@ -5293,12 +4533,12 @@ class TornadoOptions(FrameLifts):
                 self.func_ProgressBar_setProgress(
                     self.analysis_Percentage_Counter)
 
-                # Pause script for one second.
-                sleep(1)
-
         except arcpy.ExecuteError:
 
             # Display geoprocessing errors and skip the failed analysis.
+            self.func_Scroll_setOutputText(
+                "Output CSV was not written successfully.", color_Red)
+
             self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
 
             pass
@@ -5311,83 +4551,11 @@ class TornadoOptions(FrameLifts):
                                            "Traceback: " +
                                            traceback.format_exc(), color_Red)
 
-            pass
-
         try:
 
-            # If the user selects the Natural Neighbor analysis...
-            if self.statusAnalysis_NaturalNeighbor.get() == 1:
-
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                # If the total number of tornado features reach 14,750,000...
-                if self.raw_tornado_count >= 14750000:
-
-                    # Display this message, as the geoprocessing tool will fail
-                    # if the total number approaches 15 million records (Esri).
-                    self.func_Scroll_setOutputText(
-                        "UNABLE TO EXECUTE NATURAL NEIGHBOR ANALYSIS:\n" +
-                        "According to Esri, this analysis will fail if the "
-                        "input tornado count nears 15,000,000.\n" +
-                        "Skipping this analysis...", color_Red)
-
-                else:
-                    # Else, perform the analysis.
-                    self.func_Scroll_setOutputText("Performing Natural "
-                                            "Neighbor Analysis on all points, "
-                                            "then clipping/masking output to " +
-                                            featureClass_Mask + " extent...",
-                                            None)
-
-                    # Natural Neighbor parameters, with optional parameters set
-                    # to None for Esri defaults.
-                    required_InputFile = self.clipped_Output_FeatureClass
-                    required_ZField = analysis_Mag_Field
-                    optional_CellSize = None
-
-                    # Perform the Natural Neighbor analysis.
-                    output_NaturalNeighbor = arcpy.sa.NaturalNeighbor(
-                        required_InputFile, required_ZField, optional_CellSize)
-
-                    # Get geoprocessing messages.
-                    self.func_Scroll_setOutputText(arcpy.GetMessages(0),
-                                                   color_Blue)
-
-                    # Pause script for one second.
-                    sleep(1)
-
-                    # Mask the Natural Neighbor results.
-                    output_NaturalNeighbor_with_Mask = arcpy.sa.ExtractByMask(
-                        output_NaturalNeighbor, featureClass_Mask)
-
-                    self.func_Scroll_setOutputText(
-                        "Masking Natural Neighbor results...", None)
-
-                    # Save masked results to the File GDB.
-                    output_NaturalNeighbor_with_Mask.save(
-                        "naturalneighbor_" + self.clipped_Output_FeatureClass)
-
-                    # Get geoprocessing messages.
-                    self.func_Scroll_setOutputText(arcpy.GetMessages(0),
-                                                   color_Blue)
-
-                    self.func_Scroll_setOutputText(
-                        "Natural Neighbor Analysis completed.", None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script for one second.
-                sleep(1)
+            # Run the selected raster analyses at the same time, each within
+            # its own worker process (see Hazard_AnalysisScheduler).
+            self.func_Run_Scheduled_Raster_Analyses(featureClass_Mask)
 
         except arcpy.ExecuteError:
 
@@ -5409,7 +4577,7 @@ class TornadoOptions(FrameLifts):
         try:
 
             # If the user selects the Optimized Hot Spot analysis...
-            if self.statusAnalysis_OptHotSpot.get() == 1:
+            if "OptHotSpot" in self.runParams.analysis_Options:
 
                 # Set the workspace for the following analysis.
                 arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
@@ -5504,9 +4672,6 @@ class TornadoOptions(FrameLifts):
                                         analysis_Mag_Field + "') completed.",
                                         None)
 
-                    # Pause script for one second.
-                    sleep(1)
-
                 # Begin the second iteration of the same analysis WITHOUT an
                 # analysis field set as an input parameter.
 
@@ -5595,182 +4760,6 @@ class TornadoOptions(FrameLifts):
                 self.func_ProgressBar_setProgress(
                     self.analysis_Percentage_Counter)
 
-                # Pause script for one second.
-                sleep(1)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-            # Clear any intermediate output from memory.
-            self.func_Clear_InMemory()
-
-            pass
-
-        except Exception as e:
-
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-            # Clear any intermediate output from memory.
-            self.func_Clear_InMemory()
-
-            pass
-
-        try:
-
-            # If the user selects the Point Density analysis...
-            if self.statusAnalysis_PointDensity.get() == 1:
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                self.func_Scroll_setOutputText("Performing Point Density "
-                                "Analysis on all points, then clipping/masking "
-                                "output to " + featureClass_Mask + " extent...",
-                                None)
-
-                # Point Density parameters, with optional parameters set to None
-                # for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                optional_PopField = None
-                optional_CellSize = None
-                optional_NeighborhoodType = None
-                optional_AreaUnitScalFactor = None
-
-                # Execute Point Density analysis with default Esri values.
-                output_PointDensity = arcpy.sa.PointDensity(required_InputFile,
-                                                    optional_PopField,
-                                                    optional_CellSize,
-                                                    optional_NeighborhoodType,
-                                                    optional_AreaUnitScalFactor)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                # Pause script for one second.
-                sleep(1)
-
-                # Mask the Point Density results.
-                output_PointDensity_with_Mask = \
-                    arcpy.sa.ExtractByMask(output_PointDensity,
-                                           featureClass_Mask)
-
-                self.func_Scroll_setOutputText(
-                    "Masking Point Density results...", None)
-
-                # Save the masked results to the File GDB.
-                output_PointDensity_with_Mask.save("pointdensity_" +
-                                            self.clipped_Output_FeatureClass)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                self.func_Scroll_setOutputText(
-                    "Point Density Analysis completed.", None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Pause script for one second.
-                sleep(1)
-
-        except arcpy.ExecuteError:
-
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
-
-            pass
-
-        except Exception as e:
-
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
-
-            pass
-
-        try:
-
-            # If the user selects the Spline analysis...
-            if self.statusAnalysis_Spline.get() == 1:
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
-
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
-
-                self.func_Scroll_setOutputText("Performing Spline Analysis on "
-                                "all points, then clipping/masking output to " +
-                                featureClass_Mask + " extent...", None)
-
-                # Spline parameters, with optional parameters set to None
-                # for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                required_ZField = analysis_Mag_Field
-                optional_CellSize = None
-                optional_SplineType = None
-                optional_Weight = None
-                optional_PointNumber = None
-
-                # Execute Spline Analysis with default Esri values.
-                output_Spline = arcpy.sa.Spline(required_InputFile,
-                                                required_ZField,
-                                                optional_CellSize,
-                                                optional_SplineType,
-                                                optional_Weight,
-                                                optional_PointNumber)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                # Pause script for one second.
-                sleep(1)
-
-                # Mask the Spline results.
-                output_Spline_with_Mask = arcpy.sa.ExtractByMask(output_Spline,
-                                                            featureClass_Mask)
-
-                self.func_Scroll_setOutputText("Masking Spline results...",
-                                               None)
-
-                # Save the masked results to File GDB.
-                output_Spline_with_Mask.save("spline_" +
-                                             self.clipped_Output_FeatureClass)
-
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
-
-                self.func_Scroll_setOutputText("Spline Analysis completed.",
-                                               None)
-
-                # Increase current progress bar percentage by three percent.
-                self.analysis_Percentage_Counter = \
-                    self.analysis_Percentage_Counter + 3
-
-                # Increment progress bar by adjusted value.
-                self.func_ProgressBar_setProgress(
-                    self.analysis_Percentage_Counter)
-
-                # Clear any intermediate output from memory.
-                self.func_Clear_InMemory()
-
-                # Pause script for one second.
-                sleep(1)
-
         except arcpy.ExecuteError:
 
             # Display geoprocessing errors and skip the failed analysis.
@@ -5797,7 +4786,7 @@ class TornadoOptions(FrameLifts):
         try:
 
             # If the user selects the Thiessen analysis...
-            if self.statusAnalysis_Thiessen.get() == 1:
+            if "Thiessen" in self.runParams.analysis_Options:
                 # Set the workspace for the following analysis.
                 arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
 
@@ -5826,9 +4815,6 @@ class TornadoOptions(FrameLifts):
                 # Get geoprocessing messages.
                 self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
 
-                # Pause script for one second.
-                sleep(1)
-
                 self.func_Scroll_setOutputText(
                     "Clipping Thiessen Polygon Analysis results...", None)
 
@@ -5854,9 +4840,6 @@ class TornadoOptions(FrameLifts):
                 self.func_ProgressBar_setProgress(
                     self.analysis_Percentage_Counter)
 
-                # Pause script for one second.
-                sleep(1)
-
         except arcpy.ExecuteError:
 
             # Display geoprocessing errors and skip the failed analysis.
@@ -5880,57 +4863,90 @@ class TornadoOptions(FrameLifts):
 
             pass
 
-        try:
+    def func_Run_Scheduled_Raster_Analyses(self, featureClass_Mask):
 
-            # If the user selects the Trend analysis...
-            if self.statusAnalysis_Trend.get() == 1:
-                # Set the workspace for the following analysis.
-                arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
+        # This function runs the selected raster analyses (each an arcpy.sa
+        # tool, masked to the feature class mask) at the same time through the
+        # analysis scheduler, each within its own worker process with its own
+        # workspace and extent. As each analysis completes, its masked raster
+        # is copied into the File GDB (under the same name as before) and the
+        # progress bar is incremented by three percent.
 
-                # Set the extent to the input argument feature class mask.
-                arcpy.env.extent = featureClass_Mask
+        # Set the workspace and extent, the same as each analysis.
+        fileGDB_Path = self.subFolder_GIS + "/" + nameFileGDB
+        arcpy.env.workspace = fileGDB_Path
+        arcpy.env.extent = featureClass_Mask
 
-                self.func_Scroll_setOutputText("Performing Trend Analysis on "
-                                "all points, then clipping/masking output to " +
-                                featureClass_Mask + " extent...", None)
+        # Folder holding each worker's scratch File GDB.
+        scratchFolder = self.subFolder_GIS + "/" + scheduler_Scratch_FolderName
 
-                # Trend parameters, with optional parameters set to None
-                # for Esri defaults.
-                required_InputFile = self.clipped_Output_FeatureClass
-                required_ZField = analysis_Mag_Field
-                optional_CellSize = None
-                optional_Order = None
-                optional_RegressionType = None
-                optional_OutputRMSFile = None
-
-                # Execute Trend Analysis with default Esri values
-                output_Trend = arcpy.sa.Trend(required_InputFile,
-                                              required_ZField,
-                                              optional_CellSize, optional_Order,
-                                              optional_RegressionType,
-                                              optional_OutputRMSFile)
+        # Selected raster analyses.
+        list_Names = [name for name in dict_ArcGIS_Raster_Tools
+                      if name in self.runParams.analysis_Options]
 
-                # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+        # If the total number of tornado features reach 14,750,000...
+        if "NaturalNeighbor" in list_Names and \
+                self.raw_tornado_count >= 14750000:
+
+            # Display this message, as the geoprocessing tool will fail
+            # if the total number approaches 15 million records (Esri).
+            self.func_Scroll_setOutputText(
+                "UNABLE TO EXECUTE NATURAL NEIGHBOR ANALYSIS:\n" +
+                "According to Esri, this analysis will fail if the "
+                "input tornado count nears 15,000,000.\n" +
+                "Skipping this analysis...", color_Red)
+
+            list_Names.remove("NaturalNeighbor")
 
-                # Pause script for one second.
-                sleep(1)
+            # Increase current progress bar percentage by three percent.
+            self.analysis_Percentage_Counter = \
+                self.analysis_Percentage_Counter + 3
 
-                # Mask the Trend results.
-                output_Trend_with_Mask = arcpy.sa.ExtractByMask(output_Trend,
-                                                            featureClass_Mask)
+            # Increment progress bar by adjusted value.
+            self.func_ProgressBar_setProgress(
+                self.analysis_Percentage_Counter)
 
-                self.func_Scroll_setOutputText("Masking Trend results...", None)
+        list_Jobs = func_ArcGIS_Raster_Jobs(list_Names, fileGDB_Path,
+                                            self.clipped_Output_FeatureClass,
+                                            featureClass_Mask,
+                                            analysis_Mag_Field, scratchFolder)
 
-                # Save the masked results to the File GDB.
-                output_Trend_with_Mask.save("trend_" +
-                                            self.clipped_Output_FeatureClass)
+        for job in list_Jobs:
+
+            self.func_Scroll_setOutputText("Performing " + job.label +
+                                           " Analysis on all points, then "
+                                           "clipping/masking output to " +
+                                           featureClass_Mask + " extent...",
+                                           None)
+
+        def func_Progress(result, completed, total):
+
+            # This function displays each analysis as it completes, and
+            # copies its masked raster into the File GDB.
+
+            try:
+
+                # If the analysis failed, display its errors and skip it.
+                if result.error is not None:
+
+                    self.func_Scroll_setOutputText(str(result.error),
+                                                   color_Red)
+
+                    return
+
+                list_Messages, outputRaster = result.value
 
                 # Get geoprocessing messages.
-                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Blue)
+                for message in list_Messages:
 
-                self.func_Scroll_setOutputText("Trend Analysis completed.",
-                                               None)
+                    self.func_Scroll_setOutputText(message, color_Blue)
+
+                # Copy the masked results to the File GDB.
+                self.func_Scroll_setOutputText(func_Copy_ArcGIS_Raster(
+                    outputRaster, fileGDB_Path), color_Blue)
+
+                self.func_Scroll_setOutputText(
+                    result.job.label + " Analysis completed.", None)
 
                 # Increase current progress bar percentage by three percent.
                 self.analysis_Percentage_Counter = \
@@ -5940,23 +4956,32 @@ class TornadoOptions(FrameLifts):
                 self.func_ProgressBar_setProgress(
                     self.analysis_Percentage_Counter)
 
-                # Pause script for one second.
-                sleep(1)
+            except arcpy.ExecuteError:
 
-        except arcpy.ExecuteError:
+                # Display geoprocessing errors and skip the failed analysis.
+                self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
 
-            # Display geoprocessing errors and skip the failed analysis.
-            self.func_Scroll_setOutputText(arcpy.GetMessages(0), color_Red)
+                pass
 
-            pass
+            except Exception as e:
 
-        except Exception as e:
+                # Display error messages for all other errors and skip failed
+                # analysis.
+                self.func_Scroll_setOutputText("Error Message: " + str(e) +
+                                               "\n" + "Traceback: " +
+                                               traceback.format_exc(),
+                                               color_Red)
 
-            # Display error messages for all other errors and skip failed
-            # analysis.
-            self.func_Scroll_setOutputText("Error Message: " + str(e) + "\n" +
-                                           "Traceback: " +
-                                           traceback.format_exc(), color_Red)
+                pass
+
+        func_Run_Analysis_Jobs(list_Jobs, func_Progress=func_Progress)
+
+        try:
+
+            # Delete the scratch File GDBs (any still locked are left).
+            func_Remove_Folder(scratchFolder, 5.0)
+
+        except OSError:
 
             pass
 
@@ -5971,36 +4996,13 @@ class TornadoOptions(FrameLifts):
             # Set workspace to File GDB for the following analysis.
             arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
 
-            # Assign Census Shapefile within Shapefile subfolder to variable.
-            censusShapefile = self.subFolder_CensusShapefile + "/" + \
-                              census_URL_CountyShapefile_FileName + fileExtShp
-
             # Create Census polygon feature class variable stored within memory.
             memoryFeatureClass_US = "in_memory/" + \
                                     featureClass_50States_and_DC_only
 
-            # Copy Census Shapefile to feature class stored in memory.
-            arcpy.CopyFeatures_management(censusShapefile,
-                                          memoryFeatureClass_US)
-
-            # Pause script for one second.
-            sleep(1)
-
-            # Open the Census in_memory feature class with an Update Cursor.
-            with arcpy.da.UpdateCursor(memoryFeatureClass_US,
-                                    census_Shapefile_Field_StateFIPS) as cursor:
-
-                # For each feature in the Census in_memory feature class...
-                for row in cursor:
-
-                    # This If statement removes non-50 state (and DC) FIPS codes
-                    # from the Census feature class. The original polygons
-                    # include all US territories.
-                    if row[0] == "60" or row[0] == "66" or row[0] == "69" or \
-                            row[0] == "72" or row[0] == "78":
-
-                        # Delete feature from in_memory feature class.
-                        cursor.deleteRow()
+            # Copy the 50 states and DC counties from the county store to a
+            # feature class stored in memory.
+            func_Extract_County_Mask(self.countyStore, memoryFeatureClass_US)
 
             # Recalculate the extent of the in_memory feature class.
             arcpy.RecalculateFeatureClassExtent_management(
@@ -6055,36 +5057,15 @@ class TornadoOptions(FrameLifts):
             # Set workspace to File GDB for the following analysis.
             arcpy.env.workspace = self.subFolder_GIS + "/" + nameFileGDB
 
-            # Assign Census Shapefile within Shapefile subfolder to variable.
-            censusShapefile = self.subFolder_CensusShapefile + "/" + \
-                              census_URL_CountyShapefile_FileName + fileExtShp
-
             # Create Census polygon feature class variable stored in memory.
             memoryFeatureClass_State = "in_memory/" + \
-                                       self.stringState_Name.get()
+                                       self.runParams.state_Name
 
-            # Copy Census Shapefile to feature class stored in memory.
-            arcpy.CopyFeatures_management(censusShapefile,
-                                          memoryFeatureClass_State)
-
-            # Pause script for one second.
-            sleep(1)
-
-            # Open the Census in_memory feature class with an Update Cursor.
-            with arcpy.da.UpdateCursor(memoryFeatureClass_State,
-                                    census_Shapefile_Field_StateFIPS) as cursor:
-
-                # For each feature in the Census in_memory feature class...
-                for row in cursor:
-
-                    # This If statement removes all state polygon features not
-                    # matching the user-selected state FIPS code.
-                    if row[0] != \
-                            dict_StateName_StateFIPs.get(
-                                self.stringState_Name.get()):
-
-                        # Delete feature from in_memory feature class.
-                        cursor.deleteRow()
+            # Copy the user-selected state's counties from the county store to
+            # a feature class stored in memory.
+            func_Extract_County_Mask(self.countyStore, memoryFeatureClass_State,
+                                     dict_StateName_StateFIPs.get(
+                                         self.runParams.state_Name))
 
             # Recalculate the extent of the in_memory feature class.
             arcpy.RecalculateFeatureClassExtent_management(
@@ -6162,7 +5143,7 @@ class TornadoOptions(FrameLifts):
 
     def func_Scroll_saveOutputText(self):
 
-        # This function writes all of the output text found within the
+        # This function saves all of the output text posted to the
         # ScrolledText widget to a text file located within the user-defined
         # workspace. This is done at the conclusion of every application
         # iteration.
@@ -6172,11 +5153,10 @@ class TornadoOptions(FrameLifts):
             # If the output text file's naming convention has been set...
             if self.nameFeatureClass_FromCSV is not None:
 
-                # Create/Open a new text file for all output messages to be
-                # written to.
-                textFile_ProcessingHistory = open(self.fullPathName + "/" +
-                        "ProcessingHistory_" + self.nameFeatureClass_FromCSV +
-                        fileExtText, "w")
+                # Text file that all output messages are written to.
+                historyPath = self.fullPathName + "/" + \
+                    "ProcessingHistory_" + self.nameFeatureClass_FromCSV + \
+                    fileExtText
 
             else:
 
@@ -6184,17 +5164,13 @@ class TornadoOptions(FrameLifts):
                 # stages, the naming convention for the output text file will
                 # not be established. If that is the case, the naming convention
                 # will be saved with FAILED in the name.
-                textFile_ProcessingHistory = open(self.fullPathName + "/" +
-                                    "ProcessingHistory_FAILED" + fileExtText,
-                                    "w")
+                historyPath = self.fullPathName + "/" + \
+                    "ProcessingHistory_FAILED" + fileExtText
 
-            # Once the application processes have finished, take all output
-            # messages within the scroll box and write to the output text file.
-            textFile_ProcessingHistory.write(
-                self.scrollBox.get(1.0, tkinter.END))
-
-            # Close the text file.
-            textFile_ProcessingHistory.close()
+            # Once the application processes have finished, move the output
+            # messages (streamed to a text file within the workspace folder
+            # while processing) to the output text file.
+            self.guiChannel.func_Finish_History(historyPath)
 
             self.func_Scroll_setOutputText(
                 "The processing history (what you see here) "
@@ -6633,26 +5609,17 @@ class TornadoOptions(FrameLifts):
 
         # This function controls what and how the output texts are displayed
         # within the scroll box for users to read. It takes an input argument
-        # from the user as well as a text color tag.
-
-        # These tags set the color used for specific text.
-        self.scrollBox.tag_config(color_Red, foreground=color_Red)
-        self.scrollBox.tag_config(color_Orange, foreground=color_Orange)
-        self.scrollBox.tag_config(color_Blue, foreground=color_Blue)
-
-        # This section inputs the user-defined wording and displays the message
-        # within the scroll box. The focus of the scroll box shifts to the
-        # last (bottom) entered text message.
-        self.scrollBox.config(state=tkinter.NORMAL)
-        self.scrollBox.insert(tkinter.END, word, (tag))
-        self.scrollBox.insert(tkinter.END, "\n--------------------\n")
-        self.scrollBox.see(tkinter.END)
-        self.scrollBox.config(state=tkinter.DISABLED)
+        # from the user as well as a text color tag. The message is posted to
+        # the GUI channel, so it can be called from the processing thread;
+        # the main loop shows it within the scroll box and shifts the focus
+        # to the last (bottom) entered text message.
+
+        self.guiChannel.func_Post_Log(word, tag)
 
     def func_ProgressBar_setProgress(self, value):
 
         # This function controls the progress bar increment by taking a
-        # user-defined input argument (integer).
+        # user-defined input argument (integer), posted to the GUI channel
+        # the same as the output texts.
 
-        self.progressBar["value"] = value
-        self.progressBar.update()
\ No newline at end of file
+        self.guiChannel.func_Post_Progress(value)
\ No newline at end of file
@@ -0,0 +1,254 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the analysis scheduler
+# shared by the hazard options GUIs and the headless pipeline. The selected
+# raster analyses only depend on the clipped feature class (or points), not
+# on each other, so instead of one after another they are run at the same
+# time, each within its own worker process (with its own environment
+# settings). Each analysis is reported as soon as it completes, and its
+# output keeps the same name as before.
+#
+# Under ArcGIS, several processes shouldn't write to the same File GDB, so
+# each worker saves its masked raster within its own scratch File GDB; the
+# GUI then copies each raster into the run's File GDB as it completes.
+
+# All import statements for utilized modules, excluding arcpy (imported
+# within each ArcGIS worker).
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+# Number of worker processes used by the scheduler (None: one per CPU). No
+# more workers are started than there are analyses; with one worker, the
+# analyses run one after another within the calling process.
+analysis_Workers = None
+
+# Name of the folder (within the GIS folder) holding the ArcGIS workers'
+# scratch File GDBs.
+scheduler_Scratch_FolderName = "Scheduler_Scratch"
+
+# Analysis to run: analysis option name, name within the messages, function
+# (at the top level of a module, so a worker process can import it), and its
+# arguments.
+AnalysisJob = namedtuple("AnalysisJob", ["name", "label", "function",
+                                         "arguments"])
+
+# Outcome of an analysis: its job, the function's return value (None if it
+# failed), the error raised (None if it completed), and its seconds.
+AnalysisResult = namedtuple("AnalysisResult", ["job", "value", "error",
+                                               "seconds"])
+
+# ArcPy Spatial Analyst tool of a raster analysis: output name prefix, name
+# within the messages, arcpy.sa tool name, whether the analysis field follows
+# the input feature class, and the number of optional parameters (all None,
+# for the Esri defaults).
+RasterTool = namedtuple("RasterTool", ["prefix", "label", "toolName",
+                                       "usesField", "optionalCount"])
+
+# Raster analyses the GUIs run through the scheduler (analysis option name:
+# tool), each masked to the clip feature class (ExtractByMask).
+dict_ArcGIS_Raster_Tools = {
+    "IDW": RasterTool("idw_", "IDW", "Idw", True, 3),
+    "KernelDensity": RasterTool("kerneldensity_", "Kernel Density",
+                                "KernelDensity", False, 6),
+    "Kriging": RasterTool("kriging_", "Kriging", "Kriging", True, 4),
+    "NaturalNeighbor": RasterTool("naturalneighbor_", "Natural Neighbor",
+                                  "NaturalNeighbor", True, 1),
+    "PointDensity": RasterTool("pointdensity_", "Point Density",
+                               "PointDensity", False, 4),
+    "Spline": RasterTool("spline_", "Spline", "Spline", True, 4),
+    "Trend": RasterTool("trend_", "Trend", "Trend", True, 4),
+    "LineDensity": RasterTool("linedensity_", "Line Density", "LineDensity",
+                              True, 3)}
+
+
+def func_Set_Analysis_Workers(workers):
+
+    # This function sets the number of worker processes used by the
+    # scheduler (None: one per CPU).
+
+    global analysis_Workers
+
+    analysis_Workers = workers
+
+
+def func_Timed_Call(function, arguments):
+
+    # This function calls a job's function within a worker process, returning
+    # its return value and seconds.
+
+    start_time = time.perf_counter()
+
+    value = function(*arguments)
+
+    return value, time.perf_counter() - start_time
+
+
+def func_Run_Analysis_Jobs(list_Jobs, workers=None, func_Progress=None):
+
+    # This function runs every job, at the same time within worker processes,
+    # returning their results (see AnalysisResult) in the order of the jobs.
+    # As each job completes (or fails), func_Progress (if given) is called
+    # within the calling thread with its result, the number of jobs completed
+    # so far, and the number of jobs. A failed job doesn't stop the others.
+
+    if workers is None:
+
+        workers = analysis_Workers
+
+    if workers is None:
+
+        workers = os.cpu_count() or 1
+
+    workers = min(workers, len(list_Jobs))
+
+    list_Results = [None] * len(list_Jobs)
+
+    def func_Finish(index, value, error, seconds):
+
+        list_Results[index] = AnalysisResult(list_Jobs[index], value, error,
+                                             seconds)
+
+        if func_Progress is not None:
+
+            func_Progress(list_Results[index], sum(result is not None
+                                                   for result in list_Results),
+                          len(list_Jobs))
+
+    if workers <= 1:
+
+        for index, job in enumerate(list_Jobs):
+
+            start_time = time.perf_counter()
+
+            try:
+
+                value = job.function(*job.arguments)
+
+            except Exception as e:
+
+                func_Finish(index, None, e, time.perf_counter() - start_time)
+
+                continue
+
+            func_Finish(index, value, None, time.perf_counter() - start_time)
+
+        return list_Results
+
+    start_time = time.perf_counter()
+
+    with ProcessPoolExecutor(workers) as pool:
+
+        dict_Futures = {pool.submit(func_Timed_Call, job.function,
+                                    job.arguments): index
+                        for index, job in enumerate(list_Jobs)}
+
+        for future in as_completed(dict_Futures):
+
+            try:
+
+                value, seconds = future.result()
+
+            except Exception as e:
+
+                func_Finish(dict_Futures[future], None, e,
+                            time.perf_counter() - start_time)
+
+                continue
+
+            func_Finish(dict_Futures[future], value, None, seconds)
+
+    return list_Results
+
+
+def func_ArcGIS_Raster_Analysis(name, fileGDB_Path, inputFeatureClass,
+                                featureClass_Mask, fieldName, scratchFolder):
+
+    # This function runs one raster analysis within a worker process: the
+    # arcpy.sa tool on the input feature class (Esri defaults), masked to the
+    # feature class mask. The environment settings (workspace, extent,
+    # scratch workspace, and overwrite output) are set for this analysis only.
+    # The masked raster is saved within the analysis' own scratch File GDB,
+    # under the same name used within the run's File GDB, replacing any raster
+    # left there by an earlier run. Returns the geoprocessing messages and the
+    # saved raster's path.
+
+    import arcpy
+
+    tool = dict_ArcGIS_Raster_Tools[name]
+
+    analysisFolder = os.path.join(scratchFolder, name)
+    scratchGDB = os.path.join(analysisFolder, name + ".gdb")
+    outputRaster = os.path.join(scratchGDB, tool.prefix + inputFeatureClass)
+
+    os.makedirs(analysisFolder, exist_ok=True)
+
+    list_Messages = []
+
+    try:
+
+        if not arcpy.Exists(scratchGDB):
+
+            arcpy.CreateFileGDB_management(analysisFolder, name + ".gdb")
+
+        with arcpy.EnvManager(workspace=fileGDB_Path,
+                              extent=os.path.join(fileGDB_Path,
+                                                  featureClass_Mask),
+                              scratchWorkspace=analysisFolder,
+                              overwriteOutput=True):
+
+            list_Arguments = [inputFeatureClass]
+
+            if tool.usesField:
+
+                list_Arguments.append(fieldName)
+
+            list_Arguments.extend([None] * tool.optionalCount)
+
+            # Perform the analysis.
+            output = getattr(arcpy.sa, tool.toolName)(*list_Arguments)
+
+            list_Messages.append(arcpy.GetMessages(0))
+
+            # Mask the results, then save them.
+            output_with_Mask = arcpy.sa.ExtractByMask(output,
+                                                      featureClass_Mask)
+            output_with_Mask.save(outputRaster)
+
+            list_Messages.append(arcpy.GetMessages(0))
+
+    except arcpy.ExecuteError:
+
+        # ArcPy's errors can't be sent back from a worker process, so their
+        # messages are sent instead.
+        raise RuntimeError(arcpy.GetMessages(0)) from None
+
+    return list_Messages, outputRaster
+
+
+def func_ArcGIS_Raster_Jobs(list_Names, fileGDB_Path, inputFeatureClass,
+                            featureClass_Mask, fieldName, scratchFolder):
+
+    # This function returns the scheduler jobs of the selected raster
+    # analyses (see func_ArcGIS_Raster_Analysis), in the GUI's order.
+
+    return [AnalysisJob(name, dict_ArcGIS_Raster_Tools[name].label,
+                        func_ArcGIS_Raster_Analysis,
+                        (name, fileGDB_Path, inputFeatureClass,
+                         featureClass_Mask, fieldName, scratchFolder))
+            for name in dict_ArcGIS_Raster_Tools if name in list_Names]
+
+
+def func_Copy_ArcGIS_Raster(outputRaster, fileGDB_Path):
+
+    # This function copies a raster saved by a worker into the run's File
+    # GDB (under the same name), returning the geoprocessing messages.
+
+    import arcpy
+
+    arcpy.CopyRaster_management(outputRaster, os.path.join(
+        fileGDB_Path, os.path.basename(outputRaster)))
+
+    return arcpy.GetMessages(0)
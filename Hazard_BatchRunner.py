@@ -0,0 +1,400 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the batch runner, which
+# runs one hazard download for many clip regions (e.g. all 50 states and DC,
+# or every county within a state). The hazard CSV and the Census Bureau's
+# Shapefile are downloaded and checked once, the hazard points and county
+# polygons are loaded once, and the clip and statistics stages are fanned out
+# across a process pool. The hazard points and their counties are shared with
+# the workers as memory-mapped stores (each worker is only given the stores'
+# folders), so the points are never pickled or copied into every worker.
+
+# All import statements for utilized modules.
+import os
+import time
+import shutil
+import logging
+import contextlib
+import multiprocessing
+import logging.handlers
+from concurrent.futures import ProcessPoolExecutor
+import numpy
+import GUI_CountiesPerState
+import Hazard_Pipeline
+from Hazard_ClipEngine import func_Load_County_Polygons
+from Hazard_ClipEngine import func_Build_Grid_Index
+from Hazard_ClipEngine import func_Locate_Points
+from Hazard_CatalogCache import func_SPC_Catalog_Folder
+from Hazard_CatalogCache import func_Save_Catalog
+from Hazard_CatalogCache import func_Open_Catalog
+from Hazard_StageTrace import func_Stage_Span
+
+# Number of point chunks per worker for the clip stage (more chunks than
+# workers, so a worker with densely packed points doesn't hold up the rest).
+batch_Chunks_Per_Worker = 4
+
+# Data shared with each worker process. The pool's initializer sets it once
+# per worker, so the polygons and stores aren't sent with every task.
+dict_Worker_Data = {}
+
+# Name of the point counties store folder, within the shared CSV folder.
+batch_PointCounties_FolderName = "PointCounties"
+
+
+class WorkerLogHandler(logging.Handler):
+
+    # This class handles the log records sent by the worker processes, with
+    # the pipeline logger's own handlers (e.g. the command line's structured
+    # logs), as if logged within the main process.
+
+    def emit(self, record):
+
+        Hazard_Pipeline.logger.handle(record)
+
+
+@contextlib.contextmanager
+def func_Forward_Worker_Logs(mpContext=multiprocessing):
+
+    # This function returns a queue for the worker processes' log records,
+    # which are handled within the main process until the block finishes. A
+    # worker (even one started by spawn, without the main process' logging
+    # setup) sends its records to the queue, once given it by
+    # func_Init_Worker. The queue is created within the same multiprocessing
+    # context as the workers.
+
+    logQueue = mpContext.Queue()
+    listener = logging.handlers.QueueListener(logQueue, WorkerLogHandler())
+    listener.start()
+
+    try:
+
+        yield logQueue
+
+    finally:
+
+        # Handle every record sent before the workers finished.
+        listener.stop()
+        logQueue.close()
+        logQueue.join_thread()
+
+
+def func_Parse_Regions(regions):
+
+    # This function returns the (state, county) of every clip region within a
+    # list (or comma-delimited string) of region values. (None, None) is the
+    # USA. Region values are:
+    # usa: The 50 states and DC.
+    # states: Each of the 50 states and DC, one region per state.
+    # TX: A state (by abbreviation).
+    # TX:Dallas: A county within a state.
+    # TX:*: Each county within a state, one region per county.
+
+    if isinstance(regions, str):
+
+        regions = regions.split(",")
+
+    # List for the parsed regions.
+    list_Regions = []
+
+    for region in regions:
+
+        region = str(region).strip()
+
+        if not region:
+
+            continue
+
+        if region.lower() == "usa":
+
+            list_Regions.append((None, None))
+
+        elif region.lower() == "states":
+
+            list_Regions.extend((stateName, None) for stateName in
+                                Hazard_Pipeline.dict_StateName_StateFIPs)
+
+        elif ":" in region:
+
+            stateName, countyName = region.split(":", 1)
+
+            if stateName not in GUI_CountiesPerState.dict_state_counties:
+
+                raise ValueError("Unknown state within region: " + region)
+
+            if countyName == "*":
+
+                list_Regions.extend(
+                    (stateName, county) for county in
+                    GUI_CountiesPerState.dict_state_counties[stateName])
+
+            else:
+
+                list_Regions.append((stateName, countyName))
+
+        else:
+
+            list_Regions.append((region, None))
+
+    return list_Regions
+
+
+def func_Region_Job(job, stateName, countyName):
+
+    # This function returns a copy of the job dictionary for one clip region.
+
+    regionJob = dict(job)
+    regionJob.pop("regions", None)
+    regionJob["state"] = stateName
+    regionJob["county"] = countyName
+
+    if countyName is not None:
+
+        regionJob["region"] = "county"
+
+    elif stateName is not None:
+
+        regionJob["region"] = "state"
+
+    else:
+
+        regionJob["region"] = "usa"
+
+    return regionJob
+
+
+def func_Region_Label(stateName, countyName):
+
+    # This function returns the label of a clip region within the logs.
+
+    if stateName is None:
+
+        return "USA"
+
+    if countyName is None:
+
+        return stateName
+
+    return stateName + ":" + countyName
+
+
+def func_Init_Worker(workerData):
+
+    # This function is the process pool's initializer. It keeps the shared
+    # data within the worker for all of its tasks, and memory-maps the hazard
+    # points (and point counties) stores.
+
+    dict_Worker_Data.clear()
+    dict_Worker_Data.update(workerData)
+
+    # Each worker already runs its own region, so the raster analyses run
+    # within it instead of starting more processes.
+    Hazard_Pipeline.func_Set_Raster_Workers(1)
+
+    # The pipeline logs are sent to the main process (replacing any handlers
+    # copied from it by fork, so no log is written twice).
+    if "logQueue" in workerData:
+
+        logger = Hazard_Pipeline.logger
+
+        for handler in list(logger.handlers):
+
+            logger.removeHandler(handler)
+
+        logger.addHandler(logging.handlers.QueueHandler(
+            workerData["logQueue"]))
+        logger.setLevel(workerData["logLevel"])
+        logger.propagate = False
+
+    if "pointsFolder" in workerData:
+
+        dict_Worker_Data["points"] = Hazard_Pipeline.func_Hazard_Points(
+            func_Open_Catalog(workerData["pointsFolder"]))
+
+    if "countiesFolder" in workerData:
+
+        store = func_Open_Catalog(workerData["countiesFolder"])
+        dict_Worker_Data["pointCounties"] = Hazard_Pipeline.PointCounties(
+            store["stateFIPS"], store["countyNames"])
+
+
+def func_Locate_Chunk(start, end):
+
+    # This function locates the county polygon of one chunk of the hazard
+    # points (the clip stage), returning the chunk's start and the polygon
+    # indexes.
+
+    points = dict_Worker_Data["points"]
+
+    return start, func_Locate_Points(points.x[start:end], points.y[start:end],
+                                     dict_Worker_Data["polygons"],
+                                     dict_Worker_Data["gridIndex"])
+
+
+def func_Region_Task(hazard, runParams, naming):
+
+    # This function writes the clipped CSV and analyses (the statistics
+    # stage) for one clip region.
+
+    return Hazard_Pipeline.func_Clip_And_Analyze(
+        hazard, runParams, naming, dict_Worker_Data["checkedCount"],
+        dict_Worker_Data["points"], dict_Worker_Data["pointCounties"],
+        dict_Worker_Data["censusShapefile"])
+
+
+def func_Run_Batch(job, regions, workers=None, censusShapefile=None):
+
+    # This function runs the job for every clip region. The download and CSV
+    # check stages run once, then the clip stage (locating every point's
+    # county) and the statistics stage (one task per region) run across a
+    # process pool of the given number of workers (default: one per CPU).
+    # A list of (region label, PipelineResult or None, error message or None)
+    # is returned, in the same order as the regions.
+
+    hazard = job["hazard"]
+    list_Regions = func_Parse_Regions(regions)
+
+    if workers is None:
+
+        workers = os.cpu_count() or 1
+
+    # Run parameters and output names of each region (checked before any
+    # processing, so a misspelled region doesn't waste an overnight run).
+    list_Region_Params = []
+
+    for stateName, countyName in list_Regions:
+
+        runParams = Hazard_Pipeline.func_Job_RunParameters(
+            func_Region_Job(job, stateName, countyName))
+
+        list_Region_Params.append((
+            func_Region_Label(stateName, countyName), runParams,
+            Hazard_Pipeline.func_Run_Naming(hazard, runParams)))
+
+    # The download and CSV checks are shared by every region, within the
+    # output folder of the run without a clip region.
+    sharedParams = Hazard_Pipeline.func_Job_RunParameters(
+        dict(func_Region_Job(job, None, None), region="none"))
+    sharedNaming = Hazard_Pipeline.func_Run_Naming(hazard, sharedParams)
+
+    Hazard_Pipeline.func_Log_Stage("batch", 0, "Processing batch.",
+                                   hazard=hazard, regions=len(list_Regions),
+                                   workers=workers,
+                                   folder=sharedNaming.fullPathName)
+
+    checkedName, checkedCount = Hazard_Pipeline.func_Prepare_Checked_CSV(
+        hazard, sharedParams, sharedNaming)
+
+    # If the checked CSV has no rows, every region is empty.
+    if checkedCount == 0:
+
+        return [(label, Hazard_Pipeline.PipelineResult(
+            "empty", naming.fullPathName, 0, None, None), None)
+            for label, runParams, naming in list_Region_Params]
+
+    if censusShapefile is None:
+
+        with func_Stage_Span("download and unzip census shapefile"):
+
+            censusShapefile = \
+                Hazard_Pipeline.func_Download_Census_Shapefile()
+
+    # Load the hazard points (as a memory-mapped store), county polygons, and
+    # grid index once.
+    pointsFolder = func_SPC_Catalog_Folder(
+        checkedName, hazard, Hazard_Pipeline.dict_Hazard_Settings[hazard].
+        headers)
+    points = Hazard_Pipeline.func_Hazard_Points(
+        func_Open_Catalog(pointsFolder))
+    polygons = func_Load_County_Polygons(censusShapefile)
+    gridIndex = func_Build_Grid_Index(polygons)
+
+    start_time = time.perf_counter()
+
+    # Level of the workers' pipeline logs (the same as the main process').
+    logLevel = Hazard_Pipeline.logger.getEffectiveLevel()
+
+    # Chunks of points for the clip stage.
+    boundaries = numpy.linspace(0, len(points.x), workers *
+                                batch_Chunks_Per_Worker + 1).astype(int)
+    polygonIndexes = numpy.full(len(points.x), -1, dtype=numpy.int64)
+
+    with func_Stage_Span("spatial join", rows=len(points.x),
+                         workers=workers), \
+            func_Forward_Worker_Logs() as logQueue, \
+            ProcessPoolExecutor(workers, initializer=func_Init_Worker,
+                                initargs=({"pointsFolder": pointsFolder,
+                                           "polygons": polygons,
+                                           "gridIndex": gridIndex,
+                                           "logQueue": logQueue,
+                                           "logLevel": logLevel},)) as pool:
+
+        for start, chunkIndexes in pool.map(func_Locate_Chunk,
+                                            boundaries[:-1], boundaries[1:]):
+
+            polygonIndexes[start:start + len(chunkIndexes)] = chunkIndexes
+
+    pointCounties = Hazard_Pipeline.func_Point_Counties(polygons,
+                                                        polygonIndexes)
+
+    # Save the point counties as a store for the statistics stage's workers
+    # (replacing the store of any previous batch within this folder).
+    countiesFolder = os.path.join(sharedNaming.csvDirectory,
+                                  batch_PointCounties_FolderName)
+    shutil.rmtree(countiesFolder, ignore_errors=True)
+    func_Save_Catalog({"stateFIPS": pointCounties.stateFIPS,
+                       "countyNames": pointCounties.countyNames},
+                      countiesFolder)
+
+    Hazard_Pipeline.func_Log_Stage(
+        "batch", 40, "Points located within the 50 states and DC counties.",
+        rows=len(points.x), seconds=round(time.perf_counter() - start_time,
+                                          3))
+
+    # List for the results of each region.
+    list_Results = []
+
+    with func_Stage_Span("region clip and analyses",
+                         regions=len(list_Region_Params), workers=workers), \
+            func_Forward_Worker_Logs() as logQueue, \
+            ProcessPoolExecutor(workers, initializer=func_Init_Worker,
+                                initargs=({"pointsFolder": pointsFolder,
+                                           "countiesFolder": countiesFolder,
+                                           "checkedCount": checkedCount,
+                                           "censusShapefile":
+                                           censusShapefile,
+                                           "logQueue": logQueue,
+                                           "logLevel": logLevel},)) \
+            as pool:
+
+        futures = [pool.submit(func_Region_Task, hazard, runParams, naming)
+                   for label, runParams, naming in list_Region_Params]
+
+        for (label, runParams, naming), future in zip(list_Region_Params,
+                                                      futures):
+
+            try:
+
+                result = future.result()
+
+                list_Results.append((label, result, None))
+
+                Hazard_Pipeline.func_Log_Stage(
+                    "region", None, "Region complete.", region=label,
+                    status=result.status, clipped_rows=result.clippedCount,
+                    data_counts=result.dataCountsCSV)
+
+            except Exception as e:
+
+                list_Results.append((label, None, str(e)))
+
+                Hazard_Pipeline.logger.error(
+                    "Region failed: " + str(e),
+                    extra={"hazard_Fields": {"stage": "region",
+                                             "region": label}})
+
+    Hazard_Pipeline.func_Log_Stage("batch", 100, "Batch complete.",
+                                   regions=len(list_Results),
+                                   failed=sum(1 for result in list_Results
+                                              if result[2] is not None))
+
+    return list_Results
@@ -0,0 +1,301 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the catalog cache used
+# by the Hail, Wind, and Tornado Options. The first time a NOAA SPC CSV is
+# checked, its rows are parsed into a catalog of typed columns (see
+# func_SPC_Catalog), which is saved next to the download cache as one NumPy
+# .npy file per column, keyed by the SHA-256 hash of the CSV. Later runs on
+# the same CSV (e.g. a different magnitude or timespan selection) memory-map
+# the saved columns instead of parsing the CSV text again. The catalog of a
+# download already within the download cache can also be loaded before the
+# run (e.g. to show the expected output of a selection), keyed by the
+# download's hash within the cache.
+
+# All import statements for utilized modules.
+import os
+import csv
+import json
+import shutil
+import hashlib
+import zipfile
+import tempfile
+import threading
+import numpy
+import Hazard_DownloadCache
+from Hazard_FilterEngine import func_SPC_Catalog
+
+# Subfolder of the download cache folder where the catalogs are kept.
+catalog_FolderName = "Catalogs"
+
+# Maximum number of catalogs kept. Once exceeded, the least recently used
+# catalogs are removed first.
+catalog_MaxCount = 20
+
+# Version of the catalog layout. It is part of each catalog's folder name, so
+# catalogs saved by an older layout are never loaded.
+catalog_Version = "3"
+
+# File name of the index mapping each CSV's path, size, and modified time to
+# its hash (so an unchanged CSV doesn't have to be read to be hashed).
+catalog_SourcesFileName = "sources.json"
+
+# Number of bytes read at a time while hashing a CSV.
+catalog_ChunkSize = 1024 * 1024
+
+# Lock so that only one thread at a time reads/writes the catalog folder.
+catalog_Lock = threading.Lock()
+
+
+def func_Catalog_Folder():
+
+    # This function returns the folder where the catalogs are kept (within
+    # the download cache folder, which can be changed while running).
+
+    return os.path.join(Hazard_DownloadCache.cache_Folder, catalog_FolderName)
+
+
+def func_Load_Sources(sourcesPath):
+
+    # This function loads the index of the CSVs' hashes (see
+    # catalog_SourcesFileName).
+
+    try:
+
+        with open(sourcesPath) as sourcesFile:
+
+            return json.load(sourcesFile)
+
+    except (OSError, ValueError):
+
+        # If the index doesn't exist yet (or is unreadable), start empty.
+        return {}
+
+
+def func_Source_Hash(csvPath):
+
+    # This function returns the SHA-256 hash of a CSV. The hash is remembered
+    # by the CSV's path, size, and modified time, and only computed again if
+    # one of those changes. The index of hashes is saved the same way as the
+    # download cache's index (see Hazard_DownloadCache.func_Save_Index), so
+    # other processes can save their hashes at the same time.
+
+    csvPath = os.path.abspath(csvPath)
+    status = os.stat(csvPath)
+    sourcesPath = os.path.join(func_Catalog_Folder(), catalog_SourcesFileName)
+
+    source = func_Load_Sources(sourcesPath).get(csvPath)
+
+    if source is not None and source[:2] == [status.st_size,
+                                             status.st_mtime_ns]:
+
+        return source[2]
+
+    contentHash = hashlib.sha256()
+
+    with open(csvPath, "rb") as csvFile:
+
+        for chunk in iter(lambda: csvFile.read(catalog_ChunkSize), b""):
+
+            contentHash.update(chunk)
+
+    with Hazard_DownloadCache.func_File_Lock(sourcesPath + ".lock"):
+
+        dict_Sources = func_Load_Sources(sourcesPath)
+        dict_Sources[csvPath] = [status.st_size, status.st_mtime_ns,
+                                 contentHash.hexdigest()]
+
+        with tempfile.NamedTemporaryFile("w", dir=func_Catalog_Folder(),
+                                         suffix=".tmp",
+                                         delete=False) as sourcesFile:
+
+            try:
+
+                json.dump(dict_Sources, sourcesFile, indent=1,
+                          sort_keys=True)
+
+            except BaseException:
+
+                sourcesFile.close()
+                os.remove(sourcesFile.name)
+
+                raise
+
+        os.replace(sourcesFile.name, sourcesPath)
+
+    return contentHash.hexdigest()
+
+
+def func_Remove_Old_Catalogs(keepFolder):
+
+    # This function removes the least recently used catalogs until no more
+    # than catalog_MaxCount remain. The catalog just used is never removed.
+
+    catalogFolder = func_Catalog_Folder()
+
+    list_Folders = [os.path.join(catalogFolder, name)
+                    for name in os.listdir(catalogFolder)
+                    if os.path.isdir(os.path.join(catalogFolder, name)) and
+                    not name.startswith("tmp")]
+
+    list_Folders.sort(key=os.path.getmtime)
+
+    for folder in list_Folders[:max(0, len(list_Folders) -
+                                    catalog_MaxCount)]:
+
+        if folder != keepFolder:
+
+            # A memory-mapped catalog can't be removed on Windows while in
+            # use; it is removed on a later run instead.
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+def func_Save_Catalog(catalog, folder):
+
+    # This function saves every column of a catalog as its own .npy file.
+    # The columns are written to a temporary folder first, then swapped in,
+    # so a crash can't leave a half-written catalog.
+
+    tempFolder = tempfile.mkdtemp(dir=os.path.dirname(folder))
+
+    for name, values in catalog.items():
+
+        numpy.save(os.path.join(tempFolder, name + ".npy"), values)
+
+    try:
+
+        os.replace(tempFolder, folder)
+
+    except OSError:
+
+        # If another run saved the same catalog first, keep theirs.
+        shutil.rmtree(tempFolder, ignore_errors=True)
+
+
+def func_Open_Catalog(folder):
+
+    # This function memory-maps every column of a saved catalog. The columns
+    # are read-only and shared (through the operating system's page cache)
+    # by every process that opens the same catalog, so worker processes can
+    # be given the catalog's folder instead of a copy of its columns.
+
+    return {name[:-len(".npy")]: numpy.load(os.path.join(folder, name),
+                                            mmap_mode="r")
+            for name in os.listdir(folder) if name.endswith(".npy")}
+
+
+def func_Catalog_Path(sourceHash, hazard):
+
+    # This function returns the folder of the catalog of a CSV (or of a
+    # download) from its hash.
+
+    return os.path.join(func_Catalog_Folder(), sourceHash + "_" + hazard +
+                        "_v" + catalog_Version)
+
+
+def func_SPC_Catalog_Folder(csvPath, hazard, headers, sourceHash=None):
+
+    # This function returns the folder of a NOAA SPC CSV's saved catalog
+    # (without its header row, if the first row contains the headers). If
+    # the CSV hasn't been parsed before, it is parsed and its catalog saved.
+    # If no hash is given, the catalog is kept under the CSV's hash.
+
+    with catalog_Lock:
+
+        os.makedirs(func_Catalog_Folder(), exist_ok=True)
+
+        if sourceHash is None:
+
+            sourceHash = func_Source_Hash(csvPath)
+
+        folder = func_Catalog_Path(sourceHash, hazard)
+
+        if not os.path.isdir(folder):
+
+            with open(csvPath) as csv_InputFile:
+
+                csv_Reader = csv.reader(csv_InputFile)
+
+                # Remove single quotes and spaces from the CSV's first row.
+                firstLine = str(next(csv_Reader, "")).replace("'", "").\
+                    replace(" ", "")
+
+                # If the headers are not present in the CSV's first row,
+                # return to the first row, since this row does not represent
+                # a header.
+                if headers not in firstLine:
+
+                    csv_InputFile.seek(0)
+
+                func_Save_Catalog(func_SPC_Catalog(csv_Reader, hazard),
+                                  folder)
+
+        # Mark the catalog as recently used.
+        os.utime(folder)
+
+        func_Remove_Old_Catalogs(folder)
+
+        return folder
+
+
+def func_Load_SPC_Catalog(csvPath, hazard, headers, sourceHash=None):
+
+    # This function returns the memory-mapped catalog of a NOAA SPC CSV (see
+    # func_SPC_Catalog_Folder).
+
+    return func_Open_Catalog(func_SPC_Catalog_Folder(csvPath, hazard,
+                                                     headers, sourceHash))
+
+
+def func_Load_Cached_SPC_Catalog(url, hazard, headers):
+
+    # This function returns the memory-mapped catalog of a NOAA SPC CSV (or
+    # zipped CSV) URL from the download cache, without any network request.
+    # None is returned if the URL isn't cached (or is due to be revalidated).
+    # The catalog is kept under the hash the download cache stores for the
+    # download, so once saved, it is opened without reading the download
+    # again. Until then, a CSV is parsed from the cached download itself,
+    # and a zipped CSV is unzipped to a temporary file of this process within
+    # the catalog folder first.
+
+    contentHash = Hazard_DownloadCache.func_Cache_Hash(url)
+
+    if contentHash is None:
+
+        return None
+
+    downloadPath = Hazard_DownloadCache.func_Object_Path(contentHash)
+    csvPath = os.path.join(func_Catalog_Folder(), "tmp_download_" +
+                           str(os.getpid()) + ".csv")
+
+    try:
+
+        if not os.path.isdir(func_Catalog_Path(contentHash, hazard)) and \
+                zipfile.is_zipfile(downloadPath):
+
+            os.makedirs(func_Catalog_Folder(), exist_ok=True)
+
+            with zipfile.ZipFile(downloadPath) as zipFile:
+
+                csvName = [name for name in zipFile.namelist()
+                           if name.lower().endswith(".csv")][0]
+
+                with zipFile.open(csvName) as zippedFile, \
+                        open(csvPath, "wb") as csvFile:
+
+                    shutil.copyfileobj(zippedFile, csvFile)
+
+            downloadPath = csvPath
+
+        return func_Load_SPC_Catalog(downloadPath, hazard, headers,
+                                     contentHash)
+
+    except FileNotFoundError:
+
+        # The download was removed from the cache in the meantime.
+        return None
+
+    finally:
+
+        if os.path.exists(csvPath):
+
+            os.remove(csvPath)
@@ -0,0 +1,304 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the concurrent chunk
+# downloader used by the Earthquake Options' custom timespan. Each month of a
+# custom timespan is its own USGS FDSN query. The queries are downloaded a few
+# at a time (bounded concurrency, to respect the USGS rate limits), each with
+# its own retries and exponential backoff, and the results are returned in
+# the same order as the months no matter which download finishes first.
+# Chunks can either be saved to files (func_Download_Chunks), or parsed as they
+# arrive, without any intermediate files (func_Stream_Chunks).
+
+# All import statements for utilized modules.
+import os
+import socket
+import codecs
+import calendar
+import datetime
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from urllib.error import HTTPError
+from urllib.error import URLError
+from Hazard_DownloadCache import func_Cache_Retrieve
+from Hazard_DownloadCache import func_Cache_Stream
+
+# Maximum number of downloads at the same time. This can be changed with the
+# HAZARD_USGS_CONCURRENCY environment variable (USGS asks that clients keep the
+# number of parallel requests small).
+chunk_MaxWorkers = int(os.environ.get("HAZARD_USGS_CONCURRENCY", "4"))
+
+# Number of retries for each chunk after its first attempt fails.
+chunk_Retries = 4
+
+# Seconds to wait before the first retry. The wait doubles with each retry,
+# up to chunk_Backoff_Max seconds (or the server's Retry-After value).
+chunk_Backoff_Seconds = 2.0
+chunk_Backoff_Max = 60.0
+
+# HTTP status codes that indicate a temporary problem worth retrying (rate
+# limiting and server errors). Any other HTTP error (e.g. 400 for a bad
+# query) fails right away.
+tuple_Retry_Status_Codes = (429, 500, 502, 503, 504)
+
+
+def func_Month_Chunks(yearFrom, monthFrom, yearTo, monthTo):
+
+    # This function returns the (start date, end date) strings of every month
+    # within a custom timespan, e.g. ("2000-01-01", "2000-01-31"). Dates use
+    # the same format as the FDSN starttime/endtime parameters.
+
+    # List for the monthly date ranges.
+    list_Chunks = []
+
+    year, month = int(yearFrom), int(monthFrom)
+
+    while (year, month) <= (int(yearTo), int(monthTo)):
+
+        list_Chunks.append((str(datetime.date(year, month, 1)),
+                            str(datetime.date(year, month, calendar.monthrange(
+                                year, month)[1]))))
+
+        # Increment to the next month.
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    return list_Chunks
+
+
+def func_Is_Retryable(error):
+
+    # This function returns True if a download error is temporary (network
+    # problems, timeouts, rate limiting, and server errors).
+
+    if isinstance(error, HTTPError):
+
+        return error.code in tuple_Retry_Status_Codes
+
+    return isinstance(error, (URLError, socket.timeout, ConnectionError))
+
+
+def func_Backoff_Delay(error, retry, backoffSeconds):
+
+    # This function returns the number of seconds to wait before a retry. The
+    # server's Retry-After value (in seconds) is used if given, else the wait
+    # doubles with each retry.
+
+    if isinstance(error, HTTPError) and error.headers is not None:
+
+        try:
+
+            return min(float(error.headers.get("Retry-After")),
+                       chunk_Backoff_Max)
+
+        except (TypeError, ValueError):
+
+            pass
+
+    return min(backoffSeconds * 2 ** retry, chunk_Backoff_Max)
+
+
+def func_Run_Chunk(index, name, func_Task, retries, backoffSeconds,
+                   cancelEvent, func_Progress):
+
+    # This function runs one chunk's task (its download), retrying temporary
+    # errors with exponential backoff. The chunk's index and the task's
+    # result are returned.
+
+    retry = 0
+
+    while True:
+
+        try:
+
+            return index, func_Task()
+
+        except Exception as e:
+
+            # If the error isn't temporary, out of retries, or another chunk
+            # has already failed, give up.
+            if not func_Is_Retryable(e) or retry >= retries or \
+                    cancelEvent.is_set():
+
+                raise
+
+            delay = func_Backoff_Delay(e, retry, backoffSeconds)
+            retry += 1
+
+            if func_Progress is not None:
+
+                func_Progress(index, name, "retry", str(e))
+
+            # Wait before the retry (ends early if another chunk fails).
+            cancelEvent.wait(delay)
+
+
+def func_Read_CSV_Lines(byteChunks):
+
+    # This function yields the lines of CSV text within chunks of downloaded
+    # bytes (UTF-8), so that a CSV reader can parse the content as it
+    # arrives.
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+
+    for chunk in byteChunks:
+
+        pending += decoder.decode(chunk)
+        lines = pending.split("\n")
+
+        # The last piece is an incomplete line (until the next chunk).
+        pending = lines.pop()
+
+        for line in lines:
+
+            yield line + "\n"
+
+    pending += decoder.decode(b"", final=True)
+
+    if pending:
+
+        yield pending
+
+
+def func_Download_Chunks(list_URLs, list_Filenames, maxWorkers=None,
+                         retries=None, backoffSeconds=None,
+                         func_Progress=None):
+
+    # This function downloads every URL to the file name at the same index,
+    # with at most maxWorkers downloads at a time. The file names are
+    # returned in the same order as the URLs. If a chunk still fails after
+    # its retries, the remaining downloads are cancelled and its error
+    # (HTTPError/URLError) is raised.
+    # func_Progress(index, filename, status, message) is called with status
+    # "complete" once each chunk is downloaded (on the calling thread) and
+    # "retry" before each retry (on the downloading thread).
+
+    if maxWorkers is None:
+
+        maxWorkers = chunk_MaxWorkers
+
+    if retries is None:
+
+        retries = chunk_Retries
+
+    if backoffSeconds is None:
+
+        backoffSeconds = chunk_Backoff_Seconds
+
+    # Set once a chunk fails, so the other chunks stop retrying.
+    cancelEvent = threading.Event()
+
+    # List for the downloaded file names, in the same order as the URLs.
+    list_Downloaded = [None] * len(list_URLs)
+
+    with ThreadPoolExecutor(max_workers=max(1, maxWorkers)) as pool:
+
+        futures = [pool.submit(func_Run_Chunk, index, filename,
+                               functools.partial(func_Cache_Retrieve, url,
+                                                 filename),
+                               retries, backoffSeconds, cancelEvent,
+                               func_Progress)
+                   for index, (url, filename) in
+                   enumerate(zip(list_URLs, list_Filenames))]
+
+        try:
+
+            for future in as_completed(futures):
+
+                index, (filename, entry) = future.result()
+                list_Downloaded[index] = filename
+
+                if func_Progress is not None:
+
+                    func_Progress(index, filename, "complete", None)
+
+        except BaseException:
+
+            # Stop the other chunks (queued chunks never start).
+            cancelEvent.set()
+
+            for future in futures:
+
+                future.cancel()
+
+            raise
+
+    return list_Downloaded
+
+
+def func_Parse_URL(url, func_Parse):
+
+    # This function streams the URL's content (through the download cache)
+    # into func_Parse, as lines of CSV text, and returns its result.
+
+    return func_Parse(func_Read_CSV_Lines(func_Cache_Stream(url)))
+
+
+def func_Stream_Chunks(list_URLs, list_Names, func_Parse, maxWorkers=None,
+                       retries=None, backoffSeconds=None, func_Progress=None):
+
+    # This function downloads every URL the same as func_Download_Chunks,
+    # but instead of saving each chunk to a file, its content is parsed as it
+    # arrives by func_Parse (given an iterator of CSV text lines). The parsed
+    # results are yielded in the same order as the URLs. Only a window of
+    # chunks (two per worker) is downloaded ahead of the one being yielded,
+    # so memory use stays the same no matter how many chunks there are.
+    # func_Progress is called the same as func_Download_Chunks, with the
+    # chunk's name from list_Names.
+
+    if maxWorkers is None:
+
+        maxWorkers = chunk_MaxWorkers
+
+    if retries is None:
+
+        retries = chunk_Retries
+
+    if backoffSeconds is None:
+
+        backoffSeconds = chunk_Backoff_Seconds
+
+    maxWorkers = max(1, maxWorkers)
+
+    # Set once a chunk fails, so the other chunks stop retrying.
+    cancelEvent = threading.Event()
+
+    # Dictionary of the submitted chunks (by index) not yet yielded.
+    dict_Futures = {}
+    nextIndex = 0
+
+    with ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+
+        try:
+
+            for index in range(len(list_URLs)):
+
+                # Keep the window of chunks ahead of this one downloading.
+                while nextIndex < len(list_URLs) and \
+                        nextIndex < index + 2 * maxWorkers:
+
+                    dict_Futures[nextIndex] = pool.submit(
+                        func_Run_Chunk, nextIndex, list_Names[nextIndex],
+                        functools.partial(func_Parse_URL,
+                                          list_URLs[nextIndex], func_Parse),
+                        retries, backoffSeconds, cancelEvent, func_Progress)
+                    nextIndex += 1
+
+                result = dict_Futures.pop(index).result()[1]
+
+                if func_Progress is not None:
+
+                    func_Progress(index, list_Names[index], "complete", None)
+
+                yield result
+
+        finally:
+
+            # If a chunk failed (or the caller stopped early), stop the other
+            # chunks (queued chunks never start).
+            cancelEvent.set()
+
+            for future in dict_Futures.values():
+
+                future.cancel()
@@ -0,0 +1,423 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the native clip engine,
+# which decides which hazard points fall inside the Census Bureau's state or
+# county polygons without ArcGIS. The Census Shapefile is read directly, a
+# grid index is built over the polygon bounding boxes, and the points are
+# tested with vectorized ray casting (point-in-polygon) in chunks.
+
+# All import statements for utilized modules.
+import os
+import struct
+from collections import namedtuple
+import numpy
+
+# Field names for the state's FIPS code and the county name within the Census
+# Bureau's Shapefile.
+census_Shapefile_Field_StateFIPS = "STATEFP"
+census_Shapefile_Field_CountyName = "NAME"
+
+# State FIPS codes for US territories (American Samoa, Guam, Northern Mariana
+# Islands, Puerto Rico, and the Virgin Islands). These are not part of the 50
+# states and DC.
+tuple_Territory_StateFIPS = ("60", "66", "69", "72", "78")
+
+# Shapefile shape types for polygons (plain, Z, and M).
+tuple_Shape_Types_Polygon = (5, 15, 25)
+
+# Maximum number of point/edge pairs tested at once by the ray casting. Points
+# are tested in chunks so memory stays bounded for millions of points.
+clip_Chunk_Elements = 4000000
+
+# Polygons read from a Shapefile.
+# bboxes: Array of polygon bounding boxes (xmin, ymin, xmax, ymax).
+# edges: For each polygon, the (x1, y1, x2, y2) arrays of every ring's edges.
+# records: For each polygon, the tuple of requested attribute values.
+ClipPolygons = namedtuple("ClipPolygons", ["bboxes", "edges", "records"])
+
+# Grid index over the polygon bounding boxes. Cell (row, column) is number
+# row * columns + column, and cellPolygons[cellStarts[cell]:
+# cellStarts[cell + 1]] are the polygons whose bounding box overlaps the cell.
+GridIndex = namedtuple("GridIndex", ["originX", "originY", "cellSize",
+                                     "columns", "rows", "cellStarts",
+                                     "cellPolygons"])
+
+
+def func_Read_DBF_Records(dbfPath, fieldNames):
+
+    # This function reads the requested fields of every record within a
+    # Shapefile's .dbf attribute table. Values are returned as stripped
+    # strings, one tuple per record (deleted records are returned as None so
+    # the records stay aligned with the .shp shapes).
+
+    # The .cpg file names the text encoding. If it doesn't exist, the
+    # original dBASE encoding is assumed.
+    encoding = "latin-1"
+    cpgPath = os.path.splitext(dbfPath)[0] + ".cpg"
+
+    if os.path.exists(cpgPath):
+
+        with open(cpgPath, "r") as cpgFile:
+
+            encoding = cpgFile.read().strip() or encoding
+
+    with open(dbfPath, "rb") as dbfFile:
+
+        data = dbfFile.read()
+
+    # Number of records, header length, and record length.
+    recordCount, headerLength, recordLength = struct.unpack("<IHH", data[4:12])
+
+    # Dictionary of each field's (offset within record, length). Offset 0 is
+    # the deletion flag.
+    dict_Field_Positions = {}
+    offset = 1
+    position = 32
+
+    # Field descriptors are 32 bytes each, ending with 0x0D.
+    while data[position] != 0x0D:
+
+        name = data[position:position + 11].split(b"\x00")[0].decode("ascii")
+        length = data[position + 16]
+
+        dict_Field_Positions[name] = (offset, length)
+
+        offset += length
+        position += 32
+
+    # Positions of the requested fields.
+    fieldPositions = [dict_Field_Positions[name] for name in fieldNames]
+
+    # List for the records.
+    records = []
+
+    for index in range(recordCount):
+
+        start = headerLength + index * recordLength
+
+        # If the record is deleted...
+        if data[start:start + 1] == b"*":
+
+            records.append(None)
+
+            continue
+
+        records.append(tuple(data[start + fieldOffset:start + fieldOffset +
+                                  length].decode(encoding).strip()
+                             for fieldOffset, length in fieldPositions))
+
+    return records
+
+
+def func_Read_SHP_Polygons(shpPath):
+
+    # This function reads every polygon within a Shapefile's .shp file. For
+    # each shape, the bounding box and the edges of all rings are returned
+    # (None for null shapes). Holes and multi-part polygons need no special
+    # handling, as ray casting counts edge crossings across all rings.
+
+    with open(shpPath, "rb") as shpFile:
+
+        data = shpFile.read()
+
+    # File code (big-endian) must be 9994.
+    if struct.unpack(">i", data[0:4])[0] != 9994:
+
+        raise ValueError("Not a Shapefile: " + shpPath)
+
+    # List for the polygons.
+    polygons = []
+    position = 100
+
+    while position + 8 <= len(data):
+
+        # Record header (big-endian): record number, content length in 16-bit
+        # words.
+        contentLength = struct.unpack(">ii", data[position:position + 8])[1] * 2
+        content = position + 8
+        position = content + contentLength
+
+        shapeType = struct.unpack("<i", data[content:content + 4])[0]
+
+        # If the shape is null...
+        if shapeType == 0:
+
+            polygons.append(None)
+
+            continue
+
+        if shapeType not in tuple_Shape_Types_Polygon:
+
+            raise ValueError("Shapefile does not contain polygons: " + shpPath)
+
+        # Bounding box, number of parts (rings), and number of points.
+        bbox = struct.unpack("<4d", data[content + 4:content + 36])
+        numParts, numPoints = struct.unpack("<ii", data[content + 36:
+                                                        content + 44])
+
+        # Index of each ring's first point.
+        parts = numpy.frombuffer(data, dtype="<i4", count=numParts,
+                                 offset=content + 44)
+
+        # All points as an (x, y) array.
+        points = numpy.frombuffer(data, dtype="<f8", count=numPoints * 2,
+                                  offset=content + 44 +
+                                  numParts * 4).reshape(-1, 2)
+
+        # Edges run from each point to the next one within the same ring. The
+        # last point of a ring (which closes it) starts no edge.
+        ringEnds = numpy.append(parts[1:], numPoints)
+        startsEdge = numpy.ones(numPoints, dtype=bool)
+        startsEdge[ringEnds - 1] = False
+        edgeStarts = numpy.flatnonzero(startsEdge)
+
+        edges = (points[edgeStarts, 0], points[edgeStarts, 1],
+                 points[edgeStarts + 1, 0], points[edgeStarts + 1, 1])
+
+        polygons.append((bbox, edges))
+
+    return polygons
+
+
+def func_Load_Polygons(shapefilePath, fieldNames, recordFilter=None):
+
+    # This function loads the polygons and requested attributes from a
+    # Shapefile. If a record filter (function of the record tuple) is given,
+    # only polygons it returns True for are kept.
+
+    shapes = func_Read_SHP_Polygons(shapefilePath)
+    records = func_Read_DBF_Records(os.path.splitext(shapefilePath)[0] +
+                                    ".dbf", fieldNames)
+
+    # Lists for the kept polygons.
+    bboxes = []
+    edges = []
+    keptRecords = []
+
+    for shape, record in zip(shapes, records):
+
+        # Skip null shapes, deleted records, and filtered records.
+        if shape is None or record is None or \
+                (recordFilter is not None and not recordFilter(record)):
+
+            continue
+
+        bboxes.append(shape[0])
+        edges.append(shape[1])
+        keptRecords.append(record)
+
+    return ClipPolygons(numpy.array(bboxes, dtype=numpy.float64).reshape(-1, 4),
+                        edges, keptRecords)
+
+
+def func_Load_County_Polygons(censusShapefile, stateFIPS=None,
+                              countyName=None):
+
+    # This function loads the county polygons of the USA (50 states and DC, if
+    # no state is given), a state (by FIPS code), or a county (by state FIPS
+    # code and county name) from the Census Bureau's Shapefile. Each record
+    # is (STATEFP, NAME), matching the county store.
+
+    def func_Record_Filter(record):
+
+        if stateFIPS is None:
+
+            return record[0] not in tuple_Territory_StateFIPS
+
+        return record[0] == stateFIPS and \
+            (countyName is None or record[1] == countyName)
+
+    return func_Load_Polygons(censusShapefile,
+                              [census_Shapefile_Field_StateFIPS,
+                               census_Shapefile_Field_CountyName],
+                              func_Record_Filter)
+
+
+def func_Build_Grid_Index(polygons, cellSize=None):
+
+    # This function builds the grid index over the polygon bounding boxes. If
+    # no cell size is given, the median polygon width/height is used, so most
+    # polygons overlap only a few cells.
+
+    bboxes = polygons.bboxes
+
+    # If there are no polygons, use a single empty cell.
+    if len(bboxes) == 0:
+
+        return GridIndex(0.0, 0.0, 1.0, 1, 1, numpy.zeros(2, dtype=numpy.int64),
+                         numpy.zeros(0, dtype=numpy.int64))
+
+    if cellSize is None:
+
+        cellSize = float(numpy.median(numpy.maximum(bboxes[:, 2] - bboxes[:, 0],
+                                                    bboxes[:, 3] -
+                                                    bboxes[:, 1])))
+
+        # Guard against degenerate (zero-size) polygons.
+        if cellSize <= 0:
+
+            cellSize = 1.0
+
+    originX = float(bboxes[:, 0].min())
+    originY = float(bboxes[:, 1].min())
+    columns = int((bboxes[:, 2].max() - originX) // cellSize) + 1
+    rows = int((bboxes[:, 3].max() - originY) // cellSize) + 1
+
+    # First and last cell column/row overlapped by each bounding box.
+    columnFrom = ((bboxes[:, 0] - originX) // cellSize).astype(numpy.int64)
+    columnTo = ((bboxes[:, 2] - originX) // cellSize).astype(numpy.int64)
+    rowFrom = ((bboxes[:, 1] - originY) // cellSize).astype(numpy.int64)
+    rowTo = ((bboxes[:, 3] - originY) // cellSize).astype(numpy.int64)
+
+    # Lists for every (cell, polygon) pair.
+    pairCells = []
+    pairPolygons = []
+
+    for index in range(len(bboxes)):
+
+        cellRows, cellColumns = numpy.meshgrid(
+            numpy.arange(rowFrom[index], rowTo[index] + 1),
+            numpy.arange(columnFrom[index], columnTo[index] + 1),
+            indexing="ij")
+
+        cells = (cellRows * columns + cellColumns).ravel()
+
+        pairCells.append(cells)
+        pairPolygons.append(numpy.full(len(cells), index, dtype=numpy.int64))
+
+    pairCells = numpy.concatenate(pairCells)
+    pairPolygons = numpy.concatenate(pairPolygons)
+
+    # Sort the pairs by cell, keeping polygon order within each cell.
+    order = numpy.argsort(pairCells, kind="stable")
+
+    # Where each cell's polygons start within the sorted pairs.
+    cellStarts = numpy.zeros(columns * rows + 1, dtype=numpy.int64)
+    cellStarts[1:] = numpy.cumsum(numpy.bincount(pairCells,
+                                                 minlength=columns * rows))
+
+    return GridIndex(originX, originY, cellSize, columns, rows, cellStarts,
+                     pairPolygons[order])
+
+
+def func_Points_In_Polygon(x, y, edges):
+
+    # This function returns a boolean array showing which points are inside a
+    # polygon (even-odd ray casting against all of its edges). A ray is cast
+    # from each point in the +x direction, and a point is inside if the ray
+    # crosses an odd number of edges. Points are tested in chunks, so at most
+    # clip_Chunk_Elements point/edge pairs are held in memory at once.
+
+    x1, y1, x2, y2 = edges
+
+    inside = numpy.zeros(len(x), dtype=bool)
+
+    # If the polygon has no edges, no points are inside.
+    if len(x1) == 0:
+
+        return inside
+
+    chunkSize = max(1, clip_Chunk_Elements // len(x1))
+
+    # Horizontal edges are never crossed (they fail the first test below),
+    # so their division by zero is ignored.
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+
+        for start in range(0, len(x), chunkSize):
+
+            pointX = x[start:start + chunkSize, None]
+            pointY = y[start:start + chunkSize, None]
+
+            # Edges spanning the point's y value, whose crossing with the
+            # point's y value is to the right of the point.
+            crosses = ((y1 > pointY) != (y2 > pointY)) & \
+                (pointX < (x2 - x1) * (pointY - y1) / (y2 - y1) + x1)
+
+            inside[start:start + chunkSize] = \
+                numpy.count_nonzero(crosses, axis=1) % 2 == 1
+
+    return inside
+
+
+def func_Locate_Points(x, y, polygons, gridIndex=None):
+
+    # This function returns, for every point, the index of the polygon it
+    # falls inside, or -1 if it falls inside none of them (polygons are
+    # assumed not to overlap, as with counties). Each point is only tested
+    # against the polygons whose bounding box overlaps the point's grid cell.
+
+    x = numpy.asarray(x, dtype=numpy.float64)
+    y = numpy.asarray(y, dtype=numpy.float64)
+
+    if gridIndex is None:
+
+        gridIndex = func_Build_Grid_Index(polygons)
+
+    polygonIndexes = numpy.full(len(x), -1, dtype=numpy.int64)
+
+    # Grid cell column/row of every point.
+    with numpy.errstate(invalid="ignore"):
+
+        columns = numpy.floor((x - gridIndex.originX) / gridIndex.cellSize)
+        rows = numpy.floor((y - gridIndex.originY) / gridIndex.cellSize)
+
+    # Points within the grid (blank/NaN coordinates fall outside of it).
+    pointIndexes = numpy.flatnonzero((columns >= 0) &
+                                     (columns < gridIndex.columns) &
+                                     (rows >= 0) & (rows < gridIndex.rows))
+
+    cells = rows[pointIndexes].astype(numpy.int64) * gridIndex.columns + \
+        columns[pointIndexes].astype(numpy.int64)
+
+    # Number of candidate polygons for each point.
+    counts = gridIndex.cellStarts[cells + 1] - gridIndex.cellStarts[cells]
+
+    # Every (point, candidate polygon) pair.
+    pairPoints = numpy.repeat(pointIndexes, counts)
+    pairOffsets = numpy.arange(counts.sum()) - \
+        numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    pairPolygons = gridIndex.cellPolygons[
+        numpy.repeat(gridIndex.cellStarts[cells], counts) + pairOffsets]
+
+    # Sort the pairs by polygon, so each polygon's candidates are tested
+    # together.
+    order = numpy.argsort(pairPolygons, kind="stable")
+    pairPoints = pairPoints[order]
+    pairPolygons = pairPolygons[order]
+
+    # Where each polygon's candidate points start and end.
+    boundaries = numpy.searchsorted(pairPolygons,
+                                    numpy.arange(len(polygons.edges) + 1))
+
+    for index in range(len(polygons.edges)):
+
+        candidates = pairPoints[boundaries[index]:boundaries[index + 1]]
+
+        # Skip points already located within another polygon.
+        candidates = candidates[polygonIndexes[candidates] < 0]
+
+        # Keep only the points within the polygon's bounding box.
+        xmin, ymin, xmax, ymax = polygons.bboxes[index]
+        candidates = candidates[(x[candidates] >= xmin) &
+                                (x[candidates] <= xmax) &
+                                (y[candidates] >= ymin) &
+                                (y[candidates] <= ymax)]
+
+        if len(candidates) == 0:
+
+            continue
+
+        inside = func_Points_In_Polygon(x[candidates], y[candidates],
+                                        polygons.edges[index])
+
+        polygonIndexes[candidates[inside]] = index
+
+    return polygonIndexes
+
+
+def func_Clip_Points(x, y, polygons, gridIndex=None):
+
+    # This function returns a boolean array showing which points fall inside
+    # any of the polygons (the native equivalent of Clip_analysis).
+
+    return func_Locate_Points(x, y, polygons, gridIndex) >= 0
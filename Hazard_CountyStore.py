@@ -0,0 +1,173 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the prebuilt county
+# store shared by the Hail, Wind, Tornado, Hurricane, and Earthquake Options.
+
+# All import statements for utilized modules, excluding arcpy.
+import os
+from Hazard_DownloadCache import cache_Folder
+
+# If the user chooses to proceed with the application after receiving a
+# "Runtime Error", the same error will be ignored/passed within this .py file.
+try:
+
+    # If ArcPy available, import it.
+    import arcpy
+
+except RuntimeError:
+
+    # If ArcPy not available, skip it.
+    pass
+
+# Folder where the county store File GDBs are kept (next to the downloads
+# within the download cache).
+countyStore_Folder = os.path.join(cache_Folder, "CountyStore")
+
+# Name of the projected county feature class within each county store.
+countyStore_FeatureClass = "USA_Counties_Projected"
+
+# Attribute index names for the county store's lookup fields.
+countyStore_Index_State = "STATEFP_Index"
+countyStore_Index_State_County = "STATEFP_NAME_Index"
+
+# Field names for the state's FIPS code and the county name within the Census
+# Bureau's Shapefile.
+census_Shapefile_Field_StateFIPS = "STATEFP"
+census_Shapefile_Field_CountyName = "NAME"
+
+# State FIPS codes for US territories (American Samoa, Guam, Northern Mariana
+# Islands, Puerto Rico, and the Virgin Islands). These are not part of the 50
+# states and DC.
+tuple_Territory_StateFIPS = ("60", "66", "69", "72", "78")
+
+
+def func_County_Store_GDB(censusFileName):
+
+    # This function returns the path of the county store File GDB built from
+    # the Census Shapefile with the given file name (e.g.
+    # cb_2017_us_county_500k). A new Census Shapefile gets its own store.
+
+    return os.path.join(countyStore_Folder, censusFileName + ".gdb")
+
+
+def func_County_Store_Path(censusFileName):
+
+    # This function returns the path of the projected county feature class
+    # within the county store.
+
+    return func_County_Store_GDB(censusFileName) + "/" + \
+        countyStore_FeatureClass
+
+
+def func_County_Store_Exists(censusFileName):
+
+    # This function returns True if the county store has already been built.
+
+    return arcpy.Exists(func_County_Store_Path(censusFileName))
+
+
+def func_Where_Clause(featureClass, stateFIPS=None, countyName=None):
+
+    # This function creates the SQL where clause for looking up a state (by
+    # FIPS code) and optionally a county (by name) within a feature class.
+    # None is returned if no state is given (all features).
+
+    if stateFIPS is None:
+
+        return None
+
+    whereClause = arcpy.AddFieldDelimiters(featureClass,
+                                           census_Shapefile_Field_StateFIPS) + \
+        " = '" + stateFIPS + "'"
+
+    if countyName is not None:
+
+        # Single quotes within county names (e.g. O'Brien) are doubled.
+        whereClause += " AND " + \
+            arcpy.AddFieldDelimiters(featureClass,
+                                     census_Shapefile_Field_CountyName) + \
+            " = '" + countyName.replace("'", "''") + "'"
+
+    return whereClause
+
+
+def func_Build_County_Store(censusShapefile, censusFileName, spatialReference):
+
+    # This function is the one-time build step for the county store. It copies
+    # the 50 states and DC counties from the Census Shapefile, projects them
+    # to the designated PCS, and adds attribute indexes on the state FIPS code
+    # and county name. It is built under a temporary name and renamed once
+    # complete, so an interrupted build is never used.
+
+    # If the county store folder does not already exist, create it.
+    if not os.path.exists(countyStore_Folder):
+
+        os.makedirs(countyStore_Folder)
+
+    # Temporary File GDB for the build.
+    buildGDB_Name = censusFileName + "_Building.gdb"
+    buildGDB = os.path.join(countyStore_Folder, buildGDB_Name)
+
+    # If a previous build was interrupted, delete it.
+    if arcpy.Exists(buildGDB):
+
+        arcpy.Delete_management(buildGDB)
+
+    arcpy.CreateFileGDB_management(countyStore_Folder, buildGDB_Name)
+
+    # Unprojected and projected feature classes within the temporary File GDB.
+    featureClass_Unprojected = buildGDB + "/" + countyStore_FeatureClass + \
+        "_Unprojected"
+    featureClass_Projected = buildGDB + "/" + countyStore_FeatureClass
+
+    # Where clause that removes the US territories' FIPS codes.
+    whereClause = arcpy.AddFieldDelimiters(censusShapefile,
+                                           census_Shapefile_Field_StateFIPS) + \
+        " NOT IN ('" + "', '".join(tuple_Territory_StateFIPS) + "')"
+
+    # Copy the 50 states and DC counties from the Census Shapefile.
+    arcpy.Select_analysis(censusShapefile, featureClass_Unprojected,
+                          whereClause)
+
+    # Project the counties to the designated PCS.
+    arcpy.Project_management(featureClass_Unprojected, featureClass_Projected,
+                             spatialReference)
+
+    # Delete the unprojected counties. They are no longer needed.
+    arcpy.Delete_management(featureClass_Unprojected)
+
+    # Recalculate extent of the projected counties.
+    arcpy.RecalculateFeatureClassExtent_management(featureClass_Projected)
+
+    # Add attribute indexes for state and state/county lookups.
+    arcpy.AddIndex_management(featureClass_Projected,
+                              [census_Shapefile_Field_StateFIPS],
+                              countyStore_Index_State)
+    arcpy.AddIndex_management(featureClass_Projected,
+                              [census_Shapefile_Field_StateFIPS,
+                               census_Shapefile_Field_CountyName],
+                              countyStore_Index_State_County)
+
+    # Release any locks on the temporary File GDB so it can be renamed.
+    arcpy.ClearWorkspaceCache_management()
+
+    # If an older copy of the county store exists, delete it.
+    if arcpy.Exists(func_County_Store_GDB(censusFileName)):
+
+        arcpy.Delete_management(func_County_Store_GDB(censusFileName))
+
+    # Rename the completed File GDB to the county store's name.
+    os.rename(buildGDB, func_County_Store_GDB(censusFileName))
+
+
+def func_Extract_County_Mask(countyStore, outputFeatureClass, stateFIPS=None,
+                             countyName=None):
+
+    # This function looks up the USA (no state given), a state, or a county
+    # within the county store and copies those polygons to the output
+    # feature class. The polygons are already projected, and the lookup uses
+    # the store's attribute indexes.
+
+    arcpy.Select_analysis(countyStore, outputFeatureClass,
+                          func_Where_Clause(countyStore, stateFIPS,
+                                            countyName))
@@ -0,0 +1,615 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the local download cache
+# shared by the Hail, Wind, Tornado, Hurricane, and Earthquake Options.
+
+# All import statements for utilized modules.
+import os
+import json
+import time
+import datetime
+import shutil
+import hashlib
+import tempfile
+import threading
+import contextlib
+from urllib import request
+from urllib.error import HTTPError
+from urllib.error import URLError
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+# File locks are taken with fcntl (Linux/macOS) or msvcrt (Windows).
+try:
+
+    import fcntl
+
+except ImportError:
+
+    fcntl = None
+    import msvcrt
+
+# Folder where the cached downloads are kept. This can be changed with the
+# HAZARD_CACHE_FOLDER environment variable.
+cache_Folder = os.environ.get("HAZARD_CACHE_FOLDER",
+                              os.path.join(os.path.expanduser("~"),
+                                           "Hazard_DownloadCache"))
+
+# Maximum total size of the cached downloads (2 GB). Once exceeded, the least
+# recently used downloads are removed first.
+cache_MaxBytes = 2 * 1024 * 1024 * 1024
+
+# Number of seconds a cached download is served without checking the web
+# server for a newer copy (24 hours). After this, the cached copy is
+# revalidated with its ETag/Last-Modified values.
+cache_MaxAge = 24 * 60 * 60
+
+# Dictionary of URL prefixes whose data changes often enough that the cached
+# copy must always be revalidated (the USGS earthquake summary feeds are
+# rolling windows, updated every minute).
+dict_Cache_MaxAge_URLPrefix = {
+    "http://earthquake.usgs.gov/earthquakes/feed/": 0,
+    "https://earthquake.usgs.gov/earthquakes/feed/": 0}
+
+# Dictionary of URL prefixes of queries over a time window (URL prefix: name
+# of the query parameter holding the window's end, in UTC). Once the window
+# ended more than cache_Window_Settle seconds ago, the query is cached like
+# any other download; until then (or without an end), new events can still
+# be added, so the cached copy is always revalidated.
+dict_Cache_Window_URLPrefix = {
+    "http://earthquake.usgs.gov/fdsnws/event/": "endtime",
+    "https://earthquake.usgs.gov/fdsnws/event/": "endtime"}
+
+# Number of seconds after a query window's end before its events are treated
+# as final (late reports and revisions mostly arrive within a day).
+cache_Window_Settle = 24 * 60 * 60
+
+# If offline mode is on, cached downloads are always served and no network
+# requests are made. This can be turned on with HAZARD_OFFLINE=1.
+cache_Offline = os.environ.get("HAZARD_OFFLINE", "0") == "1"
+
+# Number of seconds to wait for the web server before giving up.
+cache_Timeout = 60
+
+# Number of bytes read from the web server at a time.
+cache_ChunkSize = 1024 * 1024
+
+# Index file name, and subfolder name for the downloaded files (each saved
+# under the SHA-256 hash of its content).
+cache_IndexFileName = "index.json"
+cache_ObjectsFolderName = "objects"
+
+# Lock so that only one thread at a time reads/writes the cache index (other
+# processes, e.g. the batch runner's workers, are kept out by a file lock
+# while the index is saved; see func_Save_Index).
+cache_Lock = threading.Lock()
+
+
+def func_Set_Offline_Mode(offline):
+
+    # This function turns offline mode on or off.
+
+    global cache_Offline
+
+    cache_Offline = offline
+
+
+def func_Load_Index():
+
+    # This function loads the cache index, which maps each URL to the hash,
+    # size, ETag, Last-Modified, and fetch/use times of its cached copy.
+
+    try:
+
+        with open(os.path.join(cache_Folder, cache_IndexFileName)) as \
+                indexFile:
+
+            return json.load(indexFile)
+
+    except (OSError, ValueError):
+
+        # If the index doesn't exist yet (or is unreadable), start empty.
+        return {}
+
+
+@contextlib.contextmanager
+def func_File_Lock(lockPath):
+
+    # This function holds an exclusive lock of the lock file (created if
+    # missing) within its "with" block, so that only one process at a time
+    # runs the block. Threads within the same process need a lock of their
+    # own as well.
+
+    with open(lockPath, "a+b") as lockFile:
+
+        if fcntl is not None:
+
+            fcntl.flock(lockFile, fcntl.LOCK_EX)
+
+        else:
+
+            # msvcrt gives up after 10 seconds, so keep trying.
+            lockFile.seek(0)
+
+            while True:
+
+                try:
+
+                    msvcrt.locking(lockFile.fileno(), msvcrt.LK_LOCK, 1)
+
+                    break
+
+                except OSError:
+
+                    pass
+
+        try:
+
+            yield
+
+        finally:
+
+            if fcntl is not None:
+
+                fcntl.flock(lockFile, fcntl.LOCK_UN)
+
+            else:
+
+                lockFile.seek(0)
+                msvcrt.locking(lockFile.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def func_Save_Index(index, list_URLs):
+
+    # This function saves the entries of the URLs within the index to the
+    # cache index (removing the URLs no longer within it). While the index
+    # file is locked, the saved index is read again, so entries other
+    # processes saved since it was loaded are kept. It is written to a
+    # temporary file of its own first, then swapped in, so a crash can't
+    # leave a half-written index.
+
+    indexPath = os.path.join(cache_Folder, cache_IndexFileName)
+
+    with func_File_Lock(indexPath + ".lock"):
+
+        savedIndex = func_Load_Index()
+
+        for url in list_URLs:
+
+            if url in index:
+
+                savedIndex[url] = index[url]
+
+            else:
+
+                savedIndex.pop(url, None)
+
+        with tempfile.NamedTemporaryFile("w", dir=cache_Folder,
+                                         suffix=".tmp",
+                                         delete=False) as indexFile:
+
+            try:
+
+                json.dump(savedIndex, indexFile, indent=1, sort_keys=True)
+
+            except BaseException:
+
+                indexFile.close()
+                os.remove(indexFile.name)
+
+                raise
+
+        os.replace(indexFile.name, indexPath)
+
+
+def func_Object_Path(contentHash):
+
+    # This function returns the path of a cached download from its hash.
+
+    return os.path.join(cache_Folder, cache_ObjectsFolderName, contentHash)
+
+
+def func_Remove_Unreferenced(index, contentHash):
+
+    # This function deletes a cached download's file if no URL within the
+    # index refers to it anymore. True is returned if the file was deleted.
+
+    if any(entry["sha256"] == contentHash for entry in index.values()):
+
+        return False
+
+    try:
+
+        os.remove(func_Object_Path(contentHash))
+
+    except OSError:
+
+        pass
+
+    return True
+
+
+def func_Evict_LRU(index, keepURL):
+
+    # This function removes the least recently used downloads until the total
+    # size of the cache is within cache_MaxBytes, and returns the list of
+    # removed URLs. The URL that was just downloaded is never removed.
+
+    # Total size of the cached downloads (identical downloads share a file).
+    dict_Object_Sizes = {}
+
+    for entry in index.values():
+
+        dict_Object_Sizes[entry["sha256"]] = entry["size"]
+
+    totalBytes = sum(dict_Object_Sizes.values())
+
+    list_Removed = []
+
+    # For each URL, from the least recently used...
+    for url in sorted(index, key=lambda key: index[key]["used"]):
+
+        # If the cache is within its size limit, stop removing downloads.
+        if totalBytes <= cache_MaxBytes:
+
+            break
+
+        if url == keepURL:
+
+            continue
+
+        contentHash = index.pop(url)["sha256"]
+        list_Removed.append(url)
+
+        # If no other URL shares this download, its file is deleted.
+        if func_Remove_Unreferenced(index, contentHash):
+
+            totalBytes -= dict_Object_Sizes[contentHash]
+
+    return list_Removed
+
+
+def func_Copy_To_Destination(contentHash, filename):
+
+    # This function copies a cached download to the requested file name (the
+    # processing steps unzip/rename the file, so the cached copy must not be
+    # handed out directly).
+
+    shutil.copyfile(func_Object_Path(contentHash), filename)
+
+
+def func_Window_Settled(url, parameter):
+
+    # This function returns whether a query's time window (see
+    # dict_Cache_Window_URLPrefix) ended more than cache_Window_Settle seconds
+    # ago. A query without an end (or with an unreadable one) hasn't.
+
+    list_Values = parse_qs(urlsplit(url).query).get(parameter)
+
+    if not list_Values:
+
+        return False
+
+    try:
+
+        windowEnd = datetime.datetime.fromisoformat(list_Values[-1])
+
+    except ValueError:
+
+        return False
+
+    # FDSN times without a time zone are UTC.
+    if windowEnd.tzinfo is None:
+
+        windowEnd = windowEnd.replace(tzinfo=datetime.timezone.utc)
+
+    return (datetime.datetime.now(datetime.timezone.utc) -
+            windowEnd).total_seconds() > cache_Window_Settle
+
+
+def func_Cache_MaxAge(url, maxAge):
+
+    # This function returns the maximum age of a URL's cached copy. If no
+    # maximum age is given, the URL prefix setting or the default is used.
+
+    if maxAge is None:
+
+        maxAge = cache_MaxAge
+
+        for prefix, prefixMaxAge in dict_Cache_MaxAge_URLPrefix.items():
+
+            if url.startswith(prefix):
+
+                maxAge = prefixMaxAge
+
+        for prefix, parameter in dict_Cache_Window_URLPrefix.items():
+
+            if url.startswith(prefix) and \
+                    not func_Window_Settled(url, parameter):
+
+                maxAge = 0
+
+    return maxAge
+
+
+def func_Cached_Entry(url, maxAge, func_Use):
+
+    # This function returns the (entry, func_Use result) of a URL's cached
+    # copy. If the cached copy is fresh (or offline mode is on), func_Use is
+    # called with its hash while the cache is locked (so it can't be evicted
+    # in the meantime); otherwise the result is None, and the entry (if any)
+    # is used to revalidate the cached copy.
+
+    with cache_Lock:
+
+        # If the cache subfolder does not already exist, create it.
+        os.makedirs(os.path.join(cache_Folder, cache_ObjectsFolderName),
+                    exist_ok=True)
+
+        index = func_Load_Index()
+        entry = index.get(url)
+
+        # If the cached copy's file is missing, treat it as not cached.
+        if entry is not None and \
+                not os.path.exists(func_Object_Path(entry["sha256"])):
+
+            entry = None
+            index.pop(url)
+
+        # If the URL is cached and either offline mode is on or the cached
+        # copy is still fresh, serve it without any network request.
+        if entry is not None and (cache_Offline or
+                                  time.time() - entry["fetched"] < maxAge):
+
+            entry["used"] = time.time()
+            func_Save_Index(index, [url])
+
+            return entry, func_Use(entry["sha256"])
+
+        # If offline mode is on and the URL isn't cached, it can't be served.
+        if cache_Offline:
+
+            raise URLError("Offline mode: " + url + " is not in the download "
+                           "cache.")
+
+    return entry, None
+
+
+def func_Open_Response(url, entry, func_Use):
+
+    # This function requests the URL, asking the web server to only send the
+    # content if it has changed since the cached copy was downloaded. The
+    # (response, None) is returned, or (None, func_Use result) if the web
+    # server replies 304 (Not Modified) and the cached copy is still current.
+
+    # Headers for the conditional request.
+    dict_Headers = {}
+
+    if entry is not None and entry.get("etag"):
+
+        dict_Headers["If-None-Match"] = entry["etag"]
+
+    if entry is not None and entry.get("last_modified"):
+
+        dict_Headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+
+        return request.urlopen(request.Request(url, headers=dict_Headers),
+                               timeout=cache_Timeout), None
+
+    except HTTPError as httpError:
+
+        if httpError.code == 304 and entry is not None:
+
+            with cache_Lock:
+
+                index = func_Load_Index()
+                entry["fetched"] = entry["used"] = time.time()
+                index[url] = entry
+                func_Save_Index(index, [url])
+
+                return None, func_Use(entry["sha256"])
+
+        raise
+
+
+def func_Save_Download(url, tempName, contentHash, size, headers, func_Use):
+
+    # This function adds a completed download (saved within the temporary
+    # file) to the cache, and returns the (entry, func_Use result).
+
+    with cache_Lock:
+
+        # Save the download under its content hash (if the same content is
+        # already cached, the existing file is reused).
+        os.replace(tempName, func_Object_Path(contentHash))
+
+        index = func_Load_Index()
+        previousEntry = index.get(url)
+        entry = {"sha256": contentHash,
+                 "size": size,
+                 "etag": headers.get("ETag"),
+                 "last_modified": headers.get("Last-Modified"),
+                 "fetched": time.time(),
+                 "used": time.time()}
+        index[url] = entry
+
+        # If the URL's content has changed, delete the previous download.
+        if previousEntry is not None:
+
+            func_Remove_Unreferenced(index, previousEntry["sha256"])
+
+        # Remove the least recently used downloads if the cache is too big.
+        list_Removed = func_Evict_LRU(index, url)
+
+        func_Save_Index(index, [url] + list_Removed)
+
+        return entry, func_Use(contentHash)
+
+
+def func_Cache_Retrieve(url, filename, maxAge=None):
+
+    # This function is used in place of request.urlretrieve. It copies the
+    # URL's content to the file name, using the cached download whenever
+    # possible:
+    # - If the cached copy is newer than maxAge, no network request is made.
+    # - Otherwise, the cached copy is revalidated with If-None-Match/
+    # If-Modified-Since. A 304 reply reuses the cached copy.
+    # - In offline mode, the cached copy is always used.
+    # HTTPError/URLError are raised the same as request.urlretrieve.
+
+    # This function copies the cached download to the file name.
+    def func_Use(contentHash):
+
+        func_Copy_To_Destination(contentHash, filename)
+
+        return filename
+
+    maxAge = func_Cache_MaxAge(url, maxAge)
+
+    entry, used = func_Cached_Entry(url, maxAge, func_Use)
+
+    if used is not None:
+
+        return filename, entry
+
+    response, used = func_Open_Response(url, entry, func_Use)
+
+    if used is not None:
+
+        return filename, entry
+
+    # Download the content to a temporary file within the cache, hashing it
+    # along the way.
+    contentHash = hashlib.sha256()
+    size = 0
+
+    with response:
+
+        with tempfile.NamedTemporaryFile(dir=os.path.join(cache_Folder,
+                                         cache_ObjectsFolderName),
+                                         delete=False) as tempFile:
+
+            try:
+
+                while True:
+
+                    chunk = response.read(cache_ChunkSize)
+
+                    if not chunk:
+
+                        break
+
+                    contentHash.update(chunk)
+                    size += len(chunk)
+                    tempFile.write(chunk)
+
+            except:
+
+                # If the download fails partway, remove the partial file.
+                tempFile.close()
+                os.remove(tempFile.name)
+
+                raise
+
+        headers = response.headers
+
+    entry, filename = func_Save_Download(url, tempFile.name,
+                                         contentHash.hexdigest(), size,
+                                         headers, func_Use)
+
+    return filename, entry
+
+
+def func_Cache_Hash(url, maxAge=None):
+
+    # This function returns the hash of the URL's cached copy (see
+    # func_Object_Path), but only if func_Cache_Retrieve would serve it
+    # without any network request (the cached copy is fresh, or offline mode
+    # is on). None is returned if the URL isn't cached (e.g. to show
+    # information about a download before it is requested).
+
+    try:
+
+        entry, used = func_Cached_Entry(url, func_Cache_MaxAge(url, maxAge),
+                                        lambda contentHash: contentHash)
+
+    except URLError:
+
+        # Offline mode, and the URL isn't cached.
+        return None
+
+    return used
+
+
+def func_Cache_Stream(url, maxAge=None):
+
+    # This function is used in place of func_Cache_Retrieve when the content
+    # is only read once (e.g. parsed as it arrives). It yields the URL's
+    # content in chunks of bytes, without copying it to an output file. The
+    # cache rules are the same as func_Cache_Retrieve: a fresh (or 304)
+    # cached copy is read from the cache, otherwise the download is saved to
+    # the cache as it is yielded (and added once it is complete).
+
+    maxAge = func_Cache_MaxAge(url, maxAge)
+
+    # This function opens the cached download for reading.
+    def func_Use(contentHash):
+
+        return open(func_Object_Path(contentHash), "rb")
+
+    entry, cachedFile = func_Cached_Entry(url, maxAge, func_Use)
+
+    if cachedFile is None:
+
+        response, cachedFile = func_Open_Response(url, entry, func_Use)
+
+    if cachedFile is not None:
+
+        with cachedFile:
+
+            for chunk in iter(lambda: cachedFile.read(cache_ChunkSize), b""):
+
+                yield chunk
+
+        return
+
+    contentHash = hashlib.sha256()
+    size = 0
+
+    with response:
+
+        tempFile = tempfile.NamedTemporaryFile(dir=os.path.join(
+            cache_Folder, cache_ObjectsFolderName), delete=False)
+
+        try:
+
+            with tempFile:
+
+                while True:
+
+                    chunk = response.read(cache_ChunkSize)
+
+                    if not chunk:
+
+                        break
+
+                    contentHash.update(chunk)
+                    size += len(chunk)
+                    tempFile.write(chunk)
+
+                    yield chunk
+
+        except BaseException:
+
+            # If the download fails partway (or the reader stops early),
+            # remove the partial file.
+            os.remove(tempFile.name)
+
+            raise
+
+        headers = response.headers
+
+    func_Save_Download(url, tempFile.name, contentHash.hexdigest(), size,
+                       headers, lambda contentHash: None)
@@ -0,0 +1,665 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the vectorized NOAA SPC
+# CSV filter engine used by the Hail, Wind, and Tornado Options, along with the
+# USGS earthquake CSV filter used by the Earthquake Options.
+
+# All import statements for utilized modules.
+import calendar
+import datetime
+import itertools
+import numpy
+
+# Column positions within the NOAA SPC CSVs (hail, wind, and tornado CSVs all
+# share the same leading column layout).
+spc_Column_Year = 1
+spc_Column_Month = 2
+spc_Column_Day = 3
+spc_Column_Date = 4
+spc_Column_Mag = 10
+spc_Column_Lat = 15
+spc_Column_Long = 16
+
+# Number of CSV rows parsed at a time into a catalog (so only one block of rows
+# is held as Python lists, instead of the whole CSV).
+spc_Block_Rows = 65536
+
+# Day number given to the rows whose Year, Month, and Day columns don't
+# combine into a real date (sorted after every real date).
+spc_Invalid_Day = numpy.iinfo(numpy.int64).max
+
+# Column positions within the USGS earthquake (FDSN) CSVs.
+quake_Column_Lat = 1
+quake_Column_Long = 2
+quake_Column_Mag = 4
+quake_Column_Type = 14
+
+# Event type of the USGS rows that are kept (explosions, quarry blasts, etc.
+# are removed).
+quake_Event_Type = "earthquake"
+
+# Dictionary of magnitude rules for each hazard, keyed by the same hazard
+# strings used within the output naming conventions (hail, wind, torn).
+# Values are: (truncate magnitude to integer, valid minimum, minimum is
+# inclusive, valid maximum, maximum is inclusive).
+# Hail: diameter greater than zero and less than 9.99 (negative values and
+# 9.99 indicate errors).
+# Wind: speed (truncated to integer) between 30 and 200.
+# Tornado: intensity (truncated to integer) at least zero and less than 6.
+dict_Hazard_Mag_Rules = {"hail": (False, 0.0, False, 9.99, False),
+                         "wind": (True, 30, True, 200, True),
+                         "torn": (True, 0, True, 6, False)}
+
+# Dictionary of the non-custom magnitude bins for each hazard's combo box
+# selection. Values are (lower bound inclusive, upper bound exclusive), where
+# None represents no bound.
+dict_Hazard_Mag_Bins = {"hail": {"All": (None, None),
+                                 '0.5" - 0.99"': (0.5, 1.0),
+                                 '1.0" - 1.99"': (1.0, 2.0),
+                                 '2.0" - 2.99"': (2.0, 3.0),
+                                 '3.0"+': (3.0, None)},
+                        "wind": {"All": (None, None),
+                                 "30 - 60": (30, 60),
+                                 "60 - 90": (60, 90),
+                                 "90 - 120": (90, 120),
+                                 "120+": (120, None)},
+                        "torn": {"All": (None, None),
+                                 "EF-0": (0, 1),
+                                 "EF-1": (1, 2),
+                                 "EF-2": (2, 3),
+                                 "EF-3": (3, 4),
+                                 "EF-4": (4, 5),
+                                 "EF-5": (5, 6)}}
+
+
+def func_Parse_Float(value):
+
+    # This function converts a single CSV value to a float, returning NaN for
+    # any value that can't be converted (NaN fails every mask comparison).
+
+    try:
+
+        return float(value)
+
+    except ValueError:
+
+        return numpy.nan
+
+
+def func_Column_To_Float(rows, column):
+
+    # This function loads one CSV column into a typed NumPy float array. Blank
+    # values (and rows too short to have the column, e.g. a truncated last
+    # row) are loaded as NaN so that they fail every mask comparison.
+
+    # Blank values are swapped for "nan" while the column is being gathered.
+    values = numpy.array([row[column] if column < len(row) and row[column]
+                          else "nan" for row in rows])
+
+    try:
+
+        # Convert the whole column at once.
+        return values.astype(numpy.float64)
+
+    except ValueError:
+
+        # If the column has a value that can't be read as a number, fall back
+        # to converting one value at a time.
+        return numpy.array([func_Parse_Float(value) for value in values],
+                           dtype=numpy.float64)
+
+
+def func_Column_To_Int(rows, column):
+
+    # This function loads one CSV column into a typed NumPy integer array,
+    # along with a mask showing which values were valid integers. Rows too
+    # short to have the column are loaded as blank (not valid).
+
+    # Column values (blank for rows without the column).
+    list_Values = [row[column] if column < len(row) else "" for row in rows]
+
+    try:
+
+        # Convert the whole column at once.
+        values = numpy.array(list_Values).astype(numpy.int64)
+
+        return values, numpy.ones(len(rows), dtype=bool)
+
+    except (ValueError, OverflowError):
+
+        # If the column has a value that can't be read as an integer, fall back
+        # to converting one value at a time.
+        values = numpy.zeros(len(rows), dtype=numpy.int64)
+        valid = numpy.zeros(len(rows), dtype=bool)
+
+        for index, value in enumerate(list_Values):
+
+            try:
+
+                values[index] = int(value)
+                valid[index] = True
+
+            except (ValueError, OverflowError):
+
+                pass
+
+        return values, valid
+
+
+def func_Day_Numbers(years, months, days, valid):
+
+    # This function returns the day numbers (days since 1970-01-01) of year,
+    # month, and day arrays. Rows that aren't valid, or whose values don't
+    # combine into a real date, are given spc_Invalid_Day (sorted after every
+    # real date).
+
+    # Number of days within each row's month (February adjusted for leap
+    # years).
+    daysInMonth = numpy.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30,
+                               31])[numpy.clip(months, 0, 12)]
+    leapYears = ((years % 4 == 0) & (years % 100 != 0)) | (years % 400 == 0)
+    daysInMonth = daysInMonth + ((months == 2) & leapYears)
+
+    # Rows where the Year, Month, and Day values combine into a real date.
+    validDates = valid & \
+        (years >= datetime.MINYEAR) & (years <= datetime.MAXYEAR) & \
+        (months >= 1) & (months <= 12) & (days >= 1) & (days <= daysInMonth)
+
+    # Dates of the rows (rows without a real date use 1970-01-01 until they
+    # are replaced below).
+    dates = (numpy.where(validDates, years - 1970, 0).astype(
+        "datetime64[Y]").astype("datetime64[M]") +
+        numpy.where(validDates, months - 1, 0).astype("timedelta64[M]")).\
+        astype("datetime64[D]") + \
+        numpy.where(validDates, days - 1, 0).astype("timedelta64[D]")
+
+    return numpy.where(validDates, dates.astype(numpy.int64),
+                       spc_Invalid_Day)
+
+
+def func_Timespan_Indexes(catalog, customTimespan, timeOrder=None,
+                          daySorted=None):
+
+    # This function returns the indexes of the catalog rows whose date falls
+    # within the custom timespan (from the first day of the FROM month
+    # through the last day of the TO month). The catalog's rows are indexed
+    # by day number ("time_Order" sorts the rows by "day_Sorted", their
+    # sorted day numbers), so the rows within any timespan are one slice of
+    # the time order, found with a binary search. One magnitude bin's part of
+    # the bin index (see func_Bin_Index) may be given instead, to search only
+    # that bin's rows.
+
+    # Custom timespan values (YYYY, MM, YYYY, MM) as assigned by the GUI.
+    yearFrom, monthFrom, yearTo, monthTo = customTimespan
+
+    # FROM and TO dates as day numbers.
+    fromDay, toDay = func_Day_Numbers(
+        numpy.array([int(yearFrom), int(yearTo)]),
+        numpy.array([int(monthFrom), int(monthTo)]),
+        numpy.array([1, calendar.monthrange(int(yearTo), int(monthTo))[1]]),
+        True)
+
+    if timeOrder is None:
+
+        timeOrder = catalog["time_Order"]
+        daySorted = catalog["day_Sorted"]
+
+    # Binary search for the slice of the FROM through TO days, and for the
+    # rows without a real date (sorted last).
+    start, end, invalidStart = numpy.searchsorted(
+        daySorted, [fromDay, toDay + 1, spc_Invalid_Day])
+
+    indexes = timeOrder[start:max(start, end)]
+    invalidIndexes = timeOrder[invalidStart:]
+
+    if not invalidIndexes.size:
+
+        return indexes
+
+    # If the days of the month are out of range (e.g. June 31st), the row's
+    # date is identified from the "date" column instead, which has the
+    # YYYY/MM/DD fields combined into one. These rows are rare, so they are
+    # checked one at a time with the same FROM/TO dates used previously (the
+    # TO date's day is the monthly range of the FROM month).
+    mask = numpy.zeros(len(invalidIndexes), dtype=bool)
+
+    # Assign the YYYYMM's monthly range in days.
+    monthRange = calendar.monthrange(int(yearFrom), int(monthFrom))[1]
+
+    # Create FROM date by combining YYYY, MM, and DD parameters.
+    fromDate = datetime.datetime.strptime(yearFrom + "-" + monthFrom +
+                                          "-1", "%Y-%m-%d")
+
+    try:
+
+        # Create TO date by combining YYYY, MM, and DD parameters.
+        toDate = datetime.datetime.strptime(yearTo + "-" + monthTo + "-" +
+                                            str(monthRange), "%Y-%m-%d")
+
+    except ValueError:
+
+        # If the FROM month's range doesn't exist within the TO month, use
+        # the last day of the TO month.
+        toDate = datetime.datetime(int(yearTo), int(monthTo),
+                                   calendar.monthrange(int(yearTo),
+                                                       int(monthTo))[1])
+
+    for position, index in enumerate(invalidIndexes):
+
+        try:
+
+            # Format the "date" column within the CSV into the date format
+            # so that it can be compared to the FROM and TO dates.
+            date_in_row = datetime.datetime.strptime(
+                catalog["column_" + str(spc_Column_Date)][index].decode(
+                    "utf-8"), "%Y-%m-%d")
+
+        except ValueError:
+
+            # If the "date" column within the CSV also shows invalid date
+            # values, then proceed to skip this row.
+            continue
+
+        mask[position] = fromDate <= date_in_row <= toDate
+
+    return numpy.concatenate([indexes, invalidIndexes[mask]])
+
+
+def func_Timespan_Count(catalog, customTimespan):
+
+    # This function returns the number of catalog rows whose date falls
+    # within the custom timespan (before any other checks).
+
+    return len(func_Timespan_Indexes(catalog, customTimespan))
+
+
+def func_Date_Mask(catalog, customTimespan):
+
+    # This function creates the boolean mask of rows whose date falls within
+    # the custom timespan (from the first day of the FROM month through the
+    # last day of the TO month).
+
+    mask = numpy.zeros(len(catalog["time_Order"]), dtype=bool)
+    mask[func_Timespan_Indexes(catalog, customTimespan)] = True
+
+    return mask
+
+
+def func_SPC_Block(rows):
+
+    # This function loads one block of non-empty NOAA SPC CSV rows into the
+    # arrays of a catalog (see func_SPC_Catalog), without its indexes.
+
+    block = {"row_Length": numpy.array([len(row) for row in rows],
+                                       dtype=numpy.int64)}
+
+    for column in range(max((len(row) for row in rows), default=0)):
+
+        block["column_" + str(column)] = numpy.array(
+            [row[column].encode("utf-8") if column < len(row) else b""
+             for row in rows], dtype=bytes)
+
+    # Magnitude and lat/long columns as typed arrays.
+    block["mag"] = func_Column_To_Float(rows, spc_Column_Mag)
+    block["lat"] = func_Column_To_Float(rows, spc_Column_Lat)
+    block["long"] = func_Column_To_Float(rows, spc_Column_Long)
+
+    # Year, Month, and Day columns as typed arrays.
+    block["year"], block["year_Valid"] = \
+        func_Column_To_Int(rows, spc_Column_Year)
+    block["month"], block["month_Valid"] = \
+        func_Column_To_Int(rows, spc_Column_Month)
+    block["day"], block["day_Valid"] = \
+        func_Column_To_Int(rows, spc_Column_Day)
+
+    return block
+
+
+def func_SPC_Catalog(rows, hazard=None):
+
+    # This function loads the rows of a NOAA SPC CSV into a catalog: a
+    # dictionary of NumPy arrays holding each CSV column's text (bytes) as
+    # "column_0", "column_1", etc., the number of columns of each row, and
+    # the typed columns used by the checks (magnitude, lat/long, and year/
+    # month/day with masks of valid values). If the hazard is given, the
+    # catalog also holds the hazard's magnitude bin index. Every array can be
+    # saved and memory-mapped by the catalog cache.
+
+    # Load the non-empty rows of the input CSV, one block of spc_Block_Rows
+    # rows at a time (an empty CSV still gets one, empty, block).
+    rows = (row for row in rows if row)
+    list_Blocks = []
+
+    while True:
+
+        blockRows = list(itertools.islice(rows, spc_Block_Rows))
+
+        if blockRows or not list_Blocks:
+
+            list_Blocks.append(func_SPC_Block(blockRows))
+
+        if len(blockRows) < spc_Block_Rows:
+
+            break
+
+    # Join the blocks' arrays. A block without some of the (trailing) text
+    # columns gets blank values for them.
+    columnCount = max(sum(name.startswith("column_") for name in block)
+                      for block in list_Blocks)
+    catalog = {}
+
+    for name in list(list_Blocks[0]) + ["column_" + str(column) for column in
+                                        range(columnCount)]:
+
+        if name not in catalog:
+
+            catalog[name] = numpy.concatenate([
+                block[name] if name in block else
+                numpy.full(len(block["row_Length"]), b"", dtype=bytes)
+                for block in list_Blocks])
+
+    # Time index: the row indexes sorted by day number, and the sorted day
+    # numbers (see func_Timespan_Indexes).
+    dayNumbers = func_Day_Numbers(catalog["year"], catalog["month"],
+                                  catalog["day"], catalog["year_Valid"] &
+                                  catalog["month_Valid"] & catalog["day_Valid"])
+    catalog["time_Order"] = numpy.argsort(dayNumbers, kind="stable")
+    catalog["day_Sorted"] = dayNumbers[catalog["time_Order"]]
+
+    if hazard is not None:
+
+        catalog.update(func_Bin_Index(catalog, hazard, dayNumbers))
+
+    return catalog
+
+
+def func_Catalog_Column_Text(values):
+
+    # This function converts a catalog column's bytes to a list of text
+    # values.
+
+    try:
+
+        # Convert the whole column at once (ASCII text).
+        return values.astype(str).tolist()
+
+    except UnicodeDecodeError:
+
+        # If the column has non-ASCII text, decode it as UTF-8 instead.
+        return numpy.char.decode(values, "utf-8").tolist()
+
+
+def func_Catalog_Rows(catalog, indexes):
+
+    # This function returns the rows of a catalog at the indexes, as
+    # sequences of CSV text values (the same values as a CSV reader's rows).
+
+    lengths = catalog["row_Length"][indexes]
+    width = int(lengths.max(initial=0))
+
+    # Columns of the selected rows, converted one column at a time.
+    columns = [func_Catalog_Column_Text(
+        catalog["column_" + str(column)][indexes])
+        for column in range(width)]
+
+    # If every row has the same number of columns, no row is shortened.
+    if (lengths == width).all():
+
+        return list(zip(*columns))
+
+    return [values[:length] for values, length in
+            zip(zip(*columns), lengths.tolist())]
+
+
+def func_Check_Mask(catalog, hazard):
+
+    # This function returns the boolean mask of rows that pass the lat/long
+    # range and magnitude checks of the hazard, along with the magnitudes as
+    # compared by the hazard's selections (truncated for wind and tornado).
+
+    # Magnitude and lat/long columns as typed arrays.
+    mags = catalog["mag"]
+    lats = catalog["lat"]
+    longs = catalog["long"]
+
+    # Please note: the original 0,0 coordinate check, (value != "0" or
+    # value != "0.0"), is always true, so it never removed any rows. It is
+    # intentionally not applied here so that the output remains unchanged.
+
+    # If lat/long columns are within appropriate range (blank values are NaN
+    # and fail this check)...
+    mask = (lats >= -90.0) & (lats <= 90.0) & (longs >= -180.0) & \
+        (longs <= 180.0)
+
+    # Magnitude rules for this hazard.
+    truncate, validMin, minInclusive, validMax, maxInclusive = \
+        dict_Hazard_Mag_Rules[hazard]
+
+    # Wind speeds and tornado intensities are compared as integers.
+    if truncate:
+
+        mags = numpy.trunc(mags)
+
+    # If the magnitude is within the valid range for this hazard...
+    mask &= (mags >= validMin) if minInclusive else (mags > validMin)
+    mask &= (mags <= validMax) if maxInclusive else (mags < validMax)
+
+    return mask, mags
+
+
+def func_Bin_Index(catalog, hazard, dayNumbers):
+
+    # This function returns the magnitude bin index of a catalog: the rows
+    # that pass the hazard's checks, grouped by the non-custom magnitude bin
+    # they fall within (the last group holds the rows within no bin), and
+    # sorted by day number within each group. "bin_Order" holds the row
+    # indexes in that order, "bin_Day_Sorted" their day numbers, and
+    # "bin_Offsets" where each group starts (group N is bin_Order[
+    # bin_Offsets[N]:bin_Offsets[N + 1]]). Rows that fail the checks are
+    # sorted before the first group.
+
+    mask, mags = func_Check_Mask(catalog, hazard)
+
+    # Non-custom magnitude bins of the hazard, other than "All".
+    list_Bins = [bounds for selection, bounds in
+                 dict_Hazard_Mag_Bins[hazard].items() if selection != "All"]
+
+    # Group of each row (-1 for rows that fail the checks).
+    groups = numpy.where(mask, len(list_Bins), -1)
+
+    for group, (lowerBound, upperBound) in enumerate(list_Bins):
+
+        inBin = groups == len(list_Bins)
+
+        if lowerBound is not None:
+
+            inBin &= mags >= lowerBound
+
+        if upperBound is not None:
+
+            inBin &= mags < upperBound
+
+        groups[inBin] = group
+
+    binOrder = numpy.lexsort((dayNumbers, groups))
+
+    return {"bin_Hazard": numpy.array([hazard.encode("utf-8")]),
+            "bin_Order": binOrder,
+            "bin_Day_Sorted": dayNumbers[binOrder],
+            "bin_Offsets": numpy.searchsorted(
+                groups[binOrder], numpy.arange(len(list_Bins) + 2))}
+
+
+def func_Bin_Groups(catalog, hazard, magSelection):
+
+    # This function returns the bin index groups of a non-custom magnitude
+    # selection ("All" is every group), or None if the catalog doesn't hold
+    # the hazard's bin index or the selection isn't a non-custom bin.
+
+    if "bin_Hazard" not in catalog or \
+            catalog["bin_Hazard"][0] != hazard.encode("utf-8") or \
+            magSelection not in dict_Hazard_Mag_Bins[hazard]:
+
+        return None
+
+    list_Selections = [selection for selection in
+                       dict_Hazard_Mag_Bins[hazard] if selection != "All"]
+
+    if magSelection == "All":
+
+        return range(len(list_Selections) + 1)
+
+    return [list_Selections.index(magSelection)]
+
+
+def func_Selection_Indexes(catalog, hazard, magSelection, customMagFrom=None,
+                           customMagTo=None, customTimespan=None):
+
+    # This function returns the indexes (in CSV order) of the catalog rows
+    # that pass every check of the magnitude and timespan selection. A
+    # non-custom magnitude bin is read from the catalog's bin index (each
+    # bin's rows within the timespan are one slice of the index), so only
+    # the custom magnitude range needs masks over every row.
+
+    groups = func_Bin_Groups(catalog, hazard, magSelection)
+
+    if groups is not None:
+
+        binOrder = catalog["bin_Order"]
+        binOffsets = catalog["bin_Offsets"]
+
+        # List for the rows of each group.
+        list_Indexes = []
+
+        for group in groups:
+
+            start, end = binOffsets[group], binOffsets[group + 1]
+
+            if customTimespan is None:
+
+                list_Indexes.append(binOrder[start:end])
+
+            else:
+
+                list_Indexes.append(func_Timespan_Indexes(
+                    catalog, customTimespan, binOrder[start:end],
+                    catalog["bin_Day_Sorted"][start:end]))
+
+        return numpy.sort(numpy.concatenate(list_Indexes))
+
+    mask, mags = func_Check_Mask(catalog, hazard)
+
+    # If the magnitude selection is Custom...
+    if magSelection == "Custom...":
+
+        # Custom hail diameters are floats, custom wind speeds and tornado
+        # intensities are integers.
+        convert = int if dict_Hazard_Mag_Rules[hazard][0] else float
+
+        # If the magnitude is between the custom From/To selections...
+        mask &= (mags >= convert(customMagFrom)) & \
+            (mags <= convert(customMagTo))
+
+    # If the magnitude selection is one of the non-custom bins...
+    elif magSelection in dict_Hazard_Mag_Bins[hazard]:
+
+        lowerBound, upperBound = dict_Hazard_Mag_Bins[hazard][magSelection]
+
+        if lowerBound is not None:
+
+            mask &= mags >= lowerBound
+
+        if upperBound is not None:
+
+            mask &= mags < upperBound
+
+    # Else, an unknown selection writes no rows.
+    else:
+
+        mask[:] = False
+
+    # If the timespan is Custom, the date in the CSV row must be between the
+    # FROM and TO dates.
+    if customTimespan is not None:
+
+        mask &= func_Date_Mask(catalog, customTimespan)
+
+    return numpy.flatnonzero(mask)
+
+
+def func_Selection_Count(catalog, hazard, magSelection, customMagFrom=None,
+                         customMagTo=None, customTimespan=None):
+
+    # This function returns the number of rows a magnitude and timespan
+    # selection writes (see func_Selection_Indexes), e.g. to show the
+    # expected output within the GUI before the selection is run.
+
+    return len(func_Selection_Indexes(catalog, hazard, magSelection,
+                                      customMagFrom, customMagTo,
+                                      customTimespan))
+
+
+def func_Filter_SPC_Rows(csv_Reader, csv_Writer, hazard, magSelection,
+                         customMagFrom=None, customMagTo=None,
+                         customTimespan=None):
+
+    # This function loads the remaining rows of a NOAA SPC CSV reader into a
+    # catalog of typed NumPy arrays, then checks and writes them with
+    # func_Filter_SPC_Catalog. The number of rows written is returned.
+
+    return func_Filter_SPC_Catalog(func_SPC_Catalog(csv_Reader, hazard),
+                                   csv_Writer, hazard, magSelection,
+                                   customMagFrom, customMagTo, customTimespan)
+
+
+def func_Filter_SPC_Catalog(catalog, csv_Writer, hazard, magSelection,
+                            customMagFrom=None, customMagTo=None,
+                            customTimespan=None):
+
+    # This function finds the catalog rows that pass the lat/long range,
+    # magnitude, and magnitude/timespan selection checks (see
+    # func_Selection_Indexes), and then writes them to the CSV writer in one
+    # pass. The number of rows written is returned.
+
+    # Row indexes that passed every check.
+    passedIndexes = func_Selection_Indexes(catalog, hazard, magSelection,
+                                           customMagFrom, customMagTo,
+                                           customTimespan)
+
+    # Write the surviving rows to the output CSV in one pass.
+    csv_Writer.writerows(func_Catalog_Rows(catalog, passedIndexes))
+
+    return passedIndexes.size
+
+
+def func_Filter_Quake_Rows(csv_Reader, headers):
+
+    # This function checks the rows of one USGS earthquake CSV reader and
+    # returns the list of surviving rows. A first row containing the headers
+    # is skipped. Rows are kept if the lat/long and magnitude columns are not
+    # blank, the lat/long values are within appropriate range, and the event
+    # type is an actual earthquake.
+
+    # Load all non-empty rows of the input CSV.
+    rows = [row for row in csv_Reader if row]
+
+    # If the headers exist within the first line of the CSV, skip it.
+    if rows and headers in ",".join(rows[0]).replace(" ", ""):
+
+        rows = rows[1:]
+
+    # Rows too short to have an event type can't be checked.
+    rows = [row for row in rows if len(row) > quake_Column_Type]
+
+    # Lat/long columns as typed arrays (blank values are NaN and fail the
+    # range check).
+    lats = func_Column_To_Float(rows, quake_Column_Lat)
+    longs = func_Column_To_Float(rows, quake_Column_Long)
+
+    # If lat/long columns are within appropriate range...
+    mask = (lats >= -90.0) & (lats <= 90.0) & (longs >= -180.0) & \
+        (longs <= 180.0)
+
+    return [row for row, passed in zip(rows, mask) if passed and
+            row[quake_Column_Mag] != "" and
+            row[quake_Column_Type].lower() == quake_Event_Type]
@@ -0,0 +1,274 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the GUI channel used by
+# the hazard options GUIs. The processing thread started by the OK button
+# posts its log messages and progress values to a thread-safe queue instead of
+# changing the Tk widgets itself (Tk widgets may only be changed from the
+# thread running the main loop). The main loop drains the queue a few times a
+# second with after(), showing every waiting message with one insert into the
+# scrolled text box and only the latest progress value, so thousands of
+# messages (e.g. arcpy.GetMessages) neither freeze the GUI nor slow down the
+# processing. The scrolled text box only keeps the last channel_View_MaxLines
+# lines; the full processing history is streamed to a text file as each
+# message is posted, so it stays complete (even if the application crashes)
+# without the history growing within memory. Messages posted before a run's
+# history starts are kept until it does, then written to its file first.
+
+# All import statements for utilized modules.
+import os
+import queue
+import shutil
+import threading
+import collections
+import tkinter
+
+# Milliseconds between drains of the queue (about 25 frames per second).
+channel_Frame_Milliseconds = 40
+
+# Maximum number of events shown per drain, so a flood of messages can't
+# hold up the main loop for long.
+channel_Batch_Max = 2000
+
+# Separator inserted after every log message within the scrolled text box.
+channel_Separator = "\n--------------------\n"
+
+# Maximum number of lines kept within the scrolled text box (the oldest lines
+# are removed first). This is also the maximum number of messages waiting to
+# be shown, and the number of messages kept within memory if a run's history
+# file can't be opened.
+channel_View_MaxLines = 5000
+
+
+class GUIChannel:
+
+    # This class holds the queue of log and progress events posted by any
+    # thread, and shows them within the owner's (a hazard options GUI's)
+    # scrolled text box ("scrollBox") and progress bar ("progressBar") from
+    # the main loop. Events posted before those widgets exist are kept until
+    # they do.
+
+    def __init__(self, owner, tuple_Tags):
+
+        self.owner = owner
+
+        # Text color tags used by the log messages.
+        self.tuple_Tags = tuple_Tags
+
+        # Queue of ("log", message, tag) and ("progress", value) events.
+        self.eventQueue = queue.Queue()
+
+        # Log messages taken from the queue, but not yet shown (the scrolled
+        # text box doesn't exist yet). Only the last lines the scrolled text
+        # box would keep are shown; every message is kept within the
+        # processing history.
+        self.list_Pending = collections.deque(maxlen=channel_View_MaxLines)
+
+        # Latest progress value not yet shown.
+        self.progress = None
+
+        # Scrolled text box whose color tags have been configured.
+        self.taggedScrollBox = None
+
+        # Processing history text file the log messages are streamed to,
+        # along with the messages posted while no file is open (before the
+        # history starts, or, if the file can't be opened, the last messages
+        # of the run).
+        self.historyFile = None
+        self.list_History = []
+        self.historyLock = threading.Lock()
+
+        # Final text file of the finished processing history (None while a
+        # run's history is still being streamed). Messages posted after the
+        # run finished are only shown within the scrolled text box.
+        self.finishedPath = None
+
+        self.owner.after(channel_Frame_Milliseconds, self.func_Drain)
+
+    def func_Post_Log(self, word, tag):
+
+        # This function posts a log message (with its text color tag, or
+        # None) from any thread.
+
+        with self.historyLock:
+
+            if self.historyFile is not None:
+
+                # The file is line buffered, so each message is on disk as
+                # soon as it is written.
+                self.historyFile.write(word + channel_Separator)
+
+            elif self.finishedPath is None:
+
+                self.list_History.append(word)
+
+        self.eventQueue.put(("log", word, tag))
+
+    def func_Post_Progress(self, value):
+
+        # This function posts a progress bar value from any thread.
+
+        self.eventQueue.put(("progress", value))
+
+    def func_Start_History(self, historyPath):
+
+        # This function starts a new processing history (when a new scrolled
+        # text box is created for the next run), streamed to the text file.
+        # The messages posted before it started (which the new scrolled text
+        # box shows too) are written first. If the file can't be created,
+        # only the last messages are kept.
+
+        with self.historyLock:
+
+            if self.historyFile is not None:
+
+                self.historyFile.close()
+
+            self.finishedPath = None
+
+            try:
+
+                self.historyFile = open(historyPath, "w", buffering=1)
+
+            except OSError:
+
+                self.historyFile = None
+                self.list_History = collections.deque(
+                    self.list_History, maxlen=channel_View_MaxLines)
+
+                return
+
+            self.historyFile.write("".join(word + channel_Separator
+                                           for word in self.list_History))
+            self.list_History = []
+
+    def func_Finish_History(self, historyPath):
+
+        # This function closes the processing history and moves it to its
+        # final text file. If no history file was streamed, the last messages
+        # are written instead. A second call (e.g. after an error) moves the
+        # finished history to the new path, if different, without losing it.
+        # Later messages are only shown within the scrolled text box, until
+        # the next run starts a new history.
+
+        with self.historyLock:
+
+            if self.finishedPath is not None:
+
+                finishedPath = self.finishedPath
+
+            elif self.historyFile is None:
+
+                with open(historyPath, "w") as historyFile:
+
+                    historyFile.write("".join(word + channel_Separator
+                                              for word in self.list_History))
+
+                self.list_History = []
+                finishedPath = historyPath
+
+            else:
+
+                self.historyFile.close()
+
+                finishedPath = self.historyFile.name
+                self.historyFile = None
+
+            if os.path.abspath(finishedPath) != os.path.abspath(historyPath):
+
+                shutil.move(finishedPath, historyPath)
+
+            self.finishedPath = historyPath
+
+    def func_Drain(self):
+
+        # This function runs within the main loop. It takes the waiting events
+        # from the queue, shows the log messages with one insert, shows the
+        # latest progress value, and schedules the next drain.
+
+        try:
+
+            for event in range(channel_Batch_Max):
+
+                try:
+
+                    event = self.eventQueue.get_nowait()
+
+                except queue.Empty:
+
+                    break
+
+                if event[0] == "log":
+
+                    self.list_Pending.append(event[1:])
+
+                else:
+
+                    self.progress = event[1]
+
+            self.func_Show_Logs()
+            self.func_Show_Progress()
+
+            self.owner.after(channel_Frame_Milliseconds, self.func_Drain)
+
+        except tkinter.TclError:
+
+            # The GUI has been closed, so the drains stop.
+            pass
+
+    def func_Show_Logs(self):
+
+        # This function inserts the pending log messages into the scrolled
+        # text box and scrolls to the last one.
+
+        scrollBox = getattr(self.owner, "scrollBox", None)
+
+        if scrollBox is None or not self.list_Pending:
+
+            return
+
+        # These tags set the color used for specific text (once per scrolled
+        # text box).
+        if scrollBox is not self.taggedScrollBox:
+
+            for tag in self.tuple_Tags:
+
+                scrollBox.tag_config(tag, foreground=tag)
+
+            self.taggedScrollBox = scrollBox
+
+        # Text and tag pairs of every pending message, for one insert.
+        list_Arguments = []
+
+        for word, tag in self.list_Pending:
+
+            list_Arguments.extend((word, tag, channel_Separator, ()))
+
+        self.list_Pending.clear()
+
+        scrollBox.config(state=tkinter.NORMAL)
+        scrollBox.insert(tkinter.END, *list_Arguments)
+
+        # Remove the oldest lines beyond the maximum.
+        lines = int(scrollBox.index("end-1c").split(".")[0])
+
+        if lines > channel_View_MaxLines:
+
+            scrollBox.delete("1.0", str(lines - channel_View_MaxLines + 1) +
+                             ".0")
+
+        scrollBox.see(tkinter.END)
+        scrollBox.config(state=tkinter.DISABLED)
+
+    def func_Show_Progress(self):
+
+        # This function sets the progress bar to the latest progress value.
+
+        progressBar = getattr(self.owner, "progressBar", None)
+
+        if progressBar is None or self.progress is None:
+
+            return
+
+        progressBar["value"] = self.progress
+
+        self.progress = None
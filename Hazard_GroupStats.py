@@ -0,0 +1,145 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the grouped statistics
+# (count, min, max, mean, median, and mode per state or county) written to the
+# data counts CSVs of the Hail, Wind, Tornado, Hurricane, and Earthquake
+# Options.
+
+# All import statements for utilized modules.
+import sys
+from collections import namedtuple
+import numpy
+
+# Statistics for one group of magnitude values. The mode is None if the values
+# have no unique mode.
+GroupStatistics = namedtuple("GroupStatistics", ["count", "minimum", "maximum",
+                                                 "mean", "median", "mode"])
+
+# statistics.mode raises StatisticsError when more than one value shares the
+# highest count in Python versions before 3.8. Python 3.8+ returns the first of
+# those values encountered within the data instead. func_Mode follows the same
+# rule as the running Python version, so the CSVs match the previous output.
+mode_Ties_Have_No_Mode = sys.version_info < (3, 8)
+
+
+def func_Mode(values):
+
+    # This function returns the mode of a NumPy array, or None if there is no
+    # unique mode (see mode_Ties_Have_No_Mode).
+
+    # Unique values, the index of each one's first occurrence, and how many
+    # times each one occurs.
+    uniqueValues, firstIndexes, counts = numpy.unique(values, return_index=True,
+                                                      return_counts=True)
+
+    # Unique values sharing the highest count.
+    modeIndexes = numpy.flatnonzero(counts == counts.max())
+
+    if len(modeIndexes) > 1 and mode_Ties_Have_No_Mode:
+
+        return None
+
+    # Of the values sharing the highest count, use the first one encountered.
+    return uniqueValues[modeIndexes[numpy.argmin(
+        firstIndexes[modeIndexes])]].item()
+
+
+def func_Mode_String(modeValue):
+
+    # This function formats a mode for the data counts CSV (two decimal
+    # places, or "No Unique Mode").
+
+    if modeValue is None:
+
+        return "No Unique Mode"
+
+    return str("{0:.2f}".format(float(modeValue)))
+
+
+def func_Value_Statistics(values):
+
+    # This function returns the statistics of all values within a NumPy array.
+    # Min and max are returned as Python numbers, so that they are written to
+    # the CSV the same way as values read from a Search Cursor.
+
+    return GroupStatistics(len(values), numpy.min(values).item(),
+                           numpy.max(values).item(), numpy.mean(values),
+                           numpy.median(values), func_Mode(values))
+
+
+def func_Group_Statistics(groupKeys, values):
+
+    # This function returns a dictionary of statistics for each unique group
+    # key (e.g. state FIPS code or county name), calculated in a single pass.
+    # The values are sorted by group once, keeping their original order within
+    # each group, so each group's mean and mode are identical to those
+    # calculated from a list built one row at a time.
+
+    # Dictionary for the statistics of each group.
+    dict_Group_Statistics = {}
+
+    # If there are no values, there are no groups.
+    if len(values) == 0:
+
+        return dict_Group_Statistics
+
+    # Unique group keys, and the index of each value's group key.
+    groupNames, groupIndexes = numpy.unique(groupKeys, return_inverse=True)
+
+    # Values sorted by group (stable, so the original order is kept within
+    # each group).
+    sortedValues = values[numpy.argsort(groupIndexes, kind="stable")]
+
+    # Number of values within each group, and where each group starts and
+    # ends within the sorted values.
+    counts = numpy.bincount(groupIndexes, minlength=len(groupNames))
+    ends = numpy.cumsum(counts)
+    starts = ends - counts
+
+    # Min and max of every group at once.
+    minimums = numpy.minimum.reduceat(sortedValues, starts)
+    maximums = numpy.maximum.reduceat(sortedValues, starts)
+
+    # For each group...
+    for index, groupName in enumerate(groupNames.tolist()):
+
+        groupValues = sortedValues[starts[index]:ends[index]]
+
+        dict_Group_Statistics[groupName] = GroupStatistics(
+            int(counts[index]), minimums[index].item(),
+            maximums[index].item(), numpy.mean(groupValues),
+            numpy.median(groupValues), func_Mode(groupValues))
+
+    return dict_Group_Statistics
+
+
+def func_Group_Distinct_Counts(groupKeys, labels):
+
+    # This function returns a dictionary of how many distinct labels (e.g.
+    # storm codes) occur within each unique group key.
+
+    # Dictionary for the distinct label count of each group.
+    dict_Group_Counts = {}
+
+    # If there are no labels, there are no groups.
+    if len(labels) == 0:
+
+        return dict_Group_Counts
+
+    # Unique group keys and labels, and the index of each row's key and label.
+    groupNames, groupIndexes = numpy.unique(groupKeys, return_inverse=True)
+    labelNames, labelIndexes = numpy.unique(labels, return_inverse=True)
+
+    # Each distinct group/label pair, combined into one integer.
+    pairs = numpy.unique(groupIndexes.astype(numpy.int64) * len(labelNames) +
+                         labelIndexes)
+
+    # Number of distinct pairs (labels) within each group.
+    counts = numpy.bincount(pairs // len(labelNames),
+                            minlength=len(groupNames))
+
+    for index, groupName in enumerate(groupNames.tolist()):
+
+        dict_Group_Counts[groupName] = int(counts[index])
+
+    return dict_Group_Counts
@@ -0,0 +1,403 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the native IDW engine,
+# the headless equivalent of arcpy.sa.Idw followed by ExtractByMask. A KD-tree
+# is built over the clipped points once. The output grid is split into square
+# tiles, and each tile looks up the tree's leaves that can hold its cells'
+# neighbors, then weighs those points for every cell at once. Tiles entirely
+# outside the mask are skipped, and the tiles are spread across a process
+# pool. Both of the arcpy.sa neighborhoods are supported: a variable radius
+# (the nearest points, 12 by default) and a fixed radius.
+
+# All import statements for utilized modules.
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy
+from Hazard_RasterGrid import func_Project_Points
+from Hazard_RasterGrid import func_Project_Polygons
+from Hazard_RasterGrid import func_Polygons_Grid
+from Hazard_MaskCache import func_Surface_Mask
+
+# Default power and number of nearest points (the arcpy.sa defaults).
+idw_Power = 2.0
+idw_Neighbors = 12
+
+# Most points within one leaf of the KD-tree.
+idw_Leaf_Size = 32
+
+# Number of cell rows and columns within one tile (the work given to a worker
+# process at a time), and within one block (the cells whose neighbors are
+# searched for together).
+idw_Tile_Cells = 64
+idw_Block_Cells = 8
+
+# Maximum number of cell/point pairs held in memory at once within a tile.
+idw_Chunk_Elements = 4000000
+
+# Smallest number of tiles worth a process pool (below this, the tiles run
+# within the calling process).
+idw_Pool_MinTiles = 16
+
+# KD-tree over the points, stored as its leaves. The points are reordered so
+# each leaf's points are together: leaf i holds points leafStarts[i] to
+# leafStarts[i + 1], within the bounding box leafBoxes[i] (xmin, ymin, xmax,
+# ymax).
+KDTree = namedtuple("KDTree", ["x", "y", "values", "leafStarts", "leafBoxes"])
+
+# Data shared with each worker process (see func_Init_Worker).
+dict_Worker_Data = {}
+
+
+def func_Build_KDTree(x, y, values, leafSize=None):
+
+    # This function builds the KD-tree of points: the points are split at the
+    # median of their wider side, again and again, until each part has no
+    # more than leafSize points.
+
+    if leafSize is None:
+
+        leafSize = idw_Leaf_Size
+
+    x = numpy.asarray(x, dtype=numpy.float64)
+    y = numpy.asarray(y, dtype=numpy.float64)
+    values = numpy.asarray(values, dtype=numpy.float64)
+
+    # Lists for the leaves' point indexes, and the parts still to split.
+    list_Leaves = []
+    list_Parts = [numpy.arange(len(x))]
+
+    while list_Parts:
+
+        indexes = list_Parts.pop()
+
+        if len(indexes) <= leafSize:
+
+            list_Leaves.append(indexes)
+
+            continue
+
+        partX = x[indexes]
+        partY = y[indexes]
+
+        if partX.max() - partX.min() >= partY.max() - partY.min():
+
+            keys = partX
+
+        else:
+
+            keys = partY
+
+        half = len(indexes) // 2
+        order = numpy.argpartition(keys, half)
+
+        # The first half is split last, so the leaves stay in tree order.
+        list_Parts.append(indexes[order[half:]])
+        list_Parts.append(indexes[order[:half]])
+
+    order = numpy.concatenate(list_Leaves) if list_Leaves else \
+        numpy.zeros(0, dtype=numpy.int64)
+
+    leafStarts = numpy.zeros(len(list_Leaves) + 1, dtype=numpy.int64)
+    leafStarts[1:] = numpy.cumsum([len(leaf) for leaf in list_Leaves])
+
+    leafBoxes = numpy.array([(x[leaf].min(), y[leaf].min(), x[leaf].max(),
+                              y[leaf].max()) for leaf in list_Leaves],
+                            dtype=numpy.float64).reshape(-1, 4)
+
+    return KDTree(x[order], y[order], values[order], leafStarts, leafBoxes)
+
+
+def func_Box_Distances(tree, leaves, xmin, ymin, xmax, ymax):
+
+    # This function returns the smallest distance between any point within a
+    # rectangle and any point within each leaf's box.
+
+    boxes = tree.leafBoxes[leaves]
+
+    return numpy.hypot(
+        numpy.maximum(0.0, numpy.maximum(boxes[:, 0] - xmax,
+                                         xmin - boxes[:, 2])),
+        numpy.maximum(0.0, numpy.maximum(boxes[:, 1] - ymax,
+                                         ymin - boxes[:, 3])))
+
+
+def func_Leaf_Points(tree, leaves):
+
+    # This function returns the point indexes of a list of leaves.
+
+    starts = tree.leafStarts[leaves]
+    counts = tree.leafStarts[leaves + 1] - starts
+
+    return numpy.repeat(starts, counts) + numpy.arange(counts.sum()) - \
+        numpy.repeat(numpy.cumsum(counts) - counts, counts)
+
+
+def func_Candidate_Leaves(tree, leaves, xmin, ymin, xmax, ymax, neighbors,
+                          radius):
+
+    # This function returns the leaves (of the given leaves) that can hold
+    # neighbors of any cell within a rectangle of cell centers. For a fixed
+    # radius, those are the leaves within the radius. For the nearest points,
+    # the nearest leaves holding enough points are gathered; every cell's
+    # neighbors are no farther than those points' neighbors-th distance from
+    # the rectangle's center, plus the distance from the center to the
+    # rectangle's corner. The leaves within that distance are returned.
+
+    distances = func_Box_Distances(tree, leaves, xmin, ymin, xmax, ymax)
+
+    if radius is None:
+
+        order = numpy.argsort(distances, kind="stable")
+        counts = numpy.cumsum(numpy.diff(tree.leafStarts)[leaves[order]])
+        enough = int(numpy.searchsorted(counts, neighbors)) + 1
+
+        # If the leaves hold too few points, every point is a neighbor.
+        if enough > len(order):
+
+            return leaves
+
+        points = func_Leaf_Points(tree, leaves[order[:enough]])
+        centerX = (xmin + xmax) / 2.0
+        centerY = (ymin + ymax) / 2.0
+        pointDistances = numpy.hypot(tree.x[points] - centerX,
+                                     tree.y[points] - centerY)
+
+        radius = numpy.partition(pointDistances, neighbors - 1)[
+            neighbors - 1] + numpy.hypot(xmax - centerX, ymax - centerY)
+
+    return leaves[distances <= radius]
+
+
+def func_IDW_Cells(tree, leaves, cellX, cellY, power, neighbors, radius):
+
+    # This function returns the IDW value of each cell center, from the
+    # points of the given leaves (see func_Candidate_Leaves). Each cell is
+    # weighed from its nearest points (or every point within the radius), by
+    # 1 / distance ^ power. A cell on top of a point takes the point's value
+    # (the mean, if several points share it). Cells without any points within
+    # a fixed radius are NaN.
+
+    candidates = func_Leaf_Points(tree, leaves)
+
+    output = numpy.full(len(cellX), numpy.nan)
+
+    if len(candidates) == 0:
+
+        return output
+
+    pointX = tree.x[candidates]
+    pointY = tree.y[candidates]
+    pointValues = tree.values[candidates]
+
+    chunkSize = max(1, idw_Chunk_Elements // len(candidates))
+
+    for start in range(0, len(cellX), chunkSize):
+
+        distanceSquared = \
+            (cellX[start:start + chunkSize, None] - pointX) ** 2 + \
+            (cellY[start:start + chunkSize, None] - pointY) ** 2
+
+        values = numpy.broadcast_to(pointValues, distanceSquared.shape)
+
+        if radius is None and len(candidates) > neighbors:
+
+            # Keep each cell's nearest points only.
+            nearest = numpy.argpartition(distanceSquared, neighbors - 1,
+                                         axis=1)[:, :neighbors]
+            distanceSquared = numpy.take_along_axis(distanceSquared, nearest,
+                                                    axis=1)
+            values = pointValues[nearest]
+
+        with numpy.errstate(divide="ignore"):
+
+            weights = distanceSquared ** (-power / 2.0)
+
+        if radius is not None:
+
+            weights[distanceSquared > radius * radius] = 0.0
+
+        # Cells on top of a point use the point(s) only.
+        exact = distanceSquared == 0.0
+        exactCells = exact.any(axis=1)
+        weights[exactCells] = exact[exactCells]
+
+        with numpy.errstate(invalid="ignore"):
+
+            output[start:start + chunkSize] = \
+                (weights * values).sum(axis=1) / weights.sum(axis=1)
+
+    return output
+
+
+def func_Grid_Tiles(grid, mask, tileCells=None):
+
+    # This function returns the (row start, row end, column start, column
+    # end) of every tile with at least one cell inside the mask.
+
+    if tileCells is None:
+
+        tileCells = idw_Tile_Cells
+
+    # List for the tiles.
+    list_Tiles = []
+
+    for rowStart in range(0, grid.rows, tileCells):
+
+        for columnStart in range(0, grid.columns, tileCells):
+
+            tile = (rowStart, min(rowStart + tileCells, grid.rows),
+                    columnStart, min(columnStart + tileCells, grid.columns))
+
+            if mask is None or mask[tile[0]:tile[1], tile[2]:tile[3]].any():
+
+                list_Tiles.append(tile)
+
+    return list_Tiles
+
+
+def func_Init_Worker(workerData):
+
+    # This function is the process pool's initializer. It keeps the tree and
+    # settings within the worker for all of its tiles.
+
+    dict_Worker_Data.clear()
+    dict_Worker_Data.update(workerData)
+
+
+def func_IDW_Tile(tile):
+
+    # This function returns a tile and the IDW values (rows, columns) of its
+    # cells (NaN outside the mask).
+
+    grid = dict_Worker_Data["grid"]
+    mask = dict_Worker_Data["mask"]
+    rowStart, rowEnd, columnStart, columnEnd = tile
+
+    columns, rows = numpy.meshgrid(numpy.arange(columnStart, columnEnd),
+                                   numpy.arange(rowStart, rowEnd))
+
+    if mask is None:
+
+        inside = numpy.ones(rows.shape, dtype=bool)
+
+    else:
+
+        inside = mask[rowStart:rowEnd, columnStart:columnEnd]
+
+    cellX = grid.originX + (columns[inside] + 0.5) * grid.cellSize
+    cellY = grid.originY - (rows[inside] + 0.5) * grid.cellSize
+
+    tree = dict_Worker_Data["tree"]
+    neighbors = dict_Worker_Data["neighbors"]
+    radius = dict_Worker_Data["radius"]
+
+    # Leaves that can hold neighbors of the tile's cells.
+    tileLeaves = func_Candidate_Leaves(
+        tree, numpy.arange(len(tree.leafBoxes)), cellX.min(), cellY.min(),
+        cellX.max(), cellY.max(), neighbors, radius)
+
+    # Block of every cell inside the mask, within the tile.
+    blocks = (rows[inside] - rowStart) // idw_Block_Cells * \
+        idw_Tile_Cells + (columns[inside] - columnStart) // idw_Block_Cells
+    order = numpy.argsort(blocks, kind="stable")
+    boundaries = numpy.flatnonzero(numpy.diff(blocks[order])) + 1
+
+    tileValues = numpy.empty(len(cellX))
+
+    for cells in numpy.split(order, boundaries):
+
+        blockX = cellX[cells]
+        blockY = cellY[cells]
+
+        tileValues[cells] = func_IDW_Cells(
+            tree, func_Candidate_Leaves(tree, tileLeaves, blockX.min(),
+                                        blockY.min(), blockX.max(),
+                                        blockY.max(), neighbors, radius),
+            blockX, blockY, dict_Worker_Data["power"], neighbors, radius)
+
+    values = numpy.full(rows.shape, numpy.nan)
+    values[inside] = tileValues
+
+    return tile, values
+
+
+def func_IDW(x, y, values, grid, mask=None, power=None, neighbors=None,
+             radius=None, workers=None):
+
+    # This function returns the IDW surface (rows, columns) of projected
+    # points. By default, the 12 nearest points are weighed with power 2; if
+    # a radius is given, every point within it is weighed instead. Cells
+    # outside the mask (if given) are NaN. The tiles run across a process pool
+    # of the given number of workers (default: one per CPU).
+
+    x = numpy.asarray(x, dtype=numpy.float64)
+    y = numpy.asarray(y, dtype=numpy.float64)
+    values = numpy.asarray(values, dtype=numpy.float64)
+
+    # Points with blank coordinates or values are left out.
+    keep = numpy.isfinite(x) & numpy.isfinite(y) & numpy.isfinite(values)
+
+    if power is None:
+
+        power = idw_Power
+
+    if neighbors is None:
+
+        neighbors = idw_Neighbors
+
+    if workers is None:
+
+        workers = os.cpu_count() or 1
+
+    surface = numpy.full((grid.rows, grid.columns), numpy.nan)
+
+    if not keep.any():
+
+        return surface
+
+    workerData = {"tree": func_Build_KDTree(x[keep], y[keep], values[keep]),
+                  "grid": grid, "mask": mask, "power": float(power),
+                  "neighbors": max(1, int(neighbors)), "radius": radius}
+
+    list_Tiles = func_Grid_Tiles(grid, mask)
+
+    if workers > 1 and len(list_Tiles) >= idw_Pool_MinTiles:
+
+        with ProcessPoolExecutor(workers, initializer=func_Init_Worker,
+                                 initargs=(workerData,)) as pool:
+
+            results = list(pool.map(func_IDW_Tile, list_Tiles,
+                                    chunksize=max(1, len(list_Tiles) //
+                                                  (workers * 4))))
+
+    else:
+
+        func_Init_Worker(workerData)
+        results = [func_IDW_Tile(tile) for tile in list_Tiles]
+
+    for (rowStart, rowEnd, columnStart, columnEnd), tileValues in results:
+
+        surface[rowStart:rowEnd, columnStart:columnEnd] = tileValues
+
+    return surface
+
+
+def func_IDW_Surface(longitudes, latitudes, values, polygons, cellSize=None,
+                     power=None, neighbors=None, radius=None, workers=None,
+                     mask=None):
+
+    # This function returns the (grid, surface) of the IDW of point values
+    # (longitude/latitude) over the extent of the clip polygons, with cells
+    # outside the polygons set to NaN (NoData). If no cell size is given,
+    # the ArcGIS default is used. The polygons' mask can be given (see
+    # func_Surface_Mask), if already built.
+
+    polygons = func_Project_Polygons(polygons)
+    grid = func_Polygons_Grid(polygons, cellSize)
+
+    x, y = func_Project_Points(longitudes, latitudes)
+
+    return grid, func_IDW(x, y, values, grid,
+                          func_Surface_Mask(polygons, grid, mask).inside, power,
+                          neighbors, radius, workers)
@@ -0,0 +1,292 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the native kernel
+# density engine, the headless equivalent of arcpy.sa.KernelDensity followed
+# by ExtractByMask. The same quartic kernel, default search radius, default
+# cell size, and density units (per square kilometer) as ArcGIS are used.
+# Small point counts are summed exactly, point by point; large point counts
+# are binned onto the grid and convolved with the kernel by FFT, one band of
+# rows at a time, so the time depends on the grid size rather than the number
+# of points.
+
+# All import statements for utilized modules.
+import numpy
+from Hazard_RasterGrid import func_Project_Points
+from Hazard_RasterGrid import func_Project_Polygons
+from Hazard_RasterGrid import func_Polygons_Grid
+from Hazard_MaskCache import func_Surface_Mask
+from Hazard_MaskCache import func_Apply_Mask
+
+# Square meters per square kilometer (the ArcGIS default area units for a
+# coordinate system in meters).
+kde_Area_Scale = 1000000.0
+
+# Largest number of point/cell pairs summed exactly. Above this, the points
+# are binned and convolved by FFT instead.
+kde_Exact_MaxPairs = 20000000
+
+# Maximum number of point/cell pairs held in memory at once while summing
+# exactly.
+kde_Chunk_Elements = 4000000
+
+# Number of grid rows convolved at once by FFT (each band is convolved, then
+# added to the surface with its overlap).
+kde_Band_Rows = 512
+
+
+def func_Default_Search_Radius(x, y, weights=None):
+
+    # This function returns the ArcGIS default search radius of projected
+    # points: 0.9 * min(standard distance, sqrt(1 / ln(2)) * median distance
+    # from the mean center) * n ^ -0.2, where n is the number of points (or
+    # sum of the weights).
+
+    x = numpy.asarray(x, dtype=numpy.float64)
+    y = numpy.asarray(y, dtype=numpy.float64)
+
+    if weights is None:
+
+        weights = numpy.ones(len(x))
+
+    count = float(weights.sum())
+
+    centerX = numpy.average(x, weights=weights)
+    centerY = numpy.average(y, weights=weights)
+    distances = numpy.hypot(x - centerX, y - centerY)
+
+    standardDistance = numpy.sqrt(numpy.average(distances ** 2,
+                                                weights=weights))
+    medianDistance = float(numpy.median(distances))
+
+    radius = 0.9 * min(standardDistance, numpy.sqrt(1.0 / numpy.log(2.0)) *
+                       medianDistance) * count ** -0.2
+
+    # All points at the same place: any radius gives the same surface shape.
+    if radius <= 0:
+
+        radius = 1.0
+
+    return float(radius)
+
+
+def func_Quartic_Kernel(distanceSquared, radius):
+
+    # This function returns the quartic kernel (Silverman) value per square
+    # meter of squared distances: 3 / (pi * r^2) * (1 - (d / r)^2)^2 within
+    # the radius, zero outside it.
+
+    ratio = numpy.clip(1.0 - distanceSquared / (radius * radius), 0.0, None)
+
+    return 3.0 / (numpy.pi * radius * radius) * ratio * ratio
+
+
+def func_Kernel_Offsets(grid, radius):
+
+    # This function returns the number of cells k covered by the radius, and
+    # the (2k + 1, 2k + 1) kernel values of each cell offset from a cell
+    # center.
+
+    reach = int(numpy.ceil(radius / grid.cellSize))
+    offsets = numpy.arange(-reach, reach + 1) * grid.cellSize
+
+    return reach, func_Quartic_Kernel(offsets[:, None] ** 2 +
+                                      offsets[None, :] ** 2, radius)
+
+
+def func_Density_Exact(x, y, weights, grid, radius):
+
+    # This function returns the density surface (per square meter) summed
+    # exactly: every point adds its kernel value at the exact distance to
+    # each cell center within the radius.
+
+    reach = int(numpy.ceil(radius / grid.cellSize))
+
+    # Row/column offsets of the cells that can be within the radius.
+    offsetRows, offsetColumns = numpy.meshgrid(
+        numpy.arange(-reach - 1, reach + 2), numpy.arange(-reach - 1,
+                                                          reach + 2),
+        indexing="ij")
+    offsetRows = offsetRows.ravel()
+    offsetColumns = offsetColumns.ravel()
+    keep = (numpy.maximum(numpy.abs(offsetRows), 1) - 1) ** 2 + \
+        (numpy.maximum(numpy.abs(offsetColumns), 1) - 1) ** 2 <= \
+        (radius / grid.cellSize) ** 2
+    offsetRows = offsetRows[keep]
+    offsetColumns = offsetColumns[keep]
+
+    density = numpy.zeros(grid.rows * grid.columns)
+
+    # Cell of every point.
+    pointRows = numpy.floor((grid.originY - y) /
+                            grid.cellSize).astype(numpy.int64)
+    pointColumns = numpy.floor((x - grid.originX) /
+                               grid.cellSize).astype(numpy.int64)
+
+    chunkSize = max(1, kde_Chunk_Elements // len(offsetRows))
+
+    for start in range(0, len(x), chunkSize):
+
+        rows = pointRows[start:start + chunkSize, None] + offsetRows
+        columns = pointColumns[start:start + chunkSize, None] + offsetColumns
+
+        inside = (rows >= 0) & (rows < grid.rows) & (columns >= 0) & \
+            (columns < grid.columns)
+
+        distanceSquared = \
+            (grid.originX + (columns + 0.5) * grid.cellSize -
+             x[start:start + chunkSize, None]) ** 2 + \
+            (grid.originY - (rows + 0.5) * grid.cellSize -
+             y[start:start + chunkSize, None]) ** 2
+
+        values = func_Quartic_Kernel(distanceSquared, radius) * \
+            weights[start:start + chunkSize, None]
+
+        density += numpy.bincount((rows * grid.columns + columns)[inside],
+                                  values[inside],
+                                  minlength=grid.rows * grid.columns)
+
+    return density.reshape(grid.rows, grid.columns)
+
+
+def func_Bin_Points(x, y, weights, grid, reach):
+
+    # This function returns the points' weights linearly binned onto the cell
+    # centers of the grid padded by reach cells on every side (each point's
+    # weight is split between its four nearest cell centers).
+
+    rows = grid.rows + 2 * reach
+    columns = grid.columns + 2 * reach
+
+    # Fractional row/column of every point, from the first padded cell
+    # center.
+    fractionColumns = (x - grid.originX) / grid.cellSize + reach - 0.5
+    fractionRows = (grid.originY - y) / grid.cellSize + reach - 0.5
+
+    firstColumns = numpy.floor(fractionColumns).astype(numpy.int64)
+    firstRows = numpy.floor(fractionRows).astype(numpy.int64)
+    shareColumns = fractionColumns - firstColumns
+    shareRows = fractionRows - firstRows
+
+    bins = numpy.zeros(rows * columns)
+
+    for addRow, rowShare in ((0, 1.0 - shareRows), (1, shareRows)):
+
+        for addColumn, columnShare in ((0, 1.0 - shareColumns),
+                                       (1, shareColumns)):
+
+            binRows = firstRows + addRow
+            binColumns = firstColumns + addColumn
+
+            inside = (binRows >= 0) & (binRows < rows) & \
+                (binColumns >= 0) & (binColumns < columns)
+
+            bins += numpy.bincount(
+                (binRows * columns + binColumns)[inside],
+                (weights * rowShare * columnShare)[inside],
+                minlength=rows * columns)
+
+    return bins.reshape(rows, columns)
+
+
+def func_Density_FFT(x, y, weights, grid, radius):
+
+    # This function returns the density surface (per square meter) of the
+    # binned points convolved with the kernel. The padded bins are convolved
+    # one band of rows at a time (overlap-add), so memory stays bounded for
+    # large grids.
+
+    reach, kernel = func_Kernel_Offsets(grid, radius)
+    bins = func_Bin_Points(x, y, weights, grid, reach)
+
+    # Surface of the padded grid, plus the kernel's reach on every side.
+    convolved = numpy.zeros((bins.shape[0] + 2 * reach,
+                             bins.shape[1] + 2 * reach))
+
+    # FFT size of one band (padded to avoid wrap-around).
+    shape = (kde_Band_Rows + 2 * reach, bins.shape[1] + 2 * reach)
+    kernelFFT = numpy.fft.rfft2(kernel, shape)
+
+    for start in range(0, bins.shape[0], kde_Band_Rows):
+
+        band = bins[start:start + kde_Band_Rows]
+
+        if not band.any():
+
+            continue
+
+        bandConvolved = numpy.fft.irfft2(numpy.fft.rfft2(band, shape) *
+                                         kernelFFT, shape)
+
+        convolved[start:start + len(band) + 2 * reach] += \
+            bandConvolved[:len(band) + 2 * reach]
+
+    # The grid's cells start 2 * reach rows/columns into the surface (the
+    # padding plus the kernel's reach). Round-off below zero is removed.
+    return numpy.maximum(convolved[2 * reach:2 * reach + grid.rows,
+                                   2 * reach:2 * reach + grid.columns], 0.0)
+
+
+def func_Kernel_Density(x, y, grid, radius=None, weights=None, method=None):
+
+    # This function returns the density surface (rows, columns) of projected
+    # points, per square kilometer. Method is "exact", "fft", or None to
+    # choose by the number of point/cell pairs. If no radius is given, the
+    # ArcGIS default search radius is used.
+
+    x = numpy.asarray(x, dtype=numpy.float64)
+    y = numpy.asarray(y, dtype=numpy.float64)
+
+    # Points with blank coordinates are left out.
+    keep = numpy.isfinite(x) & numpy.isfinite(y)
+
+    if weights is None:
+
+        weights = numpy.ones(len(x))
+
+    x = x[keep]
+    y = y[keep]
+    weights = numpy.asarray(weights, dtype=numpy.float64)[keep]
+
+    if len(x) == 0:
+
+        return numpy.zeros((grid.rows, grid.columns))
+
+    if radius is None:
+
+        radius = func_Default_Search_Radius(x, y, weights)
+
+    if method is None:
+
+        pairs = len(x) * numpy.pi * (radius / grid.cellSize + 1) ** 2
+        method = "exact" if pairs <= kde_Exact_MaxPairs else "fft"
+
+    if method == "exact":
+
+        density = func_Density_Exact(x, y, weights, grid, radius)
+
+    else:
+
+        density = func_Density_FFT(x, y, weights, grid, radius)
+
+    return density * kde_Area_Scale
+
+
+def func_Kernel_Density_Surface(longitudes, latitudes, polygons, cellSize=None,
+                                radius=None, weights=None, method=None,
+                                mask=None):
+
+    # This function returns the (grid, surface) of the kernel density of
+    # points (longitude/latitude) over the extent of the clip polygons (see
+    # func_Load_County_Polygons), with cells outside the polygons set to NaN
+    # (NoData). If no cell size is given, the ArcGIS default is used. The
+    # polygons' mask can be given (see func_Surface_Mask), if already built.
+
+    polygons = func_Project_Polygons(polygons)
+    grid = func_Polygons_Grid(polygons, cellSize)
+
+    x, y = func_Project_Points(longitudes, latitudes)
+
+    surface = func_Kernel_Density(x, y, grid, radius, weights, method)
+
+    return grid, func_Apply_Mask(surface, func_Surface_Mask(polygons, grid,
+                                                           mask))
@@ -0,0 +1,493 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the native ordinary
+# kriging engine, the headless equivalent of arcpy.sa.Kriging followed by
+# ExtractByMask. The empirical semivariogram is computed once per dataset on
+# a random subsample of the points and fitted with a variogram model. Each
+# cell is then kriged from its nearest points (12 by default, the same as the
+# arcpy.sa default), found with the IDW engine's KD-tree, one block of cells
+# at a time. Neighboring cells often share the same nearest points, so each
+# set of nearest points' kriging system is solved once and the solution kept,
+# then reused by every cell (and later block) with the same set. Both the
+# prediction and the prediction variance rasters are returned.
+
+# All import statements for utilized modules.
+import os
+from collections import namedtuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy
+from Hazard_RasterGrid import func_Project_Points
+from Hazard_RasterGrid import func_Project_Polygons
+from Hazard_RasterGrid import func_Polygons_Grid
+from Hazard_MaskCache import func_Surface_Mask
+from Hazard_IDWEngine import idw_Block_Cells
+from Hazard_IDWEngine import idw_Tile_Cells
+from Hazard_IDWEngine import idw_Pool_MinTiles
+from Hazard_IDWEngine import func_Build_KDTree
+from Hazard_IDWEngine import func_Candidate_Leaves
+from Hazard_IDWEngine import func_Leaf_Points
+from Hazard_IDWEngine import func_Grid_Tiles
+
+# Default variogram model and number of nearest points (the arcpy.sa
+# defaults: spherical, variable search radius of 12 points).
+krig_Model = "spherical"
+krig_Neighbors = 12
+
+# Most points used for the empirical semivariogram (a random subsample of
+# larger datasets), and the number of lags it is split into.
+krig_Sample_Points = 2000
+krig_Lags = 12
+
+# Number of ranges tried while fitting the variogram model.
+krig_Fit_Ranges = 60
+
+# Most kriging system solutions kept within each process (the least recently
+# used are dropped first).
+krig_Cache_Solutions = 20000
+
+# Variogram model fitted to the empirical semivariogram: model name, nugget,
+# partial sill, and range (meters).
+Variogram = namedtuple("Variogram", ["model", "nugget", "partialSill",
+                                     "range"])
+
+# Data shared with each worker process (see func_Init_Worker).
+dict_Worker_Data = {}
+
+
+def func_Model_Shape(model, distances, modelRange):
+
+    # This function returns the shape (0 to 1) of a variogram model at each
+    # distance: spherical, exponential, or gaussian.
+
+    ratio = numpy.asarray(distances, dtype=numpy.float64) / modelRange
+
+    if model == "spherical":
+
+        return numpy.where(ratio < 1.0, 1.5 * ratio - 0.5 * ratio ** 3, 1.0)
+
+    if model == "exponential":
+
+        return 1.0 - numpy.exp(-3.0 * ratio)
+
+    if model == "gaussian":
+
+        return 1.0 - numpy.exp(-3.0 * ratio * ratio)
+
+    raise ValueError("Unknown variogram model: " + str(model) + " (choices: "
+                     "spherical, exponential, gaussian).")
+
+
+def func_Semivariance(variogram, distances):
+
+    # This function returns the variogram's semivariance at each distance
+    # (zero at distance zero).
+
+    distances = numpy.asarray(distances, dtype=numpy.float64)
+
+    return numpy.where(distances > 0.0, variogram.nugget +
+                       variogram.partialSill *
+                       func_Model_Shape(variogram.model, distances,
+                                        variogram.range), 0.0)
+
+
+def func_Empirical_Semivariogram(x, y, values, samplePoints=None, lags=None,
+                                 seed=6389):
+
+    # This function returns the (lag distances, semivariances, pair counts)
+    # of the empirical semivariogram, from a random subsample of the points.
+    # The lags are equal parts of half the subsample's largest extent.
+
+    if samplePoints is None:
+
+        samplePoints = krig_Sample_Points
+
+    if lags is None:
+
+        lags = krig_Lags
+
+    if len(x) > samplePoints:
+
+        sample = numpy.random.default_rng(seed).choice(len(x), samplePoints,
+                                                       replace=False)
+        x = x[sample]
+        y = y[sample]
+        values = values[sample]
+
+    # Every pair of sampled points (each pair once).
+    first, second = numpy.triu_indices(len(x), 1)
+    distances = numpy.hypot(x[first] - x[second], y[first] - y[second])
+    halfSquares = 0.5 * (values[first] - values[second]) ** 2
+
+    maxDistance = 0.5 * max(x.max() - x.min(), y.max() - y.min())
+
+    if maxDistance <= 0:
+
+        maxDistance = 1.0
+
+    lagIndexes = numpy.floor(distances / maxDistance * lags).astype(
+        numpy.int64)
+    keep = lagIndexes < lags
+
+    counts = numpy.bincount(lagIndexes[keep], minlength=lags)
+    lagDistances = numpy.bincount(lagIndexes[keep], distances[keep],
+                                  minlength=lags)
+    semivariances = numpy.bincount(lagIndexes[keep], halfSquares[keep],
+                                   minlength=lags)
+
+    with numpy.errstate(invalid="ignore"):
+
+        lagDistances /= counts
+        semivariances /= counts
+
+    filled = counts > 0
+
+    return lagDistances[filled], semivariances[filled], counts[filled]
+
+
+def func_Fit_Variogram(lagDistances, semivariances, counts, model=None):
+
+    # This function fits a variogram model to the empirical semivariogram by
+    # weighted least squares (weighted by each lag's pair count). For each
+    # range tried, the nugget and partial sill follow from a linear fit (both
+    # kept at or above zero); the range with the least error is kept.
+
+    if model is None:
+
+        model = krig_Model
+
+    # If the values don't vary, any variogram gives the same prediction.
+    if len(lagDistances) == 0 or not (semivariances > 0).any():
+
+        return Variogram(model, 0.0, 1.0, max(float(lagDistances.max())
+                                              if len(lagDistances) else 1.0,
+                                              1.0))
+
+    weights = counts.astype(numpy.float64)
+    best = None
+
+    for modelRange in numpy.linspace(lagDistances.max() / krig_Fit_Ranges,
+                                     lagDistances.max() * 1.5,
+                                     krig_Fit_Ranges):
+
+        shape = func_Model_Shape(model, lagDistances, modelRange)
+
+        # Weighted least squares of semivariance = nugget + partialSill *
+        # shape.
+        design = numpy.stack([numpy.ones(len(shape)), shape], axis=1)
+        root = numpy.sqrt(weights)
+        nugget, partialSill = numpy.linalg.lstsq(
+            design * root[:, None], semivariances * root, rcond=None)[0]
+
+        if partialSill < 0:
+
+            nugget = numpy.average(semivariances, weights=weights)
+            partialSill = 0.0
+
+        elif nugget < 0:
+
+            nugget = 0.0
+            partialSill = (weights * shape * semivariances).sum() / \
+                max((weights * shape * shape).sum(), 1e-300)
+
+        error = (weights * (nugget + partialSill * shape -
+                            semivariances) ** 2).sum()
+
+        if best is None or error < best[0]:
+
+            best = (error, Variogram(model, float(nugget), float(partialSill),
+                                     float(modelRange)))
+
+    variogram = best[1]
+
+    # A pure nugget (no spatial pattern) still needs a solvable system.
+    if variogram.partialSill <= 0:
+
+        variogram = variogram._replace(partialSill=max(variogram.nugget,
+                                                       1.0) * 1e-6)
+
+    return variogram
+
+
+def func_Merge_Coincident(x, y, values):
+
+    # This function merges points at the same location into one point with
+    # their mean value (coincident points would make the kriging systems
+    # unsolvable).
+
+    locations, inverse = numpy.unique(numpy.stack([x, y], axis=1), axis=0,
+                                      return_inverse=True)
+    inverse = inverse.ravel()
+
+    return locations[:, 0], locations[:, 1], \
+        numpy.bincount(inverse, values) / numpy.bincount(inverse)
+
+
+def func_Nearest_Points(tree, leaves, cellX, cellY, neighbors):
+
+    # This function returns the tree point indexes (cells, neighbors) of each
+    # cell's nearest points, from the points of the given leaves.
+
+    candidates = func_Leaf_Points(tree, leaves)
+
+    distanceSquared = (cellX[:, None] - tree.x[candidates]) ** 2 + \
+        (cellY[:, None] - tree.y[candidates]) ** 2
+
+    nearest = numpy.argpartition(distanceSquared, neighbors - 1,
+                                 axis=1)[:, :neighbors]
+
+    return candidates[nearest]
+
+
+def func_System_Solutions(tree, variogram, dict_Cache, uniqueSets):
+
+    # This function returns the inverse of the ordinary kriging matrix of
+    # each set of nearest points (sets, neighbors + 1, neighbors + 1):
+    # [semivariances between the points, 1; 1, 0]. Each set's inverse is
+    # computed once and kept within the cache (least recently used dropped
+    # first), so every cell with the same set only needs a matrix product.
+
+    sets, neighbors = uniqueSets.shape
+    solutions = numpy.empty((sets, neighbors + 1, neighbors + 1))
+
+    # Sets not within the cache.
+    list_Missing = []
+
+    for index in range(sets):
+
+        key = uniqueSets[index].tobytes()
+        solution = dict_Cache.get(key)
+
+        if solution is None:
+
+            list_Missing.append(index)
+
+        else:
+
+            dict_Cache.move_to_end(key)
+            solutions[index] = solution
+
+    if list_Missing:
+
+        missing = uniqueSets[list_Missing]
+        pointX = tree.x[missing]
+        pointY = tree.y[missing]
+
+        matrices = numpy.ones((len(missing), neighbors + 1, neighbors + 1))
+        matrices[:, :neighbors, :neighbors] = func_Semivariance(
+            variogram, numpy.hypot(pointX[:, :, None] - pointX[:, None, :],
+                                   pointY[:, :, None] - pointY[:, None, :]))
+        matrices[:, neighbors, neighbors] = 0.0
+
+        try:
+
+            inverses = numpy.linalg.inv(matrices)
+
+        except numpy.linalg.LinAlgError:
+
+            # A degenerate set (e.g. points on a line with a Gaussian model)
+            # uses the pseudo-inverse instead.
+            inverses = numpy.linalg.pinv(matrices)
+
+        for index, inverse in zip(list_Missing, inverses):
+
+            solutions[index] = inverse
+            dict_Cache[uniqueSets[index].tobytes()] = inverse
+
+        while len(dict_Cache) > krig_Cache_Solutions:
+
+            dict_Cache.popitem(last=False)
+
+    return solutions
+
+
+def func_Krige_Cells(tree, variogram, dict_Cache, nearest, cellX, cellY):
+
+    # This function returns the ordinary kriging prediction and variance of
+    # each cell center from its nearest points. The weights and Lagrange
+    # multiplier are the set's inverse matrix times [semivariances from the
+    # cell to each point, 1]; the variance is the weights times those
+    # semivariances, plus the multiplier.
+
+    sets = numpy.sort(nearest, axis=1)
+    uniqueSets, setIndexes = numpy.unique(sets, axis=0, return_inverse=True)
+
+    solutions = func_System_Solutions(tree, variogram, dict_Cache,
+                                      uniqueSets)
+
+    semivariances = func_Semivariance(variogram, numpy.hypot(
+        cellX[:, None] - tree.x[sets], cellY[:, None] - tree.y[sets]))
+    rightSides = numpy.concatenate([semivariances,
+                                    numpy.ones((len(cellX), 1))], axis=1)
+
+    weights = numpy.einsum("cij,cj->ci", solutions[setIndexes.ravel()],
+                           rightSides)
+
+    prediction = (weights[:, :-1] * tree.values[sets]).sum(axis=1)
+    variance = (weights * rightSides).sum(axis=1)
+
+    # Round-off below zero is removed from the variance.
+    return prediction, numpy.maximum(variance, 0.0)
+
+
+def func_Init_Worker(workerData):
+
+    # This function is the process pool's initializer. It keeps the tree,
+    # variogram, and settings within the worker for all of its tiles, along
+    # with the worker's own cache of kriging system solutions.
+
+    dict_Worker_Data.clear()
+    dict_Worker_Data.update(workerData)
+    dict_Worker_Data["cache"] = OrderedDict()
+
+
+def func_Kriging_Tile(tile):
+
+    # This function returns a tile and the kriging prediction and variance
+    # (rows, columns) of its cells (NaN outside the mask), one block of
+    # cells at a time.
+
+    grid = dict_Worker_Data["grid"]
+    mask = dict_Worker_Data["mask"]
+    tree = dict_Worker_Data["tree"]
+    neighbors = dict_Worker_Data["neighbors"]
+    rowStart, rowEnd, columnStart, columnEnd = tile
+
+    columns, rows = numpy.meshgrid(numpy.arange(columnStart, columnEnd),
+                                   numpy.arange(rowStart, rowEnd))
+
+    if mask is None:
+
+        inside = numpy.ones(rows.shape, dtype=bool)
+
+    else:
+
+        inside = mask[rowStart:rowEnd, columnStart:columnEnd]
+
+    cellX = grid.originX + (columns[inside] + 0.5) * grid.cellSize
+    cellY = grid.originY - (rows[inside] + 0.5) * grid.cellSize
+
+    # Leaves that can hold neighbors of the tile's cells.
+    tileLeaves = func_Candidate_Leaves(
+        tree, numpy.arange(len(tree.leafBoxes)), cellX.min(), cellY.min(),
+        cellX.max(), cellY.max(), neighbors, None)
+
+    # Block of every cell inside the mask, within the tile.
+    blocks = (rows[inside] - rowStart) // idw_Block_Cells * \
+        idw_Tile_Cells + (columns[inside] - columnStart) // idw_Block_Cells
+    order = numpy.argsort(blocks, kind="stable")
+    boundaries = numpy.flatnonzero(numpy.diff(blocks[order])) + 1
+
+    tilePrediction = numpy.empty(len(cellX))
+    tileVariance = numpy.empty(len(cellX))
+
+    for cells in numpy.split(order, boundaries):
+
+        blockX = cellX[cells]
+        blockY = cellY[cells]
+
+        nearest = func_Nearest_Points(
+            tree, func_Candidate_Leaves(tree, tileLeaves, blockX.min(),
+                                        blockY.min(), blockX.max(),
+                                        blockY.max(), neighbors, None),
+            blockX, blockY, neighbors)
+
+        tilePrediction[cells], tileVariance[cells] = func_Krige_Cells(
+            tree, dict_Worker_Data["variogram"], dict_Worker_Data["cache"],
+            nearest, blockX, blockY)
+
+    prediction = numpy.full(rows.shape, numpy.nan)
+    variance = numpy.full(rows.shape, numpy.nan)
+    prediction[inside] = tilePrediction
+    variance[inside] = tileVariance
+
+    return tile, prediction, variance
+
+
+def func_Kriging(x, y, values, grid, mask=None, model=None, neighbors=None,
+                 variogram=None, workers=None):
+
+    # This function returns the (variogram, prediction surface, variance
+    # surface) of ordinary kriging of projected points. If no variogram is
+    # given, one is fitted to the points' empirical semivariogram. Cells
+    # outside the mask (if given) are NaN. The tiles run across a process pool
+    # of the given number of workers (default: one per CPU).
+
+    x = numpy.asarray(x, dtype=numpy.float64)
+    y = numpy.asarray(y, dtype=numpy.float64)
+    values = numpy.asarray(values, dtype=numpy.float64)
+
+    # Points with blank coordinates or values are left out.
+    keep = numpy.isfinite(x) & numpy.isfinite(y) & numpy.isfinite(values)
+
+    if neighbors is None:
+
+        neighbors = krig_Neighbors
+
+    if workers is None:
+
+        workers = os.cpu_count() or 1
+
+    prediction = numpy.full((grid.rows, grid.columns), numpy.nan)
+    variance = numpy.full((grid.rows, grid.columns), numpy.nan)
+
+    if not keep.any():
+
+        return variogram, prediction, variance
+
+    x, y, values = func_Merge_Coincident(x[keep], y[keep], values[keep])
+
+    if variogram is None:
+
+        variogram = func_Fit_Variogram(*func_Empirical_Semivariogram(
+            x, y, values), model=model)
+
+    workerData = {"tree": func_Build_KDTree(x, y, values), "grid": grid,
+                  "mask": mask, "variogram": variogram,
+                  "neighbors": max(1, min(int(neighbors), len(x)))}
+
+    list_Tiles = func_Grid_Tiles(grid, mask)
+
+    if workers > 1 and len(list_Tiles) >= idw_Pool_MinTiles:
+
+        with ProcessPoolExecutor(workers, initializer=func_Init_Worker,
+                                 initargs=(workerData,)) as pool:
+
+            results = list(pool.map(func_Kriging_Tile, list_Tiles,
+                                    chunksize=max(1, len(list_Tiles) //
+                                                  (workers * 4))))
+
+    else:
+
+        func_Init_Worker(workerData)
+        results = [func_Kriging_Tile(tile) for tile in list_Tiles]
+
+    for (rowStart, rowEnd, columnStart, columnEnd), tilePrediction, \
+            tileVariance in results:
+
+        prediction[rowStart:rowEnd, columnStart:columnEnd] = tilePrediction
+        variance[rowStart:rowEnd, columnStart:columnEnd] = tileVariance
+
+    return variogram, prediction, variance
+
+
+def func_Kriging_Surface(longitudes, latitudes, values, polygons,
+                         cellSize=None, model=None, neighbors=None,
+                         workers=None, mask=None):
+
+    # This function returns the (grid, variogram, prediction surface,
+    # variance surface) of ordinary kriging of point values (longitude/
+    # latitude) over the extent of the clip polygons, with cells outside the
+    # polygons set to NaN (NoData). If no cell size is given, the ArcGIS
+    # default is used. The polygons' mask can be given (see
+    # func_Surface_Mask), if already built.
+
+    polygons = func_Project_Polygons(polygons)
+    grid = func_Polygons_Grid(polygons, cellSize)
+
+    x, y = func_Project_Points(longitudes, latitudes)
+
+    return (grid,) + func_Kriging(x, y, values, grid,
+                                  func_Surface_Mask(polygons, grid,
+                                                    mask).inside,
+                                  model, neighbors, workers=workers)
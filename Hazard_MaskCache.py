@@ -0,0 +1,227 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the raster mask cache
+# shared by the native raster analyses (IDW, Kernel Density, and Kriging), the
+# headless equivalent of each analysis' ExtractByMask. The clip region's
+# polygons are rasterized once per (clip region, cell size, extent) into a
+# boolean grid, which every analysis of the run then uses. The mask is kept in
+# memory and saved next to the download cache as a NumPy .npy file, keyed by
+# the SHA-256 hash of the polygons and grid, so later runs for the same region
+# load it instead of rasterizing the polygons again.
+
+# All import statements for utilized modules.
+import os
+import hashlib
+import tempfile
+import threading
+from collections import namedtuple
+from collections import OrderedDict
+import numpy
+import Hazard_DownloadCache
+from Hazard_RasterGrid import func_Rasterize_Polygons
+
+# Subfolder of the download cache folder where the masks are kept.
+mask_FolderName = "RasterMasks"
+
+# Maximum number of masks kept on disk. Once exceeded, the least recently
+# used masks are removed first.
+mask_MaxCount = 200
+
+# Most bytes of masks kept in memory within each process (the least recently
+# used are dropped first).
+mask_Memory_Bytes = 256 * 1024 * 1024
+
+# Version of the mask layout and rasterization. It is part of each mask's
+# hash, so masks saved by an older version are never loaded.
+mask_Version = "1"
+
+# Raster mask of a clip region: inside (boolean, rows x columns, True for
+# cells whose center falls inside the polygons) and factor (1.0 inside, NaN
+# outside), so a surface is masked with one multiply. Both are read-only.
+RasterMask = namedtuple("RasterMask", ["inside", "factor"])
+
+# Masks within memory, by hash (least recently used first).
+dict_Masks = OrderedDict()
+
+# Lock so that only one thread at a time reads/writes the masks.
+mask_Lock = threading.Lock()
+
+
+def func_Mask_Folder():
+
+    # This function returns the folder where the masks are kept (within the
+    # download cache folder, which can be changed while running).
+
+    return os.path.join(Hazard_DownloadCache.cache_Folder, mask_FolderName)
+
+
+def func_Mask_Hash(polygons, grid):
+
+    # This function returns the SHA-256 hash identifying a mask: the mask
+    # version, the grid (origin, cell size, columns, and rows), and every
+    # projected polygon edge.
+
+    maskHash = hashlib.sha256()
+
+    maskHash.update(("%s|%r|%r|%r|%d|%d" % (mask_Version, grid.originX,
+                                            grid.originY, grid.cellSize,
+                                            grid.columns,
+                                            grid.rows)).encode("ascii"))
+
+    for edgeArrays in polygons.edges:
+
+        for values in edgeArrays:
+
+            maskHash.update(numpy.ascontiguousarray(
+                values, dtype=numpy.float64).tobytes())
+
+        maskHash.update(b"|")
+
+    return maskHash.hexdigest()
+
+
+def func_Remove_Old_Masks(keepPath):
+
+    # This function removes the least recently used masks on disk until no
+    # more than mask_MaxCount remain. The mask just used is never removed.
+
+    maskFolder = func_Mask_Folder()
+
+    list_Paths = [os.path.join(maskFolder, name)
+                  for name in os.listdir(maskFolder) if name.endswith(".npy")]
+
+    list_Paths.sort(key=os.path.getmtime)
+
+    for path in list_Paths[:max(0, len(list_Paths) - mask_MaxCount)]:
+
+        if path != keepPath:
+
+            try:
+
+                os.remove(path)
+
+            except OSError:
+
+                pass
+
+
+def func_Load_Mask(polygons, grid, path):
+
+    # This function returns a saved mask (marking it as just used), or, if
+    # not saved (or unreadable), rasterizes the polygons and saves the mask.
+    # The mask is written to a temporary file first, then swapped in, so a
+    # crash can't leave a half-written mask.
+
+    try:
+
+        inside = numpy.load(path)
+
+        if inside.shape == (grid.rows, grid.columns) and \
+                inside.dtype == numpy.bool_:
+
+            os.utime(path)
+
+            return inside
+
+    except (OSError, ValueError):
+
+        pass
+
+    inside = func_Rasterize_Polygons(polygons, grid)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), suffix=".tmp",
+                                     delete=False) as tempFile:
+
+        numpy.save(tempFile, inside)
+
+    try:
+
+        os.replace(tempFile.name, path)
+
+    except OSError:
+
+        # If another run saved the same mask first, keep theirs.
+        os.remove(tempFile.name)
+
+    func_Remove_Old_Masks(path)
+
+    return inside
+
+
+def func_Raster_Mask(inside):
+
+    # This function returns the raster mask (see RasterMask) of a boolean
+    # grid, e.g. a mask built by another process and sent with an analysis.
+    # The grid is copied, so the caller's array is left writeable.
+
+    inside = numpy.array(inside, dtype=bool)
+    factor = numpy.where(inside, 1.0, numpy.nan)
+
+    inside.flags.writeable = False
+    factor.flags.writeable = False
+
+    return RasterMask(inside, factor)
+
+
+def func_Polygon_Mask(polygons, grid):
+
+    # This function returns the raster mask (see RasterMask) of the projected
+    # clip polygons over a grid, from memory, from disk, or (the first time)
+    # by rasterizing the polygons.
+
+    maskHash = func_Mask_Hash(polygons, grid)
+
+    with mask_Lock:
+
+        rasterMask = dict_Masks.get(maskHash)
+
+        if rasterMask is not None:
+
+            dict_Masks.move_to_end(maskHash)
+
+            return rasterMask
+
+        rasterMask = func_Raster_Mask(func_Load_Mask(
+            polygons, grid, os.path.join(func_Mask_Folder(),
+                                         maskHash + ".npy")))
+        dict_Masks[maskHash] = rasterMask
+
+        # Drop the least recently used masks (never the one just added).
+        while len(dict_Masks) > 1 and \
+                sum(mask.inside.nbytes + mask.factor.nbytes
+                    for mask in dict_Masks.values()) > mask_Memory_Bytes:
+
+            dict_Masks.popitem(last=False)
+
+    return rasterMask
+
+
+def func_Surface_Mask(polygons, grid, mask=None):
+
+    # This function returns the raster mask of a surface: the given boolean
+    # grid (e.g. built once by the process running several analyses), or
+    # else the projected clip polygons' mask (see func_Polygon_Mask).
+
+    if mask is None:
+
+        return func_Polygon_Mask(polygons, grid)
+
+    if numpy.shape(mask) != (grid.rows, grid.columns):
+
+        raise ValueError("Mask of %s cells doesn't match the %d x %d grid."
+                         % ("x".join(str(size) for size in numpy.shape(mask)),
+                            grid.rows, grid.columns))
+
+    return func_Raster_Mask(mask)
+
+
+def func_Apply_Mask(surface, rasterMask):
+
+    # This function sets the surface's cells outside the mask to NaN
+    # (NoData), in place, with one multiply, and returns the surface.
+
+    numpy.multiply(surface, rasterMask.factor, out=surface)
+
+    return surface
@@ -0,0 +1,1215 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the headless hazard
+# pipeline. It runs the same download, CSV check, clip, and data count stages
+# as the Hail, Wind, and Tornado Options without Tkinter or ArcGIS, so that
+# runs can be driven from the command line (see CLI_ApplicationDriver).
+
+# All import statements for utilized modules.
+import os
+import csv
+import logging
+import zipfile
+import datetime
+from collections import namedtuple
+from collections import OrderedDict
+import numpy
+import GUI_CountiesPerState
+from Hazard_RunParameters import RunParameters
+from Hazard_DownloadCache import cache_Folder
+from Hazard_DownloadCache import func_Cache_Retrieve
+from Hazard_FilterEngine import func_Filter_SPC_Catalog
+from Hazard_FilterEngine import func_Catalog_Rows
+from Hazard_CatalogCache import func_Load_SPC_Catalog
+from Hazard_ClipEngine import func_Load_County_Polygons
+from Hazard_ClipEngine import func_Locate_Points
+from Hazard_GroupStats import func_Value_Statistics
+from Hazard_GroupStats import func_Group_Statistics
+from Hazard_GroupStats import func_Mode_String
+from Hazard_StageTrace import func_Stage_Span
+from Hazard_KernelDensity import func_Kernel_Density_Surface
+from Hazard_IDWEngine import func_IDW_Surface
+from Hazard_KrigingEngine import func_Kriging_Surface
+from Hazard_RasterGrid import func_Write_Raster
+from Hazard_RasterGrid import func_Project_Polygons
+from Hazard_RasterGrid import func_Polygons_Grid
+from Hazard_MaskCache import func_Polygon_Mask
+from Hazard_AnalysisScheduler import AnalysisJob
+from Hazard_AnalysisScheduler import func_Run_Analysis_Jobs
+
+# Logger for the pipeline's progress. Each message carries the stage name,
+# progress percentage, and any other values within the "hazard_Fields"
+# attribute, so the command line driver can write them as structured logs.
+logger = logging.getLogger("Hazard_Pipeline")
+
+# The most recent year of data, and the current date used within output
+# naming conventions (the same as the GUI).
+int_OneYearAgo = int(datetime.datetime.today().strftime("%Y")) - 1
+curDate = "__" + datetime.datetime.today().strftime("%Y%m%d")
+
+# This string represents the static portion of the URL path for accessing the
+# NOAA SPC CSVs.
+spc_siteURL = "http://www.spc.noaa.gov/wcm/data/"
+
+# Census Bureau's county Shapefile.
+census_URL_CountyShapefile_FileName = "cb_2017_us_county_500k"
+census_URL_CountyShapefile = "http://www2.census.gov/geo/tiger/GENZ2017/shp/" +\
+                             census_URL_CountyShapefile_FileName + ".zip"
+
+# Various components of output naming conventions to be used.
+noaa = "noaa"
+fileExtCSV = ".csv"
+fileExtZip = ".zip"
+fileExtTIF = ".tif"
+featureClass_50States_and_DC_only = "USA_50_and_DC_only"
+
+# Names of the analysis options (the same as the GUI's analysis checkboxes).
+tuple_Analysis_Names = ("IDW", "KernelDensity", "Kriging", "NaturalNeighbor",
+                        "OptHotSpot", "PointDensity", "Spline", "Thiessen",
+                        "Trend", "OutputToCSVFile")
+
+# Analysis options that can run without ArcGIS. All others require the GUI's
+# ArcGIS geoprocessing, and are skipped (and logged) by the pipeline.
+tuple_Headless_Analysis_Names = ("IDW", "KernelDensity", "Kriging",
+                                 "OutputToCSVFile")
+
+# Raster analyses available without ArcGIS, in the same order as the GUI:
+# (analysis option, output name prefix, name within the log messages).
+tuple_Raster_Analyses = (("IDW", "idw_", "IDW"),
+                         ("KernelDensity", "kerneldensity_", "Kernel Density"),
+                         ("Kriging", "kriging_", "Kriging"))
+
+# Output name prefix of the kriging prediction variance raster (written next
+# to the kriging raster).
+krigingVariance_Prefix = "kriging_variance_"
+
+# Number of worker processes used by the raster analyses (None: one per CPU).
+# The selected analyses run at the same time (see Hazard_AnalysisScheduler),
+# sharing these workers. Set to 1 within the batch runner's workers, which
+# already run one region per CPU.
+raster_Workers = None
+
+# Subfolder of the output folder for the analysis rasters (the same name as
+# the GUI's GIS subfolder).
+gisFolder_Name = "GIS_Folder"
+
+# Dictionary showing Census FIPs codes assigned to state abbreviation.
+dict_StateName_StateFIPs = {"AL":"01", "AK":"02", "AZ":"04", "AR":"05",
+                            "CA":"06", "CO":"08", "CT":"09", "DE":"10",
+                            "DC":"11", "FL":"12", "GA":"13", "HI":"15",
+                            "ID":"16", "IL":"17", "IN":"18", "IA":"19",
+                            "KS":"20", "KY":"21", "LA":"22", "ME":"23",
+                            "MD":"24", "MA":"25", "MI":"26", "MN":"27",
+                            "MS":"28", "MO":"29", "MT":"30", "NE":"31",
+                            "NV":"32", "NH":"33", "NJ":"34", "NM":"35",
+                            "NY":"36", "NC":"37", "ND":"38", "OH":"39",
+                            "OK":"40", "OR":"41", "PA":"42", "RI":"44",
+                            "SC":"45", "SD":"46", "TN":"47", "TX":"48",
+                            "UT":"49", "VT":"50", "VA":"51", "WA":"53",
+                            "WV":"54", "WI":"55", "WY":"56"}
+
+# Dictionary remains intact and unchanged, in the same order as the GUI's data
+# counts CSVs.
+dictKeys_OrderedDict_StateNames = OrderedDict(dict_StateName_StateFIPs)
+
+# Settings that differ between the NOAA SPC hazards.
+# hazard: Hazard string used within URLs and naming conventions.
+# headers: Comma-delimited header names for the hazard's CSVs.
+# firstYear: First year of the hazard's "All" timespan.
+# singular/plural: Hazard names used within the data counts CSV.
+# magRange_Label: Data counts CSV label for the magnitude selection.
+# mag_Label: Name of the magnitude within the data counts CSV headers.
+# meanMedian: If True, the data counts CSV includes mean and median values.
+# dict_Mag_Naming: Magnitude combobox selections and their naming conventions.
+HazardSettings = namedtuple("HazardSettings", ["hazard", "headers",
+                                               "firstYear", "singular",
+                                               "plural", "magRange_Label",
+                                               "mag_Label", "meanMedian",
+                                               "dict_Mag_Naming"])
+
+# Header names shared by all NOAA SPC CSVs (the last header differs).
+spc_headers = "om,yr,mo,dy,date,time,tz,st,stf,stn,mag,inj,fat,loss,closs," \
+              "slat,slon,elat,elon,len,wid,ns,sn,sg,f1,f2,f3,f4"
+
+# Dictionary of settings for each NOAA SPC hazard.
+dict_Hazard_Settings = {
+    "hail": HazardSettings("hail", spc_headers, 1955, "Hail", "Hail",
+                           "Diameter Range (Inches):", "Diameter", True,
+                           {"All": "all", '0.5" - 0.99"': "0_5_to_0_99",
+                            '1.0" - 1.99"': "1_0_to_1_99",
+                            '2.0" - 2.99"': "2_0_to_2_99",
+                            '3.0"+': "3_0_and_Up"}),
+    "wind": HazardSettings("wind", spc_headers + ",mt", 1955, "Wind", "Wind",
+                           "Speed Range (Knots):", "Speed", True,
+                           {"All": "all", "30 - 60": "30_to_60",
+                            "60 - 90": "60_to_90", "90 - 120": "90_to_120",
+                            "120+": "120_and_Above"}),
+    "torn": HazardSettings("torn", spc_headers + ",fc", 1950, "Tornado",
+                           "Tornadoes", "Size Range (EF):", "Size", False,
+                           {"All": "all", "EF-0": "ef0", "EF-1": "ef1",
+                            "EF-2": "ef2", "EF-3": "ef3", "EF-4": "ef4",
+                            "EF-5": "ef5"})}
+
+# Output names and paths for one run (the same naming conventions as the GUI).
+# timespan_url: Timespan portion of the URL (e.g. 2016 or 1955-2017).
+# nameFeatureClass_FromCSV: Base name of the checked CSV and clipped output.
+# folderNamingAddition: Clip region portion of the folder name.
+# fullPathName: Output folder for the run.
+# csvDirectory: CSV subfolder within the output folder.
+RunNaming = namedtuple("RunNaming", ["timespan_url", "nameFeatureClass_FromCSV",
+                                     "folderNamingAddition", "fullPathName",
+                                     "csvDirectory"])
+
+# Result of one run.
+# status: "complete", or "empty" if no hazards were left to process.
+# checkedCount: Number of rows that passed the CSV checks.
+# clippedCount: Number of those rows within the clip region (None if the run
+# had no clip region).
+# dataCountsCSV: Path of the data counts CSV (None if not written).
+PipelineResult = namedtuple("PipelineResult", ["status", "fullPathName",
+                                               "checkedCount", "clippedCount",
+                                               "dataCountsCSV"])
+
+# Hazard points loaded from a checked CSV.
+# catalog: Memory-mapped catalog of the CSV's columns (header excluded), for
+# writing the clipped output (see func_SPC_Catalog).
+# x/y: Longitude and latitude arrays.
+# mags: Magnitude array.
+HazardPoints = namedtuple("HazardPoints", ["catalog", "x", "y", "mags"])
+
+# County of every hazard point (the native equivalent of the spatial join).
+# stateFIPS/countyNames: Arrays of each point's state FIPS code and county
+# name ("" for points outside the 50 states and DC).
+PointCounties = namedtuple("PointCounties", ["stateFIPS", "countyNames"])
+
+
+def func_Set_Raster_Workers(workers):
+
+    # This function sets the number of worker processes used by the raster
+    # analyses.
+
+    global raster_Workers
+
+    raster_Workers = workers
+
+
+def func_Log_Stage(stage, progress, message, **fields):
+
+    # This function logs a progress message for a pipeline stage, along with
+    # any other values (e.g. file names or counts).
+
+    fields["stage"] = stage
+    fields["progress"] = progress
+
+    logger.info(message, extra={"hazard_Fields": fields})
+
+
+def func_Timespan_Text(hazard, timespan):
+
+    # This function returns the timespan combobox text for a command line
+    # timespan value (All, Custom, or a year/year range such as 2016 or
+    # 2005-2007).
+
+    settings = dict_Hazard_Settings[hazard]
+
+    if timespan.split(" ")[0].lower() == "all":
+
+        return "All | " + str(settings.firstYear) + "-" + str(int_OneYearAgo)
+
+    if timespan.rstrip(".").lower() == "custom":
+
+        return "Custom..."
+
+    return timespan
+
+
+def func_Magnitude_Text(hazard, magnitude):
+
+    # This function returns the magnitude combobox text for a command line
+    # magnitude value. Either the combobox text or its naming convention
+    # (e.g. 0_5_to_0_99 or ef2) may be given.
+
+    settings = dict_Hazard_Settings[hazard]
+
+    if magnitude.rstrip(".").lower() == "custom":
+
+        return "Custom..."
+
+    for magText, magNaming in settings.dict_Mag_Naming.items():
+
+        if magnitude in (magText, magNaming):
+
+            return magText
+
+    raise ValueError("Unknown " + hazard + " magnitude: " + magnitude +
+                     " (choices: " +
+                     ", ".join(settings.dict_Mag_Naming.values()) +
+                     ", custom)")
+
+
+def func_Timespan_URL(hazard, hazardTimespan):
+
+    # This function returns the timespan portion of the URL, and the URL of
+    # the hazard's CSV. All and Custom timespans use the zipped CSV of every
+    # year.
+
+    settings = dict_Hazard_Settings[hazard]
+
+    if hazardTimespan == "Custom..." or hazardTimespan.startswith("All | "):
+
+        timespan_url = str(settings.firstYear) + "-" + str(int_OneYearAgo)
+
+        return timespan_url, spc_siteURL + timespan_url + "_" + hazard + \
+            fileExtCSV + fileExtZip
+
+    return hazardTimespan, spc_siteURL + hazardTimespan + "_" + hazard + \
+        fileExtCSV
+
+
+def func_Job_RunParameters(job):
+
+    # This function builds the RunParameters for a job dictionary (from the
+    # command line arguments or a job file). Keys are hazard, timespan,
+    # magnitude, custom_from/custom_to (YYYY-MM), magnitude_min/magnitude_max,
+    # region (none, usa, state, or county), state, county, analyses, and
+    # workspace.
+
+    hazard = job["hazard"]
+
+    if hazard not in dict_Hazard_Settings:
+
+        raise ValueError("Unknown hazard: " + str(hazard) + " (choices: " +
+                         ", ".join(sorted(dict_Hazard_Settings)) + ")")
+
+    hazardTimespan = func_Timespan_Text(hazard, str(job.get("timespan",
+                                                            "All")))
+    hazardMagnitude = func_Magnitude_Text(hazard, str(job.get("magnitude",
+                                                              "all")))
+
+    # Custom timespan values (YYYY-MM).
+    customYears = [None, None]
+    customMonths = [None, None]
+
+    if hazardTimespan == "Custom...":
+
+        for index, key in enumerate(("custom_from", "custom_to")):
+
+            if not job.get(key):
+
+                raise ValueError("A custom timespan requires " + key +
+                                 " (YYYY-MM).")
+
+            customYears[index], customMonths[index] = \
+                [int(value) for value in str(job[key]).split("-")]
+
+    # Custom magnitude values (floats for hail, integers otherwise).
+    customMags = [None, None]
+
+    if hazardMagnitude == "Custom...":
+
+        convert = float if hazard == "hail" else int
+
+        for index, key in enumerate(("magnitude_min", "magnitude_max")):
+
+            if job.get(key) is None:
+
+                raise ValueError("A custom magnitude requires " + key + ".")
+
+            customMags[index] = convert(job[key])
+
+        if customMags[0] > customMags[1]:
+
+            raise ValueError("Minimum magnitude exceeds maximum magnitude.")
+
+    # Clip region.
+    region = str(job.get("region", "usa")).lower()
+    stateName = job.get("state")
+    countyName = job.get("county")
+
+    if region not in ("none", "usa", "state", "county"):
+
+        raise ValueError("Unknown region: " + region + " (choices: none, usa, "
+                         "state, county)")
+
+    if region in ("state", "county") and \
+            stateName not in dict_StateName_StateFIPs:
+
+        raise ValueError("Region " + region + " requires a state "
+                         "abbreviation (e.g. TX).")
+
+    if region == "county" and countyName not in \
+            GUI_CountiesPerState.dict_state_counties[stateName]:
+
+        raise ValueError("Unknown county for " + stateName + ": " +
+                         str(countyName))
+
+    # Analysis options, as a comma-delimited string or a list.
+    analyses = job.get("analyses", ())
+
+    if isinstance(analyses, str):
+
+        analyses = [name.strip() for name in analyses.split(",")
+                    if name.strip()]
+
+    for name in analyses:
+
+        if name not in tuple_Analysis_Names:
+
+            raise ValueError("Unknown analysis: " + name + " (choices: " +
+                             ", ".join(tuple_Analysis_Names) + ")")
+
+    return RunParameters(
+        hazard_Timespan=hazardTimespan,
+        hazard_Magnitude=hazardMagnitude,
+        custom_Year_From=customYears[0],
+        custom_Month_From=customMonths[0],
+        custom_Year_To=customYears[1],
+        custom_Month_To=customMonths[1],
+        custom_Magnitude_Min=customMags[0],
+        custom_Magnitude_Max=customMags[1],
+        url_Text=func_Timespan_URL(hazard, hazardTimespan)[1],
+        workspace_Folder=str(job.get("workspace", os.getcwd())),
+        options_Checked=0 if region == "none" else 1,
+        state_Name=stateName if region in ("state", "county") else None,
+        county_Name=countyName if region == "county" else None,
+        analysis_Options=frozenset(analyses))
+
+
+def func_Clip_Selection(runParams):
+
+    # This function returns the clipping option of the run, numbered the same
+    # as the GUI's radio buttons (0: none, 1: USA, 2: state, 3: county).
+
+    if runParams.options_Checked == 0:
+
+        return 0
+
+    if runParams.county_Name is not None:
+
+        return 3
+
+    if runParams.state_Name is not None:
+
+        return 2
+
+    return 1
+
+
+def func_Run_Naming(hazard, runParams):
+
+    # This function returns the output names and paths of a run.
+
+    settings = dict_Hazard_Settings[hazard]
+
+    timespan_url = func_Timespan_URL(hazard, runParams.hazard_Timespan)[0]
+
+    # Magnitude portion of the naming convention.
+    if runParams.hazard_Magnitude == "Custom...":
+
+        mag_naming = str(runParams.custom_Magnitude_Min).replace(".", "_") + \
+            "_to_" + str(runParams.custom_Magnitude_Max).replace(".", "_")
+
+    else:
+
+        mag_naming = settings.dict_Mag_Naming[runParams.hazard_Magnitude]
+
+    # Timespan portion of the naming convention.
+    if runParams.hazard_Timespan == "Custom...":
+
+        timespan_file_folder_naming = "_" + str(runParams.custom_Year_From) + \
+            str(runParams.custom_Month_From).zfill(2) + "_to_" + \
+            str(runParams.custom_Year_To) + \
+            str(runParams.custom_Month_To).zfill(2)
+
+    else:
+
+        timespan_file_folder_naming = "_" + timespan_url.replace("-", "_to_")
+
+    nameFeatureClass_FromCSV = noaa + "_" + hazard + "_" + mag_naming + \
+        timespan_file_folder_naming + curDate
+
+    # Clip region portion of the folder naming convention.
+    clipSelection = func_Clip_Selection(runParams)
+
+    if clipSelection == 1:
+
+        folderNamingAddition = "_" + featureClass_50States_and_DC_only
+
+    elif clipSelection == 2:
+
+        folderNamingAddition = "_state_only_" + runParams.state_Name
+
+    elif clipSelection == 3:
+
+        folderNamingAddition = "_county_only_" + \
+            runParams.county_Name.replace("'", "").replace("-", "").\
+            replace(".", "").replace(" ", "") + "_" + runParams.state_Name
+
+    else:
+
+        folderNamingAddition = ""
+
+    fullPathName = runParams.workspace_Folder + "/" + \
+        nameFeatureClass_FromCSV + folderNamingAddition
+
+    return RunNaming(timespan_url, nameFeatureClass_FromCSV,
+                     folderNamingAddition, fullPathName,
+                     fullPathName + "/CSV_Folder/")
+
+
+def func_Retrieve(url, filename):
+
+    # This function downloads a URL (through the download cache), trying one
+    # more time if the first attempt fails (it could have been a small,
+    # temporary network glitch).
+
+    try:
+
+        return func_Cache_Retrieve(url, filename)
+
+    except Exception as e:
+
+        func_Log_Stage("download", None, "Download failed, trying again.",
+                       url=url, error=str(e))
+
+        return func_Cache_Retrieve(url, filename)
+
+
+def func_Download_Hazard_CSV(hazard, runParams, naming):
+
+    # This function downloads (and unzips, if needed) the hazard's CSV into
+    # the CSV subfolder, returning the path of the downloaded CSV.
+
+    os.makedirs(naming.csvDirectory, exist_ok=True)
+
+    # Name of the downloaded CSV.
+    downloadName = naming.csvDirectory + noaa + "_" + hazard + "_" + \
+        naming.timespan_url.replace("-", "_to_") + curDate + fileExtCSV
+
+    func_Log_Stage("download", 15, "Downloading.", url=runParams.url_Text,
+                   file=downloadName)
+
+    # If the URL is a zipped CSV...
+    if runParams.url_Text.endswith(fileExtZip):
+
+        func_Retrieve(runParams.url_Text, downloadName + fileExtZip)
+
+        # Unzip the CSV file within the same folder location, and rename it
+        # to better represent the input parameters.
+        with zipfile.ZipFile(downloadName + fileExtZip, "r") as unZipThisFile:
+
+            unZipThisFile.extractall(naming.csvDirectory)
+
+        os.replace(naming.csvDirectory + naming.timespan_url + "_" + hazard +
+                   fileExtCSV, downloadName)
+
+    else:
+
+        func_Retrieve(runParams.url_Text, downloadName)
+
+    func_Log_Stage("download", 20, "Download complete.", file=downloadName)
+
+    return downloadName
+
+
+def func_Download_Census_Shapefile():
+
+    # This function downloads the Census Bureau's county Shapefile (through
+    # the download cache) and unzips it into a folder named after its content
+    # hash, so every run (and every worker) shares one copy. The path of the
+    # Shapefile is returned.
+
+    censusFolder = os.path.join(cache_Folder, "Census")
+    os.makedirs(censusFolder, exist_ok=True)
+
+    zipName = os.path.join(censusFolder,
+                           census_URL_CountyShapefile_FileName + fileExtZip)
+
+    func_Log_Stage("census", 30, "Retrieving Census Bureau's Shapefile.",
+                   url=census_URL_CountyShapefile)
+
+    entry = func_Retrieve(census_URL_CountyShapefile, zipName)[1]
+
+    # Folder for this copy of the Shapefile.
+    shapefileFolder = os.path.join(censusFolder, entry["sha256"][:16])
+    censusShapefile = os.path.join(shapefileFolder,
+                                   census_URL_CountyShapefile_FileName +
+                                   ".shp")
+
+    # If this copy hasn't been unzipped yet, unzip it under a temporary name
+    # and rename it once complete, so an interrupted unzip is never used.
+    if not os.path.exists(censusShapefile):
+
+        buildFolder = shapefileFolder + "_" + str(os.getpid())
+
+        with zipfile.ZipFile(zipName, "r") as unZipThisFile:
+
+            unZipThisFile.extractall(buildFolder)
+
+        try:
+
+            os.rename(buildFolder, shapefileFolder)
+
+        except OSError:
+
+            # Another run finished unzipping the same copy first.
+            pass
+
+    os.remove(zipName)
+
+    return censusShapefile
+
+
+def func_Check_Hazard_CSV(hazard, runParams, downloadName, checkedName):
+
+    # This function checks the downloaded CSV's headers and values, writing
+    # the rows that pass all checks to the checked CSV (the same checks as
+    # the GUI). The number of rows written is returned.
+
+    settings = dict_Hazard_Settings[hazard]
+
+    func_Log_Stage("check", 22, "Checking CSV file for missing headers, "
+                   "erroneous lat/long values, and removing invalid values.",
+                   file=checkedName)
+
+    # Custom magnitude values, as the GUI's combobox text.
+    customMagFrom = None if runParams.custom_Magnitude_Min is None else \
+        str(runParams.custom_Magnitude_Min)
+    customMagTo = None if runParams.custom_Magnitude_Max is None else \
+        str(runParams.custom_Magnitude_Max)
+
+    # Custom timespan values (YYYY, MM, YYYY, MM).
+    customTimespan = None
+
+    if runParams.hazard_Timespan == "Custom...":
+
+        customTimespan = (str(runParams.custom_Year_From),
+                          str(runParams.custom_Month_From),
+                          str(runParams.custom_Year_To),
+                          str(runParams.custom_Month_To))
+
+    # Catalog of the downloaded CSV's typed columns (parsed once, then
+    # memory-mapped from the catalog cache by later runs on the same CSV).
+    catalog = func_Load_SPC_Catalog(downloadName, hazard, settings.headers)
+
+    with open(checkedName, "w") as csv_OutputFile:
+
+        csv_Writer = csv.writer(csv_OutputFile, quotechar='"', delimiter=',',
+                                quoting=csv.QUOTE_ALL, skipinitialspace=True,
+                                lineterminator='\n')
+
+        # Write the headers to the output CSV file.
+        csv_Writer.writerow(settings.headers.split(","))
+
+        checkedCount = func_Filter_SPC_Catalog(catalog, csv_Writer, hazard,
+                                               runParams.hazard_Magnitude,
+                                               customMagFrom, customMagTo,
+                                               customTimespan)
+
+    func_Log_Stage("check", 25, "CSV file checked.", file=checkedName,
+                   rows=int(checkedCount))
+
+    return int(checkedCount)
+
+
+def func_Hazard_Points(catalog):
+
+    # This function returns the hazard points of a catalog.
+
+    return HazardPoints(catalog, catalog["long"], catalog["lat"],
+                        catalog["mag"])
+
+
+def func_Load_Hazard_Points(hazard, checkedName):
+
+    # This function loads the rows, lat/long, and magnitude of every hazard
+    # within a checked CSV, as a memory-mapped catalog (parsed once, then
+    # shared by every job and worker process using the same checked CSV).
+
+    return func_Hazard_Points(func_Load_SPC_Catalog(
+        checkedName, hazard, dict_Hazard_Settings[hazard].headers))
+
+
+def func_Locate_Point_Counties(points, polygons, gridIndex=None):
+
+    # This function returns the state FIPS code and county name of every
+    # hazard point, from the 50 states and DC county polygons.
+
+    return func_Point_Counties(polygons, func_Locate_Points(
+        points.x, points.y, polygons, gridIndex))
+
+
+def func_Point_Counties(polygons, polygonIndexes):
+
+    # This function returns the state FIPS code and county name of every
+    # hazard point, from the index of the county polygon it falls inside
+    # (-1 for none).
+
+    # Records of every polygon, with a blank record at the end for points
+    # outside of all polygons (index -1).
+    records = polygons.records + [("", "")]
+
+    stateFIPS = numpy.array([record[0] for record in records])
+    countyNames = numpy.array([record[1] for record in records])
+
+    return PointCounties(stateFIPS[polygonIndexes],
+                         countyNames[polygonIndexes])
+
+
+def func_Region_Masks(runParams, pointCounties):
+
+    # This function returns the boolean masks of the points within the USA,
+    # the selected state (None if no state), and the clip region.
+
+    usaMask = pointCounties.stateFIPS != ""
+    stateMask = None
+    clipMask = usaMask
+
+    if runParams.state_Name is not None:
+
+        stateMask = pointCounties.stateFIPS == \
+            dict_StateName_StateFIPs[runParams.state_Name]
+        clipMask = stateMask
+
+    if runParams.county_Name is not None:
+
+        clipMask = stateMask & \
+            (pointCounties.countyNames == runParams.county_Name)
+
+    return usaMask, stateMask, clipMask
+
+
+def func_Write_Clipped_CSV(hazard, points, clipMask, clippedName):
+
+    # This function writes the hazard rows within the clip region to a CSV
+    # (the headless equivalent of the clipped feature class).
+
+    with open(clippedName, "w") as csv_OutputFile:
+
+        csv_Writer = csv.writer(csv_OutputFile, quotechar='"', delimiter=',',
+                                quoting=csv.QUOTE_ALL, skipinitialspace=True,
+                                lineterminator='\n')
+
+        csv_Writer.writerow(dict_Hazard_Settings[hazard].headers.split(","))
+        csv_Writer.writerows(func_Catalog_Rows(points.catalog,
+                                               numpy.flatnonzero(clipMask)))
+
+
+def func_Stats_Text(settings, stats, twoDecimals):
+
+    # This function formats the min, max, (mean, median,) and mode values of
+    # a group's statistics for the data counts CSV. Min/max are written with
+    # two decimal places if twoDecimals is True, else as they were read.
+
+    if twoDecimals:
+
+        text = str("{0:.2f}".format(stats.minimum)) + "," + \
+            str("{0:.2f}".format(stats.maximum))
+
+    else:
+
+        text = str(stats.minimum) + "," + str(stats.maximum)
+
+    if settings.meanMedian:
+
+        text += "," + str("{0:.2f}".format(stats.mean)) + "," + \
+            str("{0:.2f}".format(stats.median))
+
+    return text + "," + func_Mode_String(stats.mode)
+
+
+def func_Stats_Header(settings):
+
+    # This function returns the data counts CSV header for the min, max,
+    # (mean, median,) and mode columns, and the number of those columns.
+
+    names = ["Minimum", "Maximum", "Mean", "Median", "Mode"] if \
+        settings.meanMedian else ["Minimum", "Maximum", "Mode"]
+
+    return ",".join(name + " " + settings.mag_Label for name in names), \
+        len(names)
+
+
+def func_Write_Data_Counts(hazard, runParams, mags, pointCounties,
+                           dataCountsName):
+
+    # This function writes the data counts CSV for the clip region, with the
+    # same layout as the GUI's "Output to CSV File" analysis option.
+
+    settings = dict_Hazard_Settings[hazard]
+    clipSelection = func_Clip_Selection(runParams)
+    usaMask, stateMask, clipMask = func_Region_Masks(runParams, pointCounties)
+    statsHeader, statsColumns = func_Stats_Header(settings)
+
+    with open(dataCountsName, "w") as csvFile:
+
+        # Timespan and magnitude selections.
+        if runParams.hazard_Timespan == "Custom...":
+
+            csvFile.write("Timespan:," + str(runParams.custom_Year_From) +
+                          str(runParams.custom_Month_From).zfill(2) + "-" +
+                          str(runParams.custom_Year_To) +
+                          str(runParams.custom_Month_To).zfill(2) + ",\n")
+
+        else:
+
+            csvFile.write("Timespan:," + runParams.hazard_Timespan + ",\n")
+
+        if runParams.hazard_Magnitude == "Custom...":
+
+            csvFile.write(settings.magRange_Label + "," +
+                          str(runParams.custom_Magnitude_Min) + "-" +
+                          str(runParams.custom_Magnitude_Max) + ",\n")
+
+        else:
+
+            csvFile.write(settings.magRange_Label + "," +
+                          runParams.hazard_Magnitude + ",\n")
+
+        csvFile.write("\n")
+        csvFile.write("USA (and DC) " + settings.plural + ":," +
+                      str(int(numpy.count_nonzero(usaMask))) + ",\n")
+
+        # If the clip region is the USA...
+        if clipSelection == 1:
+
+            csvFile.write("\n")
+            csvFile.write("Nationwide " + settings.singular + " Data,\n")
+            csvFile.write("V," * statsColumns + "\n")
+            csvFile.write(statsHeader + ",\n")
+            csvFile.write(func_Stats_Text(settings, func_Value_Statistics(
+                mags[usaMask]), False) + ",\n")
+
+            csvFile.write("\n")
+            csvFile.write(settings.singular + " Data per State,\n")
+            csvFile.write("V," * (statsColumns + 3) + "\n")
+            csvFile.write("States with " + settings.plural + "," +
+                          settings.singular + " Count," + statsHeader +
+                          ",State FIPS Code,\n")
+
+            # Statistics of the magnitudes within each state (one pass over
+            # the arrays, grouped by FIPS code).
+            stats_PerState = func_Group_Statistics(
+                pointCounties.stateFIPS[usaMask], mags[usaMask])
+
+            for key in dictKeys_OrderedDict_StateNames:
+
+                stats_State = stats_PerState.get(
+                    dictKeys_OrderedDict_StateNames[key])
+
+                if stats_State is not None:
+
+                    csvFile.write(str(key) + "," + str(stats_State.count) +
+                                  "," + func_Stats_Text(settings, stats_State,
+                                                        False) + "," +
+                                  str(dictKeys_OrderedDict_StateNames[key]) +
+                                  ",\n")
+
+        # If the clip region is a state or county...
+        else:
+
+            csvFile.write("\n")
+            csvFile.write("State " + settings.plural + " - " +
+                          runParams.state_Name + " (FIPS: " +
+                          dict_StateName_StateFIPs[runParams.state_Name] +
+                          "):," + str(int(numpy.count_nonzero(stateMask))) +
+                          ",\n")
+
+        # If the clip region is a state...
+        if clipSelection == 2:
+
+            csvFile.write("\n")
+            csvFile.write("Statewide " + settings.singular + " Data,\n")
+            csvFile.write("V," * statsColumns + "\n")
+            csvFile.write(statsHeader + ",\n")
+            csvFile.write(func_Stats_Text(settings, func_Value_Statistics(
+                mags[stateMask]), False) + ",\n")
+
+            csvFile.write("\n")
+            csvFile.write(settings.singular + " Data per County\n")
+            csvFile.write("V," * (statsColumns + 2) + "\n")
+            csvFile.write("Counties with " + settings.plural + "," +
+                          settings.singular + " Count," + statsHeader + ",\n")
+
+            # Statistics of the magnitudes within each county (one pass over
+            # the arrays, grouped by county name).
+            stats_PerCounty = func_Group_Statistics(
+                pointCounties.countyNames[stateMask], mags[stateMask])
+
+            for key in GUI_CountiesPerState.dict_state_counties[
+                    runParams.state_Name]:
+
+                stats_County = stats_PerCounty.get(key)
+
+                if stats_County is not None:
+
+                    csvFile.write(str(key) + "," + str(stats_County.count) +
+                                  "," + func_Stats_Text(settings, stats_County,
+                                                        True) + ",\n")
+
+        # If the clip region is a county...
+        if clipSelection == 3:
+
+            csvFile.write("\n")
+            csvFile.write("County " + settings.plural + " - " +
+                          runParams.county_Name + ":," +
+                          str(int(numpy.count_nonzero(clipMask))) + ",\n")
+            csvFile.write("\n")
+            csvFile.write("County " + settings.singular + " Data\n")
+            csvFile.write("V," * statsColumns + "\n")
+            csvFile.write(statsHeader + ",\n")
+            csvFile.write(func_Stats_Text(settings, func_Value_Statistics(
+                mags[clipMask]), True) + ",\n")
+
+
+def func_Clip_Polygons(runParams, censusShapefile):
+
+    # This function loads the county polygons of the run's clip region (the
+    # 50 states and DC, a state, or a county), used as the analysis mask.
+
+    if runParams.state_Name is None:
+
+        return func_Load_County_Polygons(censusShapefile)
+
+    return func_Load_County_Polygons(
+        censusShapefile, dict_StateName_StateFIPs[runParams.state_Name],
+        runParams.county_Name)
+
+
+def func_Write_IDW(points, clipMask, polygons, rasterName, mask=None):
+
+    # This function writes the IDW raster of the clipped points' magnitudes,
+    # masked to the clip region (the native equivalent of Idw and
+    # ExtractByMask with the Esri defaults). The clip region's raster mask
+    # can be given, if already built.
+
+    grid, surface = func_IDW_Surface(points.x[clipMask], points.y[clipMask],
+                                     points.mags[clipMask], polygons,
+                                     workers=raster_Workers, mask=mask)
+
+    func_Write_Raster(rasterName, grid, surface)
+
+
+def func_Write_Kernel_Density(points, clipMask, polygons, rasterName,
+                              mask=None):
+
+    # This function writes the kernel density raster of the clipped points,
+    # masked to the clip region (the native equivalent of KernelDensity and
+    # ExtractByMask with the Esri defaults). The clip region's raster mask
+    # can be given, if already built.
+
+    grid, surface = func_Kernel_Density_Surface(points.x[clipMask],
+                                                points.y[clipMask], polygons,
+                                                mask=mask)
+
+    func_Write_Raster(rasterName, grid, surface)
+
+
+def func_Write_Kriging(points, clipMask, polygons, rasterName, mask=None):
+
+    # This function writes the ordinary kriging raster of the clipped points'
+    # magnitudes, and its prediction variance raster, masked to the clip
+    # region (the native equivalent of Kriging and ExtractByMask with the Esri
+    # defaults, plus the optional output variance raster). The clip region's
+    # raster mask can be given, if already built.
+
+    grid, variogram, prediction, variance = func_Kriging_Surface(
+        points.x[clipMask], points.y[clipMask], points.mags[clipMask],
+        polygons, workers=raster_Workers, mask=mask)
+
+    func_Write_Raster(rasterName, grid, prediction)
+
+    varianceName = os.path.join(
+        os.path.dirname(rasterName), krigingVariance_Prefix +
+        os.path.basename(rasterName)[len("kriging_"):])
+
+    func_Write_Raster(varianceName, grid, variance)
+
+    # No variogram is fitted if no points fall within the clip region.
+    if variogram is None:
+
+        return None
+
+    # Message logged once the analysis completes.
+    return "Kriging variogram: " + variogram.model + ", nugget %g, partial " \
+        "sill %g, range %.0f m." % (variogram.nugget, variogram.partialSill,
+                                    variogram.range)
+
+
+# Function writing each raster analysis (returning a message to log once the
+# analysis completes, or None).
+dict_Raster_Writers = {"IDW": func_Write_IDW,
+                       "KernelDensity": func_Write_Kernel_Density,
+                       "Kriging": func_Write_Kriging}
+
+
+def func_Raster_Analysis_Task(name, workers, points, polygons, mask,
+                              rasterName):
+
+    # This function runs one raster analysis for the analysis scheduler
+    # (within a worker process, or the calling process), on the clipped
+    # points and the clip region's raster mask, using the given number of
+    # worker processes of its own. Returns the writer's message.
+
+    previousWorkers = raster_Workers
+
+    func_Set_Raster_Workers(workers)
+
+    try:
+
+        return dict_Raster_Writers[name](points, numpy.ones(len(points.x),
+                                                            dtype=bool),
+                                         polygons, rasterName, mask)
+
+    finally:
+
+        func_Set_Raster_Workers(previousWorkers)
+
+
+def func_Run_Raster_Analyses(runParams, naming, points, clipMask,
+                             censusShapefile, list_Rasters):
+
+    # This function runs the selected raster analyses (analysis option, name
+    # within the log messages, raster name) at the same time through the
+    # analysis scheduler, logging each one as it completes. The raster
+    # workers are split between the analyses. If any analysis fails, the
+    # others still complete before its error is raised.
+
+    # Clip region's polygons, loaded once, and their raster mask (see
+    # Hazard_MaskCache), built once here and sent with every analysis, along
+    # with the clipped points (all the workers need).
+    polygons = func_Clip_Polygons(runParams, censusShapefile)
+    projectedPolygons = func_Project_Polygons(polygons)
+    mask = func_Polygon_Mask(projectedPolygons, func_Polygons_Grid(
+        projectedPolygons)).inside
+    clippedPoints = HazardPoints(None, points.x[clipMask], points.y[clipMask],
+                                 points.mags[clipMask])
+
+    os.makedirs(naming.fullPathName + "/" + gisFolder_Name, exist_ok=True)
+
+    workers = raster_Workers
+
+    if workers is None:
+
+        workers = os.cpu_count() or 1
+
+    # Worker processes of each analysis' own.
+    analysisWorkers = max(1, workers // len(list_Rasters))
+
+    list_Jobs = []
+
+    for name, label, rasterName in list_Rasters:
+
+        func_Log_Stage("analysis", 70, label + " Analysis started.",
+                       analysis=name, file=rasterName)
+
+        list_Jobs.append(AnalysisJob(name, label, func_Raster_Analysis_Task,
+                                     (name, analysisWorkers, clippedPoints,
+                                      polygons, mask, rasterName)))
+
+    def func_Progress(result, completed, total):
+
+        # Log each analysis as it completes (or fails).
+        name = result.job.name
+        rasterName = result.job.arguments[-1]
+
+        if result.error is not None:
+
+            func_Log_Stage("analysis", None, result.job.label + " Analysis "
+                           "failed: " + str(result.error), analysis=name,
+                           file=rasterName)
+
+            return
+
+        if result.value is not None:
+
+            func_Log_Stage("analysis", None, result.value, analysis=name,
+                           file=rasterName)
+
+        func_Log_Stage("analysis", 70 + 20 * completed // total,
+                       result.job.label + " Analysis completed.",
+                       analysis=name, file=rasterName,
+                       seconds=round(result.seconds, 3))
+
+    with func_Stage_Span("raster analyses", analyses=",".join(
+            name for name, label, rasterName in list_Rasters)):
+
+        list_Results = func_Run_Analysis_Jobs(list_Jobs, min(workers,
+                                                             len(list_Jobs)),
+                                              func_Progress)
+
+    for result in list_Results:
+
+        if result.error is not None:
+
+            raise result.error
+
+
+def func_Run_Analyses(hazard, runParams, naming, points, pointCounties,
+                      clipMask=None, censusShapefile=None):
+
+    # This function runs the selected analysis options that are available
+    # without ArcGIS, returning the path of the data counts CSV (None if not
+    # written). All other analysis options are logged as skipped. The raster
+    # analyses require the clip mask of the points and the Census Bureau's
+    # Shapefile (for the clip region's polygons).
+
+    dataCountsName = None
+
+    for name in sorted(runParams.analysis_Options):
+
+        if name not in tuple_Headless_Analysis_Names:
+
+            func_Log_Stage("analysis", None, "Analysis requires ArcGIS, "
+                           "skipped.", analysis=name)
+
+    # Selected raster analyses: (analysis option, name within the log
+    # messages, raster name).
+    list_Rasters = []
+
+    for name, prefix, label in tuple_Raster_Analyses:
+
+        if name not in runParams.analysis_Options or clipMask is None or \
+                censusShapefile is None:
+
+            continue
+
+        list_Rasters.append((name, label, naming.fullPathName + "/" +
+                             gisFolder_Name + "/" + prefix +
+                             naming.nameFeatureClass_FromCSV +
+                             naming.folderNamingAddition + fileExtTIF))
+
+    if list_Rasters:
+
+        func_Run_Raster_Analyses(runParams, naming, points, clipMask,
+                                 censusShapefile, list_Rasters)
+
+    if "OutputToCSVFile" in runParams.analysis_Options:
+
+        dataCountsName = naming.csvDirectory + "DataCounts_" + \
+            naming.nameFeatureClass_FromCSV + naming.folderNamingAddition + \
+            fileExtCSV
+
+        with func_Stage_Span("DataCounts CSV", file=dataCountsName):
+
+            func_Write_Data_Counts(hazard, runParams, points.mags,
+                                   pointCounties, dataCountsName)
+
+        func_Log_Stage("analysis", 95, "Count results written to CSV file.",
+                       analysis="OutputToCSVFile", file=dataCountsName)
+
+    return dataCountsName
+
+
+def func_Prepare_Checked_CSV(hazard, runParams, naming):
+
+    # This function runs the download and CSV check stages, returning the path
+    # of the checked CSV and its number of rows.
+
+    os.makedirs(naming.fullPathName, exist_ok=True)
+
+    with func_Stage_Span("download", hazard=hazard):
+
+        downloadName = func_Download_Hazard_CSV(hazard, runParams, naming)
+
+    checkedName = naming.csvDirectory + naming.nameFeatureClass_FromCSV + \
+        "_checked" + fileExtCSV
+
+    with func_Stage_Span("CSV validation", file=checkedName):
+
+        return checkedName, func_Check_Hazard_CSV(hazard, runParams,
+                                                  downloadName, checkedName)
+
+
+def func_Clip_And_Analyze(hazard, runParams, naming, checkedCount, points,
+                          pointCounties, censusShapefile=None):
+
+    # This function runs the clip and analysis stages for one clip region,
+    # from the hazard points and their located counties. A PipelineResult is
+    # returned.
+
+    os.makedirs(naming.csvDirectory, exist_ok=True)
+
+    clipMask = func_Region_Masks(runParams, pointCounties)[2]
+    clippedCount = int(numpy.count_nonzero(clipMask))
+
+    clippedName = naming.csvDirectory + "clipped_" + \
+        naming.nameFeatureClass_FromCSV + naming.folderNamingAddition + \
+        fileExtCSV
+
+    with func_Stage_Span("clip", file=clippedName, rows=clippedCount):
+
+        func_Write_Clipped_CSV(hazard, points, clipMask, clippedName)
+
+    func_Log_Stage("clip", 60, "Clip complete.", file=clippedName,
+                   rows=clippedCount)
+
+    # If the clip region has no points, there is nothing left to analyze.
+    if clippedCount == 0:
+
+        func_Log_Stage("clip", 100, "No " + dict_Hazard_Settings[hazard].
+                       plural.lower() + " found within the clip region.")
+
+        return PipelineResult("empty", naming.fullPathName, checkedCount, 0,
+                              None)
+
+    dataCountsName = func_Run_Analyses(hazard, runParams, naming, points,
+                                       pointCounties, clipMask,
+                                       censusShapefile)
+
+    func_Log_Stage("complete", 100, "Processing complete.",
+                   folder=naming.fullPathName)
+
+    return PipelineResult("complete", naming.fullPathName, checkedCount,
+                          clippedCount, dataCountsName)
+
+
+def func_Run_Pipeline(hazard, runParams, censusShapefile=None):
+
+    # This function runs every stage for one set of run parameters: download,
+    # CSV checks, clip, and analyses. The Census Bureau's Shapefile is
+    # downloaded if no path is given. A PipelineResult is returned; errors
+    # are raised to the caller.
+
+    naming = func_Run_Naming(hazard, runParams)
+
+    func_Log_Stage("start", 0, "Processing.", hazard=hazard,
+                   folder=naming.fullPathName)
+
+    checkedName, checkedCount = func_Prepare_Checked_CSV(hazard, runParams,
+                                                         naming)
+
+    # If the checked CSV has no rows, there is nothing left to process.
+    if checkedCount == 0:
+
+        func_Log_Stage("check", 100, "No " + dict_Hazard_Settings[hazard].
+                       plural.lower() + " found for the selected parameters.")
+
+        return PipelineResult("empty", naming.fullPathName, 0, None, None)
+
+    # If the run has no clip region, the checked CSV is the final output.
+    if func_Clip_Selection(runParams) == 0:
+
+        func_Log_Stage("complete", 100, "Processing complete.",
+                       folder=naming.fullPathName)
+
+        return PipelineResult("complete", naming.fullPathName, checkedCount,
+                              None, None)
+
+    if censusShapefile is None:
+
+        with func_Stage_Span("download and unzip census shapefile"):
+
+            censusShapefile = func_Download_Census_Shapefile()
+
+    func_Log_Stage("clip", 40, "Locating points within the 50 states and DC "
+                   "counties.", shapefile=censusShapefile)
+
+    with func_Stage_Span("spatial join", shapefile=censusShapefile):
+
+        points = func_Load_Hazard_Points(hazard, checkedName)
+        pointCounties = func_Locate_Point_Counties(
+            points, func_Load_County_Polygons(censusShapefile))
+
+    return func_Clip_And_Analyze(hazard, runParams, naming, checkedCount,
+                                 points, pointCounties, censusShapefile)
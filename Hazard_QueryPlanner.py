@@ -0,0 +1,201 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the USGS FDSN query
+# planner used by the Earthquake Options' custom timespan. USGS rejects any
+# query with more than 20,000 events, so long timespans must be downloaded as
+# several queries. Instead of always using one query per month, the planner
+# asks the FDSN count endpoint how many events a time window holds, splits
+# the windows with too many events, and merges neighboring windows with few
+# events, so every query stays under the limit with as few queries as
+# possible.
+
+# All import statements for utilized modules.
+import json
+import math
+import datetime
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from Hazard_DownloadCache import func_Cache_Stream
+from Hazard_ChunkDownloader import chunk_MaxWorkers
+from Hazard_ChunkDownloader import chunk_Retries
+from Hazard_ChunkDownloader import chunk_Backoff_Seconds
+from Hazard_ChunkDownloader import func_Run_Chunk
+
+# Maximum number of events USGS returns for one query (the count endpoint's
+# "maxAllowed" value is used instead, if it is smaller).
+planner_MaxEvents = 20000
+
+# Fraction of the maximum events each planned query is filled to. The margin
+# allows for events added to the catalog between the count and the download.
+planner_Fill = 0.95
+
+# Shortest time window that can be split further.
+planner_MinWindow = datetime.timedelta(seconds=1)
+
+# Time window of one query. The window includes its start and excludes its
+# end. Count is the number of events within the window.
+QueryWindow = collections.namedtuple("QueryWindow", "start end count")
+
+
+def func_Window_URL(baseURL, start, end):
+
+    # This function returns the FDSN URL for the events within a time window.
+    # FDSN end times are inclusive, so the end time is one millisecond (the
+    # precision of USGS event times) before the window's end.
+
+    return baseURL + "&starttime=" + \
+        start.isoformat(timespec="milliseconds") + "&endtime=" + \
+        (end - datetime.timedelta(milliseconds=1)).isoformat(
+            timespec="milliseconds")
+
+
+def func_Window_Name(window):
+
+    # This function returns the name of a time window within the progress
+    # messages, e.g. "2000-01-01 00:00 to 2000-03-01 00:00 (1234 events)".
+
+    return window.start.strftime("%Y-%m-%d %H:%M") + " to " + \
+        window.end.strftime("%Y-%m-%d %H:%M") + " (" + str(window.count) + \
+        " events)"
+
+
+def func_Count_Events(countURL, start, end, retries, backoffSeconds):
+
+    # This function returns the (number of events, maximum events allowed per
+    # query) within a time window, from the FDSN count endpoint (GeoJSON
+    # format). Temporary errors are retried the same as the downloads.
+
+    url = func_Window_URL(countURL, start, end)
+
+    # This function reads the count endpoint's reply.
+    def func_Read_Count():
+
+        return json.loads(b"".join(func_Cache_Stream(url)).decode("utf-8"))
+
+    reply = func_Run_Chunk(0, url, func_Read_Count, retries, backoffSeconds,
+                           threading.Event(), None)[1]
+
+    return int(reply["count"]), int(reply.get("maxAllowed",
+                                              planner_MaxEvents))
+
+
+def func_Split_Window(pool, countURL, window, limit, retries,
+                      backoffSeconds):
+
+    # This function splits a time window with more events than the limit
+    # into equal parts (enough parts that each would be under the limit if
+    # the events were spread evenly), counts each part, and splits any part
+    # that is still over the limit. The list of windows is returned in time
+    # order.
+
+    if window.count <= limit:
+
+        return [window]
+
+    # If the window can't be split any further, the events can't be
+    # downloaded without USGS cutting them off.
+    if window.end - window.start <= planner_MinWindow:
+
+        raise ValueError("More than " + str(limit) + " events between " +
+                         str(window.start) + " and " + str(window.end) +
+                         "; the query can't be split any further.")
+
+    parts = math.ceil(window.count / limit)
+    step = (window.end - window.start) / parts
+
+    # Boundaries of the parts (whole milliseconds, the same as the URLs).
+    boundaries = [window.start]
+
+    for part in range(1, parts):
+
+        boundary = window.start + step * part
+        boundary = boundary.replace(microsecond=boundary.microsecond //
+                                    1000 * 1000)
+
+        if boundary > boundaries[-1]:
+
+            boundaries.append(boundary)
+
+    boundaries.append(window.end)
+
+    # Count the parts at the same time.
+    counts = pool.map(lambda start, end: func_Count_Events(
+        countURL, start, end, retries, backoffSeconds)[0],
+        boundaries[:-1], boundaries[1:])
+
+    # List for the split windows.
+    list_Windows = []
+
+    for start, end, count in zip(boundaries[:-1], boundaries[1:], counts):
+
+        list_Windows.extend(func_Split_Window(
+            pool, countURL, QueryWindow(start, end, count), limit, retries,
+            backoffSeconds))
+
+    return list_Windows
+
+
+def func_Merge_Windows(list_Windows, limit):
+
+    # This function merges neighboring time windows while the merged window
+    # stays within the limit. (Filling each query in time order gives the
+    # fewest queries for these window boundaries.)
+
+    # List for the merged windows.
+    list_Merged = []
+
+    for window in list_Windows:
+
+        if list_Merged and list_Merged[-1].count + window.count <= limit:
+
+            list_Merged[-1] = QueryWindow(list_Merged[-1].start, window.end,
+                                          list_Merged[-1].count + window.count)
+
+        else:
+
+            list_Merged.append(window)
+
+    return list_Merged
+
+
+def func_Plan_Query_Windows(countURL, start, end, maxEvents=None,
+                            maxWorkers=None, retries=None,
+                            backoffSeconds=None):
+
+    # This function returns the list of time windows (in time order) covering
+    # start (inclusive) to end (exclusive), with each window's events within
+    # the limit of one query. countURL is the FDSN count endpoint's URL with
+    # format=geojson and any other parameters (e.g. magnitude) of the query.
+    # Windows with no events are dropped.
+
+    if maxEvents is None:
+
+        maxEvents = planner_MaxEvents
+
+    if maxWorkers is None:
+
+        maxWorkers = chunk_MaxWorkers
+
+    if retries is None:
+
+        retries = chunk_Retries
+
+    if backoffSeconds is None:
+
+        backoffSeconds = chunk_Backoff_Seconds
+
+    count, maxAllowed = func_Count_Events(countURL, start, end, retries,
+                                          backoffSeconds)
+
+    # Number of events each query is filled to.
+    limit = max(1, int(min(maxEvents, maxAllowed) * planner_Fill))
+
+    with ThreadPoolExecutor(max_workers=max(1, maxWorkers)) as pool:
+
+        list_Windows = func_Split_Window(pool, countURL,
+                                         QueryWindow(start, end, count),
+                                         limit, retries, backoffSeconds)
+
+    return func_Merge_Windows([window for window in list_Windows
+                               if window.count > 0], limit)
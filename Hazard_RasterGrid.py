@@ -0,0 +1,304 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the raster grids used by
+# the native analysis engines (the headless equivalents of the arcpy.sa
+# surfaces). Points and polygons are projected the same as the GUIs' feature
+# classes, the grid covers the clip polygons' extent (the same as setting
+# arcpy.env.extent to the mask), the clip polygons are rasterized as the mask
+# (the native equivalent of ExtractByMask), and the surfaces are written as a
+# TIFF (or .npy) with a world file and projection file, so ArcGIS, QGIS, and
+# GDAL can open them.
+
+# All import statements for utilized modules.
+import os
+import struct
+from collections import namedtuple
+import numpy
+from Hazard_ClipEngine import ClipPolygons
+
+# Parameters of the GUIs' Projected Coordinate System: WGS84 Web Mercator
+# Auxiliary Sphere with -30.0 offset of Central Meridian (see GUI_HailOptions).
+raster_Sphere_Radius = 6378137.0
+raster_Central_Meridian = -30.0
+
+# Web Mercator's latitude limit (degrees).
+raster_Max_Latitude = 85.0511287798066
+
+# Projection file text (ESRI WKT) of the same coordinate system.
+raster_Projection_WKT = \
+    'PROJCS["WGS_1984_Web_Mercator_Auxiliary_Sphere",' \
+    'GEOGCS["GCS_WGS_1984",DATUM["D_WGS_1984",' \
+    'SPHEROID["WGS_1984",6378137.0,298.257223563]],PRIMEM["Greenwich",0.0],' \
+    'UNIT["Degree",0.0174532925199433]],' \
+    'PROJECTION["Mercator_Auxiliary_Sphere"],PARAMETER["False_Easting",0.0],' \
+    'PARAMETER["False_Northing",0.0],' \
+    'PARAMETER["Central_Meridian",' + str(raster_Central_Meridian) + '],' \
+    'PARAMETER["Standard_Parallel_1",0.0],' \
+    'PARAMETER["Auxiliary_Sphere_Type",0.0],UNIT["Meter",1.0]]'
+
+# Number of cells along the shorter side of the extent when no cell size is
+# given (the same as the arcpy.sa default cell size).
+raster_Default_Cells = 250
+
+# Raster grid (north up). originX/originY are the extent's left and top
+# edges, so cell (row, column) is centered at originX + (column + 0.5) *
+# cellSize, originY - (row + 0.5) * cellSize.
+RasterGrid = namedtuple("RasterGrid", ["originX", "originY", "cellSize",
+                                       "columns", "rows"])
+
+
+def func_Project_Points(longitudes, latitudes):
+
+    # This function returns the projected (x, y) arrays (meters) of longitude
+    # and latitude arrays.
+
+    longitudes = numpy.asarray(longitudes, dtype=numpy.float64)
+    latitudes = numpy.clip(numpy.asarray(latitudes, dtype=numpy.float64),
+                           -raster_Max_Latitude, raster_Max_Latitude)
+
+    # Longitudes relative to the central meridian, within -180 to 180, so
+    # Alaska isn't split.
+    longitudes = (longitudes - raster_Central_Meridian + 180.0) % 360.0 - \
+        180.0
+
+    return raster_Sphere_Radius * numpy.radians(longitudes), \
+        raster_Sphere_Radius * numpy.log(numpy.tan(
+            numpy.pi / 4.0 + numpy.radians(latitudes) / 2.0))
+
+
+def func_Project_Polygons(polygons):
+
+    # This function returns a copy of polygons (see func_Load_Polygons) with
+    # every edge and bounding box projected.
+
+    # Lists for the projected edges and bounding boxes.
+    list_Edges = []
+    list_BBoxes = []
+
+    for x1, y1, x2, y2 in polygons.edges:
+
+        x1, y1 = func_Project_Points(x1, y1)
+        x2, y2 = func_Project_Points(x2, y2)
+
+        list_Edges.append((x1, y1, x2, y2))
+
+        if len(x1) == 0:
+
+            list_BBoxes.append((0.0, 0.0, 0.0, 0.0))
+
+        else:
+
+            list_BBoxes.append((min(x1.min(), x2.min()),
+                                min(y1.min(), y2.min()),
+                                max(x1.max(), x2.max()),
+                                max(y1.max(), y2.max())))
+
+    return ClipPolygons(numpy.array(list_BBoxes,
+                                    dtype=numpy.float64).reshape(-1, 4),
+                        list_Edges, polygons.records)
+
+
+def func_Grid_From_Extent(xmin, ymin, xmax, ymax, cellSize=None):
+
+    # This function returns the raster grid covering an extent. If no cell
+    # size is given, the shorter side of the extent is split into
+    # raster_Default_Cells cells.
+
+    width = max(xmax - xmin, 0.0)
+    height = max(ymax - ymin, 0.0)
+
+    if cellSize is None:
+
+        cellSize = min(width, height) / raster_Default_Cells
+
+        # A point or line extent uses the longer side instead.
+        if cellSize <= 0:
+
+            cellSize = max(width, height, 1.0) / raster_Default_Cells
+
+    return RasterGrid(float(xmin), float(ymax), float(cellSize),
+                      max(1, int(numpy.ceil(width / cellSize))),
+                      max(1, int(numpy.ceil(height / cellSize))))
+
+
+def func_Polygons_Grid(polygons, cellSize=None):
+
+    # This function returns the raster grid covering the extent of projected
+    # polygons.
+
+    bboxes = polygons.bboxes
+
+    return func_Grid_From_Extent(bboxes[:, 0].min(), bboxes[:, 1].min(),
+                                 bboxes[:, 2].max(), bboxes[:, 3].max(),
+                                 cellSize)
+
+
+def func_Cell_Centers(grid):
+
+    # This function returns the x values of every column's cell centers and
+    # the y values of every row's cell centers.
+
+    return grid.originX + (numpy.arange(grid.columns) + 0.5) * grid.cellSize, \
+        grid.originY - (numpy.arange(grid.rows) + 0.5) * grid.cellSize
+
+
+def func_Rasterize_Polygons(polygons, grid):
+
+    # This function returns the boolean mask (rows, columns) of the cells
+    # whose center falls inside any of the projected polygons (even-odd
+    # rule, the same as the clip engine's ray casting). Each edge is crossed
+    # with the cell center rows it spans; every crossing flips the inside
+    # state of the cells to its right, so the mask is the cumulative count of
+    # crossings along each row, modulo two.
+
+    centerX, centerY = func_Cell_Centers(grid)
+
+    # Crossing counts, with one extra column for crossings right of the grid.
+    crossings = numpy.zeros((grid.rows, grid.columns + 1), dtype=numpy.int32)
+
+    for x1, y1, x2, y2 in polygons.edges:
+
+        if len(x1) == 0:
+
+            continue
+
+        # Rows (cell center y values) spanned by each edge. Row y values
+        # decrease with the row number.
+        rowFrom = numpy.ceil((grid.originY - numpy.maximum(y1, y2)) /
+                             grid.cellSize - 0.5).astype(numpy.int64)
+        rowTo = numpy.floor((grid.originY - numpy.minimum(y1, y2)) /
+                            grid.cellSize - 0.5).astype(numpy.int64)
+        rowFrom = numpy.maximum(rowFrom, 0)
+        rowTo = numpy.minimum(rowTo, grid.rows - 1)
+        counts = numpy.maximum(rowTo - rowFrom + 1, 0)
+
+        if counts.sum() == 0:
+
+            continue
+
+        # Every (edge, row) pair.
+        pairEdges = numpy.repeat(numpy.arange(len(x1)), counts)
+        pairRows = numpy.repeat(rowFrom, counts) + \
+            numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) -
+                                                      counts, counts)
+        pointY = centerY[pairRows]
+
+        ex1 = x1[pairEdges]
+        ey1 = y1[pairEdges]
+        ex2 = x2[pairEdges]
+        ey2 = y2[pairEdges]
+
+        # Keep the pairs whose edge spans the row's y value (the same test as
+        # the clip engine, so shared edges are crossed once).
+        spans = (ey1 > pointY) != (ey2 > pointY)
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+
+            crossX = (ex2 - ex1) * (pointY - ey1) / (ey2 - ey1) + ex1
+
+        # First column whose cell center is right of the crossing.
+        crossColumns = numpy.floor((crossX[spans] - grid.originX) /
+                                   grid.cellSize - 0.5).astype(numpy.int64) + 1
+
+        numpy.add.at(crossings, (pairRows[spans],
+                                 numpy.clip(crossColumns, 0, grid.columns)), 1)
+
+    return numpy.cumsum(crossings[:, :grid.columns], axis=1) % 2 == 1
+
+
+def func_Write_World_File(worldPath, grid):
+
+    # This function writes the world file of a raster grid (cell size,
+    # rotation, and the center of the upper-left cell).
+
+    with open(worldPath, "w") as worldFile:
+
+        worldFile.write("\n".join(repr(value) for value in (
+            grid.cellSize, 0.0, 0.0, -grid.cellSize,
+            grid.originX + grid.cellSize / 2.0,
+            grid.originY - grid.cellSize / 2.0)) + "\n")
+
+
+def func_Write_TIFF(tiffPath, values):
+
+    # This function writes a 32-bit floating point, single-band, uncompressed
+    # TIFF (one strip). NaN cells are NoData.
+
+    values = numpy.ascontiguousarray(values, dtype="<f4")
+    rows, columns = values.shape
+
+    # (tag, type, count, value) of every IFD entry, sorted by tag. Types:
+    # 3 = SHORT, 4 = LONG.
+    list_Entries = [(256, 4, 1, columns), (257, 4, 1, rows),
+                    (258, 3, 1, 32), (259, 3, 1, 1), (262, 3, 1, 1),
+                    (273, 4, 1, 0), (277, 3, 1, 1), (278, 4, 1, rows),
+                    (279, 4, 1, values.nbytes), (284, 3, 1, 1),
+                    (339, 3, 1, 3)]
+
+    # The strip follows the header and IFD.
+    stripOffset = 8 + 2 + len(list_Entries) * 12 + 4
+    list_Entries[5] = (273, 4, 1, stripOffset)
+
+    with open(tiffPath, "wb") as tiffFile:
+
+        tiffFile.write(b"II*\x00" + struct.pack("<I", 8))
+        tiffFile.write(struct.pack("<H", len(list_Entries)))
+
+        for tag, valueType, count, value in list_Entries:
+
+            if valueType == 3:
+
+                tiffFile.write(struct.pack("<HHIHH", tag, valueType, count,
+                                           value, 0))
+
+            else:
+
+                tiffFile.write(struct.pack("<HHII", tag, valueType, count,
+                                           value))
+
+        tiffFile.write(struct.pack("<I", 0))
+        tiffFile.write(values.tobytes())
+
+
+def func_Write_Raster(rasterPath, grid, values):
+
+    # This function writes a surface (rows, columns) as a TIFF (.tif) or NumPy
+    # array (.npy), along with its world file (.tfw or .wld) and projection
+    # file (.prj). NaN cells are NoData.
+
+    basePath, extension = os.path.splitext(rasterPath)
+
+    if extension.lower() == ".npy":
+
+        numpy.save(rasterPath, numpy.asarray(values, dtype=numpy.float32))
+        func_Write_World_File(basePath + ".wld", grid)
+
+    else:
+
+        func_Write_TIFF(rasterPath, values)
+        func_Write_World_File(basePath + ".tfw", grid)
+
+    with open(basePath + ".prj", "w") as projectionFile:
+
+        projectionFile.write(raster_Projection_WKT)
+
+
+def func_Read_TIFF(tiffPath):
+
+    # This function reads a TIFF written by func_Write_TIFF.
+
+    with open(tiffPath, "rb") as tiffFile:
+
+        data = tiffFile.read()
+
+    dict_Tags = {}
+
+    for entry in range(struct.unpack_from("<H", data, 8)[0]):
+
+        tag, valueType = struct.unpack_from("<HH", data, 10 + entry * 12)
+        dict_Tags[tag] = struct.unpack_from("<H" if valueType == 3 else "<I",
+                                            data, 10 + entry * 12 + 8)[0]
+
+    return numpy.frombuffer(data, dtype="<f4", count=dict_Tags[256] *
+                            dict_Tags[257], offset=dict_Tags[273]).reshape(
+                                dict_Tags[257], dict_Tags[256])
@@ -0,0 +1,76 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the readiness checks
+# used by the hazard options GUIs between processing stages. Instead of
+# pausing for a fixed time before re-creating a deleted output folder, the
+# stage waits only until the folder is actually gone, checking again at short,
+# growing intervals, and continues at once if it already is. (The other stages
+# use outputs that are complete once the stage before returns, e.g. a download
+# or an unzipped CSV, so they don't wait at all.)
+
+# All import statements for utilized modules.
+import os
+import time
+import shutil
+
+# Seconds between the first checks, and the most seconds between any two
+# checks (the interval doubles after each check).
+ready_Poll_Seconds = 0.01
+ready_Poll_Max = 0.25
+
+# Seconds to wait for a folder to be deleted before giving up.
+ready_Timeout_Seconds = 30.0
+
+
+def func_Remove_Folder(path, timeoutSeconds=None):
+
+    # This function deletes a folder and everything within it, returning once
+    # the folder is gone. On Windows, a deleted file stays in place until the
+    # last program holding it (e.g. a virus scanner or the search indexer)
+    # lets go of it, so deleting can fail (or finish later) for a short time;
+    # the delete is tried again until the timeout runs out.
+
+    if timeoutSeconds is None:
+
+        timeoutSeconds = ready_Timeout_Seconds
+
+    deadline = time.monotonic() + timeoutSeconds
+    interval = ready_Poll_Seconds
+
+    while True:
+
+        try:
+
+            shutil.rmtree(path)
+
+        except FileNotFoundError:
+
+            pass
+
+        except OSError:
+
+            if time.monotonic() >= deadline:
+
+                raise
+
+            time.sleep(interval)
+
+            interval = min(interval * 2, ready_Poll_Max)
+
+            continue
+
+        # Wait until the folder is gone.
+        while os.path.exists(path):
+
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+
+                raise OSError("Folder still exists after being deleted: " +
+                              path)
+
+            time.sleep(min(interval, remaining))
+
+            interval = min(interval * 2, ready_Poll_Max)
+
+        return
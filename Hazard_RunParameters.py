@@ -0,0 +1,102 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the Run Parameters that
+# are shared by the Hail, Wind, Tornado, Hurricane, and Earthquake Options.
+
+# All import statements for utilized modules.
+import tkinter
+from collections import namedtuple
+
+# Immutable set of user selections for one run of the processing tasks. This is
+# built once on the GUI thread when the user clicks the OK button, so that the
+# processing thread (and every per-row loop within it) never has to call back
+# into Tk for a value.
+# hazard_Timespan/hazard_Magnitude: Timespan and magnitude combobox text
+# (diameter for hail, speed for wind, intensity for tornadoes and hurricanes).
+# custom_*: Custom timespan and custom magnitude combobox values (None if the
+# custom comboboxes were never created).
+# url_Text: Text within the URL textbox.
+# workspace_Folder: Text within the output workspace folder textbox.
+# options_Checked: 1 if the "More Options" checkbox is selected, else 0.
+# state_Name/county_Name: State and county combobox text (None if the
+# comboboxes were never created).
+# analysis_Options: Names of the selected analysis checkboxes (e.g. "IDW").
+RunParameters = namedtuple("RunParameters", ["hazard_Timespan",
+                                             "hazard_Magnitude",
+                                             "custom_Year_From",
+                                             "custom_Month_From",
+                                             "custom_Year_To",
+                                             "custom_Month_To",
+                                             "custom_Magnitude_Min",
+                                             "custom_Magnitude_Max",
+                                             "url_Text",
+                                             "workspace_Folder",
+                                             "options_Checked",
+                                             "state_Name",
+                                             "county_Name",
+                                             "analysis_Options"])
+
+
+def func_Get_Tk_Value(tkVariable):
+
+    # This function returns the value of a Tk variable or widget, or None if
+    # the variable hasn't been created yet (or holds an empty value that can't
+    # be converted, e.g. an IntVar with no selection).
+
+    # If the variable hasn't been created...
+    if tkVariable is None:
+
+        return None
+
+    try:
+
+        return tkVariable.get()
+
+    except tkinter.TclError:
+
+        return None
+
+
+def func_Get_Checked_Analyses(guiFrame, analysisNames):
+
+    # This function returns the names of all analysis checkboxes that are
+    # selected within the GUI frame. Each name matches the suffix of the
+    # frame's "statusAnalysis_" checkbox variable (e.g. "IDW" for
+    # statusAnalysis_IDW).
+
+    return frozenset(name for name in analysisNames if
+                     func_Get_Tk_Value(getattr(guiFrame, "statusAnalysis_" +
+                                               name, None)) == 1)
+
+
+def func_Custom_Timespan(runParameters):
+
+    # This function returns the custom timespan of a run as text (FROM year,
+    # FROM month, TO year, TO month), as the filter engine takes it.
+
+    return (str(runParameters.custom_Year_From),
+            str(runParameters.custom_Month_From),
+            str(runParameters.custom_Year_To),
+            str(runParameters.custom_Month_To))
+
+
+def func_Custom_Timespan_Text(runParameters):
+
+    # This function returns the custom timespan of a run as written within
+    # the DataCounts CSVs (YYYYMM-YYYYMM).
+
+    yearFrom, monthFrom, yearTo, monthTo = func_Custom_Timespan(runParameters)
+
+    return yearFrom + monthFrom.zfill(2) + "-" + yearTo + monthTo.zfill(2)
+
+
+def func_Custom_Magnitude_Text(runParameters):
+
+    # This function returns the custom magnitude range of a run as written
+    # within the DataCounts CSVs (MIN-MAX). Negative magnitudes (earthquakes)
+    # are written with "neg_" in place of the minus sign, the same as within
+    # the output names.
+
+    return "-".join(str(value).replace("-", "neg_") for value in
+                    (runParameters.custom_Magnitude_Min,
+                     runParameters.custom_Magnitude_Max))
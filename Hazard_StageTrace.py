@@ -0,0 +1,365 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the functionality for the stage trace used by
+# the hazard options GUIs and the command line driver. While a trace is
+# running, each processing stage (download, unzip, CSV checks, each ArcPy
+# tool, each analysis, etc.) is timed as a span, along with the CPU time and
+# memory of the process. The spans are kept in memory and written to a JSON
+# trace file once the trace is stopped. If profiling is turned on, each
+# top-level span is also captured with cProfile, one .prof file per span,
+# next to the trace file.
+
+# All import statements for utilized modules.
+import os
+import sys
+import json
+import time
+import cProfile
+import tempfile
+import datetime
+import threading
+import contextlib
+
+# If set (e.g. HAZARD_PROFILE=1), every trace also captures cProfile files.
+trace_Profile = os.environ.get("HAZARD_PROFILE", "") not in ("", "0")
+
+# The running trace (only one at a time): a dictionary of the trace file's
+# path, whether spans are profiled, the trace's start, its spans, and the ID
+# of the process that started it. Worker processes forked while a trace runs
+# inherit a copy of it, which they ignore (see func_Trace_Running), so only
+# the process that started the trace writes it.
+dict_Trace = {}
+
+# Lock so that only one thread at a time changes the running trace.
+trace_Lock = threading.Lock()
+
+# Spans still running within each thread (the innermost last).
+thread_Spans = threading.local()
+
+# Stage of each hazard options GUI function traced during a run (function
+# name: stage name). Names a GUI doesn't have are skipped.
+dict_GUI_Stages = {
+    "func_DownloadCSV": "download",
+    "func_CustomTimespan_Download_CSV_and_HeaderCheck": "download",
+    "func_Download_Zipped_Hurr_Shapefile": "download",
+    "func_Download_Unzip_Census_Shapefile":
+        "download and unzip census shapefile",
+    "func_NonCustomTimespan_CSV_HeaderCheck_ValueCheck": "CSV validation",
+    "func_CustomTimespan_CSV_HeaderCheck_ValueCheck": "CSV validation",
+    "func_NonCustomTimespan_FeatureClass_ValueChecks": "value checks",
+    "func_CustomTimespan_FeatureClass_ValueChecks": "value checks",
+    "func_CreateFeatureClass_from_CSV": "feature class from CSV",
+    "func_Create_FeatureClass_from_Shapefile":
+        "feature class from shapefile",
+    "func_Prepare_County_Store": "county store",
+    "func_FeatureClass_Clip": "clip",
+    "func_FeatureClass_Buffer": "buffer",
+    "func_Controls_For_Analysis_Options": "analyses",
+    "func_Run_Scheduled_Raster_Analyses": "scheduled raster analyses",
+    "func_CSV_DataCount_Global_Count": "DataCounts CSV",
+    "func_CSV_DataCount_Nationwide_Count": "DataCounts CSV",
+    "func_CSV_DataCount_Statewide_Count": "DataCounts CSV",
+    "func_CSV_DataCount_Countywide_Count": "DataCounts CSV"}
+
+# Stage of each ArcPy tool traced during a run.
+dict_Arcpy_Stages = {
+    "MakeXYEventLayer_management": "arcpy MakeXYEventLayer",
+    "FeatureClassToFeatureClass_conversion":
+        "arcpy FeatureClassToFeatureClass",
+    "Project_management": "arcpy Project",
+    "Clip_analysis": "arcpy Clip",
+    "Buffer_analysis": "arcpy Buffer",
+    "SpatialJoin_analysis": "arcpy SpatialJoin",
+    "CreateThiessenPolygons_analysis": "arcpy CreateThiessenPolygons",
+    "OptimizedHotSpotAnalysis_stats": "arcpy OptimizedHotSpotAnalysis",
+    "CopyRaster_management": "arcpy CopyRaster"}
+
+# Stage of each ArcPy Spatial Analyst tool traced during a run.
+dict_Arcpy_SA_Stages = {
+    "Idw": "arcpy.sa Idw",
+    "KernelDensity": "arcpy.sa KernelDensity",
+    "Kriging": "arcpy.sa Kriging",
+    "NaturalNeighbor": "arcpy.sa NaturalNeighbor",
+    "PointDensity": "arcpy.sa PointDensity",
+    "Spline": "arcpy.sa Spline",
+    "Trend": "arcpy.sa Trend",
+    "ExtractByMask": "arcpy.sa ExtractByMask"}
+
+
+def func_Memory_Bytes():
+
+    # This function returns the (current, peak) memory of the process in
+    # bytes. The current memory requires psutil; without it, only the peak is
+    # returned (None where neither is available, e.g. Windows without
+    # psutil).
+
+    current = None
+    peak = None
+
+    try:
+
+        # psutil is only needed for the current memory.
+        import psutil
+
+        memory = psutil.Process().memory_info()
+        current = memory.rss
+        peak = getattr(memory, "peak_wset", None)
+
+    except ImportError:
+
+        pass
+
+    if peak is None:
+
+        try:
+
+            import resource
+
+            # Linux reports kilobytes, macOS bytes.
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+            if sys.platform != "darwin":
+
+                peak *= 1024
+
+        except ImportError:
+
+            pass
+
+    return current, peak
+
+
+def func_Trace_Running():
+
+    # This function returns whether a trace is running within this process
+    # (not a copy inherited by a forked worker process).
+
+    return bool(dict_Trace) and dict_Trace["pid"] == os.getpid()
+
+
+def func_Start_Trace(tracePath, profile=None):
+
+    # This function starts a trace written to the JSON file. If profile is
+    # None, trace_Profile decides whether the spans are profiled.
+
+    with trace_Lock:
+
+        dict_Trace.clear()
+        dict_Trace.update({"path": tracePath,
+                           "profile": trace_Profile if profile is None
+                           else profile,
+                           "start": time.perf_counter(),
+                           "started": datetime.datetime.now().isoformat(
+                               timespec="seconds"),
+                           "spans": [],
+                           "pid": os.getpid()})
+
+
+def func_Stop_Trace():
+
+    # This function writes and stops the running trace (if any), returning
+    # the trace file's path.
+
+    with trace_Lock:
+
+        if not func_Trace_Running():
+
+            return None
+
+        func_Write_Trace()
+        tracePath = dict_Trace["path"]
+        dict_Trace.clear()
+
+        return tracePath
+
+
+def func_Write_Trace():
+
+    # This function writes the running trace to its JSON file (called with
+    # trace_Lock held). The trace is written to a temporary file of its own
+    # first, then replaces the file at once, so the trace file is never left
+    # half written.
+
+    tracePath = dict_Trace["path"]
+
+    tempHandle, tempName = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(tracePath)), suffix=".tmp")
+
+    try:
+
+        with os.fdopen(tempHandle, "w") as traceFile:
+
+            json.dump({"started": dict_Trace["started"],
+                       "seconds": round(time.perf_counter() -
+                                        dict_Trace["start"], 6),
+                       "spans": dict_Trace["spans"]}, traceFile, indent=1,
+                      default=str)
+
+        os.replace(tempName, tracePath)
+
+    except BaseException:
+
+        os.remove(tempName)
+
+        raise
+
+
+@contextlib.contextmanager
+def func_Stage_Span(stage, **fields):
+
+    # This function times the statements within its "with" block as a span
+    # of the running trace, along with any other values (e.g. file names or
+    # counts). Without a running trace (or within a worker process), it does
+    # nothing.
+
+    if not func_Trace_Running():
+
+        yield
+
+        return
+
+    list_Running = thread_Spans.__dict__.setdefault("list_Running", [])
+
+    span = {"stage": stage,
+            "parent": list_Running[-1]["stage"] if list_Running else None,
+            "thread": threading.current_thread().name}
+    span.update(fields)
+
+    # Only top-level spans are profiled (cProfile can't be nested).
+    profiler = None
+
+    if dict_Trace["profile"] and not list_Running:
+
+        profiler = cProfile.Profile()
+
+        try:
+
+            profiler.enable()
+
+        except ValueError:
+
+            # Another profiler is already running (e.g. within another
+            # thread), so this span isn't profiled.
+            profiler = None
+
+    list_Running.append(span)
+    memoryStart = func_Memory_Bytes()[0]
+    cpuStart = time.process_time()
+    start = time.perf_counter()
+
+    try:
+
+        yield
+
+        span["status"] = "ok"
+
+    except BaseException as e:
+
+        span["status"] = "error"
+        span["error"] = str(e)
+
+        raise
+
+    finally:
+
+        span["seconds"] = round(time.perf_counter() - start, 6)
+        span["cpu_seconds"] = round(time.process_time() - cpuStart, 6)
+        span["memory_start"] = memoryStart
+        span["memory_end"], span["memory_peak"] = func_Memory_Bytes()
+
+        list_Running.pop()
+
+        with trace_Lock:
+
+            # If the trace was stopped (or another trace started) while the
+            # span ran, the span is dropped.
+            if func_Trace_Running():
+
+                span["start"] = round(start - dict_Trace["start"], 6)
+
+                if profiler is not None:
+
+                    profiler.disable()
+                    span["profile"] = dict_Trace["path"] + "." + \
+                        str(len(dict_Trace["spans"])) + "_" + \
+                        "".join(character if character.isalnum() else "_"
+                                for character in stage) + ".prof"
+                    profiler.dump_stats(span["profile"])
+
+                dict_Trace["spans"].append(span)
+
+            elif profiler is not None:
+
+                profiler.disable()
+
+
+@contextlib.contextmanager
+def func_Trace_Calls(target, dict_Stages):
+
+    # This function traces every call of the target's (a module or object)
+    # functions named in dict_Stages (function name: stage name) as a span,
+    # within its "with" block. The functions are replaced with traced ones
+    # for the block, then restored. Without a running trace, or for names
+    # the target doesn't have, nothing is replaced.
+
+    # Dictionary of the replaced functions (name: original).
+    dict_Originals = {}
+
+    if func_Trace_Running() and target is not None:
+
+        for name, stage in dict_Stages.items():
+
+            original = getattr(target, name, None)
+
+            if original is None:
+
+                continue
+
+            # This function returns the traced version of one function.
+            def func_Traced_Function(original, stage):
+
+                def func_Traced(*args, **kwargs):
+
+                    with func_Stage_Span(stage):
+
+                        return original(*args, **kwargs)
+
+                return func_Traced
+
+            dict_Originals[name] = original
+            setattr(target, name, func_Traced_Function(original, stage))
+
+    try:
+
+        yield
+
+    finally:
+
+        for name, original in dict_Originals.items():
+
+            # Functions of an object are removed again (so the class's
+            # function is used), functions of a module are restored.
+            if isinstance(target, type(os)):
+
+                setattr(target, name, original)
+
+            else:
+
+                delattr(target, name)
+
+
+@contextlib.contextmanager
+def func_Trace_GUI_Run(gui):
+
+    # This function traces the stages of a hazard options GUI's run (its
+    # stage functions, and the ArcPy tools they call, if ArcPy was imported)
+    # within its "with" block.
+
+    arcpy = sys.modules.get("arcpy")
+
+    with func_Trace_Calls(gui, dict_GUI_Stages), \
+            func_Trace_Calls(arcpy, dict_Arcpy_Stages), \
+            func_Trace_Calls(getattr(arcpy, "sa", None),
+                             dict_Arcpy_SA_Stages):
+
+        yield
@@ -0,0 +1,28 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the shared setup of the tests of the headless
+# hazard modules (the Hazard_*.py and CLI_*.py modules). The tests run
+# without ArcPy, so the GUI modules aren't tested here.
+
+# All import statements for utilized modules.
+import os
+import sys
+import pytest
+
+# The modules are kept at the top of the repository, next to this folder.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+import Hazard_DownloadCache
+
+
+@pytest.fixture
+def cache_Folder(tmp_path, monkeypatch):
+
+    # This fixture points the download cache (and everything kept next to
+    # it) at an empty temporary folder for one test.
+
+    monkeypatch.setattr(Hazard_DownloadCache, "cache_Folder",
+                        str(tmp_path / "cache"))
+
+    return Hazard_DownloadCache.cache_Folder
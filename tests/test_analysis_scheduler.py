@@ -0,0 +1,78 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the analysis scheduler
+# (Hazard_AnalysisScheduler).
+
+# All import statements for utilized modules.
+import os
+import time
+import pytest
+from Hazard_AnalysisScheduler import AnalysisJob
+from Hazard_AnalysisScheduler import func_Run_Analysis_Jobs
+from Hazard_AnalysisScheduler import func_ArcGIS_Raster_Jobs
+
+
+def func_Sleep_Interval(seconds):
+
+    # This function sleeps, returning the times it started and finished.
+
+    start_time = time.time()
+    time.sleep(seconds)
+
+    return start_time, time.time()
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_Jobs_Run_In_Order(workers):
+
+    list_Jobs = [AnalysisJob("Sleep" + str(index), "Sleep " + str(index),
+                             func_Sleep_Interval, (0.2,))
+                 for index in range(3)]
+    list_Jobs.append(AnalysisJob("Fail", "Fail", os.stat,
+                                 ("/missing/analysis/input",)))
+
+    # List for the progress reports.
+    list_Progress = []
+
+    list_Results = func_Run_Analysis_Jobs(
+        list_Jobs, workers, lambda result, completed, total:
+        list_Progress.append((result.job.name, completed, total)))
+
+    # The results are in the order of the jobs, and a failed job doesn't
+    # stop the others.
+    assert [result.job for result in list_Results] == list_Jobs
+    assert all(result.error is None for result in list_Results[:3])
+    assert isinstance(list_Results[3].error, OSError)
+    assert list_Results[3].value is None
+
+    # Progress is reported once per job.
+    assert sorted(progress[0] for progress in list_Progress) == \
+        sorted(job.name for job in list_Jobs)
+    assert [progress[1:] for progress in list_Progress] == \
+        [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    # Within worker processes, the jobs overlap.
+    list_Intervals = [result.value for result in list_Results[:3]]
+
+    if workers > 1:
+
+        assert max(interval[0] for interval in list_Intervals) < \
+            min(interval[1] for interval in list_Intervals)
+
+    else:
+
+        assert all(first[1] <= second[0] for first, second in
+                   zip(list_Intervals, list_Intervals[1:]))
+
+
+def test_ArcGIS_Raster_Jobs():
+
+    # Jobs follow the GUI's order, not the order of the names.
+    list_Jobs = func_ArcGIS_Raster_Jobs(["Trend", "IDW", "OptHotSpot"],
+                                        "GIS.gdb", "clipped", "mask", "mag",
+                                        "scratch")
+
+    assert [job.name for job in list_Jobs] == ["IDW", "Trend"]
+    assert list_Jobs[0].label == "IDW"
+    assert list_Jobs[1].arguments == ("Trend", "GIS.gdb", "clipped", "mask",
+                                      "mag", "scratch")
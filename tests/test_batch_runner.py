@@ -0,0 +1,98 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the batch runner
+# (Hazard_BatchRunner).
+
+# All import statements for utilized modules.
+import os
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+import Hazard_Pipeline
+from Hazard_BatchRunner import func_Parse_Regions
+from Hazard_BatchRunner import func_Forward_Worker_Logs
+from Hazard_BatchRunner import func_Init_Worker
+
+
+class RecordHandler(logging.Handler):
+
+    # This class keeps every log record it handles.
+
+    def __init__(self):
+
+        logging.Handler.__init__(self)
+
+        self.list_Records = []
+
+    def emit(self, record):
+
+        self.list_Records.append(record)
+
+
+def func_Worker_Process_ID():
+
+    # This function returns the worker's process ID.
+
+    return os.getpid()
+
+
+@pytest.fixture
+def recordHandler():
+
+    # This fixture returns a handler keeping the pipeline's log records (as
+    # the command line sets up its structured logs).
+
+    logger = Hazard_Pipeline.logger
+    level = logger.level
+    handler = RecordHandler()
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+    yield handler
+
+    logger.removeHandler(handler)
+    logger.setLevel(level)
+
+
+@pytest.mark.parametrize("startMethod", ["spawn", "fork"])
+def test_Worker_Logs_Forwarded(recordHandler, startMethod):
+
+    if startMethod not in multiprocessing.get_all_start_methods():
+
+        pytest.skip(startMethod + " is not available.")
+
+    # A spawned worker has none of the main process' logging setup, and a
+    # forked one has a copy of it; either way, each worker log is handled
+    # once within the main process.
+    mpContext = multiprocessing.get_context(startMethod)
+
+    with func_Forward_Worker_Logs(mpContext) as logQueue, \
+            ProcessPoolExecutor(
+                1, mp_context=mpContext, initializer=func_Init_Worker,
+                initargs=({"logQueue": logQueue,
+                           "logLevel": logging.INFO},)) as pool:
+
+        pool.submit(Hazard_Pipeline.func_Log_Stage, "region", 50,
+                    "Region clipped.", region="TX").result()
+        workerID = pool.submit(func_Worker_Process_ID).result()
+
+    assert len(recordHandler.list_Records) == 1
+
+    record = recordHandler.list_Records[0]
+
+    assert record.getMessage() == "Region clipped."
+    assert record.process == workerID != os.getpid()
+    assert record.hazard_Fields == {"region": "TX", "stage": "region",
+                                    "progress": 50}
+
+
+def test_Parse_Regions():
+
+    assert func_Parse_Regions("usa, TX, TX:Dallas") == [
+        (None, None), ("TX", None), ("TX", "Dallas")]
+    assert len(func_Parse_Regions(["states"])) == 51
+
+    with pytest.raises(ValueError):
+
+        func_Parse_Regions("XX:Dallas")
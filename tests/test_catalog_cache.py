@@ -0,0 +1,236 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the catalog cache
+# (Hazard_CatalogCache), with a synthetic NOAA SPC hail CSV.
+
+# All import statements for utilized modules.
+import io
+import os
+import csv
+import json
+import random
+import shutil
+import hashlib
+import zipfile
+import numpy
+import pytest
+import Hazard_CatalogCache
+import Hazard_DownloadCache
+from Hazard_CatalogCache import func_Catalog_Folder
+from Hazard_CatalogCache import func_Load_SPC_Catalog
+from Hazard_CatalogCache import func_Load_Cached_SPC_Catalog
+from Hazard_CatalogCache import func_Source_Hash
+from Hazard_FilterEngine import func_Filter_SPC_Rows
+from Hazard_FilterEngine import func_Filter_SPC_Catalog
+from Hazard_FilterEngine import func_Timespan_Count
+from Hazard_FilterEngine import func_Selection_Count
+
+# Header row of the SPC CSVs.
+hail_Headers = "om,yr,mo,dy,date,time,tz,st,stf,stn,mag,inj,fat,loss," \
+               "closs,slat,slon,elat,elon,len,wid,ns,sn,sg,f1,f2,f3,f4"
+
+# Magnitude and timespan selections checked.
+list_Selections = [("All", None), ('1.0" - 1.99"', None),
+                   ('2.0" - 2.99"', ("2000", "3", "2005", "8"))]
+
+
+@pytest.fixture
+def csvPath(tmp_path, cache_Folder):
+
+    # This fixture writes a synthetic hail CSV (3,000 rows), with an empty
+    # download cache, and returns the CSV's path.
+
+    randomGenerator = random.Random(6389)
+    csvPath = str(tmp_path / "1955-2017_hail.csv")
+
+    with open(csvPath, "w") as csvFile:
+
+        csvFile.write(hail_Headers + "\n")
+
+        for number in range(3000):
+
+            year = randomGenerator.randint(1955, 2017)
+            month = randomGenerator.randint(1, 12)
+            day = randomGenerator.randint(1, 28)
+
+            csvFile.write(",".join([
+                str(number), str(year), str(month), str(day),
+                "%d-%02d-%02d" % (year, month, day), "12:00:00", "3", "TX",
+                "48", "0", str(randomGenerator.choice([0.75, 1.0, 1.75,
+                                                       2.5, 4.0])),
+                "0", "0", "0", "0",
+                "%.4f" % randomGenerator.uniform(25.0, 49.0),
+                "%.4f" % randomGenerator.uniform(-124.0, -67.0),
+                "0", "0", "0", "0", "1", "1", "1", "0", "0", "0", "0"]) +
+                "\n")
+
+    return csvPath
+
+
+def func_Filter_Output(catalog, magSelection, customTimespan):
+
+    # This function returns the filter output (count and CSV text) of one
+    # magnitude/timespan selection of a catalog.
+
+    outputText = io.StringIO()
+    count = func_Filter_SPC_Catalog(catalog, csv.writer(outputText), "hail",
+                                    magSelection,
+                                    customTimespan=customTimespan)
+
+    return count, outputText.getvalue()
+
+
+def func_Expected_Output(csvPath, magSelection, customTimespan):
+
+    # This function returns the filter output of one selection, parsed from
+    # the CSV text.
+
+    with open(csvPath) as csv_InputFile:
+
+        csv_Reader = csv.reader(csv_InputFile)
+        next(csv_Reader)
+        outputText = io.StringIO()
+        count = func_Filter_SPC_Rows(csv_Reader, csv.writer(outputText),
+                                     "hail", magSelection,
+                                     customTimespan=customTimespan)
+
+    return count, outputText.getvalue()
+
+
+def func_Save_To_Download_Cache(url, path):
+
+    # This function adds a copy of a file to the download cache, as if
+    # downloaded.
+
+    shutil.copyfile(path, path + ".download")
+
+    with open(path, "rb") as savedFile:
+
+        contentHash = hashlib.sha256(savedFile.read()).hexdigest()
+
+    os.makedirs(os.path.join(Hazard_DownloadCache.cache_Folder,
+                             Hazard_DownloadCache.cache_ObjectsFolderName),
+                exist_ok=True)
+    Hazard_DownloadCache.func_Save_Download(url, path + ".download",
+                                            contentHash,
+                                            os.path.getsize(path), {},
+                                            lambda contentHash: None)
+
+
+def test_Saved_Catalog_Matches_CSV(csvPath):
+
+    # The first load parses and saves the CSV, the second memory-maps the
+    # saved catalog, and both give the same filter results as the CSV text.
+    list_Catalogs = [func_Load_SPC_Catalog(csvPath, "hail", hail_Headers),
+                     func_Load_SPC_Catalog(csvPath, "hail", hail_Headers)]
+
+    assert isinstance(list_Catalogs[1]["mag"], numpy.memmap)
+
+    for catalog in list_Catalogs:
+
+        for magSelection, customTimespan in list_Selections:
+
+            assert func_Filter_Output(catalog, magSelection,
+                                      customTimespan) == \
+                func_Expected_Output(csvPath, magSelection, customTimespan)
+
+
+def test_Counts(csvPath):
+
+    catalog = func_Load_SPC_Catalog(csvPath, "hail", hail_Headers)
+
+    # Record count of a custom timespan.
+    assert func_Timespan_Count(catalog, ("2000", "3", "2005", "8")) == \
+        sum(1 for year, month in zip(catalog["year"], catalog["month"])
+            if (2000, 3) <= (year, month) <= (2005, 8))
+
+    # Expected output count of a diameter bin and custom timespan.
+    assert func_Selection_Count(catalog, "hail", '2.0" - 2.99"',
+                                customTimespan=("2000", "3", "2005", "8")) \
+        == func_Expected_Output(csvPath, '2.0" - 2.99"',
+                                ("2000", "3", "2005", "8"))[0]
+
+
+def test_Changed_CSV_Parsed_Again(csvPath):
+
+    func_Load_SPC_Catalog(csvPath, "hail", hail_Headers)
+
+    with open(csvPath, "a") as csvFile:
+
+        csvFile.write("3000,2017,1,1,2017-01-01,12:00:00,3,TX,48,0,1.5,0,"
+                      "0,0,0,30.0,-97.0,0,0,0,0,1,1,1,0,0,0,0\n")
+
+    assert len(func_Load_SPC_Catalog(csvPath, "hail",
+                                     hail_Headers)["mag"]) == 3001
+
+
+def test_Source_Hash_Remembered(csvPath):
+
+    with open(csvPath, "rb") as csvFile:
+
+        contentHash = hashlib.sha256(csvFile.read()).hexdigest()
+
+    os.makedirs(func_Catalog_Folder())
+
+    assert func_Source_Hash(csvPath) == contentHash
+
+    with open(os.path.join(func_Catalog_Folder(),
+                           Hazard_CatalogCache.catalog_SourcesFileName)) as \
+            sourcesFile:
+
+        assert json.load(sourcesFile)[os.path.abspath(csvPath)][2] == \
+            contentHash
+
+    assert not [name for name in os.listdir(func_Catalog_Folder())
+                if name.endswith(".tmp")]
+
+
+def test_Cached_Download_Catalog(csvPath, monkeypatch):
+
+    # A zipped CSV within the download cache loads the same catalog, and a
+    # URL not cached loads none.
+    zipPath = csvPath + ".zip"
+
+    with zipfile.ZipFile(zipPath, "w") as zipFile:
+
+        zipFile.write(csvPath, os.path.basename(csvPath))
+
+    url = "https://example.com/1955-2017_hail.csv.zip"
+    func_Save_To_Download_Cache(url, zipPath)
+
+    catalog = func_Load_Cached_SPC_Catalog(url, "hail", hail_Headers)
+
+    assert func_Filter_Output(catalog, "All", None) == \
+        func_Expected_Output(csvPath, "All", None)
+    assert func_Load_Cached_SPC_Catalog(
+        "https://example.com/2017_hail.csv", "hail", hail_Headers) is None
+    assert not [name for name in os.listdir(func_Catalog_Folder())
+                if name.startswith("tmp_download_")]
+
+    # Once saved, the catalog is opened by the download's hash, without
+    # unzipping or hashing the download again.
+    def func_Not_Read(*args):
+
+        raise AssertionError("The download was read again.")
+
+    monkeypatch.setattr(zipfile, "is_zipfile", func_Not_Read)
+    monkeypatch.setattr(Hazard_CatalogCache, "func_Source_Hash",
+                        func_Not_Read)
+
+    assert len(func_Load_Cached_SPC_Catalog(url, "hail",
+                                            hail_Headers)["mag"]) == 3000
+
+
+def test_Cached_CSV_Download_Shares_Catalog(csvPath, monkeypatch):
+
+    # A CSV download is parsed from the cached file, under the same hash as
+    # the CSV itself, so the run's catalog is shared.
+    url = "https://example.com/2017_hail.csv"
+    func_Save_To_Download_Cache(url, csvPath)
+
+    catalog = func_Load_Cached_SPC_Catalog(url, "hail", hail_Headers)
+
+    monkeypatch.setattr(Hazard_CatalogCache, "func_Save_Catalog", None)
+
+    assert (func_Load_SPC_Catalog(csvPath, "hail", hail_Headers)["mag"] ==
+            catalog["mag"]).all()
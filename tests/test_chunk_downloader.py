@@ -0,0 +1,212 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the chunk downloader
+# (Hazard_ChunkDownloader), against a local stand-in FDSN server. The server
+# answers each query with a small CSV after a random delay, fails some
+# queries once with 503 (and one query with 429 and Retry-After), and
+# records the highest number of queries it served at the same time.
+
+# All import statements for utilized modules.
+import csv
+import time
+import random
+import threading
+import http.server
+from urllib import parse
+from urllib.error import HTTPError
+import pytest
+from Hazard_ChunkDownloader import func_Month_Chunks
+from Hazard_ChunkDownloader import func_Download_Chunks
+from Hazard_ChunkDownloader import func_Stream_Chunks
+
+
+class FDSNStandInServer:
+
+    # This class runs the stand-in FDSN server.
+
+    def __init__(self):
+
+        # Dictionary of the server's counters.
+        self.dict_Counters = {"active": 0, "peak": 0, "requests": 0,
+                              "rejected": 0, "failed": set()}
+        self.serverLock = threading.Lock()
+        self.randomGenerator = random.Random(6389)
+
+        server = self
+
+        class FDSNStandInHandler(http.server.BaseHTTPRequestHandler):
+
+            def do_GET(self):
+
+                query = dict(parse.parse_qsl(parse.urlparse(self.path).query))
+                dict_Counters = server.dict_Counters
+
+                # A query without a timespan is rejected (as by USGS).
+                if "starttime" not in query:
+
+                    with server.serverLock:
+
+                        dict_Counters["rejected"] += 1
+
+                    self.send_response(400)
+                    self.end_headers()
+
+                    return
+
+                with server.serverLock:
+
+                    dict_Counters["requests"] += 1
+                    dict_Counters["active"] += 1
+                    dict_Counters["peak"] = max(dict_Counters["peak"],
+                                                dict_Counters["active"])
+                    delay = server.randomGenerator.uniform(0.01, 0.05)
+                    failFirst = query["starttime"] not in \
+                        dict_Counters["failed"] and \
+                        server.randomGenerator.random() < 0.2
+                    dict_Counters["failed"].add(query["starttime"])
+
+                time.sleep(delay)
+
+                with server.serverLock:
+
+                    dict_Counters["active"] -= 1
+
+                if query["starttime"] == "2001-06-01" and \
+                        "retry-after" not in dict_Counters:
+
+                    dict_Counters["retry-after"] = True
+                    self.send_response(429)
+                    self.send_header("Retry-After", "0")
+                    self.end_headers()
+
+                    return
+
+                if failFirst:
+
+                    self.send_response(503)
+                    self.end_headers()
+
+                    return
+
+                body = ("time,latitude,longitude,depth,mag\n" +
+                        query["starttime"] +
+                        "T00:00:00Z,35.0,-97.0,5.0,2.5\n").encode()
+
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+
+                pass
+
+        self.httpServer = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), FDSNStandInHandler)
+        threading.Thread(target=self.httpServer.serve_forever,
+                         daemon=True).start()
+        self.baseURL = "http://127.0.0.1:" + \
+            str(self.httpServer.server_address[1]) + \
+            "/fdsnws/event/1/query?format=csv"
+
+
+@pytest.fixture
+def server(cache_Folder):
+
+    # This fixture returns a running stand-in server with an empty download
+    # cache.
+
+    standInServer = FDSNStandInServer()
+
+    yield standInServer
+
+    standInServer.httpServer.shutdown()
+
+
+@pytest.fixture
+def list_Chunks():
+
+    # This fixture returns two years of monthly chunks.
+
+    return func_Month_Chunks(2000, 1, 2001, 12)
+
+
+def func_Chunk_URLs(server, list_Chunks):
+
+    # This function returns the query URL of each chunk.
+
+    return [server.baseURL + "&starttime=" + start + "&endtime=" + end
+            for start, end in list_Chunks]
+
+
+def test_Month_Chunks(list_Chunks):
+
+    assert len(list_Chunks) == 24
+    assert list_Chunks[0] == ("2000-01-01", "2000-01-31")
+    assert list_Chunks[1] == ("2000-02-01", "2000-02-29")
+    assert list_Chunks[-1] == ("2001-12-01", "2001-12-31")
+
+
+def test_Download_Chunks(server, list_Chunks, tmp_path):
+
+    list_Filenames = [str(tmp_path / ("monthlyCSV_" + str(index + 1) +
+                                      ".csv"))
+                      for index in range(len(list_Chunks))]
+
+    # List of the chunks retried.
+    list_Retries = []
+
+    def func_Record_Progress(index, filename, status, message):
+
+        if status == "retry":
+
+            list_Retries.append(index)
+
+    list_Downloaded = func_Download_Chunks(
+        func_Chunk_URLs(server, list_Chunks), list_Filenames, maxWorkers=4,
+        backoffSeconds=0.01, func_Progress=func_Record_Progress)
+
+    # The files come back in month order, each holding its own month.
+    assert list_Downloaded == list_Filenames
+
+    for (start, end), filename in zip(list_Chunks, list_Downloaded):
+
+        with open(filename) as downloadedFile:
+
+            assert start + "T00:00:00Z" in downloadedFile.read()
+
+    # The concurrency limit was respected, and every failure was retried.
+    assert server.dict_Counters["peak"] <= 4
+    assert server.dict_Counters["retry-after"]
+    assert len(list_Retries) == \
+        server.dict_Counters["requests"] - len(list_Chunks) > 0
+
+
+def test_Stream_Chunks(server, list_Chunks):
+
+    # Each month is parsed as it arrives (no monthly files), and the parsed
+    # months come back in month order.
+    list_Rows = []
+
+    for rows in func_Stream_Chunks(func_Chunk_URLs(server, list_Chunks),
+                                   [start for start, end in list_Chunks],
+                                   lambda lines: list(csv.reader(lines))[1:],
+                                   maxWorkers=4, backoffSeconds=0.01):
+
+        list_Rows.extend(rows)
+
+    assert [row[0][:10] for row in list_Rows] == \
+        [start for start, end in list_Chunks]
+    assert server.dict_Counters["peak"] <= 4
+
+
+def test_Rejected_Query_Not_Retried(server, tmp_path):
+
+    # A query the server rejects (400) fails right away, without retries.
+    with pytest.raises(HTTPError) as httpError:
+
+        func_Download_Chunks([server.baseURL], [str(tmp_path / "missing.csv")],
+                             backoffSeconds=0.01)
+
+    assert httpError.value.code == 400
+    assert server.dict_Counters["rejected"] == 1
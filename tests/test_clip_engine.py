@@ -0,0 +1,219 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the native clip engine
+# (Hazard_ClipEngine). A synthetic Census-style Shapefile of "counties" is
+# written, covering the continental US extent with jittered quadrilaterals
+# (each edge split into several vertices, like generalized county
+# boundaries), plus one county with a hole and one within a territory.
+
+# All import statements for utilized modules.
+import os
+import struct
+import numpy
+import pytest
+from Hazard_ClipEngine import census_Shapefile_Field_StateFIPS
+from Hazard_ClipEngine import census_Shapefile_Field_CountyName
+from Hazard_ClipEngine import func_Load_Polygons
+from Hazard_ClipEngine import func_Load_County_Polygons
+from Hazard_ClipEngine import func_Build_Grid_Index
+from Hazard_ClipEngine import func_Points_In_Polygon
+from Hazard_ClipEngine import func_Locate_Points
+from Hazard_ClipEngine import func_Clip_Points
+
+# Grid of synthetic counties, and the vertices added along each county edge.
+int_Columns, int_Rows = 30, 20
+int_Edge_Vertices = 8
+
+# Index of the county with a hole, and of the territory's county.
+hole_Index = (int_Rows // 2) * int_Columns + int_Columns // 2
+territory_Index = 0
+
+# Field names of the synthetic Shapefile.
+list_Field_Names = [census_Shapefile_Field_StateFIPS,
+                    census_Shapefile_Field_CountyName]
+
+
+def func_Write_Polygon_Shapefile(shapefilePath, polygonRings, records,
+                                 fieldNames):
+
+    # This function writes a polygon Shapefile (.shp and .dbf, text fields
+    # only).
+
+    # List for the .shp records.
+    shpRecords = []
+
+    for recordNumber, rings in enumerate(polygonRings, 1):
+
+        points = numpy.concatenate(rings)
+        parts = numpy.cumsum([0] + [len(ring) for ring in rings[:-1]])
+
+        content = struct.pack("<i4dii", 5, points[:, 0].min(),
+                              points[:, 1].min(), points[:, 0].max(),
+                              points[:, 1].max(), len(rings), len(points)) + \
+            numpy.asarray(parts, dtype="<i4").tobytes() + \
+            numpy.asarray(points, dtype="<f8").tobytes()
+
+        shpRecords.append(struct.pack(">ii", recordNumber, len(content) // 2) +
+                          content)
+
+    allPoints = numpy.concatenate([numpy.concatenate(rings)
+                                   for rings in polygonRings])
+    body = b"".join(shpRecords)
+
+    with open(shapefilePath, "wb") as shpFile:
+
+        shpFile.write(struct.pack(">i20xi", 9994, (100 + len(body)) // 2) +
+                      struct.pack("<ii4d32x", 1000, 5, allPoints[:, 0].min(),
+                                  allPoints[:, 1].min(),
+                                  allPoints[:, 0].max(),
+                                  allPoints[:, 1].max()) + body)
+
+    # Text field widths.
+    fieldLengths = [max(1, max(len(record[column]) for record in records))
+                    for column in range(len(fieldNames))]
+
+    header = struct.pack("<B3xIHH20x", 3, len(records),
+                         32 + 32 * len(fieldNames) + 1,
+                         1 + sum(fieldLengths))
+
+    for name, length in zip(fieldNames, fieldLengths):
+
+        header += struct.pack("<11sc4xB15x", name.encode("ascii"), b"C",
+                              length)
+
+    with open(os.path.splitext(shapefilePath)[0] + ".dbf", "wb") as dbfFile:
+
+        dbfFile.write(header + b"\x0D" + b"".join(
+            b" " + b"".join(value.encode("latin-1").ljust(length)
+                            for value, length in zip(record, fieldLengths))
+            for record in records) + b"\x1A")
+
+
+def func_Edge(cornerFrom, cornerTo):
+
+    # This function returns the points along an edge from one corner to
+    # another (excluding the end corner).
+
+    fractions = numpy.linspace(0.0, 1.0, int_Edge_Vertices,
+                               endpoint=False)[:, None]
+
+    return numpy.array(cornerFrom) + fractions * \
+        (numpy.array(cornerTo) - numpy.array(cornerFrom))
+
+
+@pytest.fixture(scope="module")
+def shapefile(tmp_path_factory):
+
+    # This fixture writes the synthetic Shapefile, returning its path and
+    # the rings of each county.
+
+    randomGenerator = numpy.random.default_rng(6389)
+
+    # Jittered grid corners (shared by neighboring counties, so they don't
+    # overlap) spanning the continental US.
+    cornerX = numpy.linspace(-125.0, -66.0, int_Columns + 1)[None, :] + \
+        randomGenerator.uniform(-0.3, 0.3, (int_Rows + 1, int_Columns + 1))
+    cornerY = numpy.linspace(24.0, 49.0, int_Rows + 1)[:, None] + \
+        randomGenerator.uniform(-0.15, 0.15, (int_Rows + 1, int_Columns + 1))
+    cornerX[:, 0] = -125.0
+    cornerX[:, -1] = -66.0
+    cornerY[0, :] = 24.0
+    cornerY[-1, :] = 49.0
+
+    # Lists for the synthetic polygons (as rings) and records.
+    polygonRings = []
+    records = []
+
+    for row in range(int_Rows):
+
+        for column in range(int_Columns):
+
+            corners = [(cornerX[row, column], cornerY[row, column]),
+                       (cornerX[row + 1, column], cornerY[row + 1, column]),
+                       (cornerX[row + 1, column + 1],
+                        cornerY[row + 1, column + 1]),
+                       (cornerX[row, column + 1], cornerY[row, column + 1])]
+
+            # Clockwise outer ring, closed with its first point.
+            rings = [numpy.concatenate([func_Edge(corners[index],
+                                                  corners[(index + 1) % 4])
+                                        for index in range(4)] +
+                                       [[corners[0]]])]
+
+            # Give one county a hole (counter-clockwise inner ring).
+            if len(polygonRings) == hole_Index:
+
+                centerX = numpy.mean([corner[0] for corner in corners])
+                centerY = numpy.mean([corner[1] for corner in corners])
+
+                rings.append(numpy.array([(centerX - 0.2, centerY - 0.1),
+                                          (centerX + 0.2, centerY - 0.1),
+                                          (centerX + 0.2, centerY + 0.1),
+                                          (centerX - 0.2, centerY + 0.1),
+                                          (centerX - 0.2, centerY - 0.1)]))
+
+            polygonRings.append(rings)
+            records.append(("%02d" % (row + 1), "County %d" % column))
+
+    records[territory_Index] = ("72", "Territory County")
+
+    shapefilePath = str(tmp_path_factory.mktemp("census") /
+                        "synthetic_county.shp")
+    func_Write_Polygon_Shapefile(shapefilePath, polygonRings, records,
+                                 list_Field_Names)
+
+    return shapefilePath, polygonRings
+
+
+def test_Points_Located(shapefile):
+
+    shapefilePath, polygonRings = shapefile
+    polygons = func_Load_Polygons(shapefilePath, list_Field_Names)
+    gridIndex = func_Build_Grid_Index(polygons)
+
+    assert len(polygons.records) == int_Columns * int_Rows
+    assert polygons.records[hole_Index] == (
+        "%02d" % (int_Rows // 2 + 1), "County %d" % (int_Columns // 2))
+
+    # Random points covering (and extending past) the synthetic counties.
+    randomGenerator = numpy.random.default_rng(6389)
+    pointX = randomGenerator.uniform(-127.0, -64.0, 200000)
+    pointY = randomGenerator.uniform(22.0, 51.0, 200000)
+
+    polygonIndexes = func_Locate_Points(pointX, pointY, polygons, gridIndex)
+
+    # Brute-force check of a sample: each point against every polygon.
+    sampleIndexes = randomGenerator.choice(len(pointX), 2000, replace=False)
+    expected = numpy.full(len(sampleIndexes), -1, dtype=numpy.int64)
+
+    for index, edges in enumerate(polygons.edges):
+
+        inside = func_Points_In_Polygon(pointX[sampleIndexes],
+                                        pointY[sampleIndexes], edges)
+        expected[inside] = index
+
+    assert numpy.array_equal(polygonIndexes[sampleIndexes], expected)
+    assert numpy.array_equal(func_Clip_Points(pointX, pointY, polygons),
+                             polygonIndexes >= 0)
+
+    # Points within the hole aren't located, points just outside it are.
+    holeX, holeY = polygonRings[hole_Index][1][0]
+
+    assert func_Locate_Points([holeX + 0.2, holeX - 0.05],
+                              [holeY + 0.1, holeY + 0.1], polygons,
+                              gridIndex).tolist() == [-1, hole_Index]
+
+
+def test_County_Polygons(shapefile):
+
+    shapefilePath = shapefile[0]
+
+    # Territories aren't part of the 50 states and DC.
+    assert len(func_Load_County_Polygons(shapefilePath).records) == \
+        int_Columns * int_Rows - 1
+    assert len(func_Load_County_Polygons(shapefilePath, "72").records) == 1
+
+    # A county is found by state FIPS code and name.
+    assert func_Load_County_Polygons(shapefilePath, "02",
+                                     "County 3").records == [("02",
+                                                              "County 3")]
@@ -0,0 +1,289 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the download cache
+# (Hazard_DownloadCache), against a local stand-in HTTP server. The server
+# supports ETag and Last-Modified, and counts the number of requests (and
+# 304 replies) it receives.
+
+# All import statements for utilized modules.
+import os
+import hashlib
+import datetime
+import threading
+import http.server
+import multiprocessing
+from urllib.error import HTTPError
+from urllib.error import URLError
+import pytest
+import Hazard_DownloadCache
+from Hazard_DownloadCache import func_Cache_Retrieve
+from Hazard_DownloadCache import func_Cache_Stream
+from Hazard_DownloadCache import func_Cache_Hash
+from Hazard_DownloadCache import func_Cache_MaxAge
+from Hazard_DownloadCache import func_Load_Index
+from Hazard_DownloadCache import func_Save_Index
+
+
+class StandInServer:
+
+    # This class runs the stand-in HTTP server over a folder of files.
+
+    def __init__(self, serverFolder):
+
+        self.serverFolder = serverFolder
+        self.dict_Requests = {"total": 0, "304": 0}
+
+        server = self
+
+        class CacheCheckHandler(http.server.SimpleHTTPRequestHandler):
+
+            def __init__(self, *args, **kwargs):
+
+                super().__init__(*args, directory=server.serverFolder,
+                                 **kwargs)
+
+            def send_head(self):
+
+                server.dict_Requests["total"] += 1
+
+                path = self.translate_path(self.path)
+
+                # ETag is the hash of the file's content.
+                if os.path.isfile(path):
+
+                    with open(path, "rb") as servedFile:
+
+                        etag = '"' + hashlib.sha256(
+                            servedFile.read()).hexdigest() + '"'
+
+                    if self.headers.get("If-None-Match") == etag:
+
+                        server.dict_Requests["304"] += 1
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.end_headers()
+
+                        return None
+
+                    self.etag = etag
+
+                return super().send_head()
+
+            def end_headers(self):
+
+                if getattr(self, "etag", None):
+
+                    self.send_header("ETag", self.etag)
+                    self.etag = None
+
+                super().end_headers()
+
+            def log_message(self, *args):
+
+                pass
+
+        self.httpServer = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), CacheCheckHandler)
+        threading.Thread(target=self.httpServer.serve_forever,
+                         daemon=True).start()
+        self.baseURL = "http://127.0.0.1:" + \
+            str(self.httpServer.server_address[1]) + "/"
+
+    def func_Write_File(self, name, text):
+
+        # This function writes a file served by the server.
+
+        with open(os.path.join(self.serverFolder, name), "w") as serverFile:
+
+            serverFile.write(text)
+
+
+@pytest.fixture
+def server(tmp_path, cache_Folder):
+
+    # This fixture returns a running stand-in server with an empty download
+    # cache.
+
+    serverFolder = tmp_path / "server"
+    serverFolder.mkdir()
+
+    standInServer = StandInServer(str(serverFolder))
+
+    yield standInServer
+
+    standInServer.httpServer.shutdown()
+
+
+def func_Read_Output(path):
+
+    # This function returns the text of an output file.
+
+    with open(path) as outputFile:
+
+        return outputFile.read()
+
+
+def test_Cached_Download_Served_Without_Request(server, tmp_path):
+
+    url = server.baseURL + "2017_hail.csv"
+    server.func_Write_File("2017_hail.csv", "om,yr\n1,2017\n")
+
+    func_Cache_Retrieve(url, str(tmp_path / "a.csv"))
+    assert server.dict_Requests["total"] == 1
+    assert func_Read_Output(tmp_path / "a.csv") == "om,yr\n1,2017\n"
+
+    # Repeat download within the maximum age: no requests.
+    func_Cache_Retrieve(url, str(tmp_path / "b.csv"))
+    assert server.dict_Requests["total"] == 1
+    assert func_Read_Output(tmp_path / "b.csv") == "om,yr\n1,2017\n"
+
+    assert func_Cache_Hash(url) == func_Load_Index()[url]["sha256"]
+    assert func_Cache_Hash(server.baseURL + "2016_hail.csv") is None
+    assert server.dict_Requests["total"] == 1
+
+
+def test_Revalidation(server, tmp_path):
+
+    url = server.baseURL + "2017_hail.csv"
+    server.func_Write_File("2017_hail.csv", "om,yr\n1,2017\n")
+    func_Cache_Retrieve(url, str(tmp_path / "a.csv"))
+
+    # Revalidation of an unchanged file: 304 reply, cached copy used.
+    func_Cache_Retrieve(url, str(tmp_path / "b.csv"), maxAge=0)
+    assert server.dict_Requests == {"total": 2, "304": 1}
+    assert func_Read_Output(tmp_path / "b.csv") == "om,yr\n1,2017\n"
+
+    # Revalidation of a changed file: new content downloaded, and the
+    # previous download removed.
+    server.func_Write_File("2017_hail.csv", "om,yr\n1,2017\n2,2017\n")
+    func_Cache_Retrieve(url, str(tmp_path / "c.csv"), maxAge=0)
+    assert server.dict_Requests == {"total": 3, "304": 1}
+    assert func_Read_Output(tmp_path / "c.csv") == "om,yr\n1,2017\n2,2017\n"
+    assert len(os.listdir(os.path.join(
+        Hazard_DownloadCache.cache_Folder,
+        Hazard_DownloadCache.cache_ObjectsFolderName))) == 1
+
+
+def test_Stream(server):
+
+    url = server.baseURL + "2017_wind.csv"
+    server.func_Write_File("2017_wind.csv", "om,yr\n3,2017\n")
+
+    # The first stream is downloaded and cached, the second is read from
+    # the cache without a request.
+    assert b"".join(func_Cache_Stream(url)) == b"om,yr\n3,2017\n"
+    assert b"".join(func_Cache_Stream(url)) == b"om,yr\n3,2017\n"
+    assert server.dict_Requests["total"] == 1
+    assert url in func_Load_Index()
+
+
+def test_Missing_File(server, tmp_path):
+
+    # HTTPError is raised, the same as request.urlretrieve.
+    with pytest.raises(HTTPError) as httpError:
+
+        func_Cache_Retrieve(server.baseURL + "missing.csv",
+                            str(tmp_path / "a.csv"))
+
+    assert httpError.value.code == 404
+
+
+def test_Offline_Mode(server, tmp_path, monkeypatch):
+
+    url = server.baseURL + "2017_hail.csv"
+    server.func_Write_File("2017_hail.csv", "om,yr\n1,2017\n")
+    func_Cache_Retrieve(url, str(tmp_path / "a.csv"))
+
+    # The cached copy is served (even past its maximum age), and uncached
+    # URLs raise URLError.
+    server.httpServer.shutdown()
+    monkeypatch.setattr(Hazard_DownloadCache, "cache_Offline", True)
+
+    func_Cache_Retrieve(url, str(tmp_path / "b.csv"), maxAge=0)
+    assert func_Read_Output(tmp_path / "b.csv") == "om,yr\n1,2017\n"
+
+    with pytest.raises(URLError):
+
+        func_Cache_Retrieve(server.baseURL + "2016_hail.csv",
+                            str(tmp_path / "c.csv"))
+
+
+def test_Eviction(server, tmp_path, monkeypatch):
+
+    # With room for only one download, the least recently used download is
+    # removed.
+    monkeypatch.setattr(Hazard_DownloadCache, "cache_MaxBytes", 30)
+
+    server.func_Write_File("2017_hail.csv", "om,yr\n1,2017\n")
+    server.func_Write_File("2016_hail.csv", "om,yr\n1,2016\n2,2016\n")
+    func_Cache_Retrieve(server.baseURL + "2017_hail.csv",
+                        str(tmp_path / "a.csv"))
+    func_Cache_Retrieve(server.baseURL + "2016_hail.csv",
+                        str(tmp_path / "b.csv"))
+
+    assert list(func_Load_Index()) == [server.baseURL + "2016_hail.csv"]
+    assert len(os.listdir(os.path.join(
+        Hazard_DownloadCache.cache_Folder,
+        Hazard_DownloadCache.cache_ObjectsFolderName))) == 1
+
+
+def func_Save_Entries(cacheFolder, worker):
+
+    # This function saves 50 index entries of its own, one at a time, within
+    # a worker process.
+
+    Hazard_DownloadCache.cache_Folder = cacheFolder
+
+    for number in range(50):
+
+        url = "https://example.com/%d/%d.csv" % (worker, number)
+
+        func_Save_Index({url: {"sha256": url, "size": 1, "fetched": 0,
+                               "used": 0}}, [url])
+
+
+def test_Index_Saved_By_Several_Processes(cache_Folder):
+
+    os.makedirs(cache_Folder)
+
+    list_Processes = [multiprocessing.Process(target=func_Save_Entries,
+                                              args=(cache_Folder, worker))
+                      for worker in range(4)]
+
+    for process in list_Processes:
+
+        process.start()
+
+    for process in list_Processes:
+
+        process.join()
+
+    # No process' entries were lost, and no temporary files were left.
+    assert [process.exitcode for process in list_Processes] == [0] * 4
+    assert len(func_Load_Index()) == 200
+    assert not [name for name in os.listdir(cache_Folder)
+                if name.endswith(".tmp")]
+
+
+def test_Max_Age():
+
+    # Rolling USGS feeds and open FDSN windows are always revalidated, while
+    # FDSN windows that ended in the past are cached.
+    feedURL = "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary/"
+    fdsnURL = "https://earthquake.usgs.gov/fdsnws/event/1/query?format=csv"
+    currentTime = datetime.datetime.now(datetime.timezone.utc)
+    cache_MaxAge = Hazard_DownloadCache.cache_MaxAge
+
+    assert func_Cache_MaxAge(feedURL + "all_day.csv", None) == 0
+    assert func_Cache_MaxAge(fdsnURL + "&starttime=2001-06-01"
+                             "&endtime=2001-06-30", None) == cache_MaxAge
+    assert func_Cache_MaxAge(fdsnURL + "&starttime=2001-06-01T00:00:00.000"
+                             "&endtime=2001-06-30T23:59:59.999",
+                             None) == cache_MaxAge
+    assert func_Cache_MaxAge(fdsnURL + "&starttime=2001-06-01&endtime=" +
+                             currentTime.strftime("%Y-%m-%dT%H:%M"),
+                             None) == 0
+    assert func_Cache_MaxAge(fdsnURL + "&starttime=2001-06-01", None) == 0
+    assert func_Cache_MaxAge(fdsnURL + "&endtime=2001-06-30", 60) == 60
+    assert func_Cache_MaxAge("https://www.spc.noaa.gov/wcm/data/"
+                             "2017_hail.csv", None) == cache_MaxAge
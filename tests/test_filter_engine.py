@@ -0,0 +1,75 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the NOAA SPC CSV filter engine
+# (Hazard_FilterEngine).
+
+# All import statements for utilized modules.
+import io
+import csv
+import numpy
+import Hazard_FilterEngine
+from Hazard_FilterEngine import func_Column_To_Float
+from Hazard_FilterEngine import func_Column_To_Int
+from Hazard_FilterEngine import func_Filter_SPC_Rows
+
+# Rows of a hail CSV (the last one truncated partway, e.g. by a cut-off
+# download).
+list_Rows = [
+    "0,2000,3,1,2000-03-01,12:00:00,3,TX,48,0,1.0,0,0,0,0,30.1,-97.1,0,0,0,0,"
+    "1,1,1,0,0,0,0",
+    "1,2001,6,31,2001-06-30,12:00:00,3,TX,48,0,2.5,0,0,0,0,31.2,-98.2,0,0,0,0,"
+    "1,1,1,0,0,0,0",
+    "2,2002,7,4,2002-07-04,12:00:00,3,TX,48,0,,0,0,0,0,32.3,-99.3,0,0,0,0,1,1,"
+    "1,0,0,0,0",
+    "3,2003,8,9,2003-08-09,12:00:00,3,TX,48,0,1.75,0,0,0,0,33.4",
+    "4,2004"]
+
+
+def func_Filter_Output(magSelection, customTimespan=None):
+
+    # This function returns the filter output (count and rows) of the rows.
+
+    outputText = io.StringIO()
+    count = func_Filter_SPC_Rows(csv.reader(list_Rows),
+                                 csv.writer(outputText, lineterminator="\n"),
+                                 "hail", magSelection,
+                                 customTimespan=customTimespan)
+
+    return count, outputText.getvalue().splitlines()
+
+
+def test_Short_Rows_Loaded_As_Invalid():
+
+    list_Parsed = list(csv.reader(list_Rows))
+
+    assert numpy.isnan(func_Column_To_Float(
+        list_Parsed, Hazard_FilterEngine.spc_Column_Long)[3:]).all()
+    assert numpy.isnan(func_Column_To_Float(
+        list_Parsed, Hazard_FilterEngine.spc_Column_Mag)[[2, 4]]).all()
+
+    values, valid = func_Column_To_Int(list_Parsed,
+                                       Hazard_FilterEngine.spc_Column_Month)
+
+    assert values[:4].tolist() == [3, 6, 7, 8]
+    assert valid.tolist() == [True, True, True, True, False]
+
+
+def test_Short_Rows_Dropped():
+
+    assert func_Filter_Output("All") == (2, list_Rows[:2])
+    assert func_Filter_Output('2.0" - 2.99"') == (1, list_Rows[1:2])
+
+    # The second row's day (June 31st) is out of range, so its "date"
+    # column is used instead.
+    assert func_Filter_Output("All", ("2001", "6", "2004", "12")) == \
+        (1, list_Rows[1:2])
+
+
+def test_Rows_Parsed_In_Blocks(monkeypatch):
+
+    # The same rows are kept however many rows are parsed at a time.
+    monkeypatch.setattr(Hazard_FilterEngine, "spc_Block_Rows", 2)
+
+    assert func_Filter_Output("All") == (2, list_Rows[:2])
+    assert func_Filter_Output("All", ("2000", "1", "2001", "12")) == \
+        (2, list_Rows[:2])
@@ -0,0 +1,138 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the grouped statistics
+# (Hazard_GroupStats), against the per-county data counts created the
+# previous way (one scan of the rows per county, with the statistics module).
+
+# All import statements for utilized modules.
+import statistics
+import numpy
+from GUI_CountiesPerState import dict_state_counties
+from Hazard_GroupStats import func_Mode
+from Hazard_GroupStats import func_Mode_String
+from Hazard_GroupStats import func_Value_Statistics
+from Hazard_GroupStats import func_Group_Statistics
+from Hazard_GroupStats import func_Group_Distinct_Counts
+
+
+def func_Statistics_Row(key, magList, modeString):
+
+    # This function formats one county's data counts CSV row.
+
+    return str(key) + "," + str(len(magList)) + "," + \
+        "{0:.2f}".format(min(magList)) + "," + \
+        "{0:.2f}".format(max(magList)) + "," + \
+        "{0:.2f}".format(numpy.mean(magList)) + "," + \
+        "{0:.2f}".format(numpy.median(magList)) + "," + modeString + ",\n"
+
+
+def func_County_Rows_Before(rows, countyNames):
+
+    # This function creates the per-county CSV rows the previous way, with one
+    # full scan of the rows (the Search Cursor) for each county name.
+
+    # List for the per-county CSV rows.
+    list_CSV_Rows = []
+
+    for key in countyNames:
+
+        magList = [row[1] for row in rows if row[0] == key]
+
+        if len(magList) > 0:
+
+            try:
+
+                modeString = "{0:.2f}".format(float(statistics.mode(magList)))
+
+            except statistics.StatisticsError:
+
+                modeString = "No Unique Mode"
+
+            list_CSV_Rows.append(func_Statistics_Row(key, magList,
+                                                     modeString))
+
+    return list_CSV_Rows
+
+
+def func_County_Rows_After(countyArray, magArray, countyNames):
+
+    # This function creates the same per-county CSV rows from the arrays with
+    # a single grouped pass.
+
+    # List for the per-county CSV rows.
+    list_CSV_Rows = []
+
+    stats_PerCounty = func_Group_Statistics(countyArray, magArray)
+
+    for key in countyNames:
+
+        stats_County = stats_PerCounty.get(key)
+
+        if stats_County is not None:
+
+            list_CSV_Rows.append("{0},{1},{2:.2f},{3:.2f},{4:.2f},{5:.2f},"
+                                 "{6},\n".format(
+                                     key, stats_County.count,
+                                     stats_County.minimum,
+                                     stats_County.maximum, stats_County.mean,
+                                     stats_County.median,
+                                     func_Mode_String(stats_County.mode)))
+
+    return list_CSV_Rows
+
+
+def test_County_Rows_Match_Previous():
+
+    # Random Texas county names (a few counties receive most of the points)
+    # and hail diameters rounded to hundredths of an inch, like the NOAA SPC
+    # CSVs.
+    tuple_Texas_Counties = dict_state_counties["TX"]
+    randomGenerator = numpy.random.default_rng(6389)
+    countyWeights = randomGenerator.pareto(1.5,
+                                           len(tuple_Texas_Counties)) + 0.01
+    countyArray = numpy.array(tuple_Texas_Counties)[randomGenerator.choice(
+        len(tuple_Texas_Counties), 20000,
+        p=countyWeights / countyWeights.sum())]
+    magArray = numpy.round(randomGenerator.uniform(0.75, 4.5, 20000), 2)
+
+    csvRows_Before = func_County_Rows_Before(
+        list(zip(countyArray.tolist(), magArray.tolist())),
+        tuple_Texas_Counties)
+
+    assert func_County_Rows_After(countyArray, magArray,
+                                  tuple_Texas_Counties) == csvRows_Before
+    assert len(csvRows_Before) < len(tuple_Texas_Counties)
+
+
+def test_Mode():
+
+    # Of the values sharing the highest count, the first one encountered is
+    # the mode (as statistics.mode).
+    assert func_Mode(numpy.array([2.5, 1.0, 1.0, 2.5, 3.0])) == \
+        statistics.mode([2.5, 1.0, 1.0, 2.5, 3.0]) == 2.5
+    assert func_Mode(numpy.array([4.0])) == 4.0
+    assert func_Mode_String(None) == "No Unique Mode"
+    assert func_Mode_String(2) == "2.00"
+
+
+def test_Value_Statistics():
+
+    stats = func_Value_Statistics(numpy.array([1.0, 3.0, 3.0, 5.0]))
+
+    assert stats == (4, 1.0, 5.0, 3.0, 3.0, 3.0)
+    assert isinstance(stats.minimum, float)
+
+
+def test_Empty_Groups():
+
+    assert func_Group_Statistics(numpy.array([]), numpy.array([])) == {}
+    assert func_Group_Distinct_Counts(numpy.array([]), numpy.array([])) == {}
+
+
+def test_Group_Distinct_Counts():
+
+    # Storm codes within each state.
+    assert func_Group_Distinct_Counts(
+        numpy.array(["48", "48", "48", "12", "12"]),
+        numpy.array(["AL01", "AL01", "AL02", "AL02", "AL03"])) == \
+        {"12": 2, "48": 2}
@@ -0,0 +1,203 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the GUI channel
+# (Hazard_GUIChannel). Most tests use a stand-in owner without Tk; the
+# scrolled text box test needs a display, and is skipped without one.
+
+# All import statements for utilized modules.
+import os
+import threading
+import tkinter
+import pytest
+import Hazard_GUIChannel
+from Hazard_GUIChannel import GUIChannel
+from Hazard_GUIChannel import channel_Separator
+from Hazard_GUIChannel import channel_View_MaxLines
+
+
+class StandInOwner:
+
+    # This class stands in for a hazard options GUI: drains are run by the
+    # test (not scheduled), and there is no scrolled text box yet.
+
+    def __init__(self):
+
+        self.progressBar = {"value": 0}
+
+    def after(self, milliseconds, function):
+
+        pass
+
+
+def func_History_Text(list_Words):
+
+    # This function returns the history file text of the messages.
+
+    return "".join(word + channel_Separator for word in list_Words)
+
+
+def func_Read(path):
+
+    # This function returns the text of a file.
+
+    with open(path) as textFile:
+
+        return textFile.read()
+
+
+def test_Messages_Before_History_Kept(tmp_path):
+
+    channel = GUIChannel(StandInOwner(), ())
+
+    # More messages than the scrolled text box keeps are posted before the
+    # scrolled text box and the history exist.
+    list_Words = ["Message " + str(number)
+                  for number in range(channel_View_MaxLines + 1000)]
+
+    for word in list_Words:
+
+        channel.func_Post_Log(word, None)
+
+    while not channel.eventQueue.empty():
+
+        channel.func_Drain()
+
+    # Only the last lines are waiting to be shown...
+    assert len(channel.list_Pending) == channel_View_MaxLines
+    assert channel.list_Pending[0][0] == list_Words[1000]
+
+    # ...but every message is written to the history once it starts.
+    channel.func_Start_History(str(tmp_path / "running.txt"))
+    channel.func_Post_Log("Beginning assigned tasks...", None)
+    channel.func_Finish_History(str(tmp_path / "history.txt"))
+
+    assert func_Read(tmp_path / "history.txt") == func_History_Text(
+        list_Words + ["Beginning assigned tasks..."])
+    assert not os.path.exists(tmp_path / "running.txt")
+
+
+def test_Finished_History_Closed(tmp_path):
+
+    channel = GUIChannel(StandInOwner(), ())
+
+    channel.func_Start_History(str(tmp_path / "running.txt"))
+    channel.func_Post_Log("First run", None)
+    channel.func_Finish_History(str(tmp_path / "first.txt"))
+
+    # Messages posted after the run finished aren't added to its history,
+    # and a second finish (e.g. after an error) moves it.
+    channel.func_Post_Log("Late message", None)
+    channel.func_Finish_History(str(tmp_path / "moved.txt"))
+
+    assert channel.historyFile is None
+    assert func_Read(tmp_path / "moved.txt") == func_History_Text(
+        ["First run"])
+    assert not os.path.exists(tmp_path / "first.txt")
+
+    # The next run starts a history of its own.
+    channel.func_Start_History(str(tmp_path / "running.txt"))
+    channel.func_Post_Log("Second run", None)
+    channel.func_Finish_History(str(tmp_path / "second.txt"))
+
+    assert func_Read(tmp_path / "second.txt") == func_History_Text(
+        ["Second run"])
+
+
+def test_History_File_Not_Opened(tmp_path):
+
+    channel = GUIChannel(StandInOwner(), ())
+
+    # Without the history file, only the last messages are kept.
+    channel.func_Start_History(str(tmp_path / "missing" / "running.txt"))
+
+    for number in range(channel_View_MaxLines + 10):
+
+        channel.func_Post_Log("Message " + str(number), None)
+
+    channel.func_Finish_History(str(tmp_path / "history.txt"))
+
+    assert func_Read(tmp_path / "history.txt") == func_History_Text(
+        ["Message " + str(number) for number in
+         range(10, channel_View_MaxLines + 10)])
+
+
+def test_Latest_Progress_Shown():
+
+    owner = StandInOwner()
+    channel = GUIChannel(owner, ())
+
+    for value in (10, 20, 30):
+
+        channel.func_Post_Progress(value)
+
+    channel.func_Drain()
+
+    assert owner.progressBar["value"] == 30
+    assert channel.progress is None
+
+
+def test_Scrolled_Text_Box(tmp_path):
+
+    # A worker thread posts 20,000 messages and progress values while the
+    # main loop drains them. The scrolled text box keeps the last lines, and
+    # the history file every message.
+    try:
+
+        root = tkinter.Tk()
+
+    except tkinter.TclError:
+
+        pytest.skip("No display is available for Tk.")
+
+    try:
+
+        root.scrollBox = tkinter.Text(root, state=tkinter.DISABLED)
+        root.scrollBox.pack()
+        root.progressBar = {"value": 0}
+        channel = GUIChannel(root, ("red", "orange", "blue"))
+        channel.func_Start_History(str(tmp_path / "running.txt"))
+
+        # This function posts the messages (as the processing thread would).
+        def func_Worker():
+
+            for number in range(20000):
+
+                channel.func_Post_Log("Message " + str(number),
+                                      "blue" if number % 2 else None)
+                channel.func_Post_Progress(number * 100 // 20000)
+
+            channel.func_Post_Progress(100)
+
+        worker = threading.Thread(target=func_Worker, daemon=True)
+        worker.start()
+        worker.join()
+
+        # This function stops the main loop once every message is shown.
+        def func_Check_Done():
+
+            if channel.eventQueue.empty() and not channel.list_Pending:
+
+                root.quit()
+
+            else:
+
+                root.after(Hazard_GUIChannel.channel_Frame_Milliseconds,
+                           func_Check_Done)
+
+        root.after(Hazard_GUIChannel.channel_Frame_Milliseconds,
+                   func_Check_Done)
+        root.mainloop()
+
+        channel.func_Finish_History(str(tmp_path / "history.txt"))
+        historyText = func_Read(tmp_path / "history.txt")
+
+        assert historyText == func_History_Text(
+            ["Message " + str(number) for number in range(20000)])
+        assert historyText.endswith(root.scrollBox.get(1.0, "end-1c"))
+        assert int(root.scrollBox.index("end-1c").split(".")[0]) <= \
+            channel_View_MaxLines
+        assert root.progressBar["value"] == 100
+
+    finally:
+
+        root.destroy()
@@ -0,0 +1,108 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the IDW engine
+# (Hazard_IDWEngine), against a brute-force IDW.
+
+# All import statements for utilized modules.
+import numpy
+import pytest
+from Hazard_ClipEngine import ClipPolygons
+from Hazard_RasterGrid import func_Grid_From_Extent
+from Hazard_RasterGrid import func_Cell_Centers
+from Hazard_IDWEngine import func_IDW
+from Hazard_IDWEngine import func_IDW_Surface
+
+
+@pytest.fixture
+def points():
+
+    # This fixture returns random points (meters) and values within a 100 km
+    # square, with one point on a cell center.
+
+    randomGenerator = numpy.random.default_rng(6389)
+
+    x = randomGenerator.uniform(0.0, 100000.0, 1000)
+    y = randomGenerator.uniform(0.0, 100000.0, 1000)
+    values = randomGenerator.uniform(30.0, 120.0, 1000)
+    x[0] = y[0] = 50500.0
+
+    return x, y, values
+
+
+def func_Cell_Distances(x, y, grid):
+
+    # This function returns the distance from every cell center (by row,
+    # from the top) to every point.
+
+    centerX, centerY = func_Cell_Centers(grid)
+    gridX, gridY = numpy.meshgrid(centerX, centerY)
+
+    return numpy.hypot(gridX.ravel()[:, None] - x,
+                       gridY.ravel()[:, None] - y)
+
+
+def test_Nearest_Points(points):
+
+    x, y, values = points
+    grid = func_Grid_From_Extent(0.0, 0.0, 100000.0, 100000.0, 1000.0)
+    distances = func_Cell_Distances(x, y, grid)
+
+    # Brute-force nearest 12 points, power 2.
+    nearest = numpy.argsort(distances, axis=1)[:, :12]
+    nearestDistances = numpy.take_along_axis(distances, nearest, axis=1)
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+
+        weights = 1.0 / nearestDistances ** 2
+        expected = (weights * values[nearest]).sum(axis=1) / \
+            weights.sum(axis=1)
+
+    expected[nearestDistances[:, 0] == 0.0] = values[0]
+
+    surface = func_IDW(x, y, values, grid, workers=2)
+
+    assert numpy.allclose(surface.ravel(), expected)
+    assert surface[grid.rows - 1 - 50, 50] == values[0]
+
+
+def test_Fixed_Radius(points):
+
+    x, y, values = points
+    grid = func_Grid_From_Extent(0.0, 0.0, 100000.0, 100000.0, 1000.0)
+    distances = func_Cell_Distances(x, y, grid)
+
+    # Brute-force fixed radius (5 km), power 1.5. Cells without a point
+    # within the radius are NaN.
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+
+        weights = numpy.where(distances <= 5000.0, distances ** -1.5, 0.0)
+        expected = (weights * values).sum(axis=1) / weights.sum(axis=1)
+
+    expected[distances[:, 0] == 0.0] = values[0]
+
+    surface = func_IDW(x, y, values, grid, power=1.5, radius=5000.0)
+
+    assert numpy.allclose(surface.ravel(), expected, equal_nan=True)
+
+
+def test_Surface_Within_Polygons():
+
+    randomGenerator = numpy.random.default_rng(6389)
+
+    # Lower 48 states as one polygon (longitude/latitude box).
+    box = numpy.array([(-125.0, 24.5), (-125.0, 49.5), (-66.5, 49.5),
+                       (-66.5, 24.5), (-125.0, 24.5)])
+    polygons = ClipPolygons(numpy.array([[-125.0, 24.5, -66.5, 49.5]]),
+                            [(box[:-1, 0], box[:-1, 1], box[1:, 0],
+                              box[1:, 1])], [("", "")])
+
+    longitudes = randomGenerator.uniform(-124.9, -66.6, 20000)
+    latitudes = randomGenerator.uniform(24.6, 49.4, 20000)
+    speeds = randomGenerator.uniform(50.0, 120.0, 20000)
+
+    grid, surface = func_IDW_Surface(longitudes, latitudes, speeds, polygons,
+                                     cellSize=50000.0)
+
+    assert surface.shape == (grid.rows, grid.columns)
+    assert numpy.isfinite(surface).sum() > 0.99 * surface.size
+    assert 50.0 <= numpy.nanmin(surface) <= numpy.nanmax(surface) <= 120.0
@@ -0,0 +1,56 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the kernel density engine
+# (Hazard_KernelDensity).
+
+# All import statements for utilized modules.
+import numpy
+from Hazard_ClipEngine import ClipPolygons
+from Hazard_RasterGrid import func_Grid_From_Extent
+from Hazard_KernelDensity import func_Kernel_Density
+from Hazard_KernelDensity import func_Kernel_Density_Surface
+
+
+def test_Exact_And_FFT_Agree():
+
+    randomGenerator = numpy.random.default_rng(6389)
+
+    # Clustered points (meters) within a 200 km square.
+    x = numpy.concatenate([randomGenerator.normal(60000, 15000, 3000),
+                           randomGenerator.normal(140000, 25000, 2000)])
+    y = numpy.concatenate([randomGenerator.normal(120000, 20000, 3000),
+                           randomGenerator.normal(70000, 10000, 2000)])
+    grid = func_Grid_From_Extent(0.0, 0.0, 200000.0, 200000.0, 1000.0)
+
+    exact = func_Kernel_Density(x, y, grid, method="exact")
+    fft = func_Kernel_Density(x, y, grid, method="fft")
+
+    # The surface (per square kilometer, 1 square kilometer cells) sums to
+    # the points whose kernel falls within the grid.
+    assert abs(exact.sum() - len(x)) < 0.01 * len(x)
+    assert numpy.abs(fft - exact).max() < 0.02 * exact.max()
+    assert abs(fft.sum() - exact.sum()) < 0.001 * exact.sum()
+
+
+def test_Surface_Within_Polygons():
+
+    randomGenerator = numpy.random.default_rng(6389)
+
+    # A longitude/latitude box, and points clustered within it.
+    box = numpy.array([(-105.0, 30.0), (-105.0, 40.0), (-90.0, 40.0),
+                       (-90.0, 30.0), (-105.0, 30.0)])
+    polygons = ClipPolygons(numpy.array([[-105.0, 30.0, -90.0, 40.0]]),
+                            [(box[:-1, 0], box[:-1, 1], box[1:, 0],
+                              box[1:, 1])], [("", "")])
+    longitudes = numpy.clip(randomGenerator.normal(-97.0, 2.0, 20000),
+                            -104.9, -90.1)
+    latitudes = numpy.clip(randomGenerator.normal(35.0, 2.0, 20000),
+                           30.1, 39.9)
+
+    grid, surface = func_Kernel_Density_Surface(longitudes, latitudes,
+                                                polygons, cellSize=10000.0)
+
+    assert surface.shape == (grid.rows, grid.columns)
+    assert numpy.isfinite(surface).any()
+    assert numpy.isnan(surface).any()
+    assert numpy.nanmin(surface) >= 0
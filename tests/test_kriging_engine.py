@@ -0,0 +1,107 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the kriging engine
+# (Hazard_KrigingEngine), with a smooth synthetic field.
+
+# All import statements for utilized modules.
+import numpy
+import pytest
+from Hazard_ClipEngine import ClipPolygons
+from Hazard_RasterGrid import func_Grid_From_Extent
+from Hazard_RasterGrid import func_Cell_Centers
+from Hazard_KrigingEngine import krig_Neighbors
+from Hazard_KrigingEngine import func_Semivariance
+from Hazard_KrigingEngine import func_Empirical_Semivariogram
+from Hazard_KrigingEngine import func_Fit_Variogram
+from Hazard_KrigingEngine import func_Kriging
+from Hazard_KrigingEngine import func_Kriging_Surface
+
+
+@pytest.fixture
+def field():
+
+    # This fixture returns random points (meters) within a 200 km square,
+    # and the values of a smooth field (features about 40 km across) plus
+    # noise.
+
+    randomGenerator = numpy.random.default_rng(6389)
+
+    x = randomGenerator.uniform(0.0, 200000.0, 4000)
+    y = randomGenerator.uniform(0.0, 200000.0, 4000)
+    values = 2.0 + numpy.sin(x / 13000.0) * numpy.cos(y / 13000.0) + \
+        randomGenerator.normal(0.0, 0.05, len(x))
+
+    return x, y, values
+
+
+def test_Fitted_Variogram(field):
+
+    variogram = func_Fit_Variogram(*func_Empirical_Semivariogram(*field))
+
+    assert 10000.0 < variogram.range < 80000.0
+    assert variogram.nugget < 0.1 * variogram.partialSill
+
+
+def test_Cells_Match_Direct_Solve(field):
+
+    x, y, values = field
+    grid = func_Grid_From_Extent(0.0, 0.0, 200000.0, 200000.0, 2000.0)
+    variogram, prediction, variance = func_Kriging(x, y, values, grid,
+                                                   workers=2)
+
+    # Direct solve of a sample of cells' kriging systems.
+    centerX, centerY = func_Cell_Centers(grid)
+
+    for row, column in ((0, 0), (37, 55), (99, 99), (50, 12)):
+
+        distances = numpy.hypot(x - centerX[column], y - centerY[row])
+        nearest = numpy.argsort(distances)[:krig_Neighbors]
+        matrix = numpy.ones((krig_Neighbors + 1, krig_Neighbors + 1))
+        matrix[:-1, :-1] = func_Semivariance(variogram, numpy.hypot(
+            x[nearest][:, None] - x[nearest], y[nearest][:, None] -
+            y[nearest]))
+        matrix[-1, -1] = 0.0
+        rightSide = numpy.append(func_Semivariance(variogram,
+                                                   distances[nearest]), 1.0)
+        solution = numpy.linalg.solve(matrix, rightSide)
+
+        assert abs(prediction[row, column] -
+                   solution[:-1] @ values[nearest]) < 1e-8
+        assert abs(variance[row, column] - solution @ rightSide) < 1e-8
+
+
+def test_Data_Points_Honored(field):
+
+    x, y, values = field
+    variogram = func_Fit_Variogram(*func_Empirical_Semivariogram(*field))
+
+    # A cell centered on a data point has its value, with zero variance.
+    pointGrid = func_Grid_From_Extent(x[0] - 50.0, y[0] - 50.0, x[0] + 50.0,
+                                      y[0] + 50.0, 100.0)
+    pointPrediction, pointVariance = func_Kriging(x, y, values, pointGrid,
+                                                  variogram=variogram)[1:]
+
+    assert abs(pointPrediction[0, 0] - values[0]) < 1e-8
+    assert pointVariance[0, 0] < 1e-8
+
+
+def test_Surface_Within_Polygons():
+
+    randomGenerator = numpy.random.default_rng(6389)
+
+    # Lower 48 states as one polygon (longitude/latitude box).
+    box = numpy.array([(-125.0, 24.5), (-125.0, 49.5), (-66.5, 49.5),
+                       (-66.5, 24.5), (-125.0, 24.5)])
+    polygons = ClipPolygons(numpy.array([[-125.0, 24.5, -66.5, 49.5]]),
+                            [(box[:-1, 0], box[:-1, 1], box[1:, 0],
+                              box[1:, 1])], [("", "")])
+
+    longitudes = randomGenerator.uniform(-124.9, -66.6, 10000)
+    latitudes = randomGenerator.uniform(24.6, 49.4, 10000)
+    diameters = randomGenerator.choice([0.75, 1.0, 1.75, 2.5, 4.0], 10000)
+
+    grid, variogram, prediction, variance = func_Kriging_Surface(
+        longitudes, latitudes, diameters, polygons, cellSize=50000.0)
+
+    assert prediction.shape == variance.shape == (grid.rows, grid.columns)
+    assert numpy.isfinite(prediction).sum() > 0.99 * prediction.size
@@ -0,0 +1,120 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the raster mask cache
+# (Hazard_MaskCache).
+
+# All import statements for utilized modules.
+import os
+import numpy
+import pytest
+import Hazard_MaskCache
+import Hazard_RasterGrid
+from Hazard_ClipEngine import ClipPolygons
+from Hazard_RasterGrid import func_Project_Polygons
+from Hazard_RasterGrid import func_Polygons_Grid
+
+
+@pytest.fixture
+def triangle_Polygons(cache_Folder, monkeypatch):
+
+    # This fixture returns the projected polygons of a Texas-sized triangle
+    # (longitude/latitude), their grid, and the list of grids rasterized
+    # during the test. The masks start out empty.
+
+    monkeypatch.setattr(Hazard_MaskCache, "dict_Masks",
+                        Hazard_MaskCache.OrderedDict())
+
+    triangle = numpy.array([(-106.0, 26.0), (-94.0, 26.0), (-100.0, 36.0),
+                            (-106.0, 26.0)])
+    polygons = func_Project_Polygons(ClipPolygons(
+        numpy.array([[-106.0, 26.0, -94.0, 36.0]]),
+        [(triangle[:-1, 0], triangle[:-1, 1], triangle[1:, 0],
+          triangle[1:, 1])], [("48", "")]))
+
+    list_Rasterized = []
+
+    def func_Counted_Rasterize(polygons, grid):
+
+        list_Rasterized.append(grid)
+
+        return Hazard_RasterGrid.func_Rasterize_Polygons(polygons, grid)
+
+    monkeypatch.setattr(Hazard_MaskCache, "func_Rasterize_Polygons",
+                        func_Counted_Rasterize)
+
+    return polygons, func_Polygons_Grid(polygons), list_Rasterized
+
+
+def test_Mask_Matches_Rasterized_Polygons(triangle_Polygons):
+
+    polygons, grid, list_Rasterized = triangle_Polygons
+
+    rasterMask = Hazard_MaskCache.func_Polygon_Mask(polygons, grid)
+
+    assert (rasterMask.inside ==
+            Hazard_RasterGrid.func_Rasterize_Polygons(polygons, grid)).all()
+    assert 0.4 < rasterMask.inside.mean() < 0.6
+    assert not rasterMask.inside.flags.writeable
+    assert not rasterMask.factor.flags.writeable
+
+
+def test_Mask_Rasterized_Once(triangle_Polygons):
+
+    polygons, grid, list_Rasterized = triangle_Polygons
+
+    rasterMask = Hazard_MaskCache.func_Polygon_Mask(polygons, grid)
+
+    # Later requests come from memory, then from disk once memory is
+    # cleared.
+    assert Hazard_MaskCache.func_Polygon_Mask(polygons, grid) is rasterMask
+
+    Hazard_MaskCache.dict_Masks.clear()
+
+    assert (Hazard_MaskCache.func_Polygon_Mask(polygons, grid).inside ==
+            rasterMask.inside).all()
+    assert len(list_Rasterized) == 1
+
+
+def test_Changed_Grid_Gets_Own_Mask(triangle_Polygons):
+
+    polygons, grid, list_Rasterized = triangle_Polygons
+
+    Hazard_MaskCache.func_Polygon_Mask(polygons, grid)
+    Hazard_MaskCache.func_Polygon_Mask(
+        polygons, grid._replace(cellSize=grid.cellSize * 2))
+
+    assert len(list_Rasterized) == 2
+    assert len(os.listdir(Hazard_MaskCache.func_Mask_Folder())) == 2
+
+
+def test_Given_Mask_Used_As_Is(triangle_Polygons):
+
+    polygons, grid, list_Rasterized = triangle_Polygons
+
+    inside = Hazard_RasterGrid.func_Rasterize_Polygons(polygons, grid)
+
+    rasterMask = Hazard_MaskCache.func_Surface_Mask(polygons, grid, inside)
+
+    assert (rasterMask.inside == inside).all()
+    assert (rasterMask.factor[inside] == 1.0).all()
+    assert numpy.isnan(rasterMask.factor[~inside]).all()
+    assert not list_Rasterized
+
+    # The caller's array is left as it was.
+    assert inside.flags.writeable
+
+    with pytest.raises(ValueError):
+
+        Hazard_MaskCache.func_Surface_Mask(polygons, grid, inside[1:])
+
+
+def test_Apply_Mask(triangle_Polygons):
+
+    polygons, grid, list_Rasterized = triangle_Polygons
+
+    rasterMask = Hazard_MaskCache.func_Polygon_Mask(polygons, grid)
+
+    surface = numpy.ones((grid.rows, grid.columns))
+
+    assert Hazard_MaskCache.func_Apply_Mask(surface, rasterMask) is surface
+    assert (numpy.isnan(surface) == ~rasterMask.inside).all()
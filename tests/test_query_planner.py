@@ -0,0 +1,185 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the query planner
+# (Hazard_QueryPlanner), against a local stand-in FDSN server. The server
+# holds a synthetic catalog of ten years of events (a few busy months among
+# many quiet ones), answers the count endpoint, and rejects (400) any query
+# with more events than its limit.
+
+# All import statements for utilized modules.
+import csv
+import json
+import math
+import random
+import datetime
+import threading
+import http.server
+from urllib import parse
+import pytest
+from Hazard_ChunkDownloader import func_Stream_Chunks
+from Hazard_QueryPlanner import planner_Fill
+from Hazard_QueryPlanner import QueryWindow
+from Hazard_QueryPlanner import func_Window_URL
+from Hazard_QueryPlanner import func_Window_Name
+from Hazard_QueryPlanner import func_Merge_Windows
+from Hazard_QueryPlanner import func_Plan_Query_Windows
+
+# Maximum events per query of the stand-in server.
+server_MaxAllowed = 500
+
+# Timespan of the synthetic catalog.
+catalog_Start = datetime.datetime(2000, 1, 1)
+catalog_End = datetime.datetime(2010, 1, 1)
+
+
+class FDSNPlannerServer:
+
+    # This class runs the stand-in FDSN server over the synthetic catalog:
+    # 10 quiet events per month, plus aftershock sequences of 1,200 and
+    # 3,000 events.
+
+    def __init__(self):
+
+        randomGenerator = random.Random(6389)
+
+        self.list_Catalog = [catalog_Start + datetime.timedelta(
+            milliseconds=randomGenerator.randrange(
+                int((catalog_End - catalog_Start).total_seconds() * 1000)))
+            for event in range(10 * 120)]
+
+        for sequenceStart, events in ((datetime.datetime(2003, 5, 4), 1200),
+                                      (datetime.datetime(2007, 9, 12), 3000)):
+
+            self.list_Catalog.extend(sequenceStart + datetime.timedelta(
+                milliseconds=randomGenerator.randrange(3 * 86400 * 1000))
+                for event in range(events))
+
+        self.list_Catalog.sort()
+
+        # Dictionary of the server's counters.
+        self.dict_Counters = {"count": 0, "query": 0}
+
+        server = self
+
+        class FDSNPlannerHandler(http.server.BaseHTTPRequestHandler):
+
+            def do_GET(self):
+
+                url = parse.urlparse(self.path)
+                query = dict(parse.parse_qsl(url.query))
+                start = datetime.datetime.fromisoformat(query["starttime"])
+                end = datetime.datetime.fromisoformat(query["endtime"])
+                events = [event for event in server.list_Catalog
+                          if start <= event <= end]
+
+                if url.path.endswith("/count"):
+
+                    server.dict_Counters["count"] += 1
+                    body = json.dumps({"count": len(events),
+                                       "maxAllowed": server_MaxAllowed})
+
+                elif len(events) > server_MaxAllowed:
+
+                    self.send_response(400)
+                    self.end_headers()
+
+                    return
+
+                else:
+
+                    server.dict_Counters["query"] += 1
+                    body = "time,latitude,longitude,depth,mag\n" + "".join(
+                        event.isoformat(timespec="milliseconds") +
+                        "Z,35.0,-97.0,5.0,2.5\n" for event in events)
+
+                body = body.encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+
+                pass
+
+        self.httpServer = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), FDSNPlannerHandler)
+        threading.Thread(target=self.httpServer.serve_forever,
+                         daemon=True).start()
+        self.baseURL = "http://127.0.0.1:" + \
+            str(self.httpServer.server_address[1]) + "/fdsnws/event/1/"
+
+
+@pytest.fixture
+def server(cache_Folder):
+
+    # This fixture returns a running stand-in server with an empty download
+    # cache.
+
+    standInServer = FDSNPlannerServer()
+
+    yield standInServer
+
+    standInServer.httpServer.shutdown()
+
+
+def test_Windows_Within_Limit(server):
+
+    list_Windows = func_Plan_Query_Windows(
+        server.baseURL + "count?format=geojson", catalog_Start, catalog_End)
+    list_Catalog = server.list_Catalog
+
+    # Every window is within the limit, and the windows are in time order
+    # without gaps or overlaps between their events.
+    limit = int(server_MaxAllowed * planner_Fill)
+
+    assert all(0 < window.count <= limit for window in list_Windows)
+    assert all(previous.end <= window.start for previous, window in
+               zip(list_Windows, list_Windows[1:]))
+    assert sum(window.count for window in list_Windows) == len(list_Catalog)
+
+    # Far fewer queries than one per month, and close to the fewest possible.
+    assert len(list_Windows) < 120
+    assert len(list_Windows) <= 2 * math.ceil(len(list_Catalog) / limit)
+
+    # Downloading the windows returns every event once, in time order.
+    list_Events = []
+
+    for rows in func_Stream_Chunks(
+            [func_Window_URL(server.baseURL + "query?format=csv",
+                             window.start, window.end)
+             for window in list_Windows],
+            [func_Window_Name(window) for window in list_Windows],
+            lambda lines: list(csv.reader(lines))[1:]):
+
+        list_Events.extend(row[0] for row in rows)
+
+    assert list_Events == [event.isoformat(timespec="milliseconds") + "Z"
+                           for event in list_Catalog]
+    assert server.dict_Counters["query"] == len(list_Windows)
+
+
+def test_Window_URL_And_Name():
+
+    window = QueryWindow(datetime.datetime(2000, 1, 1),
+                         datetime.datetime(2000, 3, 1), 1234)
+
+    # FDSN end times are inclusive, so the URL ends a millisecond early.
+    assert func_Window_URL("query?format=csv", window.start, window.end) == \
+        "query?format=csv&starttime=2000-01-01T00:00:00.000" \
+        "&endtime=2000-02-29T23:59:59.999"
+    assert func_Window_Name(window) == \
+        "2000-01-01 00:00 to 2000-03-01 00:00 (1234 events)"
+
+
+def test_Merge_Windows():
+
+    list_Days = [datetime.datetime(2000, 1, day) for day in range(1, 6)]
+    list_Windows = [QueryWindow(start, end, count) for start, end, count in
+                    zip(list_Days, list_Days[1:], [300, 100, 250, 400])]
+
+    # Neighboring windows are merged while within the limit.
+    assert func_Merge_Windows(list_Windows, 450) == [
+        QueryWindow(list_Days[0], list_Days[2], 400),
+        QueryWindow(list_Days[2], list_Days[3], 250),
+        QueryWindow(list_Days[3], list_Days[4], 400)]
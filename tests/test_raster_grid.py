@@ -0,0 +1,68 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the raster grid
+# (Hazard_RasterGrid).
+
+# All import statements for utilized modules.
+import os
+import numpy
+from Hazard_ClipEngine import ClipPolygons
+from Hazard_ClipEngine import func_Points_In_Polygon
+from Hazard_RasterGrid import raster_Sphere_Radius
+from Hazard_RasterGrid import func_Project_Points
+from Hazard_RasterGrid import func_Grid_From_Extent
+from Hazard_RasterGrid import func_Cell_Centers
+from Hazard_RasterGrid import func_Rasterize_Polygons
+from Hazard_RasterGrid import func_Write_Raster
+from Hazard_RasterGrid import func_Read_TIFF
+
+
+def func_Ring_Edges(ring):
+
+    # This function returns the edge arrays of a ring of points.
+
+    ring = numpy.array(ring + ring[:1], dtype=numpy.float64)
+
+    return ring[:-1, 0], ring[:-1, 1], ring[1:, 0], ring[1:, 1]
+
+
+def test_Project_Points():
+
+    # The central meridian projects to x = 0, the equator to y = 0.
+    x, y = func_Project_Points([-30.0, -120.0, 150.0], [0.0, 45.0, 0.0])
+
+    assert abs(x[0]) < 1e-6 and abs(y[0]) < 1e-6
+    assert abs(x[1] + raster_Sphere_Radius * numpy.pi / 2) < 1e-3
+    assert abs(y[1] - 5621521.486192) < 1e-3
+    assert abs(abs(x[2]) - raster_Sphere_Radius * numpy.pi) < 1e-3
+
+
+def test_Rasterized_Polygon_Written(tmp_path):
+
+    # Square with a square hole, rasterized the same as the clip engine's
+    # ray casting of the cell centers.
+    outer = func_Ring_Edges([(0, 0), (0, 100), (100, 100), (100, 0)])
+    hole = func_Ring_Edges([(30, 30), (30, 60), (70, 60), (70, 30)])
+    edges = tuple(numpy.concatenate(pair) for pair in zip(outer, hole))
+    polygons = ClipPolygons(numpy.array([[0.0, 0.0, 100.0, 100.0]]),
+                            [edges], [("48", "Test")])
+
+    grid = func_Grid_From_Extent(-10.0, -10.0, 110.0, 110.0, 0.7)
+    mask = func_Rasterize_Polygons(polygons, grid)
+
+    centerX, centerY = func_Cell_Centers(grid)
+    gridX, gridY = numpy.meshgrid(centerX, centerY)
+    expected = func_Points_In_Polygon(gridX.ravel(), gridY.ravel(),
+                                      edges).reshape(mask.shape)
+
+    assert (mask == expected).all()
+    assert mask.sum() == expected.sum() > 0
+
+    # The TIFF (and its world file) is read back with the same values.
+    rasterPath = str(tmp_path / "mask.tif")
+    values = numpy.where(mask, gridX, numpy.nan)
+    func_Write_Raster(rasterPath, grid, values)
+
+    assert numpy.array_equal(func_Read_TIFF(rasterPath),
+                             values.astype(numpy.float32), equal_nan=True)
+    assert os.path.exists(rasterPath[:-4] + ".tfw")
@@ -0,0 +1,77 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the readiness checks
+# (Hazard_Readiness).
+
+# All import statements for utilized modules.
+import os
+import time
+import shutil
+import pytest
+import Hazard_Readiness
+from Hazard_Readiness import func_Remove_Folder
+
+
+def test_Folder_Removed(tmp_path):
+
+    folder = str(tmp_path / "Output")
+    os.makedirs(os.path.join(folder, "GIS"))
+
+    with open(os.path.join(folder, "GIS", "points.csv"), "w") as csvFile:
+
+        csvFile.write("x,y\n")
+
+    func_Remove_Folder(folder)
+
+    assert not os.path.exists(folder)
+
+    # A folder that is already gone returns at once.
+    start_time = time.perf_counter()
+    func_Remove_Folder(folder)
+
+    assert time.perf_counter() - start_time < 0.01
+
+
+def test_Delete_Tried_Again(tmp_path, monkeypatch):
+
+    folder = str(tmp_path / "Output")
+    os.makedirs(folder)
+
+    # The first two deletes fail (as with a file held open on Windows).
+    list_Calls = []
+    func_Rmtree = shutil.rmtree
+
+    def func_Held_Rmtree(path):
+
+        list_Calls.append(path)
+
+        if len(list_Calls) <= 2:
+
+            raise PermissionError("File in use: " + path)
+
+        func_Rmtree(path)
+
+    monkeypatch.setattr(Hazard_Readiness.shutil, "rmtree", func_Held_Rmtree)
+
+    func_Remove_Folder(folder)
+
+    assert len(list_Calls) == 3
+    assert not os.path.exists(folder)
+
+
+def test_Timeout(tmp_path, monkeypatch):
+
+    folder = str(tmp_path / "Output")
+    os.makedirs(folder)
+
+    def func_Held_Rmtree(path):
+
+        raise PermissionError("File in use: " + path)
+
+    monkeypatch.setattr(Hazard_Readiness.shutil, "rmtree", func_Held_Rmtree)
+
+    with pytest.raises(PermissionError):
+
+        func_Remove_Folder(folder, timeoutSeconds=0.05)
+
+    assert os.path.exists(folder)
@@ -0,0 +1,89 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the Run Parameters
+# (Hazard_RunParameters).
+
+# All import statements for utilized modules.
+import tkinter
+import pytest
+from Hazard_RunParameters import RunParameters
+from Hazard_RunParameters import func_Get_Tk_Value
+from Hazard_RunParameters import func_Get_Checked_Analyses
+from Hazard_RunParameters import func_Custom_Timespan
+from Hazard_RunParameters import func_Custom_Timespan_Text
+from Hazard_RunParameters import func_Custom_Magnitude_Text
+
+
+def func_Run_Parameters(**fields):
+
+    # This function returns the run parameters of a custom selection, with
+    # any fields replaced.
+
+    dict_Fields = {"hazard_Timespan": "Custom...",
+                   "hazard_Magnitude": "Custom...",
+                   "custom_Year_From": 2000, "custom_Month_From": 3,
+                   "custom_Year_To": 2005, "custom_Month_To": 11,
+                   "custom_Magnitude_Min": 1.0, "custom_Magnitude_Max": 2.5,
+                   "url_Text": "", "workspace_Folder": "",
+                   "options_Checked": 0, "state_Name": None,
+                   "county_Name": None, "analysis_Options": frozenset()}
+    dict_Fields.update(fields)
+
+    return RunParameters(**dict_Fields)
+
+
+def test_Custom_Timespan():
+
+    runParameters = func_Run_Parameters()
+
+    assert func_Custom_Timespan(runParameters) == ("2000", "3", "2005", "11")
+    assert func_Custom_Timespan_Text(runParameters) == "200003-200511"
+
+
+def test_Custom_Magnitude_Text():
+
+    assert func_Custom_Magnitude_Text(func_Run_Parameters()) == "1.0-2.5"
+    assert func_Custom_Magnitude_Text(func_Run_Parameters(
+        custom_Magnitude_Min=90, custom_Magnitude_Max=120)) == "90-120"
+
+    # Negative earthquake magnitudes are written the same as within the
+    # output names.
+    assert func_Custom_Magnitude_Text(func_Run_Parameters(
+        custom_Magnitude_Min=-1.5, custom_Magnitude_Max=2.0)) == \
+        "neg_1.5-2.0"
+
+
+@pytest.fixture
+def tclInterpreter():
+
+    # This fixture returns a Tcl interpreter for Tk variables (no display is
+    # needed).
+
+    return tkinter.Tcl()
+
+
+def test_Get_Tk_Value(tclInterpreter):
+
+    assert func_Get_Tk_Value(None) is None
+    assert func_Get_Tk_Value(tkinter.StringVar(
+        master=tclInterpreter, value="Custom...")) == "Custom..."
+
+    # An IntVar with no selection (an empty value) can't be converted.
+    assert func_Get_Tk_Value(tkinter.IntVar(master=tclInterpreter,
+                                            value="")) is None
+
+
+def test_Get_Checked_Analyses(tclInterpreter):
+
+    class GUIFrame:
+
+        pass
+
+    guiFrame = GUIFrame()
+    guiFrame.statusAnalysis_IDW = tkinter.IntVar(master=tclInterpreter,
+                                                 value=1)
+    guiFrame.statusAnalysis_Kriging = tkinter.IntVar(master=tclInterpreter,
+                                                     value=0)
+
+    assert func_Get_Checked_Analyses(
+        guiFrame, ["IDW", "Kriging", "KernelDensity"]) == frozenset(["IDW"])
@@ -0,0 +1,144 @@
+# David Lindsey - GISC 6389 - Master's Project
+# Contact: dcl160230@utdallas.edu
+# The following code represents the tests of the stage trace
+# (Hazard_StageTrace).
+
+# All import statements for utilized modules.
+import os
+import json
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from Hazard_StageTrace import func_Start_Trace
+from Hazard_StageTrace import func_Stop_Trace
+from Hazard_StageTrace import func_Stage_Span
+from Hazard_StageTrace import func_Trace_Calls
+from Hazard_StageTrace import func_Trace_Running
+
+
+class Runner:
+
+    # This class stands in for a run's stage functions.
+
+    def func_Download(self):
+
+        time.sleep(0.05)
+
+    def func_Check(self):
+
+        return sum(range(200000))
+
+
+def func_Worker_Span(index):
+
+    # This function opens a span within a worker process.
+
+    with func_Stage_Span("worker span", index=index):
+
+        time.sleep(0.01)
+
+    return index
+
+
+def func_Read_Spans(tracePath):
+
+    # This function returns the spans of a trace file.
+
+    with open(tracePath) as traceFile:
+
+        return json.load(traceFile)["spans"]
+
+
+@pytest.fixture
+def tracePath(tmp_path):
+
+    # This fixture returns the path of a trace file, and stops any trace
+    # left running by a failed test.
+
+    yield str(tmp_path / "StageTrace.json")
+
+    func_Stop_Trace()
+
+
+def test_Spans(tracePath):
+
+    func_Start_Trace(tracePath, profile=True)
+
+    runner = Runner()
+
+    with func_Trace_Calls(runner, {"func_Download": "download",
+                                   "func_Check": "CSV check"}), \
+            func_Trace_Calls(json, {"dumps": "json dumps"}):
+
+        with func_Stage_Span("run", hazard="hail"):
+
+            runner.func_Download()
+            runner.func_Check()
+            json.dumps([1, 2, 3])
+
+        with pytest.raises(RuntimeError):
+
+            with func_Stage_Span("failing stage"):
+
+                raise RuntimeError("Stage failed.")
+
+    # The original functions are back.
+    assert "func_Download" not in runner.__dict__
+    assert json.dumps.__name__ == "dumps"
+
+    # The trace is only written once stopped.
+    assert not os.path.exists(tracePath)
+    assert func_Stop_Trace() == tracePath
+    assert not func_Trace_Running()
+
+    list_Spans = func_Read_Spans(tracePath)
+
+    assert [span["stage"] for span in list_Spans] == \
+        ["download", "CSV check", "json dumps", "run", "failing stage"]
+    assert [span["parent"] for span in list_Spans] == \
+        ["run", "run", "run", None, None]
+    assert list_Spans[0]["seconds"] >= 0.05
+    assert list_Spans[3]["hazard"] == "hail"
+    assert list_Spans[4]["status"] == "error"
+    assert os.path.exists(list_Spans[3]["profile"])
+
+
+def test_No_Trace_Running(tracePath):
+
+    # Without a running trace, spans and traced calls do nothing.
+    runner = Runner()
+
+    with func_Trace_Calls(runner, {"func_Download": "download"}), \
+            func_Stage_Span("run"):
+
+        assert "func_Download" not in runner.__dict__
+
+    assert func_Stop_Trace() is None
+    assert not os.path.exists(tracePath)
+
+
+def test_Worker_Spans_Not_Written(tracePath):
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+
+        pytest.skip("fork is not available.")
+
+    # Forked worker processes inherit the trace, but must neither write it
+    # nor fail.
+    func_Start_Trace(tracePath, profile=True)
+
+    with func_Stage_Span("pool"):
+
+        with ProcessPoolExecutor(8, multiprocessing.get_context(
+                "fork")) as pool:
+
+            assert list(pool.map(func_Worker_Span, range(16))) == \
+                list(range(16))
+
+    func_Stop_Trace()
+
+    assert [span["stage"] for span in func_Read_Spans(tracePath)] == \
+        ["pool"]
+    assert not [name for name in os.listdir(os.path.dirname(tracePath))
+                if name.endswith(".tmp") or "worker_span" in name]